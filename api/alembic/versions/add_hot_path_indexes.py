@@ -0,0 +1,81 @@
+"""add_hot_path_indexes
+
+Revision ID: add_hot_path_indexes
+Revises: rename_gateway_public_private
+Create Date: 2026-10-19 10:00:00.000000
+
+Indexes for foreign keys and filters used on hot paths. On Postgres they are
+built CONCURRENTLY (outside a transaction) so large tables aren't locked.
+
+Lists paged on (created_at, id) get a matching index so a page is an index
+range scan instead of a sort of the whole table.
+
+cluster_instances.cluster_id is not indexed separately: it is the leading
+column of the cluster_instance_cluster_id unique constraint, which already
+serves cluster_id lookups.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'add_hot_path_indexes'
+down_revision: Union[str, None] = 'rename_gateway_public_private'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+INDEXES = [
+    # (name, table, columns, partial index predicate)
+    ('ix_application_components_instance_id', 'application_components', ['instance_id'], None),
+    (
+        'ix_application_components_type_created_at_id',
+        'application_components',
+        ['type', 'created_at', 'id'],
+        None,
+    ),
+    (
+        'ix_cluster_instances_application_component_id',
+        'cluster_instances',
+        ['application_component_id'],
+        None,
+    ),
+    ('ix_settings_environment_id', 'settings', ['environment_id'], None),
+    ('ix_instances_environment_id', 'instances', ['environment_id'], None),
+    ('ix_tokens_active', 'tokens', ['id'], 'is_active IS true'),
+    # Keyset pagination order of the list endpoints
+    ('ix_applications_created_at_id', 'applications', ['created_at', 'id'], None),
+    ('ix_instances_created_at_id', 'instances', ['created_at', 'id'], None),
+    ('ix_environments_created_at_id', 'environments', ['created_at', 'id'], None),
+    ('ix_clusters_created_at_id', 'clusters', ['created_at', 'id'], None),
+    ('ix_users_created_at_id', 'users', ['created_at', 'id'], None),
+    ('ix_tokens_created_at_id', 'tokens', ['created_at', 'id'], None),
+]
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        for name, table, columns, where in INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                unique=False,
+                if_not_exists=True,
+                postgresql_concurrently=True,
+                postgresql_where=sa.text(where) if where else None,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _, _ in reversed(INDEXES):
+            op.drop_index(
+                name,
+                table_name=table,
+                if_exists=True,
+                postgresql_concurrently=True,
+            )
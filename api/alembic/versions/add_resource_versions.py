@@ -0,0 +1,47 @@
+"""add_resource_versions
+
+Revision ID: add_resource_versions
+Revises: settings_jsonb_gin_indexes
+Create Date: 2026-10-19 14:00:00.000000
+
+Per-table version counters backing the weak ETags of templates, component
+template configs, environments, settings and clusters. The API bumps them in
+the same transaction as every change (app/shared/database/resource_versions.py).
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'add_resource_versions'
+down_revision: Union[str, None] = 'settings_jsonb_gin_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+RESOURCES = [
+    'templates',
+    'component_template_configs',
+    'environments',
+    'settings',
+    'clusters',
+]
+
+
+def upgrade() -> None:
+    resource_versions = op.create_table(
+        'resource_versions',
+        sa.Column('resource', sa.String(), nullable=False),
+        sa.Column('version', sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint('resource'),
+    )
+    op.bulk_insert(
+        resource_versions,
+        [{'resource': resource, 'version': 1} for resource in RESOURCES],
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('resource_versions')
@@ -0,0 +1,76 @@
+"""settings_jsonb_gin_indexes
+
+Revision ID: settings_jsonb_gin_indexes
+Revises: add_hot_path_indexes
+Create Date: 2026-10-19 12:00:00.000000
+
+Store application_components.settings and settings.value as JSONB and add GIN
+(jsonb_path_ops) indexes so settings filters on list endpoints can use
+containment (@>) instead of scanning and parsing every row.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'settings_jsonb_gin_indexes'
+down_revision: Union[str, None] = 'add_hot_path_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+COLUMNS = [
+    # (index name, table, column, nullable)
+    ('ix_application_components_settings_gin', 'application_components', 'settings', True),
+    ('ix_settings_value_gin', 'settings', 'value', False),
+]
+
+
+def upgrade() -> None:
+    for _, table, column, nullable in COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            existing_type=sa.JSON(),
+            type_=postgresql.JSONB(astext_type=sa.Text()),
+            existing_nullable=nullable,
+            postgresql_using=f'{column}::jsonb',
+        )
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        for name, table, column, _ in COLUMNS:
+            op.create_index(
+                name,
+                table,
+                [column],
+                unique=False,
+                if_not_exists=True,
+                postgresql_using='gin',
+                postgresql_ops={column: 'jsonb_path_ops'},
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _, _ in reversed(COLUMNS):
+            op.drop_index(
+                name,
+                table_name=table,
+                if_exists=True,
+                postgresql_concurrently=True,
+            )
+
+    for _, table, column, nullable in reversed(COLUMNS):
+        op.alter_column(
+            table,
+            column,
+            existing_type=postgresql.JSONB(astext_type=sa.Text()),
+            type_=sa.JSON(),
+            existing_nullable=nullable,
+            postgresql_using=f'{column}::json',
+        )
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, ConfigDict, model_validator
+from pydantic import BaseModel, ConfigDict, field_validator
 from uuid import UUID
 from datetime import datetime
 from typing import Any
@@ -25,20 +25,12 @@ class Application(ApplicationBase):
     created_at: str
     updated_at: str
 
-    @model_validator(mode="before")
+    @field_validator("created_at", "updated_at", mode="before")
     @classmethod
-    def convert_datetime_to_string(cls, data: Any) -> Any:
-        if isinstance(data, dict):
-            if "created_at" in data and isinstance(data["created_at"], datetime):
-                data["created_at"] = data["created_at"].isoformat()
-            if "updated_at" in data and isinstance(data["updated_at"], datetime):
-                data["updated_at"] = data["updated_at"].isoformat()
-        elif hasattr(data, "__dict__"):
-            if hasattr(data, "created_at") and isinstance(data.created_at, datetime):
-                data.created_at = data.created_at.isoformat()
-            if hasattr(data, "updated_at") and isinstance(data.updated_at, datetime):
-                data.updated_at = data.updated_at.isoformat()
-        return data
+    def convert_datetime_to_string(cls, value: Any) -> Any:
+        if isinstance(value, datetime):
+            return value.isoformat()
+        return value
 
     model_config = ConfigDict(
         from_attributes=True,
@@ -1,15 +1,30 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 from uuid import UUID
+from typing import Optional
 
 from app.shared.database.database import get_db
+from app.shared.utils.pagination import (
+    CURSOR_DESCRIPTION,
+    InvalidCursorError,
+)
+from app.shared.utils.serialization import (
+    FIELDS_DESCRIPTION,
+    InvalidFieldsError,
+    json_list_response,
+    parse_fields,
+    validate_page,
+)
+from app.shared.database.replica import get_read_db
 from app.applications.infra.application_repository import ApplicationRepository
 from app.applications.core.application_service import ApplicationService
+from app.applications.core import application_overview_service
 from app.applications.api.application_dto import (
     ApplicationCreate,
     ApplicationUpdate,
     Application,
 )
+from app.applications.api.application_overview_dto import ApplicationOverview
 from app.applications.core.application_validators import (
     ApplicationNotFoundError,
     ApplicationNameAlreadyExistsError,
@@ -22,10 +37,7 @@ from app.shared.dependencies.auth import require_role, get_current_user
 router = APIRouter()
 
 
-def get_application_service(
-    database_session: Session = Depends(get_db),
-) -> ApplicationService:
-    """Dependency to get ApplicationService instance."""
+def _build_application_service(database_session: Session) -> ApplicationService:
     from app.instances.infra.instance_repository import InstanceRepository
     from app.instances.core.instance_service import InstanceService
 
@@ -35,6 +47,20 @@ def get_application_service(
     return ApplicationService(application_repository, instance_service)
 
 
+def get_application_service(
+    database_session: Session = Depends(get_db),
+) -> ApplicationService:
+    """Dependency to get ApplicationService instance."""
+    return _build_application_service(database_session)
+
+
+def get_application_read_service(
+    database_session: Session = Depends(get_read_db),
+) -> ApplicationService:
+    """Dependency to get ApplicationService instance bound to a read replica when available."""
+    return _build_application_service(database_session)
+
+
 @router.post("/applications/", response_model=Application)
 def create_application(
     application: ApplicationCreate,
@@ -76,17 +102,26 @@ def update_application(
 def list_applications(
     skip: int = 0,
     limit: int = 100,
-    service: ApplicationService = Depends(get_application_service),
+    cursor: Optional[str] = Query(None, description=CURSOR_DESCRIPTION),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+    service: ApplicationService = Depends(get_application_read_service),
     current_user: User = Depends(get_current_user),
 ):
     """List all applications."""
-    return service.get_applications(skip=skip, limit=limit)
+    try:
+        include = parse_fields(Application, fields)
+        page = service.get_applications(skip=skip, limit=limit, cursor=cursor)
+    except (InvalidCursorError, InvalidFieldsError) as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return json_list_response(
+        Application, validate_page(Application, page), fields=include
+    )
 
 
 @router.get("/applications/{uuid}", response_model=Application)
 def get_application(
     uuid: UUID,
-    service: ApplicationService = Depends(get_application_service),
+    service: ApplicationService = Depends(get_application_read_service),
     current_user: User = Depends(get_current_user),
 ):
     """Get application by UUID."""
@@ -96,6 +131,26 @@ def get_application(
         raise HTTPException(status_code=404, detail=str(e))
 
 
+@router.get("/applications/{uuid}/overview", response_model=ApplicationOverview)
+def get_application_overview(
+    uuid: UUID,
+    database_session: Session = Depends(get_read_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Get the application with its instances, components and their pods and jobs.
+
+    Clusters that don't answer within OVERVIEW_CLUSTER_TIMEOUT_SECONDS are
+    reported with status "timeout"; the rest of the overview is still returned.
+    """
+    try:
+        return application_overview_service.get_application_overview(
+            ApplicationRepository(database_session), uuid
+        )
+    except ApplicationNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+
 @router.delete("/applications/{uuid}", response_model=dict)
 def delete_application(
     uuid: UUID,
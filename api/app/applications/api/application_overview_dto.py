@@ -0,0 +1,47 @@
+from pydantic import BaseModel, ConfigDict
+from uuid import UUID
+from typing import List
+
+from app.applications.api.application_dto import Application
+from app.cron.api.cron_dto import CronJob
+from app.environments.api.environment_dto import Environment
+from app.instances.api.instance_dto import InstanceComponent
+from app.webapps.api.webapp_dto import Pod
+
+
+class ComponentClusterOverview(BaseModel):
+    """What one cluster runs for a component.
+
+    status is "ok", "timeout" (the cluster didn't answer in time) or "error";
+    pods (webapps and workers) or jobs (crons) are None unless it is "ok".
+    """
+
+    uuid: UUID
+    name: str
+    status: str
+    error: str | None = None
+    pods: List[Pod] | None = None
+    jobs: List[CronJob] | None = None
+
+
+class ComponentOverview(InstanceComponent):
+    clusters: List[ComponentClusterOverview] = []
+
+
+class InstanceOverview(BaseModel):
+    uuid: UUID
+    image: str
+    version: str
+    enabled: bool
+    environment: Environment
+    components: List[ComponentOverview] = []
+
+    model_config = ConfigDict(
+        from_attributes=True,
+    )
+
+
+class ApplicationOverview(BaseModel):
+    application: Application
+    namespace: str
+    instances: List[InstanceOverview] = []
@@ -0,0 +1,194 @@
+"""
+Aggregated application overview.
+
+One request returns the application, its instances and components, and what
+each component runs on every cluster it is deployed to:
+
+- the database is read in four queries however large the application is
+  (ApplicationRepository.find_by_uuid_for_overview), and the connection is
+  released before any cluster is asked
+- each cluster is asked once per kind, not once per component: one pod list
+  and one job list of the application's namespace, split by the `app` label
+- clusters are asked concurrently; one that hasn't answered within
+  OVERVIEW_CLUSTER_TIMEOUT_SECONDS (default 3) is reported with status
+  "timeout" and the rest of the overview is returned anyway
+- the calls themselves time out too, and a request joins a call for the same
+  cluster, namespace and kind that is still running instead of starting
+  another, so an unresponsive cluster can't tie up the shared threads
+"""
+
+import logging
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from app.applications.api.application_dto import Application
+from app.applications.api.application_overview_dto import (
+    ApplicationOverview,
+    ComponentClusterOverview,
+    ComponentOverview,
+    InstanceOverview,
+)
+from app.applications.core.application_validators import ApplicationNotFoundError
+from app.applications.infra.application_repository import ApplicationRepository
+from app.cron.api.cron_dto import CronJob
+from app.environments.api.environment_dto import Environment
+from app.webapps.api.webapp_dto import Pod
+from app.webapps.infra.application_component_model import WebappType
+
+logger = logging.getLogger(__name__)
+
+PODS = "pods"
+JOBS = "jobs"
+
+# Shared, so a cluster call that outlives its timeout finishes in the
+# background instead of holding up the response
+_executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix="overview")
+# Running calls by (api address, namespace, kind)
+_in_flight: Dict[Tuple[str, str, str], Future] = {}
+_in_flight_lock = threading.Lock()
+
+
+def get_cluster_timeout_seconds() -> float:
+    return float(os.getenv("OVERVIEW_CLUSTER_TIMEOUT_SECONDS", "3"))
+
+
+def list_workloads(
+    api_address: str, token: str, namespace: str, kind: str, timeout_seconds: float
+) -> List[Dict[str, Any]]:
+    """
+    Every pod or job of the namespace, with its labels.
+
+    API errors (401, 403, 500...) are raised, so the cluster is reported as an
+    error instead of as running nothing.
+    """
+    from app.k8s.client import K8sClient
+
+    k8s_client = K8sClient(url=api_address, token=token)
+    if kind == JOBS:
+        return k8s_client.list_jobs(
+            namespace=namespace, timeout_seconds=timeout_seconds, raise_errors=True
+        )
+    return k8s_client.list_pods(
+        namespace=namespace, timeout_seconds=timeout_seconds, raise_errors=True
+    )
+
+
+def submit_list_workloads(
+    api_address: str, token: str, namespace: str, kind: str, timeout_seconds: float
+) -> Future:
+    """Start list_workloads, or return the same call if it is still running."""
+    key = (api_address, namespace, kind)
+    with _in_flight_lock:
+        future = _in_flight.get(key)
+        if future is not None:
+            return future
+        future = _executor.submit(
+            list_workloads, api_address, token, namespace, kind, timeout_seconds
+        )
+        _in_flight[key] = future
+
+    def forget(done: Future) -> None:
+        with _in_flight_lock:
+            if _in_flight.get(key) is done:
+                del _in_flight[key]
+
+    future.add_done_callback(forget)
+    return future
+
+
+def workloads_of(
+    component_name: str, workloads: List[Dict[str, Any]]
+) -> List[Dict[str, Any]]:
+    """
+    The pods or jobs of one component.
+
+    Matched by the `app` label the templates set; workloads without it (jobs
+    of a CronJob) by the component name their own name starts with.
+    """
+    found = []
+    for workload in workloads:
+        app_label = workload.get("labels", {}).get("app")
+        if app_label == component_name or (
+            app_label is None and workload["name"].startswith(f"{component_name}-")
+        ):
+            found.append(workload)
+    return found
+
+
+def get_application_overview(
+    repository: ApplicationRepository,
+    uuid: UUID,
+    timeout_seconds: Optional[float] = None,
+) -> ApplicationOverview:
+    """Get the application with its instances, components, pods and jobs."""
+    application = repository.find_by_uuid_for_overview(uuid)
+    if not application:
+        raise ApplicationNotFoundError(f"Application with UUID '{uuid}' not found")
+    namespace = application.namespace or application.name
+
+    # Component sections to fill in, and one cluster call per (cluster, kind)
+    sections: List[Tuple[ComponentClusterOverview, str, str, Tuple[int, str]]] = []
+    calls: Dict[Tuple[int, str], Tuple[str, str]] = {}
+    instances = []
+    for instance in application.instances:
+        components = []
+        for component in instance.components:
+            kind = JOBS if component.type == WebappType.cron else PODS
+            overview = ComponentOverview.model_validate(component)
+            for cluster_instance in component.instances:
+                cluster = cluster_instance.cluster
+                section = ComponentClusterOverview(
+                    uuid=cluster.uuid, name=cluster.name, status="timeout"
+                )
+                overview.clusters.append(section)
+                sections.append((section, component.name, kind, (cluster.id, kind)))
+                calls[(cluster.id, kind)] = (cluster.api_address, cluster.token)
+            components.append(overview)
+        instances.append(
+            InstanceOverview(
+                uuid=instance.uuid,
+                image=instance.image,
+                version=instance.version,
+                enabled=instance.enabled,
+                environment=Environment.model_validate(instance.environment),
+                components=components,
+            )
+        )
+    result = ApplicationOverview(
+        application=Application.model_validate(application),
+        namespace=namespace,
+        instances=instances,
+    )
+    # Nothing below reads the database; don't hold a connection while waiting
+    repository.rollback()
+
+    if timeout_seconds is None:
+        timeout_seconds = get_cluster_timeout_seconds()
+    futures: Dict[Tuple[int, str], Future] = {
+        key: submit_list_workloads(
+            api_address, token, namespace, key[1], timeout_seconds
+        )
+        for key, (api_address, token) in calls.items()
+    }
+    wait(futures.values(), timeout=timeout_seconds)
+
+    for section, component_name, kind, key in sections:
+        future = futures[key]
+        if not future.done():
+            continue
+        try:
+            workloads = workloads_of(component_name, future.result())
+        except Exception as e:
+            logger.warning(f"Overview: cluster '{section.name}' {kind} failed: {e}")
+            section.status = "error"
+            section.error = type(e).__name__
+            continue
+        section.status = "ok"
+        if kind == JOBS:
+            section.jobs = [CronJob.model_validate(job) for job in workloads]
+        else:
+            section.pods = [Pod.model_validate(pod) for pod in workloads]
+    return result
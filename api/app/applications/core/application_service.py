@@ -1,5 +1,5 @@
 from uuid import uuid4, UUID
-from typing import List
+from typing import List, Optional
 from sqlalchemy.orm import Session
 
 from app.applications.infra.application_repository import ApplicationRepository
@@ -37,14 +37,13 @@ class ApplicationService:
         validate_application_name_uniqueness(self.repository, dto.name)
 
         application = self._build_application_entity(dto)
-        return self.repository.create(application)
+        with self.repository.unit_of_work():
+            return self.repository.create(application)
 
     def update_application(self, uuid: UUID, dto: ApplicationUpdate) -> Application:
         """Update an existing application."""
         validate_application_update_dto(dto)
-        validate_application_exists(self.repository, uuid)
-
-        application = self.repository.find_by_uuid(uuid)
+        application = validate_application_exists(self.repository, uuid)
 
         if dto.name is not None:
             validate_application_name_uniqueness(
@@ -58,22 +57,22 @@ class ApplicationService:
         if dto.enabled is not None:
             application.enabled = dto.enabled
 
-        return self.repository.update(application)
+        with self.repository.unit_of_work():
+            return self.repository.update(application)
 
     def get_application(self, uuid: UUID) -> Application:
         """Get application by UUID."""
-        validate_application_exists(self.repository, uuid)
-        return self.repository.find_by_uuid(uuid)
+        return validate_application_exists(self.repository, uuid)
 
-    def get_applications(self, skip: int = 0, limit: int = 100) -> List[Application]:
+    def get_applications(
+        self, skip: int = 0, limit: int = 100, cursor: Optional[str] = None
+    ) -> List[Application]:
         """Get all applications."""
-        return self.repository.find_all(skip=skip, limit=limit)
+        return self.repository.find_all(skip=skip, limit=limit, cursor=cursor)
 
     def delete_application(self, uuid: UUID, database_session: Session) -> dict:
         """Delete an application and all its instances."""
-        validate_application_exists(self.repository, uuid)
-
-        application = self.repository.find_by_uuid(uuid)
+        application = validate_application_exists(self.repository, uuid)
         instances = application.instances
 
         # Delete all instances
@@ -84,30 +83,30 @@ class ApplicationService:
                 instance_repository, database_session
             )
 
-        for instance in instances:
+        # Instances and the application go in one transaction: a failure part
+        # way through leaves everything in place instead of a partial delete.
+        with self.repository.unit_of_work():
+            for instance in instances:
+                try:
+                    self.instance_service.delete_instance(
+                        instance.uuid, database_session
+                    )
+                except Exception as e:
+                    error_msg = str(e)
+                    # Log the full error for debugging
+                    print(f"Error deleting instance '{instance.uuid}': {error_msg}")
+                    raise Exception(
+                        f"Failed to delete instance '{instance.uuid}': {error_msg}"
+                    )
+
+            # Delete application
             try:
-                self.instance_service.delete_instance(instance.uuid, database_session)
-                # Commit after each instance deletion to ensure consistency
-                database_session.commit()
+                self.repository.delete_by_id(application.id)
             except Exception as e:
-                database_session.rollback()
                 error_msg = str(e)
                 # Log the full error for debugging
-                print(f"Error deleting instance '{instance.uuid}': {error_msg}")
-                raise Exception(
-                    f"Failed to delete instance '{instance.uuid}': {error_msg}"
-                )
-
-        # Delete application
-        try:
-            self.repository.delete_by_id(application.id)
-            database_session.commit()
-        except Exception as e:
-            database_session.rollback()
-            error_msg = str(e)
-            # Log the full error for debugging
-            print(f"Error deleting application '{uuid}': {error_msg}")
-            raise Exception(f"Failed to delete application: {error_msg}")
+                print(f"Error deleting application '{uuid}': {error_msg}")
+                raise Exception(f"Failed to delete application: {error_msg}")
 
         return {"detail": "Application deleted successfully"}
 
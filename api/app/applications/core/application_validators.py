@@ -2,6 +2,7 @@ from uuid import UUID
 from app.applications.infra.application_repository import ApplicationRepository
 from app.applications.api.application_dto import ApplicationCreate, ApplicationUpdate
 from app.shared.config import is_namespace_protected
+from app.applications.infra.application_model import Application as ApplicationModel
 
 
 class ApplicationNotFoundError(Exception):
@@ -43,14 +44,17 @@ def validate_application_name_uniqueness(
         )
 
 
-def validate_application_exists(repository: ApplicationRepository, uuid: UUID) -> None:
+def validate_application_exists(
+    repository: ApplicationRepository, uuid: UUID
+) -> ApplicationModel:
     """
-    Validate that application exists.
+    Validate that application exists and return it.
     Raises ApplicationNotFoundError if application not found.
     """
     application = repository.find_by_uuid(uuid)
     if not application:
         raise ApplicationNotFoundError(f"Application with UUID '{uuid}' not found")
+    return application
 
 
 def validate_application_name_not_protected(name: str) -> None:
@@ -1,4 +1,12 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, UniqueConstraint
+from sqlalchemy import (
+    Column,
+    Integer,
+    String,
+    Boolean,
+    DateTime,
+    Index,
+    UniqueConstraint,
+)
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from sqlalchemy.dialects.postgresql import UUID
@@ -28,4 +36,8 @@ class Application(Base):
 
     instances = relationship("Instance", back_populates="application")
 
-    __table_args__ = (UniqueConstraint("name", name="uix_application_name"),)
+    __table_args__ = (
+        UniqueConstraint("name", name="uix_application_name"),
+        # Keyset pagination order
+        Index("ix_applications_created_at_id", "created_at", "id"),
+    )
@@ -1,8 +1,18 @@
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session, joinedload, selectinload
 from sqlalchemy import delete
 from uuid import UUID
 from typing import Optional, List
 from app.applications.infra.application_model import Application as ApplicationModel
+from app.instances.infra.instance_model import Instance as InstanceModel
+from app.shared.infra.cluster_instance_model import (
+    ClusterInstance as ClusterInstanceModel,
+)
+from app.webapps.infra.application_component_model import (
+    ApplicationComponent as ApplicationComponentModel,
+)
+from app.shared.database.lookup_cache import cached_lookup
+from app.shared.database.unit_of_work import UnitOfWork
+from app.shared.utils.pagination import paginate
 
 
 class ApplicationRepository:
@@ -13,8 +23,33 @@ class ApplicationRepository:
 
     def find_by_uuid(self, uuid: UUID) -> Optional[ApplicationModel]:
         """Find application by UUID."""
+        return cached_lookup(
+            self.db,
+            ApplicationModel,
+            uuid,
+            lambda: (
+                self.db.query(ApplicationModel)
+                .filter(ApplicationModel.uuid == uuid)
+                .first()
+            ),
+        )
+
+    def find_by_uuid_for_overview(self, uuid: UUID) -> Optional[ApplicationModel]:
+        """
+        Find application by UUID with everything the overview shows.
+
+        Instances (with their environment), components and cluster instances
+        (with their cluster) load in one SELECT ... IN per level.
+        """
+        instances = selectinload(ApplicationModel.instances)
         return (
             self.db.query(ApplicationModel)
+            .options(
+                instances.joinedload(InstanceModel.environment),
+                instances.selectinload(InstanceModel.components)
+                .selectinload(ApplicationComponentModel.instances)
+                .joinedload(ClusterInstanceModel.cluster),
+            )
             .filter(ApplicationModel.uuid == uuid)
             .first()
         )
@@ -51,15 +86,22 @@ class ApplicationRepository:
             .all()
         )
 
-    def find_all(self, skip: int = 0, limit: int = 100) -> List[ApplicationModel]:
-        """Find all applications."""
-        return self.db.query(ApplicationModel).offset(skip).limit(limit).all()
+    def find_all(
+        self, skip: int = 0, limit: int = 100, cursor: Optional[str] = None
+    ) -> List[ApplicationModel]:
+        """Find all applications, ordered by (created_at, id)."""
+        return paginate(
+            self.db.query(ApplicationModel),
+            [ApplicationModel.created_at, ApplicationModel.id],
+            skip=skip,
+            limit=limit,
+            cursor=cursor,
+        )
 
     def create(self, application: ApplicationModel) -> ApplicationModel:
         """Create a new application."""
         self.db.add(application)
-        self.db.commit()
-        self.db.refresh(application)
+        self.db.flush()
         return application
 
     def update(self, application: ApplicationModel) -> ApplicationModel:
@@ -67,21 +109,24 @@ class ApplicationRepository:
         # Ensure created_at is not modified during update
         # Store original created_at to prevent SQLAlchemy from trying to update it
         original_created_at = application.created_at
-        self.db.commit()
+        self.db.flush()
         # Restore created_at in case it was modified
         if (
             hasattr(application, "created_at")
             and application.created_at != original_created_at
         ):
             application.created_at = original_created_at
-        self.db.refresh(application)
         return application
 
     def delete_by_id(self, application_id: int) -> None:
         """Delete application by ID."""
         stmt = delete(ApplicationModel).where(ApplicationModel.id == application_id)
         self.db.execute(stmt)
-        self.db.commit()
+        self.db.flush()
+
+    def unit_of_work(self) -> UnitOfWork:
+        """Open a transaction that commits once, when the block succeeds."""
+        return UnitOfWork(self.db)
 
     def rollback(self) -> None:
         """Rollback current transaction."""
@@ -174,7 +174,8 @@ async def update_profile(
     if profile_data.full_name is not None:
         current_user.full_name = profile_data.full_name
 
-    user_repository.update(current_user)
+    with user_repository.unit_of_work():
+        user_repository.update(current_user)
     return current_user
 
 
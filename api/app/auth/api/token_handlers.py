@@ -5,6 +5,16 @@ from sqlalchemy.orm import Session
 from typing import List, Optional
 
 from app.shared.database.database import get_db
+from app.shared.utils.serialization import (
+    FIELDS_DESCRIPTION,
+    InvalidFieldsError,
+    json_list_response,
+    parse_fields,
+)
+from app.shared.utils.pagination import (
+    CURSOR_DESCRIPTION,
+    InvalidCursorError,
+)
 from app.users.infra.user_model import User, UserRole
 from app.shared.dependencies.auth import require_role
 from app.auth.infra.token_repository import TokenRepository
@@ -39,12 +49,19 @@ def get_token_service(
 async def list_tokens(
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description=CURSOR_DESCRIPTION),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
     search: Optional[str] = Query(None),
     service: TokenService = Depends(get_token_service),
     current_user: User = Depends(require_role([UserRole.ADMIN])),
 ):
     """Lista todos os tokens (apenas admin)"""
-    return service.list_tokens(skip=skip, limit=limit, search=search)
+    try:
+        include = parse_fields(TokenResponse, fields)
+        page = service.list_tokens(skip=skip, limit=limit, search=search, cursor=cursor)
+    except (InvalidCursorError, InvalidFieldsError) as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return json_list_response(TokenResponse, page, fields=include)
 
 
 @router.get("/{token_uuid}", response_model=TokenResponse)
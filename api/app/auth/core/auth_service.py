@@ -142,6 +142,7 @@ class AuthService:
         tokens = self.token_repository.find_active_tokens()
         for token in tokens:
             if self.verify_token_hash(plain_token, token.token_hash):
-                self.token_repository.update_last_used(token)
+                with self.token_repository.unit_of_work():
+                    self.token_repository.update_last_used(token)
                 return token
         return None
@@ -13,6 +13,7 @@ from app.auth.api.token_dto import (
 )
 from app.auth.core.token_validators import validate_token_exists
 from app.auth.core.auth_service import AuthService
+from app.shared.utils.serialization import validate_page
 
 
 class TokenService:
@@ -23,16 +24,21 @@ class TokenService:
         self.db = database_session
 
     def list_tokens(
-        self, skip: int = 0, limit: int = 100, search: Optional[str] = None
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        search: Optional[str] = None,
+        cursor: Optional[str] = None,
     ) -> List[TokenResponse]:
         """List all tokens with optional search."""
-        tokens = self.repository.find_all(skip=skip, limit=limit, search=search)
-        return [self._serialize_token(t) for t in tokens]
+        tokens = self.repository.find_all(
+            skip=skip, limit=limit, search=search, cursor=cursor
+        )
+        return validate_page(TokenResponse, tokens)
 
     def get_token(self, token_uuid: str) -> TokenResponse:
         """Get token by UUID."""
-        validate_token_exists(self.repository, token_uuid)
-        token = self.repository.find_by_uuid(token_uuid)
+        token = validate_token_exists(self.repository, token_uuid)
         return self._serialize_token(token)
 
     def create_token(
@@ -45,7 +51,8 @@ class TokenService:
 
         # Create token in database
         token = self._build_token_entity(dto, token_hash, user_id)
-        token = self.repository.create(token)
+        with self.repository.unit_of_work():
+            token = self.repository.create(token)
 
         # Return response with plain text token (only appears on creation)
         return TokenCreateResponse(
@@ -59,19 +66,19 @@ class TokenService:
 
     def update_token(self, token_uuid: str, dto: TokenUpdate) -> TokenResponse:
         """Update an existing token."""
-        validate_token_exists(self.repository, token_uuid)
-        token = self.repository.find_by_uuid(token_uuid)
+        token = validate_token_exists(self.repository, token_uuid)
 
         self._update_token_fields(token, dto)
-        self.repository.update(token)
+        with self.repository.unit_of_work():
+            self.repository.update(token)
 
         return self._serialize_token(token)
 
     def delete_token(self, token_uuid: str) -> dict:
         """Delete a token."""
-        validate_token_exists(self.repository, token_uuid)
-        token = self.repository.find_by_uuid(token_uuid)
-        self.repository.delete(token)
+        token = validate_token_exists(self.repository, token_uuid)
+        with self.repository.unit_of_work():
+            self.repository.delete(token)
         return {"detail": "Token deleted successfully"}
 
     def _build_token_entity(
@@ -1,6 +1,7 @@
 """Validation logic for tokens."""
 
 from app.auth.infra.token_repository import TokenRepository
+from app.auth.infra.token_model import Token as TokenModel
 
 
 class TokenNotFoundError(Exception):
@@ -9,8 +10,9 @@ class TokenNotFoundError(Exception):
     pass
 
 
-def validate_token_exists(repository: TokenRepository, token_uuid: str) -> None:
-    """Validate that token exists."""
+def validate_token_exists(repository: TokenRepository, token_uuid: str) -> TokenModel:
+    """Validate that token exists and return it."""
     token = repository.find_by_uuid(token_uuid)
     if not token:
         raise TokenNotFoundError(f"Token with UUID {token_uuid} not found")
+    return token
@@ -2,7 +2,10 @@ from sqlalchemy.orm import Session
 from typing import Optional, List
 from uuid import UUID
 from app.auth.infra.token_model import Token as TokenModel
+from app.shared.database.lookup_cache import cached_lookup
+from app.shared.database.unit_of_work import UnitOfWork
 from datetime import datetime, timezone
+from app.shared.utils.pagination import paginate
 
 
 class TokenRepository:
@@ -12,7 +15,11 @@ class TokenRepository:
         self.db = database_session
 
     def find_all(
-        self, skip: int = 0, limit: int = 100, search: Optional[str] = None
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        search: Optional[str] = None,
+        cursor: Optional[str] = None,
     ) -> List[TokenModel]:
         """Find all tokens with optional search."""
         query = self.db.query(TokenModel)
@@ -21,16 +28,26 @@ class TokenRepository:
             search_term = f"%{search}%"
             query = query.filter(TokenModel.name.ilike(search_term))
 
-        return (
-            query.order_by(TokenModel.created_at.desc()).offset(skip).limit(limit).all()
+        return paginate(
+            query,
+            [TokenModel.created_at, TokenModel.id],
+            skip=skip,
+            limit=limit,
+            cursor=cursor,
+            descending=True,
         )
 
     def find_by_uuid(self, token_uuid: str) -> Optional[TokenModel]:
         """Find token by UUID."""
-        return (
-            self.db.query(TokenModel)
-            .filter(TokenModel.uuid == UUID(token_uuid))
-            .first()
+        return cached_lookup(
+            self.db,
+            TokenModel,
+            token_uuid,
+            lambda: (
+                self.db.query(TokenModel)
+                .filter(TokenModel.uuid == UUID(token_uuid))
+                .first()
+            ),
         )
 
     def find_active_tokens(self) -> List[TokenModel]:
@@ -40,22 +57,24 @@ class TokenRepository:
     def create(self, token: TokenModel) -> TokenModel:
         """Create a new token."""
         self.db.add(token)
-        self.db.commit()
-        self.db.refresh(token)
+        self.db.flush()
         return token
 
     def update(self, token: TokenModel) -> TokenModel:
         """Update a token."""
-        self.db.commit()
-        self.db.refresh(token)
+        self.db.flush()
         return token
 
     def delete(self, token: TokenModel) -> None:
         """Delete a token."""
         self.db.delete(token)
-        self.db.commit()
+        self.db.flush()
 
     def update_last_used(self, token: TokenModel) -> None:
         """Update token last_used_at timestamp."""
         token.last_used_at = datetime.now(timezone.utc)
-        self.db.commit()
+        self.db.flush()
+
+    def unit_of_work(self) -> UnitOfWork:
+        """Open a transaction that commits once, when the block succeeds."""
+        return UnitOfWork(self.db)
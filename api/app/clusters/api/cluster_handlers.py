@@ -1,8 +1,14 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.orm import Session
 from uuid import UUID
+from typing import Optional
 
 from app.shared.database.database import get_db
+from app.shared.utils.pagination import (
+    CURSOR_DESCRIPTION,
+    InvalidCursorError,
+    set_next_cursor_header,
+)
 from app.clusters.infra.cluster_repository import ClusterRepository
 from app.clusters.core.cluster_service import ClusterService
 from app.clusters.api.cluster_dto import (
@@ -64,13 +70,20 @@ def update_cluster(
 
 @router.get("/clusters/", response_model=list[ClusterResponseWithValidation])
 def list_clusters(
+    response: Response,
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = Query(None, description=CURSOR_DESCRIPTION),
     service: ClusterService = Depends(get_cluster_service),
     current_user: User = Depends(get_current_user),
 ):
     """List all clusters."""
-    return service.get_clusters(skip=skip, limit=limit)
+    try:
+        page = service.get_clusters(skip=skip, limit=limit, cursor=cursor)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    set_next_cursor_header(response, page)
+    return page
 
 
 @router.get("/clusters/{uuid}", response_model=ClusterCompletedResponse)
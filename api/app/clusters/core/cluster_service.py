@@ -1,6 +1,6 @@
 import json
 from uuid import uuid4, UUID
-from typing import List
+from typing import List, Optional
 from fastapi import HTTPException
 
 from app.clusters.infra.cluster_repository import ClusterRepository
@@ -18,8 +18,7 @@ from app.clusters.core.cluster_validators import (
     ClusterConnectionError,
 )
 
-# TODO: Migrate to shared/k8s
-from app.k8s.client import K8sClient
+from app.shared.utils.pagination import map_page
 
 
 def get_gateway_reference_from_cluster(
@@ -54,6 +53,8 @@ def get_gateway_reference_from_cluster(
         }
 
     # Otherwise, try auto-discovery
+    from app.k8s.client import K8sClient
+
     try:
         k8s_client = K8sClient(url=cluster.api_address, token=cluster.token)
         gateway_ref = k8s_client.get_gateway_reference()
@@ -91,28 +92,25 @@ class ClusterService:
     def create_cluster(self, dto: ClusterCreate) -> ClusterResponse:
         """Create a new cluster."""
         validate_cluster_create_dto(dto)
-        validate_environment_exists(self.repository, dto.environment_uuid)
+        environment = validate_environment_exists(self.repository, dto.environment_uuid)
 
         # Validate Kubernetes connection
         self._validate_cluster_connection(dto.api_address, dto.token)
 
-        environment = self.repository.find_environment_by_uuid(dto.environment_uuid)
         cluster = self._build_cluster_entity(dto, environment.id)
 
-        return self.repository.create(cluster)
+        with self.repository.unit_of_work():
+            return self.repository.create(cluster)
 
     def update_cluster(self, uuid: UUID, dto: ClusterCreate) -> ClusterResponse:
         """Update an existing cluster."""
         validate_cluster_create_dto(dto)
-        validate_cluster_exists(self.repository, uuid)
-        validate_environment_exists(self.repository, dto.environment_uuid)
+        cluster = validate_cluster_exists(self.repository, uuid)
+        environment = validate_environment_exists(self.repository, dto.environment_uuid)
 
         # Validate Kubernetes connection
         self._validate_cluster_connection(dto.api_address, dto.token)
 
-        cluster = self.repository.find_by_uuid(uuid)
-        environment = self.repository.find_environment_by_uuid(dto.environment_uuid)
-
         cluster.name = dto.name
         cluster.api_address = dto.api_address
         cluster.token = dto.token
@@ -122,36 +120,33 @@ class ClusterService:
         cluster.public_gateway_name = dto.public_gateway_name or None
         cluster.environment_id = environment.id
 
-        return self.repository.update(cluster)
+        with self.repository.unit_of_work():
+            return self.repository.update(cluster)
 
     def get_cluster(self, uuid: UUID) -> ClusterCompletedResponse:
         """Get cluster by UUID with full details."""
-        validate_cluster_exists(self.repository, uuid)
-
-        cluster = self.repository.find_by_uuid(uuid)
+        cluster = validate_cluster_exists(self.repository, uuid)
         return self._build_cluster_completed_response(cluster)
 
     def get_clusters(
-        self, skip: int = 0, limit: int = 100
+        self, skip: int = 0, limit: int = 100, cursor: Optional[str] = None
     ) -> List[ClusterResponseWithValidation]:
         """Get all clusters with validation details."""
-        clusters = self.repository.find_all(skip=skip, limit=limit)
-        return [
-            self._build_cluster_response_with_validation(cluster)
-            for cluster in clusters
-        ]
+        clusters = self.repository.find_all(skip=skip, limit=limit, cursor=cursor)
+        return map_page(clusters, self._build_cluster_response_with_validation)
 
     def delete_cluster(self, uuid: UUID) -> dict:
         """Delete a cluster."""
-        validate_cluster_exists(self.repository, uuid)
-
-        cluster = self.repository.find_by_uuid(uuid)
-        self.repository.delete(cluster)
+        cluster = validate_cluster_exists(self.repository, uuid)
+        with self.repository.unit_of_work():
+            self.repository.delete(cluster)
 
         return {"detail": "Cluster deleted successfully"}
 
     def _validate_cluster_connection(self, api_address: str, token: str) -> None:
         """Validate Kubernetes cluster connection. Raises ClusterConnectionError if fails."""
+        from app.k8s.client import K8sClient
+
         k8s_client = K8sClient(url=api_address, token=token)
 
         try:
@@ -189,6 +184,8 @@ class ClusterService:
     ) -> ClusterResponseWithValidation:
         """Build cluster response with validation details."""
         # TODO: Migrate Kubernetes client to shared/k8s
+        from app.k8s.client import K8sClient
+
         k8s_client = K8sClient(url=cluster.api_address, token=cluster.token)
         success, connection_message = k8s_client.validate_connection()
 
@@ -227,6 +224,8 @@ class ClusterService:
     ) -> ClusterCompletedResponse:
         """Build complete cluster response with all details."""
         # TODO: Migrate Kubernetes client to shared/k8s
+        from app.k8s.client import K8sClient
+
         k8s_client = K8sClient(url=cluster.api_address, token=cluster.token)
         gateway_api_available = k8s_client.check_api_available(
             "gateway.networking.k8s.io"
@@ -1,5 +1,7 @@
 from uuid import UUID
 from app.clusters.infra.cluster_repository import ClusterRepository
+from app.clusters.infra.cluster_model import Cluster as ClusterModel
+from app.environments.infra.environment_model import Environment as EnvironmentModel
 
 
 class ClusterNotFoundError(Exception):
@@ -35,15 +37,22 @@ def validate_cluster_create_dto(dto) -> None:
         raise ValueError("Environment UUID is required")
 
 
-def validate_cluster_exists(repository: ClusterRepository, uuid: UUID) -> None:
-    """Validate that cluster exists. Raises ClusterNotFoundError if not found."""
+def validate_cluster_exists(repository: ClusterRepository, uuid: UUID) -> ClusterModel:
+    """
+    Validate that cluster exists and return it.
+    Raises ClusterNotFoundError if not found.
+    """
     cluster = repository.find_by_uuid(uuid)
     if not cluster:
         raise ClusterNotFoundError(f"Cluster with UUID '{uuid}' not found")
+    return cluster
 
 
-def validate_environment_exists(repository: ClusterRepository, uuid: UUID) -> None:
-    """Validate that environment exists."""
+def validate_environment_exists(
+    repository: ClusterRepository, uuid: UUID
+) -> EnvironmentModel:
+    """Validate that environment exists and return it."""
     environment = repository.find_environment_by_uuid(uuid)
     if not environment:
         raise EnvironmentNotFoundError(f"Environment with UUID '{uuid}' not found")
+    return environment
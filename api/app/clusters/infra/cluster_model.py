@@ -1,4 +1,12 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, UniqueConstraint
+from sqlalchemy import (
+    Column,
+    Integer,
+    String,
+    DateTime,
+    ForeignKey,
+    Index,
+    UniqueConstraint,
+)
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from app.shared.database.database import Base
@@ -42,4 +50,8 @@ class Cluster(Base):
         DateTime, server_default=func.now(), server_onupdate=func.now(), nullable=False
     )
 
-    __table_args__ = (UniqueConstraint("uuid", name="uix_cluster_uuid"),)
+    __table_args__ = (
+        UniqueConstraint("uuid", name="uix_cluster_uuid"),
+        # Keyset pagination order
+        Index("ix_clusters_created_at_id", "created_at", "id"),
+    )
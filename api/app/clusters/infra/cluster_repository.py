@@ -3,6 +3,9 @@ from uuid import UUID
 from typing import Optional, List
 from app.clusters.infra.cluster_model import Cluster as ClusterModel
 from app.environments.infra.environment_model import Environment as EnvironmentModel
+from app.shared.database.lookup_cache import cached_lookup
+from app.shared.database.unit_of_work import UnitOfWork
+from app.shared.utils.pagination import paginate
 
 
 class ClusterRepository:
@@ -13,7 +16,14 @@ class ClusterRepository:
 
     def find_by_uuid(self, uuid: UUID) -> Optional[ClusterModel]:
         """Find cluster by UUID."""
-        return self.db.query(ClusterModel).filter(ClusterModel.uuid == uuid).first()
+        return cached_lookup(
+            self.db,
+            ClusterModel,
+            uuid,
+            lambda: (
+                self.db.query(ClusterModel).filter(ClusterModel.uuid == uuid).first()
+            ),
+        )
 
     def find_by_name(self, name: str) -> Optional[ClusterModel]:
         """Find cluster by name."""
@@ -27,35 +37,50 @@ class ClusterRepository:
             .first()
         )
 
-    def find_all(self, skip: int = 0, limit: int = 100) -> List[ClusterModel]:
-        """Find all clusters."""
-        return self.db.query(ClusterModel).offset(skip).limit(limit).all()
+    def find_all(
+        self, skip: int = 0, limit: int = 100, cursor: Optional[str] = None
+    ) -> List[ClusterModel]:
+        """Find all clusters, ordered by (created_at, id)."""
+        return paginate(
+            self.db.query(ClusterModel),
+            [ClusterModel.created_at, ClusterModel.id],
+            skip=skip,
+            limit=limit,
+            cursor=cursor,
+        )
 
     def find_environment_by_uuid(self, uuid: UUID) -> Optional[EnvironmentModel]:
         """Find environment by UUID."""
-        return (
-            self.db.query(EnvironmentModel)
-            .filter(EnvironmentModel.uuid == uuid)
-            .first()
+        return cached_lookup(
+            self.db,
+            EnvironmentModel,
+            uuid,
+            lambda: (
+                self.db.query(EnvironmentModel)
+                .filter(EnvironmentModel.uuid == uuid)
+                .first()
+            ),
         )
 
     def create(self, cluster: ClusterModel) -> ClusterModel:
         """Create a new cluster."""
         self.db.add(cluster)
-        self.db.commit()
-        self.db.refresh(cluster)
+        self.db.flush()
         return cluster
 
     def update(self, cluster: ClusterModel) -> ClusterModel:
         """Update an existing cluster."""
-        self.db.commit()
-        self.db.refresh(cluster)
+        self.db.flush()
         return cluster
 
     def delete(self, cluster: ClusterModel) -> None:
         """Delete a cluster."""
         self.db.delete(cluster)
-        self.db.commit()
+        self.db.flush()
+
+    def unit_of_work(self) -> UnitOfWork:
+        """Open a transaction that commits once, when the block succeeds."""
+        return UnitOfWork(self.db)
 
     def rollback(self) -> None:
         """Rollback current transaction."""
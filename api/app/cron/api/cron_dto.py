@@ -4,6 +4,8 @@ from uuid import UUID
 from datetime import datetime
 import shlex
 
+from app.shared.crypto import strip_secrets_from_settings
+
 
 class CronEnvs(BaseModel):
     key: str
@@ -72,20 +74,17 @@ class Cron(CronBase):
     created_at: str
     updated_at: str
 
-    @model_validator(mode="before")
+    @field_validator("created_at", "updated_at", mode="before")
+    @classmethod
+    def convert_datetime_to_string(cls, value: Any) -> Any:
+        if isinstance(value, datetime):
+            return value.isoformat()
+        return value
+
+    @field_validator("settings")
     @classmethod
-    def convert_datetime_to_string(cls, data: Any) -> Any:
-        if isinstance(data, dict):
-            if "created_at" in data and isinstance(data["created_at"], datetime):
-                data["created_at"] = data["created_at"].isoformat()
-            if "updated_at" in data and isinstance(data["updated_at"], datetime):
-                data["updated_at"] = data["updated_at"].isoformat()
-        elif hasattr(data, "__dict__"):
-            if hasattr(data, "created_at") and isinstance(data.created_at, datetime):
-                data.created_at = data.created_at.isoformat()
-            if hasattr(data, "updated_at") and isinstance(data.updated_at, datetime):
-                data.updated_at = data.updated_at.isoformat()
-        return data
+    def strip_secrets(cls, settings: Dict[str, Any] | None) -> Dict[str, Any] | None:
+        return strip_secrets_from_settings(settings)
 
     model_config = ConfigDict(
         from_attributes=True,
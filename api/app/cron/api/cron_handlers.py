@@ -1,8 +1,24 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from sqlalchemy.orm import Session
 from uuid import UUID
+from typing import Optional
 
 from app.shared.database.database import get_db
+from app.shared.utils.serialization import (
+    FIELDS_DESCRIPTION,
+    InvalidFieldsError,
+    json_list_response,
+    parse_fields,
+)
+from app.shared.utils.pagination import (
+    CURSOR_DESCRIPTION,
+    InvalidCursorError,
+)
+from app.shared.database.replica import get_read_db
+from app.shared.utils.settings_filters import (
+    InvalidSettingsFilterError,
+    parse_settings_filters,
+)
 from app.cron.infra.cron_repository import CronRepository
 from app.cron.core.cron_service import CronService
 from app.cron.api.cron_dto import CronCreate, CronUpdate, Cron, CronJob, CronJobLogs
@@ -29,6 +45,14 @@ def get_cron_service(database_session: Session = Depends(get_db)) -> CronService
     return CronService(cron_repository, database_session)
 
 
+def get_cron_read_service(
+    database_session: Session = Depends(get_read_db),
+) -> CronService:
+    """Dependency to get CronService instance bound to a read replica when available."""
+    cron_repository = CronRepository(database_session)
+    return CronService(cron_repository, database_session)
+
+
 @router.post("/", response_model=Cron)
 def create_cron(
     cron: CronCreate,
@@ -46,19 +70,37 @@ def create_cron(
 
 @router.get("/", response_model=list[Cron])
 def list_crons(
+    request: Request,
     skip: int = 0,
     limit: int = 100,
-    service: CronService = Depends(get_cron_service),
+    cursor: Optional[str] = Query(None, description=CURSOR_DESCRIPTION),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+    service: CronService = Depends(get_cron_read_service),
     current_user: User = Depends(get_current_user),
 ):
-    """List all crons."""
-    return service.get_crons(skip=skip, limit=limit)
+    """
+    List all crons.
+
+    Filter on settings with dotted paths, e.g. ?settings.exposure.visibility=public
+    or ?settings.cpu>=2. Secret values are not filterable.
+    """
+    try:
+        include = parse_fields(Cron, fields)
+        page = service.get_crons(
+            skip=skip,
+            limit=limit,
+            cursor=cursor,
+            settings_filters=parse_settings_filters(request.url.query),
+        )
+    except (InvalidCursorError, InvalidSettingsFilterError, InvalidFieldsError) as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return json_list_response(Cron, page, fields=include)
 
 
 @router.get("/{uuid}", response_model=Cron)
 def get_cron(
     uuid: UUID,
-    service: CronService = Depends(get_cron_service),
+    service: CronService = Depends(get_cron_read_service),
     current_user: User = Depends(get_current_user),
 ):
     """Get cron by UUID."""
@@ -1,6 +1,5 @@
 """Kubernetes CronJob operations. Isolated from business logic."""
 
-from app.k8s.client import K8sClient
 from app.clusters.infra.cluster_model import Cluster as ClusterModel
 from typing import List, Dict, Any
 
@@ -9,6 +8,8 @@ def get_cron_jobs_from_cluster(
     cluster: ClusterModel, application_name: str, component_name: str
 ) -> List[Dict[str, Any]]:
     """Get jobs for cron from cluster."""
+    from app.k8s.client import K8sClient
+
     k8s_client = K8sClient(url=cluster.api_address, token=cluster.token)
     label_selector = f"app={component_name}"
     jobs = k8s_client.list_jobs(
@@ -30,6 +31,8 @@ def get_cron_job_logs_from_cluster(
     tail_lines: int = 100,
 ) -> Dict[str, Any]:
     """Get logs for a cron job from cluster."""
+    from app.k8s.client import K8sClient
+
     k8s_client = K8sClient(url=cluster.api_address, token=cluster.token)
 
     # Find pods for the job
@@ -61,5 +64,7 @@ def delete_cron_job_from_cluster(
     cluster: ClusterModel, application_name: str, job_name: str
 ) -> None:
     """Delete a cron job from cluster."""
+    from app.k8s.client import K8sClient
+
     k8s_client = K8sClient(url=cluster.api_address, token=cluster.token)
     k8s_client.delete_job(namespace=application_name, job_name=job_name)
@@ -1,7 +1,7 @@
 """Business logic for crons. Broken into small, focused functions."""
 
 from uuid import UUID
-from typing import List
+from typing import List, Optional
 from sqlalchemy.orm import Session
 
 from app.cron.infra.cron_repository import CronRepository
@@ -38,9 +38,10 @@ from app.shared.core.application_component_helpers import (
 )
 from app.shared.crypto import (
     encrypt_secrets_in_settings,
-    strip_secrets_from_settings,
     merge_secrets_for_update,
 )
+from app.shared.utils.serialization import validate_page
+from app.shared.utils.settings_filters import SettingsFilter
 
 
 class CronService:
@@ -53,9 +54,7 @@ class CronService:
     def create_cron(self, dto: CronCreate) -> Cron:
         """Create a new cron."""
         validate_cron_create_dto(dto)
-        validate_instance_exists(self.repository, dto.instance_uuid)
-
-        instance = self.repository.find_instance_by_uuid(dto.instance_uuid)
+        instance = validate_instance_exists(self.repository, dto.instance_uuid)
         cluster = get_cluster_for_instance(self.db, instance)
 
         settings_dict = ensure_private_exposure_settings(dto.settings.model_dump())
@@ -63,83 +62,88 @@ class CronService:
         settings_dict = encrypt_secrets_in_settings(settings_dict)
 
         cron = self._build_cron_entity(dto, instance.id, settings_dict)
-        cron = self.repository.create(cron)
+        with self.repository.unit_of_work():
+            cron = self.repository.create(cron)
 
-        cluster_instance = ensure_cluster_instance(self.repository, cron, cluster)
-        self._deploy_to_kubernetes(
-            cron, instance.environment_id, cluster, cluster_instance
-        )
+            cluster_instance = ensure_cluster_instance(self.repository, cron, cluster)
+            self._deploy_to_kubernetes(
+                cron, instance.environment_id, cluster, cluster_instance
+            )
 
         return self._serialize_cron(cron)
 
     def update_cron(self, uuid: UUID, dto: CronUpdate) -> Cron:
         """Update an existing cron."""
         validate_cron_update_dto(dto)
-        validate_cron_exists(self.repository, uuid)
-
-        cron = self.repository.find_by_uuid(uuid)
+        cron = validate_cron_exists(self.repository, uuid, load_relations=True)
         validate_cron_type(cron)
 
         # Check if there are any changes that require Kubernetes update
         has_changes = dto.settings is not None or dto.enabled is not None
 
-        enabled_changed = self._update_cron_fields(cron, dto)
-        cluster_instance = get_or_create_cluster_instance(
-            self.repository, self.db, cron
-        )
-        cluster = cluster_instance.cluster
-
-        if enabled_changed["changed"]:
-            # Handle enabled status change
-            handle_enabled_change(
-                cron,
-                enabled_changed,
-                cluster,
-                cluster_instance,
-                lambda c, cl: self._delete_from_kubernetes_safe(c, cl),
-                lambda c, eid, cl, ci: self._deploy_to_kubernetes(c, eid, cl, ci),
-            )
-        elif cron.enabled and has_changes:
-            # If cron is enabled and there are changes, always redeploy to apply new configs
-            self._deploy_to_kubernetes(
-                cron, cron.instance.environment_id, cluster, cluster_instance
+        with self.repository.unit_of_work():
+            enabled_changed = self._update_cron_fields(cron, dto)
+            cluster_instance = get_or_create_cluster_instance(
+                self.repository, self.db, cron
             )
+            cluster = cluster_instance.cluster
+
+            if enabled_changed["changed"]:
+                # Handle enabled status change
+                handle_enabled_change(
+                    cron,
+                    enabled_changed,
+                    cluster,
+                    cluster_instance,
+                    lambda c, cl: self._delete_from_kubernetes_safe(c, cl),
+                    lambda c, eid, cl, ci: self._deploy_to_kubernetes(c, eid, cl, ci),
+                )
+            elif cron.enabled and has_changes:
+                # If cron is enabled and there are changes, always redeploy to apply new configs
+                self._deploy_to_kubernetes(
+                    cron, cron.instance.environment_id, cluster, cluster_instance
+                )
 
         return self._serialize_cron(cron)
 
     def get_cron(self, uuid: UUID) -> Cron:
         """Get cron by UUID."""
-        validate_cron_exists(self.repository, uuid)
-        cron = self.repository.find_by_uuid(uuid)
+        cron = validate_cron_exists(self.repository, uuid)
         validate_cron_type(cron)
         return self._serialize_cron(cron)
 
     def get_cron_raw(self, uuid: UUID):
         """Get raw cron model by UUID (for admin operations like decrypting secrets)."""
-        validate_cron_exists(self.repository, uuid)
-        cron = self.repository.find_by_uuid(uuid)
+        cron = validate_cron_exists(self.repository, uuid)
         validate_cron_type(cron)
         return cron
 
-    def get_crons(self, skip: int = 0, limit: int = 100) -> List[Cron]:
-        """Get all crons."""
-        crons = self.repository.find_all(skip=skip, limit=limit)
-        return [self._serialize_cron(c) for c in crons]
+    def get_crons(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        settings_filters: Optional[List[SettingsFilter]] = None,
+    ) -> List[Cron]:
+        """Get all crons. The result carries next_cursor for keyset pagination."""
+        crons = self.repository.find_all(
+            skip=skip, limit=limit, cursor=cursor, settings_filters=settings_filters
+        )
+        return validate_page(Cron, crons)
 
     def delete_cron(self, uuid: UUID) -> dict:
         """Delete a cron."""
-        validate_cron_exists(self.repository, uuid)
-
-        cron = self.repository.find_by_uuid(uuid, load_relations=True)
+        cron = validate_cron_exists(self.repository, uuid, load_relations=True)
         validate_cron_type(cron)
 
-        return delete_component(
-            cron,
-            self.repository,
-            self.db,
-            lambda c, cl: self._delete_from_kubernetes_safe(c, cl),
-            "cron",
-        )
+        with self.repository.unit_of_work():
+            return delete_component(
+                cron,
+                self.repository,
+                self.db,
+                lambda c, cl: self._delete_from_kubernetes_safe(c, cl),
+                "cron",
+            )
 
     def _build_cron_entity(
         self, dto: CronCreate, instance_id: int, settings_dict: dict
@@ -208,8 +212,5 @@ class CronService:
         )
 
     def _serialize_cron(self, cron: ApplicationComponentModel) -> Cron:
-        """Serialize cron to DTO with secrets stripped."""
-        # Strip secret values before returning to API
-        if cron.settings:
-            cron.settings = strip_secrets_from_settings(cron.settings)
+        """Serialize cron to DTO. The DTO strips secret values."""
         return Cron.model_validate(cron)
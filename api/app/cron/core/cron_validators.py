@@ -7,6 +7,10 @@ from app.shared.utils.validators import (
     InvalidEnvVarError,
     InvalidSecretError,
 )
+from app.cron.infra.application_component_model import (
+    ApplicationComponent as ApplicationComponentModel,
+)
+from app.instances.infra.instance_model import Instance as InstanceModel
 
 # Re-export for backward compatibility
 __all__ = [
@@ -74,11 +78,17 @@ def validate_cron_update_dto(dto: CronUpdate) -> None:
             raise ValueError("Cron schedule cannot be empty")
 
 
-def validate_cron_exists(repository: CronRepository, uuid: UUID) -> None:
-    """Validate that cron exists. Raises CronNotFoundError if not found."""
-    cron = repository.find_by_uuid(uuid)
+def validate_cron_exists(
+    repository: CronRepository, uuid: UUID, load_relations: bool = False
+) -> ApplicationComponentModel:
+    """
+    Validate that cron exists and return it.
+    Raises CronNotFoundError if not found.
+    """
+    cron = repository.find_by_uuid(uuid, load_relations=load_relations)
     if not cron:
         raise CronNotFoundError(f"Cron with UUID '{uuid}' not found")
+    return cron
 
 
 def validate_cron_type(cron) -> None:
@@ -89,8 +99,9 @@ def validate_cron_type(cron) -> None:
         raise CronNotCronTypeError("Component is not a cron")
 
 
-def validate_instance_exists(repository: CronRepository, uuid: UUID) -> None:
-    """Validate that instance exists."""
+def validate_instance_exists(repository: CronRepository, uuid: UUID) -> InstanceModel:
+    """Validate that instance exists and return it."""
     instance = repository.find_instance_by_uuid(uuid)
     if not instance:
         raise InstanceNotFoundError(f"Instance with UUID '{uuid}' not found")
+    return instance
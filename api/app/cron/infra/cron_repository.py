@@ -1,4 +1,4 @@
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session
 from uuid import UUID
 from typing import Optional, List
 from app.cron.infra.application_component_model import (
@@ -6,10 +6,21 @@ from app.cron.infra.application_component_model import (
     WebappType,
 )
 from app.instances.infra.instance_model import Instance as InstanceModel
+from app.shared.database.lookup_cache import cached_lookup
+from app.shared.database.unit_of_work import UnitOfWork
 from app.shared.infra.cluster_instance_model import (
     ClusterInstance as ClusterInstanceModel,
 )
+from app.shared.infra.deploy_context import (
+    component_deploy_context,
+    instance_deploy_context,
+)
 from app.settings.infra.settings_model import Settings as SettingsModel
+from app.shared.utils.pagination import paginate
+from app.shared.utils.settings_filters import (
+    SettingsFilter,
+    apply_settings_filters,
+)
 
 
 class CronRepository:
@@ -21,40 +32,62 @@ class CronRepository:
     def find_by_uuid(
         self, uuid: UUID, load_relations: bool = False
     ) -> Optional[ApplicationComponentModel]:
-        """Find cron by UUID."""
+        """
+        Find cron by UUID.
+
+        load_relations loads everything a deploy or delete reads: instance,
+        application, environment and its settings, cluster instance and cluster.
+        """
         query = self.db.query(ApplicationComponentModel).filter(
             ApplicationComponentModel.uuid == uuid,
             ApplicationComponentModel.type == WebappType.cron,
         )
         if load_relations:
-            query = query.options(
-                joinedload(ApplicationComponentModel.instance).joinedload(
-                    InstanceModel.application
-                ),
-                joinedload(ApplicationComponentModel.instance).joinedload(
-                    InstanceModel.environment
-                ),
-                joinedload(ApplicationComponentModel.instances).joinedload(
-                    ClusterInstanceModel.cluster
-                ),
-            )
-        return query.first()
+            query = query.options(*component_deploy_context())
+        return cached_lookup(
+            self.db,
+            ApplicationComponentModel,
+            uuid,
+            query.first,
+            options=(WebappType.cron, load_relations),
+        )
 
     def find_all(
-        self, skip: int = 0, limit: int = 100
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        settings_filters: Optional[List[SettingsFilter]] = None,
     ) -> List[ApplicationComponentModel]:
-        """Find all crons."""
-        return (
-            self.db.query(ApplicationComponentModel)
-            .filter(ApplicationComponentModel.type == WebappType.cron)
-            .offset(skip)
-            .limit(limit)
-            .all()
+        """Find all crons, ordered by (created_at, id), optionally filtered on settings."""
+        query = self.db.query(ApplicationComponentModel).filter(
+            ApplicationComponentModel.type == WebappType.cron
+        )
+        query = apply_settings_filters(
+            query, ApplicationComponentModel.settings, settings_filters
+        )
+        return paginate(
+            query,
+            [ApplicationComponentModel.created_at, ApplicationComponentModel.id],
+            skip=skip,
+            limit=limit,
+            cursor=cursor,
         )
 
     def find_instance_by_uuid(self, uuid: UUID) -> Optional[InstanceModel]:
-        """Find instance by UUID."""
-        return self.db.query(InstanceModel).filter(InstanceModel.uuid == uuid).first()
+        """Find instance by UUID, with what deploying a new component reads."""
+        return cached_lookup(
+            self.db,
+            InstanceModel,
+            uuid,
+            lambda: (
+                self.db.query(InstanceModel)
+                .options(*instance_deploy_context(load_components=False))
+                .filter(InstanceModel.uuid == uuid)
+                .first()
+            ),
+            options=("deploy_context",),
+        )
 
     def find_cluster_instance_by_component_id(
         self, component_id: int
@@ -80,20 +113,16 @@ class CronRepository:
         """Create a new cron."""
         self.db.add(cron)
         try:
-            self.db.commit()
-            self.db.refresh(cron)
+            self.db.flush()
         except Exception as e:
-            self.db.rollback()
             raise Exception(f"Failed to create cron: {str(e)}")
         return cron
 
     def update(self, cron: ApplicationComponentModel) -> ApplicationComponentModel:
         """Update an existing cron."""
         try:
-            self.db.commit()
-            self.db.refresh(cron)
+            self.db.flush()
         except Exception as e:
-            self.db.rollback()
             raise Exception(f"Failed to update cron: {str(e)}")
         return cron
 
@@ -101,9 +130,8 @@ class CronRepository:
         """Delete a cron."""
         self.db.delete(cron)
         try:
-            self.db.commit()
+            self.db.flush()
         except Exception as e:
-            self.db.rollback()
             raise Exception(f"Failed to delete cron: {str(e)}")
 
     def create_cluster_instance(
@@ -117,6 +145,10 @@ class CronRepository:
         """Delete a cluster instance."""
         self.db.delete(cluster_instance)
 
+    def unit_of_work(self) -> UnitOfWork:
+        """Open a transaction that commits once, when the block succeeds."""
+        return UnitOfWork(self.db)
+
     def rollback(self) -> None:
         """Rollback current transaction."""
         self.db.rollback()
@@ -1,7 +1,8 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request, Response
 from sqlalchemy.orm import Session
 
 from app.shared.database.database import get_db
+from app.shared.utils.etag import etag_matches
 from app.dashboard.infra.dashboard_repository import DashboardRepository
 from app.dashboard.core.dashboard_service import DashboardService
 from app.dashboard.api.dashboard_dto import DashboardOverview
@@ -15,17 +16,33 @@ router = APIRouter(prefix="/dashboard", tags=["dashboard"])
 def get_dashboard_service(
     database_session: Session = Depends(get_db),
 ) -> DashboardService:
-    """Dependency to get DashboardService instance."""
+    """
+    Dependency to get DashboardService instance.
+
+    Bound to the primary, not a replica: snapshots are cached process-wide
+    until the next commit invalidates them, so one built from a lagging
+    replica would serve the pre-write numbers for the whole TTL.
+    """
     dashboard_repository = DashboardRepository(database_session)
     return DashboardService(dashboard_repository)
 
 
 @router.get("/", response_model=DashboardOverview)
 def get_dashboard_overview(
+    request: Request,
+    response: Response,
     service: DashboardService = Depends(get_dashboard_service),
     current_user: User = Depends(get_current_user),
 ):
     """
     Get dashboard overview with statistics about applications, instances, components, clusters, and environments.
+
+    Responses carry an ETag; polling clients should send it back in If-None-Match
+    and get a 304 while the numbers are unchanged.
     """
-    return service.get_dashboard_overview()
+    snapshot = service.get_dashboard_snapshot()
+    headers = {"ETag": snapshot.etag, "Cache-Control": "private, no-cache"}
+    if etag_matches(request, snapshot.etag):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return snapshot.overview
@@ -0,0 +1,104 @@
+"""
+Cached dashboard snapshots.
+
+The overview is computed at most once per DASHBOARD_CACHE_TTL_SECONDS (default 10)
+per process and dropped as soon as a session commits a change to applications,
+instances, components, clusters or environments. Invalidation is local to the
+process; the TTL bounds how stale other workers can be. Set the TTL to 0 to
+disable caching.
+"""
+
+import os
+import threading
+import time
+from typing import NamedTuple, Optional
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.dashboard.api.dashboard_dto import DashboardOverview
+from app.applications.infra.application_model import Application
+from app.instances.infra.instance_model import Instance
+from app.webapps.infra.application_component_model import ApplicationComponent
+from app.clusters.infra.cluster_model import Cluster
+from app.environments.infra.environment_model import Environment
+from app.shared.infra.cluster_instance_model import ClusterInstance
+
+# Models whose changes alter the dashboard numbers
+TRACKED_MODELS = (
+    Application,
+    Instance,
+    ApplicationComponent,
+    Cluster,
+    ClusterInstance,
+    Environment,
+)
+
+_PENDING_INVALIDATION = "dashboard_cache_invalidate"
+
+
+class DashboardSnapshot(NamedTuple):
+    overview: DashboardOverview
+    etag: str
+
+
+class DashboardCache:
+    """Thread-safe single-entry TTL cache for the dashboard snapshot."""
+
+    def __init__(self, ttl_seconds: float):
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._snapshot: Optional[DashboardSnapshot] = None
+        self._expires_at = 0.0
+        self._generation = 0
+
+    @property
+    def generation(self) -> int:
+        """Incremented on every invalidation; pass it back to set()."""
+        return self._generation
+
+    def get(self) -> Optional[DashboardSnapshot]:
+        with self._lock:
+            if self._snapshot is None or time.monotonic() >= self._expires_at:
+                return None
+            return self._snapshot
+
+    def set(self, snapshot: DashboardSnapshot, generation: int) -> None:
+        """Store a snapshot, unless it was invalidated while being computed."""
+        if self.ttl_seconds <= 0:
+            return
+        with self._lock:
+            if generation != self._generation:
+                return
+            self._snapshot = snapshot
+            self._expires_at = time.monotonic() + self.ttl_seconds
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._snapshot = None
+            self._generation += 1
+
+
+dashboard_cache = DashboardCache(float(os.getenv("DASHBOARD_CACHE_TTL_SECONDS", "10")))
+
+
+@event.listens_for(Session, "after_flush")
+def _track_dashboard_changes(session, flush_context):
+    """Remember that the transaction touched a model shown on the dashboard."""
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(obj, TRACKED_MODELS):
+            session.info[_PENDING_INVALIDATION] = True
+            return
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_after_commit(session):
+    # Invalidate on commit, not flush, so a concurrent request can't re-cache
+    # numbers that don't include the change yet
+    if session.info.pop(_PENDING_INVALIDATION, False):
+        dashboard_cache.invalidate()
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending_invalidation(session):
+    session.info.pop(_PENDING_INVALIDATION, None)
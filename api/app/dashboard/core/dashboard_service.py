@@ -1,51 +1,67 @@
+from typing import Optional
+
 from app.dashboard.infra.dashboard_repository import DashboardRepository
 from app.dashboard.api.dashboard_dto import DashboardOverview, ComponentStats
+from app.dashboard.core.dashboard_cache import (
+    DashboardCache,
+    DashboardSnapshot,
+    dashboard_cache,
+)
+from app.shared.utils.etag import make_etag
 
 
 class DashboardService:
     """Business logic for dashboard. No direct database access."""
 
-    def __init__(self, repository: DashboardRepository):
+    def __init__(
+        self, repository: DashboardRepository, cache: Optional[DashboardCache] = None
+    ):
         self.repository = repository
+        self.cache = cache if cache is not None else dashboard_cache
 
     def get_dashboard_overview(self) -> DashboardOverview:
         """Get dashboard overview with statistics."""
-        applications_count = self.repository.count_applications()
-        instances_count = self.repository.count_instances()
+        return self.get_dashboard_snapshot().overview
+
+    def get_dashboard_snapshot(self) -> DashboardSnapshot:
+        """Get the dashboard overview and its ETag, from the cache when fresh."""
+        snapshot = self.cache.get()
+        if snapshot is not None:
+            return snapshot
 
-        total_components = self.repository.count_total_components()
-        webapp_count = self.repository.count_components_by_type("webapp")
-        worker_count = self.repository.count_components_by_type("worker")
-        cron_count = self.repository.count_components_by_type("cron")
-        enabled_components = self.repository.count_enabled_components()
-        disabled_components = self.repository.count_disabled_components()
+        generation = self.cache.generation
+        overview = self._build_overview()
+        snapshot = DashboardSnapshot(
+            overview=overview,
+            etag=make_etag(overview.model_dump_json().encode()),
+        )
+        self.cache.set(snapshot, generation)
+        return snapshot
 
-        clusters_count = self.repository.count_clusters()
-        environments_count = self.repository.count_environments()
+    def _build_overview(self) -> DashboardOverview:
+        totals = self.repository.get_totals()
 
         components_by_environment = {}
-        environment_components = self.repository.get_components_by_environment()
-        for env_name, count in environment_components:
-            components_by_environment[env_name] = count
-
         components_by_cluster = {}
-        cluster_components = self.repository.get_components_by_cluster()
-        for cluster_name, count in cluster_components:
-            components_by_cluster[cluster_name] = count
+        for dimension, name, count in self.repository.get_component_breakdown():
+            if dimension == "environment":
+                components_by_environment[name] = count
+            else:
+                components_by_cluster[name] = count
 
         return DashboardOverview(
-            applications=applications_count,
-            instances=instances_count,
+            applications=totals["applications"],
+            instances=totals["instances"],
             components=ComponentStats(
-                total=total_components,
-                webapp=webapp_count,
-                worker=worker_count,
-                cron=cron_count,
-                enabled=enabled_components,
-                disabled=disabled_components,
+                total=totals["total"],
+                webapp=totals["webapp"],
+                worker=totals["worker"],
+                cron=totals["cron"],
+                enabled=totals["enabled"],
+                disabled=totals["disabled"],
             ),
-            clusters=clusters_count,
-            environments=environments_count,
+            clusters=totals["clusters"],
+            environments=totals["environments"],
             components_by_environment=components_by_environment,
             components_by_cluster=components_by_cluster,
         )
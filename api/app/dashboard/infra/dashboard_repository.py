@@ -1,9 +1,10 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import func, literal, select, union_all
 from app.applications.infra.application_model import Application as ApplicationModel
 from app.instances.infra.instance_model import Instance as InstanceModel
 from app.webapps.infra.application_component_model import (
     ApplicationComponent as ApplicationComponentModel,
+    WebappType,
 )
 from app.clusters.infra.cluster_model import Cluster as ClusterModel
 from app.environments.infra.environment_model import Environment as EnvironmentModel
@@ -18,58 +19,55 @@ class DashboardRepository:
     def __init__(self, database_session: Session):
         self.db = database_session
 
-    def count_applications(self) -> int:
-        """Count total applications."""
-        return self.db.query(func.count(ApplicationModel.id)).scalar() or 0
+    def get_totals(self) -> dict:
+        """
+        Get entity counts and component statistics in a single statement.
 
-    def count_instances(self) -> int:
-        """Count total instances."""
-        return self.db.query(func.count(InstanceModel.id)).scalar() or 0
+        Component statistics are computed in one pass over application_components
+        with COUNT(*) FILTER (...); the other counts are scalar subqueries.
+        """
+        component = ApplicationComponentModel
+        statement = select(
+            select(func.count(ApplicationModel.id))
+            .scalar_subquery()
+            .label("applications"),
+            select(func.count(InstanceModel.id)).scalar_subquery().label("instances"),
+            select(func.count(ClusterModel.id)).scalar_subquery().label("clusters"),
+            select(func.count(EnvironmentModel.id))
+            .scalar_subquery()
+            .label("environments"),
+            func.count(component.id).label("total"),
+            func.count(component.id)
+            .filter(component.type == WebappType.webapp)
+            .label("webapp"),
+            func.count(component.id)
+            .filter(component.type == WebappType.worker)
+            .label("worker"),
+            func.count(component.id)
+            .filter(component.type == WebappType.cron)
+            .label("cron"),
+            func.count(component.id)
+            .filter(component.enabled.is_(True))
+            .label("enabled"),
+            func.count(component.id)
+            .filter(component.enabled.is_(False))
+            .label("disabled"),
+        ).select_from(component)
+        row = self.db.execute(statement).mappings().one()
+        return {key: value or 0 for key, value in row.items()}
 
-    def count_total_components(self) -> int:
-        """Count total components."""
-        return self.db.query(func.count(ApplicationComponentModel.id)).scalar() or 0
+    def get_component_breakdown(self) -> list:
+        """
+        Get component counts grouped by environment and by cluster in one round trip.
 
-    def count_components_by_type(self, component_type: str) -> int:
-        """Count components by type."""
-        return (
-            self.db.query(func.count(ApplicationComponentModel.id))
-            .filter(ApplicationComponentModel.type == component_type)
-            .scalar()
-            or 0
-        )
-
-    def count_enabled_components(self) -> int:
-        """Count enabled components."""
-        return (
-            self.db.query(func.count(ApplicationComponentModel.id))
-            .filter(ApplicationComponentModel.enabled.is_(True))
-            .scalar()
-            or 0
-        )
-
-    def count_disabled_components(self) -> int:
-        """Count disabled components."""
-        return (
-            self.db.query(func.count(ApplicationComponentModel.id))
-            .filter(ApplicationComponentModel.enabled.is_(False))
-            .scalar()
-            or 0
-        )
-
-    def count_clusters(self) -> int:
-        """Count total clusters."""
-        return self.db.query(func.count(ClusterModel.id)).scalar() or 0
-
-    def count_environments(self) -> int:
-        """Count total environments."""
-        return self.db.query(func.count(EnvironmentModel.id)).scalar() or 0
-
-    def get_components_by_environment(self) -> list:
-        """Get components count grouped by environment."""
-        return (
-            self.db.query(
-                EnvironmentModel.name, func.count(ApplicationComponentModel.id)
+        Returns:
+            List of (dimension, name, count) rows, dimension being "environment" or "cluster"
+        """
+        by_environment = (
+            select(
+                literal("environment").label("dimension"),
+                EnvironmentModel.name.label("name"),
+                func.count(ApplicationComponentModel.id).label("count"),
             )
             .join(InstanceModel, InstanceModel.environment_id == EnvironmentModel.id)
             .join(
@@ -77,13 +75,13 @@ class DashboardRepository:
                 ApplicationComponentModel.instance_id == InstanceModel.id,
             )
             .group_by(EnvironmentModel.name)
-            .all()
         )
-
-    def get_components_by_cluster(self) -> list:
-        """Get components count grouped by cluster."""
-        return (
-            self.db.query(ClusterModel.name, func.count(ApplicationComponentModel.id))
+        by_cluster = (
+            select(
+                literal("cluster").label("dimension"),
+                ClusterModel.name.label("name"),
+                func.count(ApplicationComponentModel.id).label("count"),
+            )
             .join(
                 ClusterInstanceModel, ClusterInstanceModel.cluster_id == ClusterModel.id
             )
@@ -93,5 +91,5 @@ class DashboardRepository:
                 == ClusterInstanceModel.application_component_id,
             )
             .group_by(ClusterModel.name)
-            .all()
         )
+        return self.db.execute(union_all(by_environment, by_cluster)).all()
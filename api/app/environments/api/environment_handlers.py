@@ -1,9 +1,15 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 from uuid import UUID
+from typing import Optional
 
 from app.shared.database.database import get_db
+from app.shared.utils.pagination import (
+    CURSOR_DESCRIPTION,
+    InvalidCursorError,
+    set_next_cursor_header,
+)
 from app.environments.infra.environment_repository import EnvironmentRepository
 from app.environments.core.environment_service import EnvironmentService
 from app.environments.api.environment_dto import (
@@ -15,6 +21,7 @@ from app.environments.core.environment_validators import (
     EnvironmentNotFoundError,
     EnvironmentHasComponentsError,
 )
+from app.shared.dependencies.conditional_get import conditional_get
 from app.users.infra.user_model import User, UserRole
 from app.shared.dependencies.auth import require_role, get_current_user
 
@@ -41,7 +48,6 @@ def create_environment(
         return service.create_environment(environment)
     except IntegrityError:
         # Handle unique constraint violations (e.g., duplicate name)
-        service.repository.rollback()
         raise HTTPException(
             status_code=400, detail="Environment with this name already exists"
         )
@@ -63,7 +69,6 @@ def update_environment(
         raise HTTPException(status_code=404, detail=str(e))
     except IntegrityError:
         # Handle unique constraint violations (e.g., duplicate name)
-        service.repository.rollback()
         raise HTTPException(
             status_code=400, detail="Environment with this name already exists"
         )
@@ -73,13 +78,21 @@ def update_environment(
 
 @router.get("/environments/", response_model=list[EnvironmentWithClusters])
 def list_environments(
+    response: Response,
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = Query(None, description=CURSOR_DESCRIPTION),
     service: EnvironmentService = Depends(get_environment_service),
     current_user: User = Depends(get_current_user),
+    etag: str = conditional_get("environments", "clusters", "settings"),
 ):
     """List all environments."""
-    return service.get_environments(skip=skip, limit=limit)
+    try:
+        page = service.get_environments(skip=skip, limit=limit, cursor=cursor)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    set_next_cursor_header(response, page)
+    return page
 
 
 @router.get("/environments/{uuid}", response_model=EnvironmentWithClusters)
@@ -87,6 +100,7 @@ def get_environment(
     uuid: UUID,
     service: EnvironmentService = Depends(get_environment_service),
     current_user: User = Depends(get_current_user),
+    etag: str = conditional_get("environments", "clusters", "settings"),
 ):
     """Get environment by UUID."""
     try:
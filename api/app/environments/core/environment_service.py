@@ -1,5 +1,5 @@
 from uuid import uuid4, UUID
-from typing import List
+from typing import List, Optional
 from app.environments.infra.environment_repository import EnvironmentRepository
 from app.environments.infra.environment_model import Environment as EnvironmentModel
 from app.environments.api.environment_dto import (
@@ -12,6 +12,7 @@ from app.environments.core.environment_validators import (
     validate_environment_exists,
     validate_environment_can_be_deleted,
 )
+from app.shared.utils.pagination import map_page
 
 
 class EnvironmentService:
@@ -25,38 +26,37 @@ class EnvironmentService:
         validate_environment_create_dto(dto)
 
         environment = self._build_environment_entity(dto)
-        return self.repository.create(environment)
+        with self.repository.unit_of_work():
+            return self.repository.create(environment)
 
     def update_environment(self, uuid: UUID, dto: EnvironmentCreate) -> Environment:
         """Update an existing environment."""
         validate_environment_create_dto(dto)
-        validate_environment_exists(self.repository, uuid)
-
-        environment = self.repository.find_by_uuid(uuid)
+        environment = validate_environment_exists(self.repository, uuid)
         environment.name = dto.name
 
-        return self.repository.update(environment)
+        with self.repository.unit_of_work():
+            return self.repository.update(environment)
 
     def get_environment(self, uuid: UUID) -> EnvironmentWithClusters:
         """Get environment by UUID with clusters and settings."""
-        validate_environment_exists(self.repository, uuid)
-
-        environment = self.repository.find_by_uuid(uuid)
+        environment = validate_environment_exists(self.repository, uuid)
         return self._serialize_environment_with_clusters(environment)
 
     def get_environments(
-        self, skip: int = 0, limit: int = 100
+        self, skip: int = 0, limit: int = 100, cursor: Optional[str] = None
     ) -> List[EnvironmentWithClusters]:
         """Get all environments with clusters and settings."""
-        environments = self.repository.find_all(skip=skip, limit=limit)
-        return [self._serialize_environment_with_clusters(env) for env in environments]
+        environments = self.repository.find_all(skip=skip, limit=limit, cursor=cursor)
+        return map_page(environments, self._serialize_environment_with_clusters)
 
     def delete_environment(self, uuid: UUID) -> dict:
         """Delete an environment."""
         validate_environment_can_be_deleted(self.repository, uuid)
 
         environment = self.repository.find_by_uuid(uuid)
-        self.repository.delete(environment)
+        with self.repository.unit_of_work():
+            self.repository.delete(environment)
 
         return {"detail": "Environment deleted successfully"}
 
@@ -1,5 +1,6 @@
 from uuid import UUID
 from app.environments.infra.environment_repository import EnvironmentRepository
+from app.environments.infra.environment_model import Environment as EnvironmentModel
 
 
 class EnvironmentNotFoundError(Exception):
@@ -23,11 +24,17 @@ def validate_environment_create_dto(dto) -> None:
         raise ValueError("Environment name must be at least 1 character long")
 
 
-def validate_environment_exists(repository: EnvironmentRepository, uuid: UUID) -> None:
-    """Validate that environment exists. Raises EnvironmentNotFoundError if not found."""
+def validate_environment_exists(
+    repository: EnvironmentRepository, uuid: UUID
+) -> EnvironmentModel:
+    """
+    Validate that environment exists and return it.
+    Raises EnvironmentNotFoundError if not found.
+    """
     environment = repository.find_by_uuid(uuid)
     if not environment:
         raise EnvironmentNotFoundError(f"Environment with UUID '{uuid}' not found")
+    return environment
 
 
 def validate_environment_can_be_deleted(
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime
+from sqlalchemy import Column, Integer, String, DateTime, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from app.shared.database.database import Base
@@ -21,3 +21,6 @@ class Environment(Base):
     settings = relationship("Settings", back_populates="environment")
     clusters = relationship("Cluster", back_populates="environment")
     instances = relationship("Instance", back_populates="environment")
+
+    # Keyset pagination order
+    __table_args__ = (Index("ix_environments_created_at_id", "created_at", "id"),)
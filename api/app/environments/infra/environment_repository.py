@@ -2,10 +2,13 @@ from sqlalchemy.orm import Session
 from uuid import UUID
 from typing import Optional, List
 from app.environments.infra.environment_model import Environment as EnvironmentModel
+from app.shared.database.lookup_cache import cached_lookup
+from app.shared.database.unit_of_work import UnitOfWork
 from app.webapps.infra.application_component_model import (
     ApplicationComponent as ApplicationComponentModel,
 )
 from app.instances.infra.instance_model import Instance as InstanceModel
+from app.shared.utils.pagination import paginate
 
 
 class EnvironmentRepository:
@@ -16,10 +19,15 @@ class EnvironmentRepository:
 
     def find_by_uuid(self, uuid: UUID) -> Optional[EnvironmentModel]:
         """Find environment by UUID."""
-        return (
-            self.db.query(EnvironmentModel)
-            .filter(EnvironmentModel.uuid == uuid)
-            .first()
+        return cached_lookup(
+            self.db,
+            EnvironmentModel,
+            uuid,
+            lambda: (
+                self.db.query(EnvironmentModel)
+                .filter(EnvironmentModel.uuid == uuid)
+                .first()
+            ),
         )
 
     def find_by_name(self, name: str) -> Optional[EnvironmentModel]:
@@ -30,9 +38,17 @@ class EnvironmentRepository:
             .first()
         )
 
-    def find_all(self, skip: int = 0, limit: int = 100) -> List[EnvironmentModel]:
-        """Find all environments."""
-        return self.db.query(EnvironmentModel).offset(skip).limit(limit).all()
+    def find_all(
+        self, skip: int = 0, limit: int = 100, cursor: Optional[str] = None
+    ) -> List[EnvironmentModel]:
+        """Find all environments, ordered by (created_at, id)."""
+        return paginate(
+            self.db.query(EnvironmentModel),
+            [EnvironmentModel.created_at, EnvironmentModel.id],
+            skip=skip,
+            limit=limit,
+            cursor=cursor,
+        )
 
     def find_components_by_environment_id(
         self, environment_id: int
@@ -48,20 +64,22 @@ class EnvironmentRepository:
     def create(self, environment: EnvironmentModel) -> EnvironmentModel:
         """Create a new environment."""
         self.db.add(environment)
-        self.db.commit()
-        self.db.refresh(environment)
+        self.db.flush()
         return environment
 
     def update(self, environment: EnvironmentModel) -> EnvironmentModel:
         """Update an existing environment."""
-        self.db.commit()
-        self.db.refresh(environment)
+        self.db.flush()
         return environment
 
     def delete(self, environment: EnvironmentModel) -> None:
         """Delete an environment."""
         self.db.delete(environment)
-        self.db.commit()
+        self.db.flush()
+
+    def unit_of_work(self) -> UnitOfWork:
+        """Open a transaction that commits once, when the block succeeds."""
+        return UnitOfWork(self.db)
 
     def rollback(self) -> None:
         """Rollback current transaction."""
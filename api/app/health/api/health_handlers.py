@@ -0,0 +1,32 @@
+from fastapi import APIRouter, status
+from fastapi.responses import ORJSONResponse
+
+from app.health.core.readiness import get_readiness_monitor
+from app.health.core.warmup import get_warmup
+
+router = APIRouter(tags=["health"])
+
+
+@router.get("/ready", include_in_schema=False)
+async def readiness_check():
+    """
+    Readiness probe: 503 while warming up or when a dependency check fails.
+
+    Unlike /health, which only says the process is alive, load balancers
+    should wait for this one before sending traffic. It reads the results of
+    the background checks and never touches the database itself.
+    """
+    warmup = get_warmup()
+    monitor = get_readiness_monitor()
+    if not warmup.ready:
+        state = "warming"
+    elif monitor.ready():
+        state = "ready"
+    else:
+        state = "unavailable"
+    return ORJSONResponse(
+        {"status": state, **monitor.status(), "warmup": warmup.status()["warmup"]},
+        status_code=status.HTTP_200_OK
+        if state == "ready"
+        else status.HTTP_503_SERVICE_UNAVAILABLE,
+    )
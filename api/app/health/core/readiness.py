@@ -0,0 +1,257 @@
+"""
+Cached dependency checks for /ready.
+
+Probes from kubelets and load balancers arrive every few seconds from every
+source; running checks per probe would put that load on Postgres. Instead a
+background task checks every READINESS_CHECK_INTERVAL_SECONDS (default 5)
+and /ready only reads the latest result:
+
+- database: a `SELECT 1` through the pool
+- pool: saturated when every connection is checked out, or a checkout timed
+  out since the previous check
+- secrets: the secrets key is configured and can encrypt and decrypt
+- clusters: each cluster answers GET /version, only with
+  READINESS_CHECK_CLUSTERS=true. Reported, but never makes the worker
+  unready: an unreachable cluster is not fixed by routing traffic elsewhere.
+  It runs on its own task, so slow clusters can't delay the other checks,
+  and counts clusters that haven't answered within 10 seconds as unreachable.
+
+A result older than READINESS_MAX_AGE_SECONDS (default three intervals)
+counts as failed, so a stuck check task doesn't leave a worker ready forever.
+"""
+
+import asyncio
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional
+
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import sessionmaker
+
+from app.clusters.infra.cluster_repository import ClusterRepository
+from app.shared.crypto import decrypt_secret, encrypt_secret
+from app.shared.database.database import SessionLocal, engine
+from app.shared.database.pool import get_pool_stats
+
+logger = logging.getLogger(__name__)
+
+# Checks that make /ready fail; "clusters" is informational
+REQUIRED_CHECKS = ("database", "pool", "secrets")
+
+CLUSTER_TIMEOUT_SECONDS = 2
+# For the whole cluster check; clusters unanswered by then count as unreachable
+CLUSTER_CHECK_DEADLINE_SECONDS = 10
+MAX_CLUSTERS = 500
+
+
+def check_database(database_engine: Engine) -> Dict[str, Any]:
+    with database_engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+    return {"status": "ok"}
+
+
+def check_pool(
+    database_engine: Engine, previous_timeouts: Optional[int]
+) -> Dict[str, Any]:
+    stats = get_pool_stats(database_engine)
+    result = {"timeouts": stats["timeouts"]}
+    # The counter is per process; the first check only takes a baseline
+    saturated = previous_timeouts is not None and stats["timeouts"] > previous_timeouts
+    if "size" in stats:
+        capacity = stats["size"] + max(stats["max_overflow"], 0)
+        result.update({"checked_out": stats["checked_out"], "capacity": capacity})
+        saturated = saturated or stats["checked_out"] >= capacity
+    result["status"] = "saturated" if saturated else "ok"
+    return result
+
+
+def check_secrets() -> Dict[str, Any]:
+    if decrypt_secret(encrypt_secret("ready")) != "ready":
+        return {"status": "error", "error": "round trip mismatch"}
+    return {"status": "ok"}
+
+
+def cluster_reachable(api_address: str, token: str) -> bool:
+    from kubernetes import client
+
+    from app.k8s.client import K8sClient
+
+    k8s_client = K8sClient(url=api_address, token=token)
+    client.VersionApi(k8s_client.api_client).get_code(
+        _request_timeout=CLUSTER_TIMEOUT_SECONDS
+    )
+    return True
+
+
+def check_clusters(
+    session_factory: sessionmaker,
+    concurrency: int,
+    deadline_seconds: float = CLUSTER_CHECK_DEADLINE_SECONDS,
+) -> Dict[str, Any]:
+    with session_factory() as session:
+        clusters = [
+            (cluster.name, cluster.api_address, cluster.token)
+            for cluster in ClusterRepository(session).find_all(limit=MAX_CLUSTERS)
+        ]
+    reachable = {}
+    if clusters:
+        executor = ThreadPoolExecutor(max_workers=concurrency)
+        futures = {
+            name: executor.submit(cluster_reachable, api_address, token)
+            for name, api_address, token in clusters
+        }
+        wait(futures.values(), timeout=deadline_seconds)
+        # Don't wait for calls still running past the deadline
+        executor.shutdown(wait=False, cancel_futures=True)
+        for name, future in futures.items():
+            if not future.done() or future.cancelled():
+                logger.warning(f"Readiness: cluster '{name}' didn't answer in time")
+                reachable[name] = False
+                continue
+            try:
+                reachable[name] = future.result()
+            except Exception as e:
+                logger.warning(f"Readiness: cluster '{name}' unreachable: {e}")
+                reachable[name] = False
+    unreachable = sorted(name for name, ok in reachable.items() if not ok)
+    return {
+        "status": "degraded" if unreachable else "ok",
+        "reachable": len(reachable) - len(unreachable),
+        "unreachable": unreachable,
+    }
+
+
+class ReadinessMonitor:
+    """Runs the dependency checks in the background and keeps the latest result."""
+
+    def __init__(
+        self,
+        interval_seconds: float = 5.0,
+        max_age_seconds: Optional[float] = None,
+        check_clusters: bool = False,
+        cluster_concurrency: int = 8,
+        database_engine: Engine = engine,
+        session_factory: sessionmaker = SessionLocal,
+    ):
+        self.interval_seconds = interval_seconds
+        self.max_age_seconds = (
+            max_age_seconds if max_age_seconds is not None else 3 * interval_seconds
+        )
+        self.check_clusters = check_clusters
+        self.cluster_concurrency = cluster_concurrency
+        self.database_engine = database_engine
+        self.session_factory = session_factory
+        self.checks: Dict[str, Dict[str, Any]] = {}
+        self.cluster_check: Optional[Dict[str, Any]] = None
+        self.checked_at: Optional[float] = None
+        self._pool_timeouts: Optional[int] = None
+        self._tasks: List[asyncio.Task] = []
+
+    def checks_to_run(self) -> Dict[str, Callable[[], Dict[str, Any]]]:
+        return {
+            "database": lambda: check_database(self.database_engine),
+            "pool": lambda: check_pool(self.database_engine, self._pool_timeouts),
+            "secrets": check_secrets,
+        }
+
+    @staticmethod
+    def _timed(name: str, check: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        started = time.perf_counter()
+        try:
+            result = check()
+        except Exception as e:
+            logger.warning(f"Readiness check '{name}' failed: {e}")
+            # /ready is unauthenticated: the details only go to the log
+            result = {"status": "error", "error": type(e).__name__}
+        result["seconds"] = round(time.perf_counter() - started, 3)
+        return result
+
+    def run_checks(self) -> Dict[str, Dict[str, Any]]:
+        """Run the required checks once (blocking) and store the result."""
+        results = {
+            name: self._timed(name, check)
+            for name, check in self.checks_to_run().items()
+        }
+        if "timeouts" in results["pool"]:
+            self._pool_timeouts = results["pool"]["timeouts"]
+        self.checks = results
+        self.checked_at = time.monotonic()
+        return results
+
+    def run_cluster_check(self) -> Dict[str, Any]:
+        """Check the clusters once (blocking) and store the result."""
+        self.cluster_check = self._timed(
+            "clusters",
+            lambda: check_clusters(self.session_factory, self.cluster_concurrency),
+        )
+        return self.cluster_check
+
+    async def _loop(self, run: Callable[[], Any]) -> None:
+        while True:
+            await run_in_threadpool(run)
+            await asyncio.sleep(self.interval_seconds)
+
+    def start(self) -> None:
+        if self._tasks:
+            return
+        loop = asyncio.get_running_loop()
+        self._tasks.append(loop.create_task(self._loop(self.run_checks)))
+        if self.check_clusters:
+            self._tasks.append(loop.create_task(self._loop(self.run_cluster_check)))
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self._tasks = []
+
+    def age_seconds(self) -> Optional[float]:
+        if self.checked_at is None:
+            return None
+        return time.monotonic() - self.checked_at
+
+    def ready(self) -> bool:
+        age = self.age_seconds()
+        if age is None or age > self.max_age_seconds:
+            return False
+        return all(
+            self.checks.get(name, {}).get("status") == "ok" for name in REQUIRED_CHECKS
+        )
+
+    def status(self) -> Dict[str, Any]:
+        age = self.age_seconds()
+        checks = dict(self.checks)
+        if self.cluster_check is not None:
+            checks["clusters"] = self.cluster_check
+        return {
+            "checks": checks,
+            "checked_seconds_ago": round(age, 3) if age is not None else None,
+        }
+
+
+@lru_cache(maxsize=1)
+def get_readiness_monitor() -> ReadinessMonitor:
+    """The process-wide monitor, configured from the READINESS_* variables."""
+    interval = float(os.getenv("READINESS_CHECK_INTERVAL_SECONDS", "5"))
+    max_age = os.getenv("READINESS_MAX_AGE_SECONDS")
+    return ReadinessMonitor(
+        interval_seconds=interval,
+        max_age_seconds=float(max_age) if max_age else None,
+        check_clusters=os.getenv("READINESS_CHECK_CLUSTERS", "false").lower() == "true",
+    )
+
+
+async def start_readiness_checks() -> None:
+    get_readiness_monitor().start()
+
+
+async def stop_readiness_checks() -> None:
+    await get_readiness_monitor().stop()
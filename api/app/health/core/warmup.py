@@ -0,0 +1,236 @@
+"""
+Startup warmup.
+
+Right after a worker starts, its first requests would open the first database
+connections, compile the deploy templates and build a Kubernetes client and
+run Gateway API discovery per cluster. The warmup does that work in the
+background as soon as the worker starts:
+
+- opens WARMUP_DB_CONNECTIONS pooled connections (default: the pool size)
+- compiles the enabled templates of every component type, and the secrets one
+- builds the client of every cluster and primes its discovery cache,
+  WARMUP_CLUSTER_CONCURRENCY (default 8) clusters at a time
+
+/ready answers 503 until the warmup is done, or WARMUP_TIMEOUT_SECONDS
+(default 30) have passed, whichever comes first. A failing step is logged
+and does not keep the worker unready. Set WARMUP_ENABLED=false to skip it.
+"""
+
+import asyncio
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional
+
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import sessionmaker
+
+from app.clusters.infra.cluster_repository import ClusterRepository
+from app.shared.database.database import SessionLocal, engine
+from app.shared.k8s.application_component_manager import (
+    SECRETS_TEMPLATE_PATH,
+    compile_template,
+)
+from app.templates.infra.component_template_config_repository import (
+    ComponentTemplateConfigRepository,
+)
+from app.webapps.infra.application_component_model import WebappType
+
+logger = logging.getLogger(__name__)
+
+GATEWAY_API_GROUP = "gateway.networking.k8s.io"
+
+# Clusters primed at startup; more than this is unusual for one installation
+MAX_CLUSTERS = 500
+
+
+def open_connections(database_engine: Engine, count: int) -> int:
+    """Check out `count` connections at once and return them to the pool."""
+    connections = []
+    try:
+        for _ in range(count):
+            connections.append(database_engine.connect())
+    finally:
+        for connection in connections:
+            connection.close()
+    return len(connections)
+
+
+def compile_templates(session_factory: sessionmaker) -> int:
+    """Compile the enabled templates of every component type; return how many."""
+    with session_factory() as session:
+        repository = ComponentTemplateConfigRepository(session)
+        sources = {
+            template.content
+            for component_type in WebappType
+            for template in repository.find_templates_for_component_type(
+                component_type.value
+            )
+        }
+    if os.path.exists(SECRETS_TEMPLATE_PATH):
+        with open(SECRETS_TEMPLATE_PATH, "r") as f:
+            sources.add(f.read())
+    for source in sources:
+        compile_template(source)
+    return len(sources)
+
+
+def prime_cluster(api_address: str, token: str) -> bool:
+    """
+    Build the cluster's client and cache its Gateway API discovery.
+
+    Returns False when the Gateway API wasn't found, including when the
+    cluster couldn't be reached; there is nothing to cache then.
+    """
+    from app.k8s.client import K8sClient
+
+    k8s_client = K8sClient(url=api_address, token=token)
+    if not k8s_client.check_api_available(GATEWAY_API_GROUP):
+        return False
+    k8s_client.get_gateway_api_resources()
+    k8s_client.get_gateway_reference()
+    return True
+
+
+def prime_clusters(session_factory: sessionmaker, concurrency: int) -> int:
+    """Prime every cluster in parallel; return how many have the Gateway API cached."""
+    with session_factory() as session:
+        clusters = [
+            (cluster.name, cluster.api_address, cluster.token)
+            for cluster in ClusterRepository(session).find_all(limit=MAX_CLUSTERS)
+        ]
+    if not clusters:
+        return 0
+
+    primed = 0
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        futures = {
+            name: executor.submit(prime_cluster, api_address, token)
+            for name, api_address, token in clusters
+        }
+        for name, future in futures.items():
+            try:
+                primed += future.result()
+            except Exception as e:
+                logger.warning(f"Warmup could not reach cluster '{name}': {e}")
+    return primed
+
+
+class Warmup:
+    """Runs the warmup steps once and tracks whether the worker is ready."""
+
+    def __init__(
+        self,
+        timeout_seconds: float = 30.0,
+        db_connections: int = 1,
+        cluster_concurrency: int = 8,
+        enabled: bool = True,
+        database_engine: Engine = engine,
+        session_factory: sessionmaker = SessionLocal,
+    ):
+        self.timeout_seconds = timeout_seconds
+        self.db_connections = db_connections
+        self.cluster_concurrency = cluster_concurrency
+        self.enabled = enabled
+        self.database_engine = database_engine
+        self.session_factory = session_factory
+        self.ready = not enabled
+        self.timed_out = False
+        self.steps: Dict[str, Dict[str, Any]] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    def steps_to_run(self) -> Dict[str, Callable[[], int]]:
+        return {
+            "database": lambda: open_connections(
+                self.database_engine, self.db_connections
+            ),
+            "templates": lambda: compile_templates(self.session_factory),
+            "clusters": lambda: prime_clusters(
+                self.session_factory, self.cluster_concurrency
+            ),
+        }
+
+    async def _run_step(self, name: str, step: Callable[[], int]) -> None:
+        started = time.perf_counter()
+        try:
+            count = await run_in_threadpool(step)
+            self.steps[name] = {"status": "ok", "count": count}
+        except Exception as e:
+            logger.warning(f"Warmup step '{name}' failed: {e}")
+            # /ready is unauthenticated: the details only go to the log
+            self.steps[name] = {"status": "error", "error": type(e).__name__}
+        self.steps[name]["seconds"] = round(time.perf_counter() - started, 3)
+
+    async def run(self) -> None:
+        """Run every step concurrently; become ready when done or on timeout."""
+        if self.ready:
+            return
+        started = time.perf_counter()
+        steps = self.steps_to_run()
+        for name in steps:
+            self.steps[name] = {"status": "running"}
+        tasks = [
+            asyncio.create_task(self._run_step(name, step))
+            for name, step in steps.items()
+        ]
+        # Steps still running after the timeout finish in the background
+        _, pending = await asyncio.wait(tasks, timeout=self.timeout_seconds)
+        self.timed_out = bool(pending)
+        self.ready = True
+        logger.info(
+            f"Warmup finished in {time.perf_counter() - started:.2f}s"
+            + (" (timed out)" if self.timed_out else "")
+        )
+
+    def start(self) -> None:
+        """Start the warmup in the background; /ready reports its progress."""
+        if self._task is None and not self.ready:
+            self._task = asyncio.get_running_loop().create_task(self.run())
+
+    async def stop(self) -> None:
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "status": "ready" if self.ready else "warming",
+            "warmup": {
+                "enabled": self.enabled,
+                "timed_out": self.timed_out,
+                "steps": self.steps,
+            },
+        }
+
+
+def default_db_connections() -> int:
+    """The pool size for pooled engines, one connection otherwise."""
+    size = getattr(engine.pool, "size", None)
+    return size() if callable(size) else 1
+
+
+@lru_cache(maxsize=1)
+def get_warmup() -> Warmup:
+    """The process-wide warmup, configured from the WARMUP_* variables."""
+    return Warmup(
+        timeout_seconds=float(os.getenv("WARMUP_TIMEOUT_SECONDS", "30")),
+        db_connections=int(
+            os.getenv("WARMUP_DB_CONNECTIONS", str(default_db_connections()))
+        ),
+        cluster_concurrency=int(os.getenv("WARMUP_CLUSTER_CONCURRENCY", "8")),
+        enabled=os.getenv("WARMUP_ENABLED", "true").lower() == "true",
+    )
+
+
+async def start_warmup() -> None:
+    get_warmup().start()
+
+
+async def stop_warmup() -> None:
+    await get_warmup().stop()
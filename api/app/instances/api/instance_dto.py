@@ -1,9 +1,10 @@
-from pydantic import BaseModel, ConfigDict, model_validator
+from pydantic import BaseModel, ConfigDict, field_validator
 from uuid import UUID
 from datetime import datetime
 from typing import Any, List
 from app.applications.api.application_dto import Application
 from app.environments.api.environment_dto import Environment
+from app.shared.crypto import strip_secrets_from_settings
 
 
 class InstanceBase(BaseModel):
@@ -33,24 +34,17 @@ class InstanceComponent(BaseModel):
     created_at: str
     updated_at: str
 
-    @model_validator(mode="before")
+    @field_validator("created_at", "updated_at", mode="before")
     @classmethod
-    def convert_datetime_to_string_and_remove_visibility(cls, data: Any) -> Any:
-        if isinstance(data, dict):
-            if "created_at" in data and isinstance(data["created_at"], datetime):
-                data["created_at"] = data["created_at"].isoformat()
-            if "updated_at" in data and isinstance(data["updated_at"], datetime):
-                data["updated_at"] = data["updated_at"].isoformat()
-            if "visibility" in data:
-                del data["visibility"]
-        elif hasattr(data, "__dict__"):
-            if hasattr(data, "created_at") and isinstance(data.created_at, datetime):
-                data.created_at = data.created_at.isoformat()
-            if hasattr(data, "updated_at") and isinstance(data.updated_at, datetime):
-                data.updated_at = data.updated_at.isoformat()
-            if hasattr(data, "visibility"):
-                delattr(data, "visibility")
-        return data
+    def convert_datetime_to_string(cls, value: Any) -> Any:
+        if isinstance(value, datetime):
+            return value.isoformat()
+        return value
+
+    @field_validator("settings")
+    @classmethod
+    def strip_secrets(cls, settings: dict[str, Any] | None) -> dict[str, Any] | None:
+        return strip_secrets_from_settings(settings)
 
     model_config = ConfigDict(
         from_attributes=True,
@@ -65,45 +59,12 @@ class Instance(InstanceBase):
     created_at: str
     updated_at: str
 
-    @model_validator(mode="before")
+    @field_validator("created_at", "updated_at", mode="before")
     @classmethod
-    def convert_datetime_to_string(cls, data: Any) -> Any:
-        if isinstance(data, dict):
-            if "created_at" in data and isinstance(data["created_at"], datetime):
-                data["created_at"] = data["created_at"].isoformat()
-            if "updated_at" in data and isinstance(data["updated_at"], datetime):
-                data["updated_at"] = data["updated_at"].isoformat()
-            if "components" in data and data["components"]:
-                for component in data["components"]:
-                    if isinstance(component, dict):
-                        if "created_at" in component and isinstance(
-                            component["created_at"], datetime
-                        ):
-                            component["created_at"] = component[
-                                "created_at"
-                            ].isoformat()
-                        if "updated_at" in component and isinstance(
-                            component["updated_at"], datetime
-                        ):
-                            component["updated_at"] = component[
-                                "updated_at"
-                            ].isoformat()
-        elif hasattr(data, "__dict__"):
-            if hasattr(data, "created_at") and isinstance(data.created_at, datetime):
-                data.created_at = data.created_at.isoformat()
-            if hasattr(data, "updated_at") and isinstance(data.updated_at, datetime):
-                data.updated_at = data.updated_at.isoformat()
-            if hasattr(data, "components") and data.components:
-                for component in data.components:
-                    if hasattr(component, "created_at") and isinstance(
-                        component.created_at, datetime
-                    ):
-                        component.created_at = component.created_at.isoformat()
-                    if hasattr(component, "updated_at") and isinstance(
-                        component.updated_at, datetime
-                    ):
-                        component.updated_at = component.updated_at.isoformat()
-        return data
+    def convert_datetime_to_string(cls, value: Any) -> Any:
+        if isinstance(value, datetime):
+            return value.isoformat()
+        return value
 
     model_config = ConfigDict(
         from_attributes=True,
@@ -1,9 +1,20 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 from uuid import UUID
-from typing import List
+from typing import List, Optional
 
 from app.shared.database.database import get_db
+from app.shared.utils.serialization import (
+    FIELDS_DESCRIPTION,
+    InvalidFieldsError,
+    json_list_response,
+    parse_fields,
+)
+from app.shared.utils.pagination import (
+    CURSOR_DESCRIPTION,
+    InvalidCursorError,
+)
+from app.shared.database.replica import get_read_db
 from app.instances.infra.instance_repository import InstanceRepository
 from app.instances.core.instance_service import InstanceService
 from app.instances.api.instance_dto import (
@@ -33,6 +44,14 @@ def get_instance_service(
     return InstanceService(instance_repository, database_session)
 
 
+def get_instance_read_service(
+    database_session: Session = Depends(get_read_db),
+) -> InstanceService:
+    """Dependency to get InstanceService instance bound to a read replica when available."""
+    instance_repository = InstanceRepository(database_session)
+    return InstanceService(instance_repository, database_session)
+
+
 @router.post("/instances/", response_model=Instance)
 def create_instance(
     instance: InstanceCreate,
@@ -70,17 +89,24 @@ def update_instance(
 def list_instances(
     skip: int = 0,
     limit: int = 100,
-    service: InstanceService = Depends(get_instance_service),
+    cursor: Optional[str] = Query(None, description=CURSOR_DESCRIPTION),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+    service: InstanceService = Depends(get_instance_read_service),
     current_user: User = Depends(get_current_user),
 ):
     """List all instances."""
-    return service.get_instances(skip=skip, limit=limit)
+    try:
+        include = parse_fields(Instance, fields)
+        page = service.get_instances(skip=skip, limit=limit, cursor=cursor)
+    except (InvalidCursorError, InvalidFieldsError) as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return json_list_response(Instance, page, fields=include)
 
 
 @router.get("/instances/{uuid}", response_model=Instance)
 def get_instance(
     uuid: UUID,
-    service: InstanceService = Depends(get_instance_service),
+    service: InstanceService = Depends(get_instance_read_service),
     current_user: User = Depends(get_current_user),
 ):
     """Get instance by UUID."""
@@ -1,5 +1,5 @@
 from uuid import uuid4, UUID
-from typing import List
+from typing import List, Optional
 from sqlalchemy.orm import Session
 
 from app.instances.infra.instance_repository import InstanceRepository
@@ -12,7 +12,6 @@ from app.instances.core.instance_validators import (
     validate_instance_uniqueness,
     validate_application_exists,
     validate_environment_exists,
-    InstanceNotFoundError,
 )
 from app.webapps.infra.application_component_model import (
     ApplicationComponent as ApplicationComponentModel,
@@ -24,9 +23,7 @@ from app.shared.core.application_component_helpers import (
     delete_from_kubernetes_safe,
 )
 from app.shared.serializers.serializers import serialize_settings
-from app.shared.crypto import strip_secrets_from_settings
 from app.shared.k8s.cluster_selection import ClusterSelectionService
-from app.k8s.client import K8sClient
 from app.webapps.core.webapp_kubernetes_service import (
     upsert_to_kubernetes as upsert_webapp_to_k8s,
     delete_from_kubernetes as delete_webapp_from_k8s,
@@ -39,6 +36,7 @@ from app.cron.core.cron_kubernetes_service import (
     upsert_to_kubernetes as upsert_cron_to_k8s,
     delete_from_kubernetes as delete_cron_from_k8s,
 )
+from app.shared.utils.serialization import validate_page
 
 
 class InstanceService:
@@ -55,24 +53,21 @@ class InstanceService:
         validate_instance_create_dto(dto)
 
         # Validate application and environment exist
-        validate_application_exists(self.repository, dto.application_uuid)
-        validate_environment_exists(self.repository, dto.environment_uuid)
-
-        application = self.repository.find_application_by_uuid(dto.application_uuid)
-        environment = self.repository.find_environment_by_uuid(dto.environment_uuid)
+        application = validate_application_exists(self.repository, dto.application_uuid)
+        environment = validate_environment_exists(self.repository, dto.environment_uuid)
 
         # Validate uniqueness
         validate_instance_uniqueness(self.repository, application.id, environment.id)
 
         instance = self._build_instance_entity(dto, application.id, environment.id)
-        return self.repository.create(instance)
+        with self.repository.unit_of_work():
+            return self.repository.create(instance)
 
     def update_instance(self, uuid: UUID, dto: InstanceUpdate) -> Instance:
         """Update an existing instance."""
         validate_instance_update_dto(dto)
-        validate_instance_exists(self.repository, uuid)
-
-        instance = self.repository.find_by_uuid(uuid)
+        # With relations, as the response includes them
+        instance = validate_instance_exists(self.repository, uuid, with_relations=True)
 
         if dto.image is not None:
             instance.image = dto.image
@@ -86,47 +81,36 @@ class InstanceService:
         # TODO: Handle Kubernetes sync when image/version/enabled changes
         # This will be implemented when Kubernetes features are migrated
 
-        return self.repository.update(instance)
+        with self.repository.unit_of_work():
+            return self.repository.update(instance)
 
     def get_instance(self, uuid: UUID) -> Instance:
         """Get instance by UUID."""
-        validate_instance_exists(self.repository, uuid)
-        instance = self.repository.find_by_uuid(uuid, load_components=True)
-        return self._strip_secrets_from_instance(instance)
+        return validate_instance_exists(self.repository, uuid, with_relations=True)
 
-    def get_instances(self, skip: int = 0, limit: int = 100) -> List[Instance]:
+    def get_instances(
+        self, skip: int = 0, limit: int = 100, cursor: Optional[str] = None
+    ) -> List[Instance]:
         """Get all instances."""
         instances = self.repository.find_all(
-            skip=skip, limit=limit, load_components=True
+            skip=skip, limit=limit, load_components=True, cursor=cursor
         )
-        return [self._strip_secrets_from_instance(i) for i in instances]
-
-    def _strip_secrets_from_instance(self, instance: InstanceModel) -> InstanceModel:
-        """Strip secret values from all components in the instance."""
-        if hasattr(instance, "components") and instance.components:
-            for component in instance.components:
-                if component.settings:
-                    component.settings = strip_secrets_from_settings(component.settings)
-        return instance
+        return validate_page(Instance, instances)
 
     def delete_instance(self, uuid: UUID, database_session: Session) -> dict:
         """Delete an instance and all its components."""
-        validate_instance_exists(self.repository, uuid)
+        instance = validate_instance_exists(self.repository, uuid, for_deploy=True)
 
         if not self.db:
             raise ValueError("Database session is required for deleting instance")
 
-        instance = self.repository.find_by_uuid_with_relations(uuid)
-        if not instance:
-            raise InstanceNotFoundError(f"Instance with UUID {uuid} not found")
+        # Kubernetes cleanup already tolerates failures; a database error ends
+        # the unit of work, which rolls back every row deleted so far
+        with self.repository.unit_of_work():
+            # Delete all components first
+            components = instance.components if hasattr(instance, "components") else []
 
-        # Delete all components first
-        components = instance.components if hasattr(instance, "components") else []
-
-        for component in components:
-            repository = None
-            component_type = None
-            try:
+            for component in components:
                 # Get component type
                 component_type = (
                     component.type.value
@@ -161,58 +145,32 @@ class InstanceService:
                 else:
                     # Unknown component type, just delete from database
                     repository.delete(component)
-                    self.db.commit()
                     continue
 
                 # Delete component (handles Kubernetes cleanup and database deletion)
                 delete_component(
-                    component, repository, self.db, delete_from_k8s_func, component_type
+                    component,
+                    repository,
+                    self.db,
+                    delete_from_k8s_func,
+                    component_type,
                 )
-                self.db.commit()
 
+            # Delete instance
+            try:
+                self.repository.delete_by_id(instance.id)
             except Exception as e:
-                # Log error and try to delete from database anyway
-                component_name = getattr(component, "name", "unknown")
-                error_msg = str(e)
-                print(
-                    f"Error deleting component '{component_name}' (type: {component_type or 'unknown'}): {error_msg}"
-                )
-                # Try to delete from database anyway
-                try:
-                    if repository is None:
-                        repository = self._get_component_repository(component)
-                    repository.delete(component)
-                    self.db.commit()
-                except Exception as db_error:
-                    self.db.rollback()
-                    db_error_msg = str(db_error)
-                    print(f"Error deleting component from database: {db_error_msg}")
-                    # Re-raise the original error if database deletion also fails
-                    raise Exception(
-                        f"Failed to delete component '{component_name}': {error_msg}. Database error: {db_error_msg}"
-                    )
-
-        # Delete instance
-        try:
-            self.repository.delete_by_id(instance.id)
-        except Exception as e:
-            self.repository.rollback()
-            raise Exception(f"Failed to delete instance: {str(e)}")
+                raise Exception(f"Failed to delete instance: {str(e)}")
 
         return {"detail": "Instance deleted successfully"}
 
     def get_instance_events(self, uuid: UUID) -> List:
         """Get Kubernetes events for an instance."""
-        validate_instance_exists(self.repository, uuid)
+        instance = validate_instance_exists(self.repository, uuid, with_relations=True)
 
         if not self.db:
             raise ValueError("Database session is required for getting instance events")
 
-        # Get instance with relations
-        instance = self.repository.find_by_uuid_with_relations(uuid)
-        if not instance:
-            raise InstanceNotFoundError(f"Instance with UUID {uuid} not found")
-
         # Get cluster for the instance's environment
         try:
             cluster = ClusterSelectionService.get_cluster_with_least_load_or_raise(
@@ -235,6 +193,8 @@ class InstanceService:
 
         # Get events from Kubernetes
         try:
+            from app.k8s.client import K8sClient
+
             k8s_client = K8sClient(url=cluster.api_address, token=cluster.token)
             events = k8s_client.list_events(namespace=application_namespace)
 
@@ -275,72 +235,57 @@ class InstanceService:
 
     def sync_instance(self, uuid: UUID) -> dict:
         """Sync instance components with Kubernetes."""
-        validate_instance_exists(self.repository, uuid)
+        instance = validate_instance_exists(self.repository, uuid, for_deploy=True)
 
         if not self.db:
             raise ValueError("Database session is required for sync")
 
-        instance = self.repository.find_by_uuid_with_relations(uuid)
-        if not instance:
-            raise InstanceNotFoundError(f"Instance with UUID {uuid} not found")
-
-        # Get settings for the environment
-        from app.settings.infra.settings_model import Settings as SettingsModel
-
-        settings = (
-            self.db.query(SettingsModel)
-            .filter(SettingsModel.environment_id == instance.environment_id)
-            .first()
-        )
-        settings_serialized = serialize_settings(settings) if settings else {}
+        settings_serialized = serialize_settings(instance.environment.settings)
 
         synced_components = 0
         total_components = len([c for c in instance.components if c.enabled])
         errors = []
 
-        # Sync each enabled component
-        for component in instance.components:
-            if not component.enabled:
-                continue
-
-            try:
-                # Get or create cluster instance
-                cluster_instance = get_or_create_cluster_instance(
-                    self._get_component_repository(component), self.db, component
-                )
-                cluster = cluster_instance.cluster
+        with self.repository.unit_of_work():
+            # Sync each enabled component
+            for component in instance.components:
+                if not component.enabled:
+                    continue
 
-                # Determine component type and use appropriate upsert function
-                if isinstance(component.type, WebappType):
-                    component_type = component.type.value
-                else:
-                    component_type = str(component.type)
-
-                if component_type == WebappType.webapp.value:
-                    upsert_func = upsert_webapp_to_k8s
-                elif component_type == WebappType.worker.value:
-                    upsert_func = upsert_worker_to_k8s
-                elif component_type == WebappType.cron.value:
-                    upsert_func = upsert_cron_to_k8s
-                else:
-                    errors.append(
-                        {
-                            "component": component.name,
-                            "error": f"Unknown component type: {component_type}",
-                        }
+                try:
+                    # Get or create cluster instance
+                    cluster_instance = get_or_create_cluster_instance(
+                        self._get_component_repository(component), self.db, component
                     )
-                    continue
+                    cluster = cluster_instance.cluster
+
+                    # Determine component type and use appropriate upsert function
+                    if isinstance(component.type, WebappType):
+                        component_type = component.type.value
+                    else:
+                        component_type = str(component.type)
+
+                    if component_type == WebappType.webapp.value:
+                        upsert_func = upsert_webapp_to_k8s
+                    elif component_type == WebappType.worker.value:
+                        upsert_func = upsert_worker_to_k8s
+                    elif component_type == WebappType.cron.value:
+                        upsert_func = upsert_cron_to_k8s
+                    else:
+                        errors.append(
+                            {
+                                "component": component.name,
+                                "error": f"Unknown component type: {component_type}",
+                            }
+                        )
+                        continue
 
-                # Deploy to Kubernetes
-                upsert_func(cluster, component, settings_serialized, self.db)
-                self.db.commit()
-                self.db.refresh(component)
-                self.db.refresh(cluster_instance)
+                    # Deploy to Kubernetes
+                    upsert_func(cluster, component, settings_serialized, self.db)
 
-                synced_components += 1
-            except Exception as e:
-                self.db.rollback()
-                errors.append({"component": component.name, "error": str(e)})
+                    synced_components += 1
+                except Exception as e:
+                    errors.append({"component": component.name, "error": str(e)})
 
         return {
             "detail": f"Sync completed. {synced_components}/{total_components} components synced.",
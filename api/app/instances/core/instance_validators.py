@@ -1,6 +1,9 @@
 from uuid import UUID
 from app.instances.infra.instance_repository import InstanceRepository
 from app.instances.api.instance_dto import InstanceCreate, InstanceUpdate
+from app.instances.infra.instance_model import Instance as InstanceModel
+from app.applications.infra.application_model import Application as ApplicationModel
+from app.environments.infra.environment_model import Environment as EnvironmentModel
 
 
 class InstanceNotFoundError(Exception):
@@ -51,11 +54,30 @@ def validate_instance_update_dto(dto: InstanceUpdate) -> None:
         raise ValueError("Instance version cannot be empty")
 
 
-def validate_instance_exists(repository: InstanceRepository, uuid: UUID) -> None:
-    """Validate that instance exists. Raises InstanceNotFoundError if not found."""
-    instance = repository.find_by_uuid(uuid)
+def validate_instance_exists(
+    repository: InstanceRepository,
+    uuid: UUID,
+    load_components: bool = False,
+    with_relations: bool = False,
+    for_deploy: bool = False,
+) -> InstanceModel:
+    """
+    Validate that instance exists and return it.
+    Raises InstanceNotFoundError if not found.
+
+    for_deploy loads everything syncing or deleting the instance reads;
+    with_relations loads application, environment and components;
+    load_components only the components.
+    """
+    if for_deploy:
+        instance = repository.find_by_uuid_for_deploy(uuid)
+    elif with_relations:
+        instance = repository.find_by_uuid_with_relations(uuid)
+    else:
+        instance = repository.find_by_uuid(uuid, load_components=load_components)
     if not instance:
         raise InstanceNotFoundError(f"Instance with UUID '{uuid}' not found")
+    return instance
 
 
 def validate_instance_uniqueness(
@@ -76,15 +98,21 @@ def validate_instance_uniqueness(
         )
 
 
-def validate_application_exists(repository: InstanceRepository, uuid: UUID) -> None:
-    """Validate that application exists."""
+def validate_application_exists(
+    repository: InstanceRepository, uuid: UUID
+) -> ApplicationModel:
+    """Validate that application exists and return it."""
     application = repository.find_application_by_uuid(uuid)
     if not application:
         raise ApplicationNotFoundError(f"Application with UUID '{uuid}' not found")
+    return application
 
 
-def validate_environment_exists(repository: InstanceRepository, uuid: UUID) -> None:
-    """Validate that environment exists."""
+def validate_environment_exists(
+    repository: InstanceRepository, uuid: UUID
+) -> EnvironmentModel:
+    """Validate that environment exists and return it."""
     environment = repository.find_environment_by_uuid(uuid)
     if not environment:
         raise EnvironmentNotFoundError(f"Environment with UUID '{uuid}' not found")
+    return environment
@@ -5,6 +5,7 @@ from sqlalchemy import (
     ForeignKey,
     Boolean,
     DateTime,
+    Index,
     UniqueConstraint,
 )
 from sqlalchemy.sql import func
@@ -23,7 +24,9 @@ class Instance(Base):
     application_id = Column(Integer, ForeignKey("applications.id"), nullable=False)
     application = relationship("Application", back_populates="instances")
 
-    environment_id = Column(Integer, ForeignKey("environments.id"), nullable=False)
+    environment_id = Column(
+        Integer, ForeignKey("environments.id"), nullable=False, index=True
+    )
     environment = relationship("Environment", back_populates="instances")
 
     components = relationship("ApplicationComponent", back_populates="instance")
@@ -41,4 +44,6 @@ class Instance(Base):
         UniqueConstraint(
             "application_id", "environment_id", name="uix_application_environment"
         ),
+        # Keyset pagination order
+        Index("ix_instances_created_at_id", "created_at", "id"),
     )
@@ -2,8 +2,12 @@ from sqlalchemy.orm import Session, joinedload
 from uuid import UUID
 from typing import Optional, List
 from app.instances.infra.instance_model import Instance as InstanceModel
+from app.shared.database.lookup_cache import cached_lookup
+from app.shared.infra.deploy_context import instance_deploy_context
+from app.shared.database.unit_of_work import UnitOfWork
 from app.applications.infra.application_model import Application as ApplicationModel
 from app.environments.infra.environment_model import Environment as EnvironmentModel
+from app.shared.utils.pagination import paginate
 
 
 class InstanceRepository:
@@ -19,19 +23,49 @@ class InstanceRepository:
         query = self.db.query(InstanceModel).filter(InstanceModel.uuid == uuid)
         if load_components:
             query = query.options(joinedload(InstanceModel.components))
-        return query.first()
+        return cached_lookup(
+            self.db,
+            InstanceModel,
+            uuid,
+            query.first,
+            options=("components",) if load_components else (),
+        )
 
     def find_by_uuid_with_relations(self, uuid: UUID) -> Optional[InstanceModel]:
         """Find instance by UUID with all relations loaded."""
-        return (
-            self.db.query(InstanceModel)
-            .options(
-                joinedload(InstanceModel.application),
-                joinedload(InstanceModel.environment),
-                joinedload(InstanceModel.components),
-            )
-            .filter(InstanceModel.uuid == uuid)
-            .first()
+        return cached_lookup(
+            self.db,
+            InstanceModel,
+            uuid,
+            lambda: (
+                self.db.query(InstanceModel)
+                .options(
+                    joinedload(InstanceModel.application),
+                    joinedload(InstanceModel.environment),
+                    joinedload(InstanceModel.components),
+                )
+                .filter(InstanceModel.uuid == uuid)
+                .first()
+            ),
+            options=("relations",),
+        )
+
+    def find_by_uuid_for_deploy(self, uuid: UUID) -> Optional[InstanceModel]:
+        """
+        Find instance by UUID with everything syncing or deleting it reads:
+        relations, environment settings, cluster instances and clusters.
+        """
+        return cached_lookup(
+            self.db,
+            InstanceModel,
+            uuid,
+            lambda: (
+                self.db.query(InstanceModel)
+                .options(*instance_deploy_context())
+                .filter(InstanceModel.uuid == uuid)
+                .first()
+            ),
+            options=("deploy_context", "components"),
         )
 
     def find_by_application_and_environment(
@@ -48,41 +82,68 @@ class InstanceRepository:
         )
 
     def find_all(
-        self, skip: int = 0, limit: int = 100, load_components: bool = False
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        load_components: bool = False,
+        cursor: Optional[str] = None,
     ) -> List[InstanceModel]:
-        """Find all instances."""
-        query = self.db.query(InstanceModel).offset(skip).limit(limit)
+        """
+        Find all instances, ordered by (created_at, id).
+
+        load_components loads everything the Instance DTO reads: components,
+        application and environment.
+        """
+        query = self.db.query(InstanceModel)
         if load_components:
-            query = query.options(joinedload(InstanceModel.components))
-        return query.all()
+            query = query.options(
+                joinedload(InstanceModel.application),
+                joinedload(InstanceModel.environment),
+                joinedload(InstanceModel.components),
+            )
+        return paginate(
+            query,
+            [InstanceModel.created_at, InstanceModel.id],
+            skip=skip,
+            limit=limit,
+            cursor=cursor,
+        )
 
     def find_application_by_uuid(self, uuid: UUID) -> Optional[ApplicationModel]:
         """Find application by UUID."""
-        return (
-            self.db.query(ApplicationModel)
-            .filter(ApplicationModel.uuid == uuid)
-            .first()
+        return cached_lookup(
+            self.db,
+            ApplicationModel,
+            uuid,
+            lambda: (
+                self.db.query(ApplicationModel)
+                .filter(ApplicationModel.uuid == uuid)
+                .first()
+            ),
         )
 
     def find_environment_by_uuid(self, uuid: UUID) -> Optional[EnvironmentModel]:
         """Find environment by UUID."""
-        return (
-            self.db.query(EnvironmentModel)
-            .filter(EnvironmentModel.uuid == uuid)
-            .first()
+        return cached_lookup(
+            self.db,
+            EnvironmentModel,
+            uuid,
+            lambda: (
+                self.db.query(EnvironmentModel)
+                .filter(EnvironmentModel.uuid == uuid)
+                .first()
+            ),
         )
 
     def create(self, instance: InstanceModel) -> InstanceModel:
         """Create a new instance."""
         self.db.add(instance)
-        self.db.commit()
-        self.db.refresh(instance)
+        self.db.flush()
         return instance
 
     def update(self, instance: InstanceModel) -> InstanceModel:
         """Update an existing instance."""
-        self.db.commit()
-        self.db.refresh(instance)
+        self.db.flush()
         return instance
 
     def delete_by_id(self, instance_id: int) -> None:
@@ -91,7 +152,11 @@ class InstanceRepository:
 
         stmt = delete(InstanceModel).where(InstanceModel.id == instance_id)
         self.db.execute(stmt)
-        self.db.commit()
+        self.db.flush()
+
+    def unit_of_work(self) -> UnitOfWork:
+        """Open a transaction that commits once, when the block succeeds."""
+        return UnitOfWork(self.db)
 
     def rollback(self) -> None:
         """Rollback current transaction."""
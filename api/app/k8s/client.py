@@ -1,10 +1,18 @@
+import copy
 import json
+import os
+import threading
+import time
+from urllib.parse import urlparse
 
 from kubernetes import client
 from kubernetes.client.rest import ApiException
 from kubernetes.stream import stream
 from fastapi import HTTPException
 
+from app.shared.observability.metrics import observe_k8s_call
+from app.shared.observability.tracing import current_span, span
+
 
 K8S_API_MAPPING = {
     "Deployment": (
@@ -52,17 +60,147 @@ K8S_API_MAPPING = {
 }
 
 
+def describe_api_call(method: str, resource_path: str) -> tuple[str, str]:
+    """
+    Kubernetes verb and resource of a REST call, for metric labels.
+
+    "/apis/apps/v1/namespaces/{namespace}/deployments/{name}" with PUT is
+    ("replace", "deployments"); subresources keep their parent, e.g. "pods/log".
+    Calls to group discovery paths such as "/apis/gateway.networking.k8s.io"
+    are reported as kind "discovery".
+    """
+    parts = [part for part in resource_path.split("?")[0].split("/") if part]
+    # Drop the API prefix: /api/<version> or /apis/<group>/<version>
+    if parts[:1] == ["api"]:
+        parts = parts[2:]
+    elif parts[:1] == ["apis"]:
+        parts = parts[3:]
+    if len(parts) > 2 and parts[0] == "namespaces":
+        parts = parts[2:]
+    if not parts:
+        return method.lower(), "discovery"
+
+    kind = f"{parts[0]}/{parts[2]}" if len(parts) > 2 else parts[0]
+    named = len(parts) > 1
+    verb = {
+        "GET": "get" if named else "list",
+        "POST": "create",
+        "PUT": "replace",
+        "PATCH": "patch",
+        "DELETE": "delete" if named else "deletecollection",
+    }.get(method.upper(), method.lower())
+    return verb, kind
+
+
+class InstrumentedApiClient(client.ApiClient):
+    """
+    ApiClient that records latency and errors of every call.
+
+    Typed APIs (CoreV1Api, AppsV1Api, ...) and the direct call_api requests in
+    K8sClient all go through call_api, so this is the only hook needed.
+    """
+
+    def __init__(self, configuration: client.Configuration, cluster: str):
+        super().__init__(configuration)
+        self.cluster = cluster
+
+    def call_api(self, resource_path, method, *args, **kwargs):
+        verb, kind = describe_api_call(method, resource_path)
+        attributes = {"k8s.cluster": self.cluster, "k8s.verb": verb, "k8s.kind": kind}
+        with (
+            observe_k8s_call(self.cluster, verb, kind),
+            span(f"k8s {verb} {kind}", attributes) as call_span,
+        ):
+            try:
+                response = super().call_api(resource_path, method, *args, **kwargs)
+            except Exception as e:
+                status = getattr(e, "status", None)
+                if status:
+                    call_span.set_attribute("http.response.status_code", status)
+                raise
+            if isinstance(response, tuple) and len(response) == 3:
+                # (data, status, headers) unless only the data was asked for
+                call_span.set_attribute("http.response.status_code", response[1])
+            return response
+
+
+# ApiClients kept for reuse; the oldest is dropped beyond this (e.g. after token rotations)
+MAX_SHARED_API_CLIENTS = 64
+
+_shared_api_clients: dict[tuple, InstrumentedApiClient] = {}
+_shared_api_clients_lock = threading.Lock()
+
+
+def shared_api_client(
+    url: str, token: str, verify_ssl: bool = False
+) -> InstrumentedApiClient:
+    """
+    The ApiClient for a cluster and token, built on first use.
+
+    Requests to the same cluster share it, and with it the urllib3 connection
+    pool, so they don't pay a new TCP and TLS handshake each time.
+    """
+    key = (url, token, verify_ssl)
+    with _shared_api_clients_lock:
+        api_client = _shared_api_clients.get(key)
+        if api_client is None:
+            configuration = client.Configuration()
+            configuration.host = url
+            configuration.verify_ssl = verify_ssl
+            configuration.api_key = {"authorization": f"Bearer {token}"}
+            api_client = InstrumentedApiClient(
+                configuration, cluster=urlparse(url).netloc or url
+            )
+            if len(_shared_api_clients) >= MAX_SHARED_API_CLIENTS:
+                _shared_api_clients.pop(next(iter(_shared_api_clients)))
+            _shared_api_clients[key] = api_client
+    return api_client
+
+
+class DiscoveryCache:
+    """
+    Thread-safe TTL cache for discovery answers, per cluster and token.
+
+    Only positive answers (an available API group, a non-empty resource list,
+    a Gateway found) are kept: a cluster that gains the Gateway API is noticed
+    on the next call, and a failed lookup is never served from the cache.
+    """
+
+    def __init__(self, ttl_seconds: float):
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._entries: dict[tuple, tuple] = {}
+
+    def get_or_load(self, key: tuple, load):
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None and time.monotonic() < entry[1]:
+            return copy.copy(entry[0])
+
+        value = load()
+        if value and self.ttl_seconds > 0:
+            with self._lock:
+                self._entries[key] = (value, time.monotonic() + self.ttl_seconds)
+        return copy.copy(value)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+discovery_cache = DiscoveryCache(
+    float(os.getenv("K8S_DISCOVERY_CACHE_TTL_SECONDS", "60"))
+)
+
+
 class K8sClient:
     def __init__(self, url: str, token: str, verify_ssl: bool = False):
         """
         Initialize the Kubernetes client with the provided parameters.
         """
-        self.configuration = client.Configuration()
-        self.configuration.host = url
-        self.configuration.verify_ssl = verify_ssl
-        self.configuration.api_key = {"authorization": f"Bearer {token}"}
-        self.api_client = client.ApiClient(self.configuration)
-        self.api_client = client.ApiClient(self.configuration)
+        self.api_client = shared_api_client(url, token, verify_ssl)
+        self.configuration = self.api_client.configuration
+        self._cache_key = (url, token, verify_ssl)
 
     def validate_connection(self):
         """
@@ -587,6 +725,9 @@ class K8sClient:
                                     # Retry with fresh resourceVersion
                                     import time
 
+                                    current_span().set_attribute(
+                                        "k8s.retries", retry + 1
+                                    )
                                     time.sleep(0.1 * (retry + 1))  # Backoff
                                     continue
                                 elif e.status == 404:
@@ -654,6 +795,9 @@ class K8sClient:
                                     # Retry with fresh resourceVersion
                                     import time
 
+                                    current_span().set_attribute(
+                                        "k8s.retries", retry + 1
+                                    )
                                     time.sleep(0.1 * (retry + 1))  # Backoff
                                     continue
                                 else:
@@ -785,13 +929,21 @@ class K8sClient:
 
         return "Documents applied successfully"
 
-    def list_pods(self, namespace: str, label_selector: str = None):
+    def list_pods(
+        self,
+        namespace: str,
+        label_selector: str = None,
+        timeout_seconds=None,
+        raise_errors: bool = False,
+    ):
         """
         List pods from a namespace, optionally filtered by label selector.
 
         Args:
             namespace: Namespace name
             label_selector: Label selector (e.g., "app=myapp")
+            timeout_seconds: Request timeout (default: none)
+            raise_errors: Raise API errors instead of returning an empty list
 
         Returns:
             List of pods with formatted information
@@ -801,10 +953,14 @@ class K8sClient:
 
             if label_selector:
                 pods = v1.list_namespaced_pod(
-                    namespace=namespace, label_selector=label_selector
+                    namespace=namespace,
+                    label_selector=label_selector,
+                    _request_timeout=timeout_seconds,
                 ).items
             else:
-                pods = v1.list_namespaced_pod(namespace=namespace).items
+                pods = v1.list_namespaced_pod(
+                    namespace=namespace, _request_timeout=timeout_seconds
+                ).items
 
             # Format pod data
             formatted_pods = []
@@ -873,15 +1029,24 @@ class K8sClient:
                         "memory_limits": memory_limits,
                         "age_seconds": age_seconds,
                         "host_ip": host_ip,
+                        "labels": pod.metadata.labels or {},
                     }
                 )
 
             return formatted_pods
         except ApiException as e:
+            if raise_errors:
+                raise
             print(f"Error listing pods: {e}")
             return []
 
-    def list_jobs(self, namespace: str, label_selector: str = None):
+    def list_jobs(
+        self,
+        namespace: str,
+        label_selector: str = None,
+        timeout_seconds=None,
+        raise_errors: bool = False,
+    ):
         """
         List Jobs from a namespace, optionally filtered by label selector.
         Used to list Jobs created by CronJobs.
@@ -889,6 +1054,8 @@ class K8sClient:
         Args:
             namespace: Namespace name
             label_selector: Label selector (e.g., "app=myapp")
+            timeout_seconds: Request timeout (default: none)
+            raise_errors: Raise API errors instead of returning an empty list
 
         Returns:
             List of jobs with formatted information
@@ -898,10 +1065,14 @@ class K8sClient:
 
             if label_selector:
                 jobs = batch_v1.list_namespaced_job(
-                    namespace=namespace, label_selector=label_selector
+                    namespace=namespace,
+                    label_selector=label_selector,
+                    _request_timeout=timeout_seconds,
                 ).items
             else:
-                jobs = batch_v1.list_namespaced_job(namespace=namespace).items
+                jobs = batch_v1.list_namespaced_job(
+                    namespace=namespace, _request_timeout=timeout_seconds
+                ).items
 
             # Format job data
             formatted_jobs = []
@@ -971,6 +1142,7 @@ class K8sClient:
                         "completion_time": completion_time,
                         "age_seconds": age_seconds,
                         "duration_seconds": duration_seconds,
+                        "labels": job.metadata.labels or {},
                     }
                 )
 
@@ -979,6 +1151,8 @@ class K8sClient:
 
             return formatted_jobs
         except ApiException as e:
+            if raise_errors:
+                raise
             print(f"Error listing jobs: {e}")
             return []
 
@@ -1112,6 +1286,12 @@ class K8sClient:
         Returns:
             True if the API is available, False otherwise
         """
+        return discovery_cache.get_or_load(
+            (*self._cache_key, "api_group", api_group),
+            lambda: self._check_api_available(api_group),
+        )
+
+    def _check_api_available(self, api_group: str) -> bool:
         try:
             # Use REST API directly to check if the group exists
             # Making a GET request to /apis/{api_group}
@@ -1164,6 +1344,12 @@ class K8sClient:
         Returns:
             List of available resources (e.g., ['HTTPRoute', 'TCPRoute', 'UDPRoute'])
         """
+        return discovery_cache.get_or_load(
+            (*self._cache_key, "gateway_api_resources"),
+            self._get_gateway_api_resources,
+        )
+
+    def _get_gateway_api_resources(self) -> list[str]:
         available_resources = []
 
         try:
@@ -1257,6 +1443,11 @@ class K8sClient:
         Returns:
             Dict with Gateway 'namespace' and 'name', or None if not found
         """
+        return discovery_cache.get_or_load(
+            (*self._cache_key, "gateway_reference"), self._get_gateway_reference
+        )
+
+    def _get_gateway_reference(self) -> dict | None:
         try:
             # Try different Gateway API versions
             api_versions = [
@@ -1,10 +1,29 @@
 import os
 
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.openapi.docs import get_redoc_html
 
 from app.shared.database.database import Base, engine
+from app.shared.database.replica import (
+    ReadYourWritesMiddleware,
+    get_replica_hosts,
+    start_replica_lag_checks,
+    stop_replica_lag_checks,
+)
+from app.shared.observability.metrics import (
+    MetricsMiddleware,
+    mark_worker_stopped,
+    metrics_endpoint,
+)
+from app.shared.observability.tracing import (
+    TracingMiddleware,
+    configure_tracing,
+    shutdown_tracing,
+)
+from app.shared.utils.compression import CompressionMiddleware
+from app.shared.utils.pagination import NEXT_CURSOR_HEADER
 
 # Also import Base from old database to ensure compatibility
 from app.database import Base as OldBase
@@ -27,6 +46,14 @@ from app.webapps.api.webapp_handlers import router as webapps_router
 from app.workers.api.worker_handlers import router as workers_router
 from app.cron.api.cron_handlers import router as crons_router
 from app.setup.api.setup_handlers import router as setup_router
+from app.health.api.health_handlers import router as health_router
+from app.health.core.readiness import start_readiness_checks, stop_readiness_checks
+from app.health.core.warmup import start_warmup, stop_warmup
+from app.profiling.api.profiling_handlers import (
+    ProfileIdMiddleware,
+    profile_request,
+    router as profiling_router,
+)
 
 # Version is injected at build time via APP_VERSION environment variable
 APP_VERSION = os.getenv("APP_VERSION", "dev")
@@ -50,7 +77,11 @@ assert Base is OldBase, (
 
 # Import component_template_config model
 
-Base.metadata.create_all(bind=engine)
+# Alembic owns the schema everywhere else (api-migrate runs `alembic upgrade
+# head` before the API starts); creating it here would run DDL checks in every
+# worker on every boot.
+if os.getenv("ENV") in ("test", "development"):
+    Base.metadata.create_all(bind=engine)
 
 app = FastAPI(
     title="Tron",
@@ -59,6 +90,9 @@ app = FastAPI(
     openapi_url="/openapi.json",
     docs_url="/docs",
     redoc_url=None,  # Disable default ReDoc to use custom one with fixed CDN URL
+    default_response_class=ORJSONResponse,
+    # Admins can profile any request with the X-Tron-Profile header
+    dependencies=[Depends(profile_request)],
 )
 
 # CORS Configuration
@@ -79,14 +113,44 @@ CORS_ALLOW_HEADERS = os.getenv(
 ).split(",")
 CORS_ALLOW_HEADERS = [header.strip() for header in CORS_ALLOW_HEADERS if header.strip()]
 
+# Mark clients after writes so their reads stick to the primary for a short window
+if get_replica_hosts():
+    app.add_middleware(ReadYourWritesMiddleware)
+    app.add_event_handler("startup", start_replica_lag_checks)
+    app.add_event_handler("shutdown", stop_replica_lag_checks)
+
+# Returns the id of profiled requests, whatever Response the handler built
+app.add_middleware(ProfileIdMiddleware)
+
+# gzip (or brotli, when installed) for large responses such as component lists
+app.add_middleware(CompressionMiddleware)
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=CORS_ORIGINS,
     allow_credentials=CORS_ALLOW_CREDENTIALS,
     allow_methods=CORS_ALLOW_METHODS,
     allow_headers=CORS_ALLOW_HEADERS,
+    expose_headers=[NEXT_CURSOR_HEADER, "ETag"],
 )
 
+# Outermost, so request latency includes every other middleware
+app.add_middleware(MetricsMiddleware)
+app.add_route("/metrics", metrics_endpoint, include_in_schema=False)
+app.add_event_handler("shutdown", mark_worker_stopped)
+
+# Warm connections, templates and cluster clients in the background, and check
+# dependencies every few seconds; /ready reports both without doing any work
+app.add_event_handler("startup", start_warmup)
+app.add_event_handler("startup", start_readiness_checks)
+app.add_event_handler("shutdown", stop_warmup)
+app.add_event_handler("shutdown", stop_readiness_checks)
+
+# Optional OpenTelemetry tracing, switched on with TRACING_EXPORTER
+if configure_tracing():
+    app.add_middleware(TracingMiddleware)
+    app.add_event_handler("shutdown", shutdown_tracing)
+
 # Include new structure routers
 app.include_router(applications_router)
 app.include_router(instances_router)
@@ -103,6 +167,8 @@ app.include_router(webapps_router)
 app.include_router(workers_router)
 app.include_router(crons_router)
 app.include_router(setup_router)
+app.include_router(profiling_router)
+app.include_router(health_router)
 
 # Legacy routers removed - all features migrated to new structure
 
@@ -0,0 +1,10 @@
+from datetime import datetime
+
+from pydantic import BaseModel
+
+
+class ProfileSummary(BaseModel):
+    id: str
+    name: str  # method and route template of the profiled request
+    size: int  # bytes
+    created_at: datetime
@@ -0,0 +1,125 @@
+from typing import List
+
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import FileResponse
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.profiling.api.profiling_dto import ProfileSummary
+from app.profiling.core.profiling_service import (
+    ProfileNotFoundError,
+    ProfilingRateLimitedError,
+    ProfilingService,
+    get_profiling_service,
+)
+from app.shared.database.database import get_db
+from app.shared.dependencies.auth import (
+    get_current_user,
+    get_current_user_or_token,
+    require_role,
+    security,
+)
+from app.users.infra.user_model import User, UserRole
+
+PROFILE_HEADER = "x-tron-profile"
+PROFILE_ID_HEADER = "X-Tron-Profile-Id"
+
+router = APIRouter(prefix="/profiles", tags=["profiles"])
+
+
+async def profile_request(request: Request):
+    """
+    App-wide dependency: profile this request when an admin asks for it.
+
+    Without the X-Tron-Profile header it only checks the header. With it, the
+    caller must be an admin; the profile id is kept on request.state for
+    ProfileIdMiddleware to return in X-Tron-Profile-Id, and the profile is
+    stored once the response has been built. A database session is only
+    opened for that check, not for every request.
+    """
+    if request.headers.get(PROFILE_HEADER, "").lower() not in ("1", "true"):
+        yield
+        return
+
+    # get_db, or what the app overrides it with
+    sessions = request.app.dependency_overrides.get(get_db, get_db)()
+    try:
+        current_auth = await get_current_user_or_token(
+            request.headers.get("x-tron-token"),
+            await security(request),
+            next(sessions),
+        )
+        require_role([UserRole.ADMIN])(await get_current_user(current_auth))
+    finally:
+        sessions.close()
+
+    service = get_profiling_service()
+    try:
+        active = service.start()
+    except ProfilingRateLimitedError as e:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=str(e),
+            headers={"Retry-After": str(e.retry_after)},
+        )
+    request.state.profile_id = active.id
+    try:
+        yield
+    finally:
+        route = request.scope.get("route")
+        name = f"{request.method} {getattr(route, 'path', request.url.path)}"
+        await run_in_threadpool(service.finish, active, name)
+
+
+class ProfileIdMiddleware:
+    """
+    Add X-Tron-Profile-Id to profiled responses.
+
+    The dependency can't set it on its injected Response: handlers returning
+    their own Response (lists, 304s, files) would drop it.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                profile_id = scope.get("state", {}).get("profile_id")
+                if profile_id:
+                    MutableHeaders(scope=message)[PROFILE_ID_HEADER] = profile_id
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+
+@router.get("/", response_model=List[ProfileSummary])
+def list_profiles(
+    service: ProfilingService = Depends(get_profiling_service),
+    current_user: User = Depends(require_role([UserRole.ADMIN])),
+):
+    """List stored request profiles, newest first (admin only)."""
+    return service.list_profiles()
+
+
+@router.get("/{profile_id}")
+def get_profile(
+    profile_id: str,
+    service: ProfilingService = Depends(get_profiling_service),
+    current_user: User = Depends(require_role([UserRole.ADMIN])),
+):
+    """Download a profile in speedscope format, e.g. for https://www.speedscope.app (admin only)."""
+    try:
+        path = service.get_profile_path(profile_id)
+    except ProfileNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    return FileResponse(
+        path,
+        media_type="application/json",
+        filename=f"{profile_id}.speedscope.json",
+    )
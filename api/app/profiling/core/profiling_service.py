@@ -0,0 +1,130 @@
+"""
+Per-request profiling for admins.
+
+An admin sends X-Tron-Profile: 1 with any request; that request is sampled and
+the profile stored for download from /profiles. Profiling is bounded on every
+axis:
+
+- one profile at a time, and at most PROFILER_MAX_PER_MINUTE started per
+  minute (default 6), across every worker sharing PROFILER_DIR
+- sampling stops after PROFILER_MAX_SECONDS (default 30) even if the request
+  is still running
+- PROFILER_INTERVAL_MS between samples (default 5)
+- only the newest PROFILER_MAX_PROFILES (default 20) are kept in PROFILER_DIR
+"""
+
+import os
+import time
+import uuid
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import IO, Any, Dict, List
+
+from app.profiling.core.sampler import SamplingProfiler
+from app.profiling.infra.profile_store import ProfileStore
+
+
+class ProfilingRateLimitedError(Exception):
+    """Raised when another profile is running or the per-minute budget is spent."""
+
+    def __init__(self, retry_after: int):
+        self.retry_after = retry_after
+        super().__init__(f"Profiling is rate limited, retry in {retry_after} seconds")
+
+
+class ProfileNotFoundError(Exception):
+    pass
+
+
+@dataclass
+class ActiveProfile:
+    id: str
+    profiler: SamplingProfiler
+    handle: IO
+
+
+class ProfilingService:
+    """Business logic for profiling single requests."""
+
+    def __init__(
+        self,
+        store: ProfileStore,
+        interval: float = 0.005,
+        max_duration: float = 30.0,
+        max_per_minute: int = 6,
+    ):
+        self.store = store
+        self.interval = interval
+        self.max_duration = max_duration
+        self.max_per_minute = max_per_minute
+
+    def start(self) -> ActiveProfile:
+        """
+        Start sampling for one request.
+
+        Raises:
+            ProfilingRateLimitedError: If a profile is running or the budget for
+                the current minute is spent
+        """
+        handle = self.store.claim_active()
+        if handle is None:
+            raise ProfilingRateLimitedError(retry_after=1)
+        try:
+            with self.store.starts() as starts:
+                now = time.time()
+                starts[:] = [started for started in starts if now - started < 60]
+                if len(starts) >= self.max_per_minute:
+                    raise ProfilingRateLimitedError(
+                        retry_after=int(60 - (now - starts[0])) + 1
+                    )
+                starts.append(now)
+        except Exception:
+            self.store.release_active(handle)
+            raise
+
+        profiler = SamplingProfiler(self.interval, self.max_duration)
+        profiler.start()
+        return ActiveProfile(id=uuid.uuid4().hex, profiler=profiler, handle=handle)
+
+    def finish(self, active: ActiveProfile, name: str) -> None:
+        """Stop sampling and store the profile under active.id."""
+        try:
+            active.profiler.stop()
+            document = active.profiler.to_speedscope(name)
+            document["truncated"] = active.profiler.truncated
+            self.store.save(active.id, document)
+        finally:
+            self.store.release_active(active.handle)
+
+    def list_profiles(self) -> List[Dict[str, Any]]:
+        return self.store.list()
+
+    def get_profile_path(self, profile_id: str) -> str:
+        path = self.store.path_for(profile_id)
+        if path is None:
+            raise ProfileNotFoundError(f"Profile '{profile_id}' not found")
+        return path
+
+
+def _env_float(name: str, default: float) -> float:
+    value = os.getenv(name)
+    return float(value) if value else default
+
+
+@lru_cache(maxsize=1)
+def get_profiling_service() -> ProfilingService:
+    """Process-wide profiling service configured from PROFILER_* variables."""
+    return ProfilingService(
+        ProfileStore(
+            os.getenv("PROFILER_DIR", "/tmp/tron-profiles"),
+            int(_env_float("PROFILER_MAX_PROFILES", 20)),
+        ),
+        interval=_env_float("PROFILER_INTERVAL_MS", 5) / 1000,
+        max_duration=_env_float("PROFILER_MAX_SECONDS", 30),
+        max_per_minute=int(_env_float("PROFILER_MAX_PER_MINUTE", 6)),
+    )
+
+
+def reset_profiling_service() -> None:
+    """Forget the configured service so the next call re-reads the environment."""
+    get_profiling_service.cache_clear()
@@ -0,0 +1,134 @@
+"""
+Wall-clock sampling profiler.
+
+A background thread reads the stack of every other thread with
+sys._current_frames() at a fixed interval. Sync endpoints run in the AnyIO
+thread pool and async ones on the event loop thread, so sampling all threads is
+what catches the request wherever it runs. Threads parked waiting for work
+(idle pool workers, the event loop in select) are left out. On a busy worker
+other requests in flight show up in the profile too.
+
+The result is exported in the speedscope format (https://www.speedscope.app),
+one sampled profile per thread, which also renders as a flamegraph.
+"""
+
+import sys
+import threading
+import time
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+
+SPEEDSCOPE_SCHEMA = "https://www.speedscope.app/file-format-schema.json"
+
+# Innermost frames of threads that are waiting for something to do
+IDLE_FRAMES = {
+    ("selectors.py", "select"),
+    ("threading.py", "wait"),
+    ("queue.py", "get"),
+}
+
+Frame = Tuple[str, str, int]
+
+
+def _is_idle(leaf: Frame) -> bool:
+    name, filename, _ = leaf
+    return (filename.rsplit("/", 1)[-1], name) in IDLE_FRAMES
+
+
+class SamplingProfiler:
+    """Samples the stacks of all threads until stopped or max_duration passes."""
+
+    def __init__(self, interval: float, max_duration: float):
+        self.interval = interval
+        self.max_duration = max_duration
+        self.truncated = False
+        self.duration = 0.0
+        self._frames: Dict[Frame, int] = {}
+        self._samples: Dict[int, List[List[int]]] = defaultdict(list)
+        self._thread_names: Dict[int, str] = {}
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        self._thread = threading.Thread(
+            target=self._run, name="tron-profiler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    @property
+    def sample_count(self) -> int:
+        return sum(len(samples) for samples in self._samples.values())
+
+    def _frame_index(self, frame: Frame) -> int:
+        index = self._frames.get(frame)
+        if index is None:
+            index = self._frames[frame] = len(self._frames)
+        return index
+
+    def _sample(self, own_id: int) -> None:
+        for thread_id, frame in sys._current_frames().items():
+            if thread_id == own_id:
+                continue
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append((code.co_name, code.co_filename, code.co_firstlineno))
+                frame = frame.f_back
+            if not stack or _is_idle(stack[0]):
+                continue
+            if thread_id not in self._thread_names:
+                self._name_threads()
+            self._samples[thread_id].append(
+                [self._frame_index(f) for f in reversed(stack)]
+            )
+
+    def _name_threads(self) -> None:
+        # Names are taken while sampling; short-lived threads are gone by stop()
+        for thread in threading.enumerate():
+            self._thread_names.setdefault(thread.ident, thread.name)
+
+    def _run(self) -> None:
+        own_id = threading.get_ident()
+        started = time.perf_counter()
+        while not self._stopped.wait(self.interval):
+            if time.perf_counter() - started >= self.max_duration:
+                self.truncated = True
+                break
+            self._sample(own_id)
+        self.duration = time.perf_counter() - started
+
+    def to_speedscope(self, name: str) -> dict:
+        """The samples as a speedscope document, one profile per thread."""
+        profiles = []
+        for thread_id, samples in self._samples.items():
+            thread_name = self._thread_names.get(thread_id, str(thread_id))
+            profiles.append(
+                {
+                    "type": "sampled",
+                    "name": f"{name} [{thread_name}]",
+                    "unit": "seconds",
+                    "startValue": 0,
+                    "endValue": len(samples) * self.interval,
+                    "samples": samples,
+                    "weights": [self.interval] * len(samples),
+                }
+            )
+        frames = sorted(self._frames.items(), key=lambda item: item[1])
+        return {
+            "$schema": SPEEDSCOPE_SCHEMA,
+            "name": name,
+            "exporter": "tron",
+            "activeProfileIndex": 0,
+            "shared": {
+                "frames": [
+                    {"name": frame_name, "file": filename, "line": line}
+                    for (frame_name, filename, line), _ in frames
+                ]
+            },
+            "profiles": profiles,
+        }
@@ -0,0 +1,121 @@
+"""
+On-disk ring of recorded profiles.
+
+Each profile is one speedscope JSON file named after its id. After every save
+the oldest files beyond max_profiles are deleted, so the directory never holds
+more than that. Files are written under a temporary name and renamed, so a
+reader never sees half a profile.
+
+The directory is shared by every worker, so it also holds what the rate limits
+need across processes: an ACTIVE_FILE whose flock marks the running profile
+(released by the kernel if the worker dies) and a STARTS_FILE with the start
+times of recent profiles, read and rewritten under an exclusive flock.
+"""
+
+import fcntl
+import json
+import os
+import re
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import IO, Any, Dict, Iterator, List, Optional
+
+SUFFIX = ".speedscope.json"
+PROFILE_ID = re.compile(r"^[0-9a-f]{32}$")
+ACTIVE_FILE = ".active.lock"
+STARTS_FILE = ".starts"
+
+
+class ProfileStore:
+    """Repository for recorded profiles on disk. No business logic here."""
+
+    def __init__(self, directory: str, max_profiles: int):
+        self.directory = directory
+        self.max_profiles = max_profiles
+
+    def path_for(self, profile_id: str) -> Optional[str]:
+        """Path of a stored profile, or None if the id is unknown or malformed."""
+        if not PROFILE_ID.match(profile_id):
+            return None
+        path = os.path.join(self.directory, profile_id + SUFFIX)
+        return path if os.path.exists(path) else None
+
+    def save(self, profile_id: str, document: dict) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        path = os.path.join(self.directory, profile_id + SUFFIX)
+        with open(path + ".tmp", "w") as f:
+            json.dump(document, f)
+        os.replace(path + ".tmp", path)
+        self._prune()
+
+    def claim_active(self) -> Optional[IO]:
+        """
+        Take the one-at-a-time lock without waiting.
+
+        Returns:
+            The handle to pass to release_active, or None if a profile is
+            already running in any worker
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        handle = open(os.path.join(self.directory, ACTIVE_FILE), "a")
+        try:
+            fcntl.flock(handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            handle.close()
+            return None
+        return handle
+
+    def release_active(self, handle: IO) -> None:
+        handle.close()
+
+    @contextmanager
+    def starts(self) -> Iterator[List[float]]:
+        """
+        Start times (time.time()) of recent profiles, across all workers.
+
+        The list may be edited inside the block; it is written back when the
+        block succeeds. Other workers wait for the block to finish.
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        with open(os.path.join(self.directory, STARTS_FILE), "a+") as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            f.seek(0)
+            starts = [float(line) for line in f.read().split()]
+            yield starts
+            f.seek(0)
+            f.truncate()
+            f.write("".join(f"{started}\n" for started in starts))
+
+    def _entries(self) -> List[os.DirEntry]:
+        if not os.path.isdir(self.directory):
+            return []
+        with os.scandir(self.directory) as entries:
+            profiles = [entry for entry in entries if entry.name.endswith(SUFFIX)]
+        return sorted(profiles, key=lambda entry: entry.stat().st_mtime, reverse=True)
+
+    def _prune(self) -> None:
+        for entry in self._entries()[self.max_profiles :]:
+            try:
+                os.remove(entry.path)
+            except FileNotFoundError:
+                pass  # Pruned by another worker
+
+    def list(self) -> List[Dict[str, Any]]:
+        """Stored profiles, newest first."""
+        summaries = []
+        for entry in self._entries():
+            try:
+                stat = entry.stat()
+                with open(entry.path) as f:
+                    name = json.load(f).get("name", "")
+            except (FileNotFoundError, ValueError):
+                continue
+            summaries.append(
+                {
+                    "id": entry.name[: -len(SUFFIX)],
+                    "name": name,
+                    "size": stat.st_size,
+                    "created_at": datetime.fromtimestamp(stat.st_mtime, timezone.utc),
+                }
+            )
+        return summaries
@@ -1,8 +1,18 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from sqlalchemy.orm import Session
 from uuid import UUID
+from typing import Optional
 
 from app.shared.database.database import get_db
+from app.shared.utils.pagination import (
+    CURSOR_DESCRIPTION,
+    InvalidCursorError,
+    set_next_cursor_header,
+)
+from app.shared.utils.settings_filters import (
+    InvalidSettingsFilterError,
+    parse_settings_filters,
+)
 from app.settings.infra.settings_repository import SettingsRepository
 from app.settings.core.settings_service import SettingsService
 from app.settings.api.settings_dto import (
@@ -16,6 +26,7 @@ from app.settings.core.settings_validators import (
     EnvironmentNotFoundError,
     SettingsKeyAlreadyExistsError,
 )
+from app.shared.dependencies.conditional_get import conditional_get
 from app.users.infra.user_model import UserRole, User
 from app.shared.dependencies.auth import require_role, get_current_user
 
@@ -68,13 +79,33 @@ def update_settings(
 
 @router.get("/settings/", response_model=list[SettingsWithEnvironment])
 def list_settings(
+    request: Request,
+    response: Response,
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = Query(None, description=CURSOR_DESCRIPTION),
     service: SettingsService = Depends(get_settings_service),
     current_user: User = Depends(get_current_user),
+    etag: str = conditional_get("settings", "environments"),
 ):
-    """List all settings."""
-    return service.get_settings_list(skip=skip, limit=limit)
+    """
+    List all settings.
+
+    Filter on the value with e.g. ?value=true, ?value>=3 or ?value.enabled=true.
+    """
+    try:
+        page = service.get_settings_list(
+            skip=skip,
+            limit=limit,
+            cursor=cursor,
+            value_filters=parse_settings_filters(
+                request.url.query, prefix="value", allow_root=True
+            ),
+        )
+    except (InvalidCursorError, InvalidSettingsFilterError) as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    set_next_cursor_header(response, page)
+    return page
 
 
 @router.get("/settings/{uuid}", response_model=SettingsWithEnvironment)
@@ -82,6 +113,7 @@ def get_settings(
     uuid: UUID,
     service: SettingsService = Depends(get_settings_service),
     current_user: User = Depends(get_current_user),
+    etag: str = conditional_get("settings", "environments"),
 ):
     """Get settings by UUID."""
     try:
@@ -1,5 +1,5 @@
 from uuid import uuid4, UUID
-from typing import List
+from typing import List, Optional
 from app.settings.infra.settings_repository import SettingsRepository
 from app.settings.infra.settings_model import Settings as SettingsModel
 from app.settings.api.settings_dto import (
@@ -15,6 +15,8 @@ from app.settings.core.settings_validators import (
     validate_environment_exists,
     validate_settings_key_uniqueness,
 )
+from app.shared.utils.pagination import map_page
+from app.shared.utils.settings_filters import SettingsFilter
 
 
 class SettingsService:
@@ -26,20 +28,17 @@ class SettingsService:
     def create_settings(self, dto: SettingsCreate) -> Settings:
         """Create a new settings."""
         validate_settings_create_dto(dto)
-        validate_environment_exists(self.repository, dto.environment_uuid)
-
-        environment = self.repository.find_environment_by_uuid(dto.environment_uuid)
+        environment = validate_environment_exists(self.repository, dto.environment_uuid)
         validate_settings_key_uniqueness(self.repository, dto.key, environment.id)
 
         settings = self._build_settings_entity(dto, environment.id)
-        return self.repository.create(settings)
+        with self.repository.unit_of_work():
+            return self.repository.create(settings)
 
     def update_settings(self, uuid: UUID, dto: SettingsUpdate) -> Settings:
         """Update an existing settings."""
         validate_settings_update_dto(dto)
-        validate_settings_exists(self.repository, uuid)
-
-        settings = self.repository.find_by_uuid(uuid)
+        settings = validate_settings_exists(self.repository, uuid)
 
         if dto.key is not None:
             validate_settings_key_uniqueness(
@@ -53,28 +52,32 @@ class SettingsService:
         if dto.description is not None:
             settings.description = dto.description
 
-        return self.repository.update(settings)
+        with self.repository.unit_of_work():
+            return self.repository.update(settings)
 
     def get_settings(self, uuid: UUID) -> SettingsWithEnvironment:
         """Get settings by UUID with environment."""
-        validate_settings_exists(self.repository, uuid)
-
-        settings = self.repository.find_by_uuid(uuid)
+        settings = validate_settings_exists(self.repository, uuid)
         return self._serialize_settings_with_environment(settings)
 
     def get_settings_list(
-        self, skip: int = 0, limit: int = 100
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        value_filters: Optional[List[SettingsFilter]] = None,
     ) -> List[SettingsWithEnvironment]:
         """Get all settings with environment."""
-        settings_list = self.repository.find_all(skip=skip, limit=limit)
-        return [self._serialize_settings_with_environment(s) for s in settings_list]
+        settings_list = self.repository.find_all(
+            skip=skip, limit=limit, cursor=cursor, value_filters=value_filters
+        )
+        return map_page(settings_list, self._serialize_settings_with_environment)
 
     def delete_settings(self, uuid: UUID) -> dict:
         """Delete a settings."""
-        validate_settings_exists(self.repository, uuid)
-
-        settings = self.repository.find_by_uuid(uuid)
-        self.repository.delete(settings)
+        settings = validate_settings_exists(self.repository, uuid)
+        with self.repository.unit_of_work():
+            self.repository.delete(settings)
 
         return {"detail": "Settings deleted successfully"}
 
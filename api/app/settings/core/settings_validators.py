@@ -1,5 +1,7 @@
 from uuid import UUID
 from app.settings.infra.settings_repository import SettingsRepository
+from app.settings.infra.settings_model import Settings as SettingsModel
+from app.environments.infra.environment_model import Environment as EnvironmentModel
 
 
 class SettingsNotFoundError(Exception):
@@ -38,18 +40,27 @@ def validate_settings_update_dto(dto) -> None:
         raise ValueError("Settings key cannot be empty")
 
 
-def validate_settings_exists(repository: SettingsRepository, uuid: UUID) -> None:
-    """Validate that settings exists. Raises SettingsNotFoundError if not found."""
+def validate_settings_exists(
+    repository: SettingsRepository, uuid: UUID
+) -> SettingsModel:
+    """
+    Validate that settings exists and return it.
+    Raises SettingsNotFoundError if not found.
+    """
     settings = repository.find_by_uuid(uuid)
     if not settings:
         raise SettingsNotFoundError(f"Settings with UUID '{uuid}' not found")
+    return settings
 
 
-def validate_environment_exists(repository: SettingsRepository, uuid: UUID) -> None:
-    """Validate that environment exists."""
+def validate_environment_exists(
+    repository: SettingsRepository, uuid: UUID
+) -> EnvironmentModel:
+    """Validate that environment exists and return it."""
     environment = repository.find_environment_by_uuid(uuid)
     if not environment:
         raise EnvironmentNotFoundError(f"Environment with UUID '{uuid}' not found")
+    return environment
 
 
 def validate_settings_key_uniqueness(
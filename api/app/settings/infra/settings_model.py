@@ -1,7 +1,15 @@
-from sqlalchemy import Column, String, JSON, Integer, ForeignKey, UniqueConstraint
+from sqlalchemy import (
+    Column,
+    String,
+    JSON,
+    Integer,
+    ForeignKey,
+    UniqueConstraint,
+    Index,
+)
 from sqlalchemy.orm import relationship
 from app.shared.database.database import Base
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from uuid import uuid4
 
 
@@ -11,12 +19,21 @@ class Settings(Base):
     id = Column(Integer, primary_key=True)
     uuid = Column(UUID(as_uuid=True), default=uuid4, unique=True, nullable=False)
     key = Column(String, nullable=False)
-    value = Column(JSON, nullable=False)
+    value = Column(JSON().with_variant(JSONB, "postgresql"), nullable=False)
     description = Column(String)
 
-    environment_id = Column(Integer, ForeignKey("environments.id"), nullable=False)
+    environment_id = Column(
+        Integer, ForeignKey("environments.id"), nullable=False, index=True
+    )
     environment = relationship("Environment", back_populates="settings")
 
     __table_args__ = (
         UniqueConstraint("key", "environment_id", name="uq_key_environment"),
+        # Containment (@>) filters on value
+        Index(
+            "ix_settings_value_gin",
+            "value",
+            postgresql_using="gin",
+            postgresql_ops={"value": "jsonb_path_ops"},
+        ),
     )
@@ -3,6 +3,13 @@ from uuid import UUID
 from typing import Optional, List
 from app.settings.infra.settings_model import Settings as SettingsModel
 from app.environments.infra.environment_model import Environment as EnvironmentModel
+from app.shared.database.lookup_cache import cached_lookup
+from app.shared.database.unit_of_work import UnitOfWork
+from app.shared.utils.pagination import paginate
+from app.shared.utils.settings_filters import (
+    SettingsFilter,
+    apply_settings_filters,
+)
 
 
 class SettingsRepository:
@@ -13,7 +20,14 @@ class SettingsRepository:
 
     def find_by_uuid(self, uuid: UUID) -> Optional[SettingsModel]:
         """Find settings by UUID."""
-        return self.db.query(SettingsModel).filter(SettingsModel.uuid == uuid).first()
+        return cached_lookup(
+            self.db,
+            SettingsModel,
+            uuid,
+            lambda: (
+                self.db.query(SettingsModel).filter(SettingsModel.uuid == uuid).first()
+            ),
+        )
 
     def find_by_key_and_environment_id(
         self, key: str, environment_id: int
@@ -27,36 +41,52 @@ class SettingsRepository:
             .first()
         )
 
-    def find_all(self, skip: int = 0, limit: int = 100) -> List[SettingsModel]:
-        """Find all settings."""
-        return self.db.query(SettingsModel).offset(skip).limit(limit).all()
+    def find_all(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        value_filters: Optional[List[SettingsFilter]] = None,
+    ) -> List[SettingsModel]:
+        """Find all settings, ordered by id (settings have no timestamps)."""
+        query = apply_settings_filters(
+            self.db.query(SettingsModel), SettingsModel.value, value_filters
+        )
+        return paginate(
+            query,
+            [SettingsModel.id],
+            skip=skip,
+            limit=limit,
+            cursor=cursor,
+        )
 
     def find_environment_by_uuid(self, uuid: UUID) -> Optional[EnvironmentModel]:
         """Find environment by UUID."""
-        return (
-            self.db.query(EnvironmentModel)
-            .filter(EnvironmentModel.uuid == uuid)
-            .first()
+        return cached_lookup(
+            self.db,
+            EnvironmentModel,
+            uuid,
+            lambda: (
+                self.db.query(EnvironmentModel)
+                .filter(EnvironmentModel.uuid == uuid)
+                .first()
+            ),
         )
 
     def create(self, settings: SettingsModel) -> SettingsModel:
         """Create a new settings."""
         self.db.add(settings)
         try:
-            self.db.commit()
-            self.db.refresh(settings)
+            self.db.flush()
         except Exception as e:
-            self.db.rollback()
             raise Exception(f"Failed to create settings: {str(e)}")
         return settings
 
     def update(self, settings: SettingsModel) -> SettingsModel:
         """Update an existing settings."""
         try:
-            self.db.commit()
-            self.db.refresh(settings)
+            self.db.flush()
         except Exception as e:
-            self.db.rollback()
             raise Exception(f"Failed to update settings: {str(e)}")
         return settings
 
@@ -64,11 +94,14 @@ class SettingsRepository:
         """Delete a settings."""
         self.db.delete(settings)
         try:
-            self.db.commit()
+            self.db.flush()
         except Exception as e:
-            self.db.rollback()
             raise Exception(f"Failed to delete settings: {str(e)}")
 
+    def unit_of_work(self) -> UnitOfWork:
+        """Open a transaction that commits once, when the block succeeds."""
+        return UnitOfWork(self.db)
+
     def rollback(self) -> None:
         """Rollback current transaction."""
         self.db.rollback()
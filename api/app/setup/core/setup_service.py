@@ -5,6 +5,7 @@ from sqlalchemy.orm import Session
 
 from app.users.infra.user_model import User, UserRole
 from app.auth.core.auth_service import AuthService
+from app.shared.database.unit_of_work import UnitOfWork
 
 
 class SetupService:
@@ -58,8 +59,7 @@ class SetupService:
             is_active=True,
         )
 
-        self.db.add(admin_user)
-        self.db.commit()
-        self.db.refresh(admin_user)
+        with UnitOfWork(self.db):
+            self.db.add(admin_user)
 
         return admin_user
@@ -1,7 +1,7 @@
 """Shared helper functions for application components (webapps, workers, cron)."""
 
 from uuid import uuid4
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional
 from sqlalchemy.orm import Session
 
 from app.shared.k8s.cluster_selection import ClusterSelectionService
@@ -11,6 +11,9 @@ from app.shared.infra.cluster_instance_model import (
 from app.webapps.infra.application_component_model import (
     ApplicationComponent as ApplicationComponentModel,
 )
+from app.shared.infra.deploy_context import is_loaded
+from app.shared.observability.metrics import observe_deploy
+from app.shared.observability.tracing import span
 from app.shared.serializers.serializers import serialize_settings
 
 
@@ -21,6 +24,35 @@ def get_cluster_for_instance(db: Session, instance: Any) -> Any:
     )
 
 
+def find_cluster_instance(
+    repository: Any, component: ApplicationComponentModel
+) -> Optional[ClusterInstanceModel]:
+    """
+    Find the cluster instance of a component.
+
+    Read from the component when its cluster instances were loaded with the
+    deploy context, otherwise looked up through the repository.
+    """
+    if is_loaded(component, "instances"):
+        return component.instances[0] if component.instances else None
+    return repository.find_cluster_instance_by_component_id(component.id)
+
+
+def find_environment_settings(
+    repository: Any, component: ApplicationComponentModel, environment_id: int
+) -> List[Any]:
+    """
+    Find the settings of the environment a component is deployed to.
+
+    Read from the component's environment when the deploy context loaded them,
+    otherwise looked up through the repository.
+    """
+    environment = component.instance.environment
+    if is_loaded(environment, "settings") and environment.id == environment_id:
+        return environment.settings
+    return repository.find_settings_by_environment_id(environment_id)
+
+
 def ensure_cluster_instance(
     repository: Any, component: ApplicationComponentModel, cluster: Any
 ) -> ClusterInstanceModel:
@@ -35,7 +67,7 @@ def ensure_cluster_instance(
     Returns:
         ClusterInstanceModel
     """
-    existing = repository.find_cluster_instance_by_component_id(component.id)
+    existing = find_cluster_instance(repository, component)
     if existing:
         return existing
 
@@ -62,7 +94,7 @@ def get_or_create_cluster_instance(
     Returns:
         ClusterInstanceModel
     """
-    cluster_instance = repository.find_cluster_instance_by_component_id(component.id)
+    cluster_instance = find_cluster_instance(repository, component)
     if cluster_instance:
         return cluster_instance
 
@@ -110,6 +142,8 @@ def deploy_to_kubernetes(
 ) -> None:
     """
     Deploy component to Kubernetes.
+    Runs inside the caller's unit of work: a failed apply raises, and the
+    rows written so far are rolled back with it.
 
     Args:
         component: ApplicationComponent entity
@@ -121,16 +155,19 @@ def deploy_to_kubernetes(
         upsert_to_k8s_func: Function to upsert to Kubernetes
         component_type: Type of component ('webapp', 'worker', 'cron')
     """
-    settings = repository.find_settings_by_environment_id(environment_id)
+    settings = find_environment_settings(repository, component, environment_id)
     settings_serialized = serialize_settings(settings)
 
     try:
-        upsert_to_k8s_func(cluster, component, settings_serialized, db)
-        db.commit()
-        db.refresh(component)
-        db.refresh(cluster_instance)
+        with (
+            observe_deploy(component_type),
+            span(
+                f"deploy {component_type}",
+                {"component.type": component_type, "k8s.cluster": cluster.name},
+            ),
+        ):
+            upsert_to_k8s_func(cluster, component, settings_serialized, db)
     except Exception as e:
-        db.rollback()
         raise Exception(
             f"Failed to deploy {component_type} to Kubernetes cluster '{cluster.name}': {str(e)}"
         )
@@ -156,19 +193,15 @@ def delete_from_kubernetes_safe(
         component_type: Type of component ('webapp', 'worker', 'cron')
     """
     try:
-        settings = repository.find_settings_by_environment_id(
-            component.instance.environment_id
+        settings = find_environment_settings(
+            repository, component, component.instance.environment_id
         )
         settings_serialized = serialize_settings(settings)
         delete_from_k8s_func(cluster, component, settings_serialized, db)
-        db.commit()
-        db.refresh(component)
     except Exception as e:
         print(
             f"Error removing {component_type} '{component.name}' from Kubernetes: {e}"
         )
-        db.commit()
-        db.refresh(component)
 
 
 def ensure_private_exposure_settings(settings_dict: Dict[str, Any]) -> Dict[str, Any]:
@@ -214,7 +247,7 @@ def delete_component(
     Returns:
         Success message dict
     """
-    cluster_instance = repository.find_cluster_instance_by_component_id(component.id)
+    cluster_instance = find_cluster_instance(repository, component)
     if cluster_instance:
         delete_from_k8s_safe_func(component, cluster_instance.cluster)
         repository.delete_cluster_instance(cluster_instance)
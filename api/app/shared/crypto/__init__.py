@@ -2,13 +2,19 @@
 Cryptography module for encrypting/decrypting secrets.
 
 Uses Fernet (AES-128-CBC + HMAC) for symmetric encryption.
-The encryption key is read from TRON_SECRETS_KEY environment variable.
+The encryption key is read from TRON_SECRETS_KEY environment variable, or
+from TRON_SECRETS_KEYS (newest first) while a key is being rotated.
 """
 
 from .secrets_crypto import (
     encrypt_secret,
     decrypt_secret,
+    encrypt_many,
+    decrypt_many,
+    rotate_many,
+    on_newest_key_many,
     get_or_generate_key,
+    get_secrets_keys,
     SecretsKeyNotConfiguredError,
 )
 
@@ -21,7 +27,12 @@ from .secrets_service import (
 __all__ = [
     "encrypt_secret",
     "decrypt_secret",
+    "encrypt_many",
+    "decrypt_many",
+    "rotate_many",
+    "on_newest_key_many",
     "get_or_generate_key",
+    "get_secrets_keys",
     "SecretsKeyNotConfiguredError",
     "encrypt_secrets_in_settings",
     "strip_secrets_from_settings",
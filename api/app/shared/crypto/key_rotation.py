@@ -0,0 +1,175 @@
+"""
+Re-encrypt stored component secrets with the newest key.
+
+Used after a new key has been put first in TRON_SECRETS_KEYS. Components are
+walked in primary key order, one batch per short transaction: the batch is read
+with FOR UPDATE (so an API write can't be overwritten with stale settings),
+re-encrypted in memory and written back with a single executemany UPDATE. Only
+ids and settings are loaded, never ORM objects, so memory stays flat however
+many components exist.
+
+The job is resumable: progress.last_id is the last component done, and passing
+it back as after_id continues from there. Re-running over rows that were
+already rotated is harmless.
+
+verify_component_secrets is the read-only check to run before the old key is
+dropped: it counts the components that still hold a value the newest key
+can't read.
+"""
+
+import time
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+from sqlalchemy import bindparam, func, select, update
+
+from app.shared.crypto.secrets_crypto import on_newest_key_many, rotate_many
+from app.webapps.infra.application_component_model import ApplicationComponent
+
+components = ApplicationComponent.__table__
+
+
+@dataclass
+class RotationProgress:
+    """Where a re-encryption run stands."""
+
+    total: int
+    processed: int = 0
+    updated: int = 0
+    failed: int = 0
+    last_id: int = 0
+
+
+def _rotate_settings(settings: Optional[dict], progress: RotationProgress):
+    """Settings with every secret re-encrypted, or None when there is nothing to do."""
+    secrets = (settings or {}).get("secrets") or []
+    values = [secret.get("value", "") for secret in secrets]
+    if not any(values):
+        return None
+
+    rotated_secrets = []
+    for secret, rotated in zip(secrets, rotate_many(values, strict=False)):
+        if rotated is None:
+            # Matches none of the configured keys; leave it as it is
+            progress.failed += 1
+            rotated = secret.get("value", "")
+        rotated_secrets.append({**secret, "value": rotated})
+    return {**settings, "secrets": rotated_secrets}
+
+
+def reencrypt_component_secrets(
+    session_factory: Callable,
+    batch_size: int = 500,
+    max_rows_per_second: Optional[float] = None,
+    after_id: int = 0,
+    on_batch: Optional[Callable[[RotationProgress], None]] = None,
+) -> RotationProgress:
+    """
+    Re-encrypt the secrets of every component after `after_id`.
+
+    Args:
+        session_factory: Callable returning a new Session (e.g. SessionLocal).
+        batch_size: Components per batch and transaction.
+        max_rows_per_second: Sleep between batches to stay under this rate.
+        after_id: Resume after this component id.
+        on_batch: Called with the progress after each committed batch.
+
+    Returns:
+        The final progress.
+    """
+    with session_factory() as session:
+        total = session.execute(
+            select(func.count())
+            .select_from(components)
+            .where(components.c.id > after_id)
+        ).scalar()
+    progress = RotationProgress(total=total, last_id=after_id)
+
+    write = (
+        update(components)
+        .where(components.c.id == bindparam("component_id"))
+        .values(settings=bindparam("rotated_settings"))
+    )
+
+    while True:
+        started = time.monotonic()
+        with session_factory() as session, session.begin():
+            rows = session.execute(
+                select(components.c.id, components.c.settings)
+                .where(components.c.id > progress.last_id)
+                .order_by(components.c.id)
+                .limit(batch_size)
+                .with_for_update()
+                .execution_options(stream_results=True, yield_per=batch_size)
+            )
+            batch = 0
+            changes = []
+            for component_id, settings in rows:
+                batch += 1
+                rotated = _rotate_settings(settings, progress)
+                if rotated is not None:
+                    changes.append(
+                        {"component_id": component_id, "rotated_settings": rotated}
+                    )
+                last_id = component_id
+            if changes:
+                session.execute(write, changes)
+
+        if not batch:
+            return progress
+
+        progress.processed += batch
+        progress.updated += len(changes)
+        progress.last_id = last_id
+        if on_batch:
+            on_batch(progress)
+
+        if max_rows_per_second:
+            remaining = batch / max_rows_per_second - (time.monotonic() - started)
+            if remaining > 0:
+                time.sleep(remaining)
+
+
+def verify_component_secrets(
+    session_factory: Callable,
+    batch_size: int = 500,
+    on_batch: Optional[Callable[[RotationProgress], None]] = None,
+) -> RotationProgress:
+    """
+    Count the components whose secrets are not all on the newest key.
+
+    Nothing is written. In the returned progress, `failed` is the number of
+    such components; `updated` stays 0.
+
+    Args:
+        session_factory: Callable returning a new Session (e.g. SessionLocal).
+        batch_size: Components read per query.
+        on_batch: Called with the progress after each batch.
+
+    Returns:
+        The final progress.
+    """
+    with session_factory() as session:
+        total = session.execute(select(func.count()).select_from(components)).scalar()
+    progress = RotationProgress(total=total)
+
+    while True:
+        with session_factory() as session:
+            rows = session.execute(
+                select(components.c.id, components.c.settings)
+                .where(components.c.id > progress.last_id)
+                .order_by(components.c.id)
+                .limit(batch_size)
+            ).all()
+        if not rows:
+            return progress
+
+        for component_id, settings in rows:
+            secrets = (settings or {}).get("secrets") or []
+            values = [secret.get("value", "") for secret in secrets]
+            if not all(on_newest_key_many(values)):
+                progress.failed += 1
+        progress.processed += len(rows)
+        progress.last_id = rows[-1][0]
+        if on_batch:
+            on_batch(progress)
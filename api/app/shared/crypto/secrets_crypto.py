@@ -7,12 +7,22 @@ This provides authenticated encryption - any tampering will be detected.
 Security notes:
 - The TRON_SECRETS_KEY must be kept secure
 - Losing the key means losing access to all encrypted secrets
-- Key rotation requires re-encrypting all secrets
+- To rotate, list the new key first in TRON_SECRETS_KEYS (new values use it,
+  old ones still decrypt with the others), then run
+  scripts/rotate_secrets_key.py to re-encrypt what is stored
 """
 
 import os
 import base64
-from cryptography.fernet import Fernet
+from functools import lru_cache
+from typing import Iterable, List, Optional, Tuple
+
+from cryptography.fernet import Fernet, InvalidToken, MultiFernet
+
+# Stored ciphertexts are "v2:<fernet token>". Values written before the prefix
+# existed are the Fernet token base64-encoded a second time (a third larger);
+# they are still read transparently.
+FORMAT_PREFIX = "v2:"
 
 
 class SecretsKeyNotConfiguredError(Exception):
@@ -57,10 +67,60 @@ def get_or_generate_key() -> str:
     raise SecretsKeyNotConfiguredError()
 
 
-def _get_fernet() -> Fernet:
-    """Get a Fernet instance with the configured key."""
-    key = get_or_generate_key()
-    return Fernet(key.encode() if isinstance(key, str) else key)
+def get_secrets_keys() -> List[str]:
+    """
+    Get the configured keys, newest first.
+
+    TRON_SECRETS_KEYS takes a comma-separated list for key rotation: values are
+    encrypted with the first key and decrypted with whichever key matches.
+    Without it, TRON_SECRETS_KEY (or the development key) is the only key.
+
+    Returns:
+        The Fernet keys as strings.
+    """
+    keys = [
+        key.strip()
+        for key in os.environ.get("TRON_SECRETS_KEYS", "").split(",")
+        if key.strip()
+    ]
+    return keys or [get_or_generate_key()]
+
+
+@lru_cache(maxsize=4)
+def _build_fernet(keys: Tuple[str, ...]) -> MultiFernet:
+    """Build the cipher for a key list. Cached, so a key change builds a new one."""
+    return MultiFernet([Fernet(key.encode()) for key in keys])
+
+
+def _get_fernet() -> MultiFernet:
+    """Get the cipher for the configured keys."""
+    return _build_fernet(tuple(get_secrets_keys()))
+
+
+def _token(ciphertext: str) -> bytes:
+    if ciphertext.startswith(FORMAT_PREFIX):
+        return ciphertext[len(FORMAT_PREFIX) :].encode("ascii")
+    # Legacy format: the Fernet token base64-encoded a second time
+    return base64.urlsafe_b64decode(ciphertext.encode("utf-8"))
+
+
+def _encrypt(fernet: MultiFernet, plaintext: str) -> str:
+    if not plaintext:
+        return ""
+    token = fernet.encrypt(plaintext.encode("utf-8"))
+    return FORMAT_PREFIX + token.decode("ascii")
+
+
+def _decrypt(fernet: MultiFernet, ciphertext: str) -> str:
+    if not ciphertext:
+        return ""
+    return fernet.decrypt(_token(ciphertext)).decode("utf-8")
+
+
+def _rotate(fernet: MultiFernet, ciphertext: str) -> str:
+    if not ciphertext:
+        return ""
+    return FORMAT_PREFIX + fernet.rotate(_token(ciphertext)).decode("ascii")
 
 
 def encrypt_secret(plaintext: str) -> str:
@@ -71,7 +131,7 @@ def encrypt_secret(plaintext: str) -> str:
         plaintext: The secret value to encrypt.
 
     Returns:
-        The encrypted value as a base64-encoded string.
+        The encrypted value: "v2:" followed by the Fernet token.
 
     Raises:
         SecretsKeyNotConfiguredError: If TRON_SECRETS_KEY is not set in production.
@@ -79,9 +139,7 @@ def encrypt_secret(plaintext: str) -> str:
     if not plaintext:
         return ""
 
-    fernet = _get_fernet()
-    encrypted = fernet.encrypt(plaintext.encode("utf-8"))
-    return base64.urlsafe_b64encode(encrypted).decode("utf-8")
+    return _encrypt(_get_fernet(), plaintext)
 
 
 def decrypt_secret(ciphertext: str) -> str:
@@ -89,7 +147,7 @@ def decrypt_secret(ciphertext: str) -> str:
     Decrypt a secret value.
 
     Args:
-        ciphertext: The encrypted value (base64-encoded).
+        ciphertext: The encrypted value, in the current or the legacy format.
 
     Returns:
         The decrypted plaintext value.
@@ -101,10 +159,118 @@ def decrypt_secret(ciphertext: str) -> str:
     if not ciphertext:
         return ""
 
+    return _decrypt(_get_fernet(), ciphertext)
+
+
+def encrypt_many(plaintexts: Iterable[str]) -> List[str]:
+    """
+    Encrypt several secret values with a single key lookup.
+
+    Args:
+        plaintexts: The secret values to encrypt.
+
+    Returns:
+        The encrypted values, in order.
+
+    Raises:
+        SecretsKeyNotConfiguredError: If TRON_SECRETS_KEY is not set in production.
+    """
+    fernet = _get_fernet()
+    return [_encrypt(fernet, plaintext) for plaintext in plaintexts]
+
+
+def decrypt_many(
+    ciphertexts: Iterable[str], strict: bool = True
+) -> List[Optional[str]]:
+    """
+    Decrypt several secret values with a single key lookup.
+
+    Args:
+        ciphertexts: The encrypted values, in the current or the legacy format.
+        strict: Raise on the first value that can't be decrypted. When False,
+            such values come back as None and the rest are still decrypted.
+
+    Returns:
+        The decrypted values, in order.
+
+    Raises:
+        SecretsKeyNotConfiguredError: If TRON_SECRETS_KEY is not set in production.
+        InvalidToken: If strict and a value is invalid or used a different key.
+    """
     fernet = _get_fernet()
-    encrypted = base64.urlsafe_b64decode(ciphertext.encode("utf-8"))
-    decrypted = fernet.decrypt(encrypted)
-    return decrypted.decode("utf-8")
+    decrypted = []
+    for ciphertext in ciphertexts:
+        try:
+            decrypted.append(_decrypt(fernet, ciphertext))
+        except (InvalidToken, ValueError):
+            if strict:
+                raise
+            decrypted.append(None)
+    return decrypted
+
+
+def rotate_many(ciphertexts: Iterable[str], strict: bool = True) -> List[Optional[str]]:
+    """
+    Re-encrypt several stored values with the newest key.
+
+    Values in the legacy format come back in the current one.
+
+    Args:
+        ciphertexts: The encrypted values, in the current or the legacy format.
+        strict: Raise on the first value no configured key can decrypt. When
+            False, such values come back as None and the rest are rotated.
+
+    Returns:
+        The re-encrypted values, in order.
+
+    Raises:
+        SecretsKeyNotConfiguredError: If TRON_SECRETS_KEY is not set in production.
+        InvalidToken: If strict and a value matches none of the keys.
+    """
+    fernet = _get_fernet()
+    rotated = []
+    for ciphertext in ciphertexts:
+        try:
+            rotated.append(_rotate(fernet, ciphertext))
+        except (InvalidToken, ValueError):
+            if strict:
+                raise
+            rotated.append(None)
+    return rotated
+
+
+def on_newest_key_many(ciphertexts: Iterable[str]) -> List[bool]:
+    """
+    Tell which stored values are already encrypted with the newest key.
+
+    Values in the legacy format never are. Nothing is decrypted with the other
+    keys, so a value no configured key can read is reported as False too.
+
+    Args:
+        ciphertexts: The encrypted values, in the current or the legacy format.
+
+    Returns:
+        One flag per value, in order; empty values count as up to date.
+
+    Raises:
+        SecretsKeyNotConfiguredError: If TRON_SECRETS_KEY is not set in production.
+    """
+    newest = _build_fernet(tuple(get_secrets_keys()[:1]))
+    flags = []
+    for ciphertext in ciphertexts:
+        if not ciphertext:
+            flags.append(True)
+            continue
+        if not ciphertext.startswith(FORMAT_PREFIX):
+            flags.append(False)
+            continue
+        try:
+            _decrypt(newest, ciphertext)
+        except (InvalidToken, ValueError):
+            flags.append(False)
+        else:
+            flags.append(True)
+    return flags
 
 
 def mask_secret_value(value: str, show_chars: int = 4) -> str:
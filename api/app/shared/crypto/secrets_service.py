@@ -6,7 +6,10 @@ and to strip secret values from API responses.
 """
 
 from typing import Dict, Any, List
-from .secrets_crypto import encrypt_secret
+from .secrets_crypto import encrypt_many, rotate_many
+
+# Returned instead of secret values; sent back unchanged, it keeps the stored value
+SECRET_PLACEHOLDER = "********"
 
 
 def encrypt_secrets_in_settings(settings: Dict[str, Any]) -> Dict[str, Any]:
@@ -30,15 +33,12 @@ def encrypt_secrets_in_settings(settings: Dict[str, Any]) -> Dict[str, Any]:
     encrypted_settings = copy.deepcopy(settings)
 
     if "secrets" in encrypted_settings and encrypted_settings["secrets"]:
-        encrypted_secrets = []
-        for secret in encrypted_settings["secrets"]:
-            encrypted_secrets.append(
-                {
-                    "key": secret.get("key", ""),
-                    "value": encrypt_secret(secret.get("value", "")),
-                }
-            )
-        encrypted_settings["secrets"] = encrypted_secrets
+        secrets = encrypted_settings["secrets"]
+        values = encrypt_many(secret.get("value", "") for secret in secrets)
+        encrypted_settings["secrets"] = [
+            {"key": secret.get("key", ""), "value": value}
+            for secret, value in zip(secrets, values)
+        ]
 
     return encrypted_settings
 
@@ -50,32 +50,28 @@ def strip_secrets_from_settings(settings: Dict[str, Any]) -> Dict[str, Any]:
     Secret keys are preserved but values are replaced with a placeholder.
     This ensures secrets are never exposed via the API.
 
+    Only the top-level dict and the secrets list are rebuilt; everything else
+    (envs, exposure, ...) is shared with the input, which is never modified.
+    Response DTOs call this from their settings validator, so ORM objects keep
+    their stored values.
+
     Args:
         settings: The settings dict containing a 'secrets' list.
 
     Returns:
         A new settings dict with secret values stripped.
     """
-    if not settings:
+    if not settings or not settings.get("secrets"):
         return settings
 
-    # Make a copy to avoid modifying the original
-    import copy
-
-    stripped_settings = copy.deepcopy(settings)
-
-    if "secrets" in stripped_settings and stripped_settings["secrets"]:
-        stripped_secrets = []
-        for secret in stripped_settings["secrets"]:
-            stripped_secrets.append(
-                {
-                    "key": secret.get("key", ""),
-                    "value": "********",  # Never expose actual values
-                }
-            )
-        stripped_settings["secrets"] = stripped_secrets
-
-    return stripped_settings
+    return {
+        **settings,
+        "secrets": [
+            # Never expose actual values
+            {"key": secret.get("key", ""), "value": SECRET_PLACEHOLDER}
+            for secret in settings["secrets"]
+        ],
+    }
 
 
 def merge_secrets_for_update(
@@ -85,8 +81,11 @@ def merge_secrets_for_update(
     """
     Merge new secrets with existing ones for updates.
 
-    If a new secret has value "********", preserve the existing encrypted value.
-    This allows updating other settings without re-entering all secret values.
+    If a new secret has value "********", preserve the existing value,
+    re-encrypted with the newest key: the row was read without a lock, so
+    writing the old ciphertext back could undo a key rotation batch that ran
+    in between. This allows updating other settings without re-entering all
+    secret values.
 
     Args:
         new_secrets: List of secrets from the update request.
@@ -102,15 +101,32 @@ def merge_secrets_for_update(
     existing_map = {s.get("key"): s.get("value") for s in (existing_secrets or [])}
 
     merged_secrets = []
+    to_encrypt = []
+    to_rotate = []
     for secret in new_secrets:
         key = secret.get("key", "")
         value = secret.get("value", "")
 
-        if value == "********" and key in existing_map:
-            # Preserve existing encrypted value
-            merged_secrets.append({"key": key, "value": existing_map[key]})
+        if value == SECRET_PLACEHOLDER and key in existing_map:
+            # Preserve existing value (rotated to the newest key below)
+            merged = {"key": key, "value": existing_map[key]}
+            merged_secrets.append(merged)
+            to_rotate.append(merged)
         else:
-            # Encrypt new value
-            merged_secrets.append({"key": key, "value": encrypt_secret(value)})
+            # Encrypt new value (all of them in one pass below)
+            merged = {"key": key, "value": value}
+            merged_secrets.append(merged)
+            to_encrypt.append(merged)
+
+    for merged, value in zip(
+        to_encrypt, encrypt_many(merged["value"] for merged in to_encrypt)
+    ):
+        merged["value"] = value
+    for merged, value in zip(
+        to_rotate, rotate_many((merged["value"] for merged in to_rotate), strict=False)
+    ):
+        # A value no configured key can read is kept as it is
+        if value is not None:
+            merged["value"] = value
 
     return merged_secrets
@@ -0,0 +1,5 @@
+# Register the resource version, lookup cache and unit of work listeners for
+# every session, whichever entry point (API, scripts, tests) opened it
+from app.shared.database import lookup_cache  # noqa: F401
+from app.shared.database import resource_versions  # noqa: F401
+from app.shared.database import unit_of_work  # noqa: F401
@@ -1,3 +1,4 @@
+import logging
 import os
 
 from sqlalchemy import create_engine
@@ -6,19 +7,50 @@ from sqlalchemy.orm import sessionmaker
 # Import Base from app.database to ensure all models are in the same registry
 # This is necessary for SQLAlchemy relationships to work correctly
 from app.database import Base
+from app.shared.database.pool import InstrumentedQueuePool, build_pool_options
+from app.shared.database.unit_of_work import has_uncommitted_writes
+from app.shared.observability.metrics import instrument_engine
 
-__all__ = ["Base", "SessionLocal", "engine", "get_db"]
+logger = logging.getLogger(__name__)
 
-if os.getenv("ENV") == "test":
-    TEST_DATABASE_URL = "sqlite:///:memory:"
-    engine = create_engine(TEST_DATABASE_URL, connect_args={"check_same_thread": False})
-else:
+__all__ = [
+    "Base",
+    "SessionLocal",
+    "engine",
+    "get_db",
+    "get_async_engine",
+    "get_async_db",
+    "is_async_enabled",
+]
+
+
+def _postgres_url(driver: str = "postgresql") -> str:
     DB_HOST = os.getenv("DB_HOST")
     DB_USER = os.getenv("DB_USER")
     DB_PASSWORD = os.getenv("DB_PASSWORD")
     DB_NAME = os.getenv("DB_NAME")
-    DATABASE_URL = f"postgresql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}/{DB_NAME}"
-    engine = create_engine(DATABASE_URL)
+    return f"{driver}://{DB_USER}:{DB_PASSWORD}@{DB_HOST}/{DB_NAME}"
+
+
+if os.getenv("ENV") == "test":
+    TEST_DATABASE_URL = "sqlite:///:memory:"
+    engine = create_engine(TEST_DATABASE_URL, connect_args={"check_same_thread": False})
+else:
+    DATABASE_URL = _postgres_url()
+    pool_options = build_pool_options()
+    statement_timeout_ms = pool_options.pop("statement_timeout_ms")
+    connect_args = {}
+    if statement_timeout_ms:
+        # Applied per connection so runaway queries can't hold a pooled connection forever
+        connect_args["options"] = f"-c statement_timeout={statement_timeout_ms}"
+    engine = create_engine(
+        DATABASE_URL,
+        poolclass=InstrumentedQueuePool,
+        connect_args=connect_args,
+        **pool_options,
+    )
+
+instrument_engine(engine)
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
@@ -29,4 +61,57 @@ def get_db():
     try:
         yield db
     finally:
+        if has_uncommitted_writes(db):
+            # Flushed outside a unit of work; close() rolls these back
+            logger.warning("Discarding writes that no unit of work committed")
         db.close()
+
+
+# Optional async engine (DB_ASYNC_ENABLED=true). Built lazily so the asyncpg
+# driver is only required when the feature is switched on.
+_async_engine = None
+_AsyncSessionLocal = None
+
+
+def is_async_enabled() -> bool:
+    """Check whether the async engine is enabled for this process."""
+    return os.getenv("DB_ASYNC_ENABLED", "false").lower() == "true"
+
+
+def get_async_engine():
+    """Return the process-wide async engine, creating it on first use."""
+    global _async_engine, _AsyncSessionLocal
+
+    if not is_async_enabled():
+        raise RuntimeError(
+            "Async database engine is disabled. Set DB_ASYNC_ENABLED=true to use it."
+        )
+
+    if _async_engine is None:
+        from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+        pool_options = build_pool_options()
+        statement_timeout_ms = pool_options.pop("statement_timeout_ms")
+        connect_args = {}
+        if statement_timeout_ms:
+            connect_args["server_settings"] = {
+                "statement_timeout": str(statement_timeout_ms)
+            }
+
+        _async_engine = create_async_engine(
+            _postgres_url("postgresql+asyncpg"),
+            connect_args=connect_args,
+            **pool_options,
+        )
+        instrument_engine(_async_engine.sync_engine, database="primary-async")
+        _AsyncSessionLocal = async_sessionmaker(
+            bind=_async_engine, autoflush=False, expire_on_commit=False
+        )
+    return _async_engine
+
+
+# Dependency to get an async DB session (read-heavy endpoints)
+async def get_async_db():
+    get_async_engine()
+    async with _AsyncSessionLocal() as db:
+        yield db
@@ -0,0 +1,83 @@
+"""
+Request-scoped lookup cache for entities fetched by UUID.
+
+A request often loads the same row more than once: a validator checks that it
+exists, then the service fetches it again (sometimes with relations). The
+session identity map doesn't help, because a filter on uuid always runs the
+SELECT. Repositories route their by-UUID lookups through cached_lookup, which
+keeps the result in session.info under (model, uuid, load options).
+
+The API opens one session per request, so the cache lives as long as the
+request's transaction: it is dropped when the transaction ends (commit,
+rollback or close), on bulk UPDATE/DELETE statements, and deleted objects are
+evicted on flush. Misses are never cached, so a row created later in the same
+request is found.
+"""
+
+from typing import Any, Callable, Hashable, Optional, Tuple, TypeVar
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+T = TypeVar("T")
+
+CACHE_KEY = "lookup_cache"
+
+
+def cached_lookup(
+    database_session: Session,
+    model: type,
+    uuid: Any,
+    loader: Callable[[], Optional[T]],
+    options: Tuple[Hashable, ...] = (),
+) -> Optional[T]:
+    """
+    Return the cached entity for (model, uuid, options), loading it on a miss.
+
+    Args:
+        database_session: Session of the current request
+        model: Mapped class being looked up
+        uuid: UUID of the row
+        loader: Runs the query when the entity isn't cached
+        options: Anything that changes what the query loads (type filter,
+            eager loaded relations)
+
+    Returns:
+        The entity, or None if the row doesn't exist
+    """
+    cache = database_session.info.setdefault(CACHE_KEY, {})
+    key = (model, str(uuid), options)
+    entity = cache.get(key)
+    if entity is None:
+        entity = loader()
+        if entity is not None:
+            cache[key] = entity
+    return entity
+
+
+def clear_lookup_cache(database_session: Session) -> None:
+    """Forget every cached entity of the session."""
+    database_session.info.pop(CACHE_KEY, None)
+
+
+@event.listens_for(Session, "after_flush")
+def _evict_deleted(session, flush_context):
+    cache = session.info.get(CACHE_KEY)
+    if not cache or not session.deleted:
+        return
+    deleted = {id(obj) for obj in session.deleted}
+    for key in [key for key, entity in cache.items() if id(entity) in deleted]:
+        del cache[key]
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _clear_on_bulk_write(orm_execute_state):
+    if orm_execute_state.is_update or orm_execute_state.is_delete:
+        clear_lookup_cache(orm_execute_state.session)
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _clear_on_transaction_end(session, transaction):
+    # Savepoints have a parent; only the outermost transaction ends the request scope
+    if transaction.parent is None:
+        clear_lookup_cache(session)
@@ -0,0 +1,148 @@
+"""Connection pool configuration and checkout metrics."""
+
+import os
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from sqlalchemy import exc
+from sqlalchemy.pool import QueuePool
+
+from app.shared.observability.metrics import observe_db_pool_checkout
+
+__all__ = [
+    "InstrumentedQueuePool",
+    "build_pool_options",
+    "get_pool_stats",
+    "reset_pool_stats",
+]
+
+DEFAULT_POOL_SIZE = 10
+DEFAULT_MAX_OVERFLOW = 10
+DEFAULT_POOL_TIMEOUT = 10
+DEFAULT_POOL_RECYCLE = 1800
+
+
+def _env_int(name: str, default: Optional[int]) -> Optional[int]:
+    """Read an integer from the environment, falling back to default when unset."""
+    value = os.getenv(name)
+    if value is None or value.strip() == "":
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        raise ValueError(
+            f"Environment variable {name} must be an integer, got '{value}'"
+        )
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    """Read a boolean flag from the environment."""
+    value = os.getenv(name)
+    if value is None or value.strip() == "":
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+def build_pool_options() -> Dict[str, Any]:
+    """
+    Build pool keyword arguments for create_engine from DB_POOL_* variables.
+
+    Returns:
+        Dict with pool_size, max_overflow, pool_timeout, pool_recycle,
+        pool_pre_ping and, when DB_STATEMENT_TIMEOUT_MS is set, the
+        statement timeout (in milliseconds) under "statement_timeout_ms".
+    """
+    return {
+        "pool_size": _env_int("DB_POOL_SIZE", DEFAULT_POOL_SIZE),
+        "max_overflow": _env_int("DB_MAX_OVERFLOW", DEFAULT_MAX_OVERFLOW),
+        "pool_timeout": _env_int("DB_POOL_TIMEOUT", DEFAULT_POOL_TIMEOUT),
+        "pool_recycle": _env_int("DB_POOL_RECYCLE", DEFAULT_POOL_RECYCLE),
+        "pool_pre_ping": _env_bool("DB_POOL_PRE_PING", True),
+        "statement_timeout_ms": _env_int("DB_STATEMENT_TIMEOUT_MS", None),
+    }
+
+
+class _PoolStats:
+    """Process-wide counters for pool checkouts. Thread safe."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.checkouts = 0
+            self.timeouts = 0
+            self.wait_seconds_total = 0.0
+            self.wait_seconds_max = 0.0
+
+    def record_checkout(self, waited: float) -> None:
+        with self._lock:
+            self.checkouts += 1
+            self.wait_seconds_total += waited
+            if waited > self.wait_seconds_max:
+                self.wait_seconds_max = waited
+
+    def record_timeout(self) -> None:
+        with self._lock:
+            self.timeouts += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "wait_seconds_total": self.wait_seconds_total,
+                "wait_seconds_max": self.wait_seconds_max,
+            }
+
+
+_stats = _PoolStats()
+
+
+class InstrumentedQueuePool(QueuePool):
+    """QueuePool that records how long each checkout waited for a connection."""
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            _stats.record_timeout()
+            observe_db_pool_checkout(None)
+            raise
+        waited = time.perf_counter() - started
+        _stats.record_checkout(waited)
+        observe_db_pool_checkout(waited)
+        return connection
+
+
+def get_pool_stats(engine) -> Dict[str, Any]:
+    """
+    Return current pool occupancy plus cumulative checkout metrics.
+
+    Args:
+        engine: SQLAlchemy engine whose pool should be inspected
+
+    Returns:
+        Dict with size, checked_out, overflow and the checkout counters.
+        Occupancy fields are omitted for pools that don't track them (e.g. SQLite).
+    """
+    stats = _stats.snapshot()
+    pool = engine.pool
+    if isinstance(pool, QueuePool):
+        stats.update(
+            {
+                "size": pool.size(),
+                "checked_out": pool.checkedout(),
+                "overflow": pool.overflow(),
+                "max_overflow": pool._max_overflow,
+            }
+        )
+    return stats
+
+
+def reset_pool_stats() -> None:
+    """Reset cumulative checkout counters (used by tests and load runs)."""
+    _stats.reset()
@@ -0,0 +1,262 @@
+"""Read-replica routing for read-only endpoints.
+
+Replicas are configured with DB_READ_HOSTS (comma separated) or DB_READ_HOST.
+GET handlers depend on get_read_db, which hands out a replica session unless:
+
+- no replica is configured,
+- the client wrote something within DB_READ_STICKY_SECONDS (read-your-writes),
+- every replica lags more than DB_REPLICA_MAX_LAG_SECONDS or is unreachable.
+
+In all of those cases the primary session from get_db is used.
+
+Lag is measured by a background task every DB_REPLICA_LAG_CHECK_SECONDS, so
+requests only read the cached values and never wait on a replica connection.
+Until the first measurement, or when the task stops reporting for three
+intervals, replicas are skipped. Replica connections time out after
+DB_REPLICA_CONNECT_TIMEOUT_SECONDS.
+"""
+
+import asyncio
+import itertools
+import logging
+import os
+import threading
+import time
+from typing import Dict, List, Optional
+
+from fastapi import Depends, Request
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session, sessionmaker
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from app.shared.database.database import get_db
+from app.shared.database.pool import InstrumentedQueuePool, build_pool_options
+from app.shared.observability.metrics import instrument_engine
+
+__all__ = [
+    "LAST_WRITE_COOKIE",
+    "LAST_WRITE_HEADER",
+    "ReadYourWritesMiddleware",
+    "ReplicaRouter",
+    "get_read_db",
+    "get_replica_router",
+    "get_replica_hosts",
+    "start_replica_lag_checks",
+    "stop_replica_lag_checks",
+]
+
+logger = logging.getLogger(__name__)
+
+LAST_WRITE_COOKIE = "tron_last_write"
+LAST_WRITE_HEADER = "X-Tron-Last-Write"
+
+SAFE_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+# Lag of a replica that is fully caught up reads as 0 even when the primary is idle
+REPLICA_LAG_QUERY = text(
+    "SELECT CASE WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+    "ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) END"
+)
+
+
+def get_replica_hosts() -> List[str]:
+    """Return configured replica hosts from DB_READ_HOSTS / DB_READ_HOST."""
+    raw = os.getenv("DB_READ_HOSTS") or os.getenv("DB_READ_HOST") or ""
+    return [host.strip() for host in raw.split(",") if host.strip()]
+
+
+def get_sticky_seconds() -> float:
+    """Seconds after a write during which the client reads from the primary."""
+    return float(os.getenv("DB_READ_STICKY_SECONDS", "5"))
+
+
+class ReplicaRouter:
+    """Picks a healthy replica engine, round robin, skipping lagging ones."""
+
+    def __init__(
+        self,
+        engines: List,
+        max_lag_seconds: float = 10.0,
+        lag_check_interval: float = 5.0,
+    ):
+        self.engines = engines
+        self.max_lag_seconds = max_lag_seconds
+        self.lag_check_interval = lag_check_interval
+        self._sessionmakers = {
+            id(engine): sessionmaker(autocommit=False, autoflush=False, bind=engine)
+            for engine in engines
+        }
+        self._cycle = itertools.cycle(engines) if engines else None
+        self._lag: Dict[int, Optional[float]] = {}
+        self._checked_at: Optional[float] = None
+        self._lock = threading.Lock()
+        self._task: Optional[asyncio.Task] = None
+
+    def _measure_lag(self, engine) -> Optional[float]:
+        """Return replication lag in seconds, or None when the replica is unreachable."""
+        try:
+            with engine.connect() as connection:
+                value = connection.execute(REPLICA_LAG_QUERY).scalar()
+            return float(value or 0)
+        except Exception as e:
+            logger.warning(f"Replica lag check failed for {engine.url.host}: {e}")
+            return None
+
+    def refresh_lag(self) -> None:
+        """Measure the lag of every replica (blocking) and store it."""
+        lags = {id(engine): self._measure_lag(engine) for engine in self.engines}
+        with self._lock:
+            self._lag = lags
+            self._checked_at = time.monotonic()
+
+    def replica_lag(self, engine) -> Optional[float]:
+        """
+        Return the last measured replication lag.
+
+        None, like an unreachable replica, before the first measurement and
+        once the measurements are older than three check intervals.
+        """
+        with self._lock:
+            if (
+                self._checked_at is None
+                or time.monotonic() - self._checked_at > 3 * self.lag_check_interval
+            ):
+                return None
+            return self._lag.get(id(engine))
+
+    def is_healthy(self, engine) -> bool:
+        lag = self.replica_lag(engine)
+        return lag is not None and lag <= self.max_lag_seconds
+
+    def choose_engine(self):
+        """Return the next healthy replica engine, or None to use the primary."""
+        if not self._cycle:
+            return None
+        for _ in range(len(self.engines)):
+            engine = next(self._cycle)
+            if self.is_healthy(engine):
+                return engine
+        return None
+
+    def session_for(self, engine) -> Session:
+        return self._sessionmakers[id(engine)]()
+
+    async def _loop(self) -> None:
+        while True:
+            await run_in_threadpool(self.refresh_lag)
+            await asyncio.sleep(self.lag_check_interval)
+
+    def start(self) -> None:
+        if self._task is None and self.engines:
+            self._task = asyncio.get_running_loop().create_task(self._loop())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+_router: Optional[ReplicaRouter] = None
+_router_lock = threading.Lock()
+
+
+def _build_router() -> ReplicaRouter:
+    hosts = get_replica_hosts()
+    engines = []
+    if hosts and os.getenv("ENV") != "test":
+        pool_options = build_pool_options()
+        statement_timeout_ms = pool_options.pop("statement_timeout_ms")
+        connect_args = {
+            "connect_timeout": int(os.getenv("DB_REPLICA_CONNECT_TIMEOUT_SECONDS", "2"))
+        }
+        if statement_timeout_ms:
+            connect_args["options"] = f"-c statement_timeout={statement_timeout_ms}"
+        DB_USER = os.getenv("DB_READ_USER") or os.getenv("DB_USER")
+        DB_PASSWORD = os.getenv("DB_READ_PASSWORD") or os.getenv("DB_PASSWORD")
+        DB_NAME = os.getenv("DB_NAME")
+        for host in hosts:
+            engine = create_engine(
+                f"postgresql://{DB_USER}:{DB_PASSWORD}@{host}/{DB_NAME}",
+                poolclass=InstrumentedQueuePool,
+                connect_args=connect_args,
+                **pool_options,
+            )
+            instrument_engine(engine, database=host)
+            engines.append(engine)
+    return ReplicaRouter(
+        engines,
+        max_lag_seconds=float(os.getenv("DB_REPLICA_MAX_LAG_SECONDS", "10")),
+        lag_check_interval=float(os.getenv("DB_REPLICA_LAG_CHECK_SECONDS", "5")),
+    )
+
+
+def get_replica_router() -> ReplicaRouter:
+    """Return the process-wide replica router, building it on first use."""
+    global _router
+    if _router is None:
+        with _router_lock:
+            if _router is None:
+                _router = _build_router()
+    return _router
+
+
+async def start_replica_lag_checks() -> None:
+    get_replica_router().start()
+
+
+async def stop_replica_lag_checks() -> None:
+    await get_replica_router().stop()
+
+
+def _wrote_recently(request: Request) -> bool:
+    """Check the client's last-write marker (cookie or header)."""
+    raw = request.headers.get(LAST_WRITE_HEADER) or request.cookies.get(
+        LAST_WRITE_COOKIE
+    )
+    if not raw:
+        return False
+    try:
+        last_write = float(raw)
+    except ValueError:
+        return False
+    return time.time() - last_write < get_sticky_seconds()
+
+
+# Dependency to get a read-only DB session (replica when possible)
+def get_read_db(request: Request, database_session: Session = Depends(get_db)):
+    router = get_replica_router()
+    engine = None if _wrote_recently(request) else router.choose_engine()
+    if engine is None:
+        # Primary session is managed (and closed) by get_db
+        yield database_session
+        return
+
+    db = router.session_for(engine)
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+class ReadYourWritesMiddleware(BaseHTTPMiddleware):
+    """Marks clients that just wrote so their next reads go to the primary."""
+
+    async def dispatch(self, request: Request, call_next):
+        response = await call_next(request)
+        if request.method not in SAFE_METHODS and response.status_code < 400:
+            now = f"{time.time():.3f}"
+            sticky_seconds = get_sticky_seconds()
+            response.headers[LAST_WRITE_HEADER] = now
+            response.set_cookie(
+                LAST_WRITE_COOKIE,
+                now,
+                max_age=max(int(sticky_seconds), 1),
+                httponly=True,
+                samesite="lax",
+            )
+        return response
@@ -0,0 +1,69 @@
+"""
+Per-table version counters for conditional GETs.
+
+Every flush that inserts, changes or deletes rows of a tracked table bumps the
+counter of that table in resource_versions, inside the same transaction.
+Reading the counters is a primary key lookup, so endpoints can answer
+If-None-Match before running their real query. The counters live in the
+database, so they stay correct across API processes. updated_at can't be used
+for this, because nothing bumps it on Postgres.
+"""
+
+from typing import Dict, Iterable
+
+from sqlalchemy import event, insert, select, update
+from sqlalchemy.orm import Session
+
+from app.shared.infra.resource_version_model import ResourceVersion
+
+# Tables with versioned list/detail endpoints
+TRACKED_TABLES = frozenset(
+    {
+        "templates",
+        "component_template_configs",
+        "environments",
+        "settings",
+        "clusters",
+    }
+)
+
+
+def get_resource_versions(
+    database_session: Session, resources: Iterable[str]
+) -> Dict[str, int]:
+    """Get the current version of each resource (0 if it never changed)."""
+    resources = list(resources)
+    rows = database_session.execute(
+        select(ResourceVersion.resource, ResourceVersion.version).where(
+            ResourceVersion.resource.in_(resources)
+        )
+    ).all()
+    versions = dict.fromkeys(resources, 0)
+    versions.update({resource: version for resource, version in rows})
+    return versions
+
+
+def _changed_tables(session: Session) -> set:
+    tables = set()
+    for obj in session.new | session.deleted:
+        tables.add(getattr(obj, "__tablename__", None))
+    for obj in session.dirty:
+        if session.is_modified(obj, include_collections=False):
+            tables.add(getattr(obj, "__tablename__", None))
+    return tables & TRACKED_TABLES
+
+
+@event.listens_for(Session, "after_flush")
+def _bump_resource_versions(session, flush_context):
+    connection = session.connection()
+    for table in sorted(_changed_tables(session)):
+        result = connection.execute(
+            update(ResourceVersion)
+            .where(ResourceVersion.resource == table)
+            .values(version=ResourceVersion.version + 1)
+        )
+        if result.rowcount == 0:
+            # Rows are seeded by the migration; this covers create_all() databases
+            connection.execute(
+                insert(ResourceVersion).values(resource=table, version=1)
+            )
@@ -0,0 +1,85 @@
+"""
+Unit of work: one transaction per service call.
+
+Repositories only add/delete and flush, so rows get their ids and server
+defaults (INSERT ... RETURNING) without ending the transaction. The service
+wraps each write use case in a UnitOfWork, which commits once when the block
+succeeds and rolls back everything when it raises. A failed Kubernetes apply
+therefore no longer leaves half-written rows behind.
+
+    with self.repository.unit_of_work():
+        webapp = self.repository.create(webapp)
+        deploy(webapp)
+
+Nested units (a service calling another one) join the outermost transaction.
+The commit doesn't expire loaded objects: their state was just flushed, so
+reloading every attribute for the response would only repeat what the
+database already returned.
+"""
+
+import logging
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+DEPTH_KEY = "unit_of_work_depth"
+UNCOMMITTED_KEY = "uncommitted_writes"
+
+
+class UnitOfWork:
+    """Transaction boundary for one service call."""
+
+    def __init__(self, database_session: Session):
+        self.db = database_session
+
+    def __enter__(self) -> "UnitOfWork":
+        self.db.info[DEPTH_KEY] = self.db.info.get(DEPTH_KEY, 0) + 1
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> bool:
+        depth = self.db.info[DEPTH_KEY] - 1
+        self.db.info[DEPTH_KEY] = depth
+        if depth:
+            return False
+        if exc_type is not None:
+            self.db.rollback()
+            return False
+        self.commit()
+        return False
+
+    def commit(self) -> None:
+        """Commit without expiring the objects that were just written."""
+        expire_on_commit = self.db.expire_on_commit
+        self.db.expire_on_commit = False
+        try:
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        finally:
+            self.db.expire_on_commit = expire_on_commit
+
+
+def has_uncommitted_writes(database_session: Session) -> bool:
+    """Whether the session flushed changes that no commit has covered yet."""
+    return database_session.info.get(UNCOMMITTED_KEY, False)
+
+
+@event.listens_for(Session, "after_flush")
+def _mark_uncommitted(session, flush_context):
+    if session.new or session.dirty or session.deleted:
+        session.info[UNCOMMITTED_KEY] = True
+
+
+@event.listens_for(Session, "after_bulk_update")
+@event.listens_for(Session, "after_bulk_delete")
+def _mark_uncommitted_bulk(context):
+    context.session.info[UNCOMMITTED_KEY] = True
+
+
+@event.listens_for(Session, "after_commit")
+@event.listens_for(Session, "after_rollback")
+def _clear_uncommitted(session):
+    session.info.pop(UNCOMMITTED_KEY, None)
@@ -0,0 +1,52 @@
+"""Conditional GET (weak ETag / 304) for rarely changing resources."""
+
+import os
+
+from fastapi import Depends, HTTPException, Request, Response
+from sqlalchemy.orm import Session
+
+from app.shared.database.database import get_db
+from app.shared.database.resource_versions import get_resource_versions
+from app.shared.utils.etag import etag_matches, make_etag
+
+# Responses are per user: browsers may keep them but must revalidate, shared
+# caches (nginx) must not store them
+CACHE_CONTROL = "private, no-cache"
+
+APP_VERSION = os.getenv("APP_VERSION", "dev")
+
+
+def conditional_get(*resources: str):
+    """
+    Dependency answering If-None-Match from resource versions.
+
+    The weak ETag is derived from the versions of the given tables, the URL and
+    the API version, so it is known before the endpoint runs its query. When
+    the client already has the current representation, a 304 is raised right
+    away. Declare it after the authentication dependency.
+
+    Args:
+        resources: Tables whose rows appear in the response
+
+    Returns:
+        Depends marker to use as a route parameter default
+    """
+
+    def check_etag(
+        request: Request,
+        response: Response,
+        database_session: Session = Depends(get_db),
+    ) -> str:
+        versions = get_resource_versions(database_session, resources)
+        fingerprint = "|".join(
+            [APP_VERSION, request.url.path, request.url.query]
+            + [f"{resource}={versions[resource]}" for resource in sorted(versions)]
+        )
+        etag = make_etag(fingerprint.encode(), weak=True)
+        headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+        if etag_matches(request, etag):
+            raise HTTPException(status_code=304, headers=headers)
+        response.headers.update(headers)
+        return etag
+
+    return Depends(check_etag)
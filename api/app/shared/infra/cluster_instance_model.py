@@ -17,7 +17,7 @@ class ClusterInstance(Base):
     uuid = Column(UUID(as_uuid=True), default=uuid4, unique=True, nullable=False)
 
     application_component_id = Column(
-        Integer, ForeignKey("application_components.id"), nullable=False
+        Integer, ForeignKey("application_components.id"), nullable=False, index=True
     )
     application_component = relationship(
         "ApplicationComponent",
@@ -36,6 +36,7 @@ class ClusterInstance(Base):
         DateTime, server_default=func.now(), server_onupdate=func.now(), nullable=False
     )
 
+    # cluster_id lookups use the unique constraint below (cluster_id is its first column)
     __table_args__ = (
         UniqueConstraint(
             "cluster_id", "application_component_id", name="cluster_instance_cluster_id"
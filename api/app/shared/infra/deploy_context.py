@@ -0,0 +1,67 @@
+"""
+Loader options for deploying and deleting application components.
+
+Rendering a component for Kubernetes reads its instance, application and
+environment, the environment settings, and the cluster instance and cluster it
+runs on. Loaded bare, each of those is a lazy load per component. These options
+fetch all of it with the component (or instance): the many-to-one chain in the
+same joined query, then settings and cluster instances (with their cluster) in
+one SELECT ... IN each, however many components there are.
+"""
+
+from typing import Any, Tuple
+
+from sqlalchemy import inspect
+from sqlalchemy.orm import joinedload, selectinload
+from sqlalchemy.orm.interfaces import LoaderOption
+
+from app.environments.infra.environment_model import Environment as EnvironmentModel
+from app.instances.infra.instance_model import Instance as InstanceModel
+from app.shared.infra.cluster_instance_model import (
+    ClusterInstance as ClusterInstanceModel,
+)
+from app.webapps.infra.application_component_model import (
+    ApplicationComponent as ApplicationComponentModel,
+)
+
+
+def component_deploy_context() -> Tuple[LoaderOption, ...]:
+    """Options for a component query: everything a deploy or delete reads."""
+    instance = joinedload(ApplicationComponentModel.instance)
+    return (
+        instance.joinedload(InstanceModel.application),
+        instance.joinedload(InstanceModel.environment).selectinload(
+            EnvironmentModel.settings
+        ),
+        selectinload(ApplicationComponentModel.instances).joinedload(
+            ClusterInstanceModel.cluster
+        ),
+    )
+
+
+def instance_deploy_context(
+    load_components: bool = True,
+) -> Tuple[LoaderOption, ...]:
+    """
+    Options for an instance query: application, environment and its settings.
+
+    With load_components, also the components with their cluster instances and
+    clusters, for syncing or deleting the whole instance.
+    """
+    options = (
+        joinedload(InstanceModel.application),
+        joinedload(InstanceModel.environment).selectinload(EnvironmentModel.settings),
+    )
+    if load_components:
+        options += (
+            joinedload(InstanceModel.components)
+            .selectinload(ApplicationComponentModel.instances)
+            .joinedload(ClusterInstanceModel.cluster),
+        )
+    return options
+
+
+def is_loaded(entity: Any, relationship: str) -> bool:
+    """Whether reading the relationship is free, i.e. it won't run a query."""
+    state = inspect(entity, raiseerr=False)
+    return state is not None and relationship not in state.unloaded
@@ -0,0 +1,11 @@
+from sqlalchemy import BigInteger, Column, String
+from app.shared.database.database import Base
+
+
+class ResourceVersion(Base):
+    """Version counter per table, bumped in the same transaction as every change."""
+
+    __tablename__ = "resource_versions"
+
+    resource = Column(String, primary_key=True)
+    version = Column(BigInteger, nullable=False, default=0)
@@ -1,7 +1,8 @@
 import os
 import yaml
+from functools import lru_cache
 from typing import Optional
-from jinja2 import Environment, BaseLoader
+from jinja2 import Environment, BaseLoader, Template
 from sqlalchemy.orm import Session
 
 from app.templates.infra.component_template_config_repository import (
@@ -11,6 +12,8 @@ from app.templates.infra.template_repository import TemplateRepository
 from app.templates.core.component_template_config_service import (
     ComponentTemplateConfigService,
 )
+from app.shared.observability.metrics import observe_template_render
+from app.shared.observability.tracing import span
 
 # Path to the shared secrets template
 SECRETS_TEMPLATE_PATH = os.path.join(
@@ -23,6 +26,19 @@ SECRETS_TEMPLATE_PATH = os.path.join(
     "secret.yaml.j2",
 )
 
+_jinja_environment = Environment(loader=BaseLoader())
+
+
+@lru_cache(maxsize=256)
+def compile_template(template_content: str) -> Template:
+    """
+    Compile a Jinja2 template, reusing the compiled code for the same source.
+
+    Keyed by content rather than template id, so an edited template is simply
+    compiled again and the old entry ages out.
+    """
+    return _jinja_environment.from_string(template_content)
+
 
 class KubernetesApplicationComponentManager:
     """
@@ -85,33 +101,43 @@ class KubernetesApplicationComponentManager:
                 "Please configure templates in the Component Template Config section."
             )
 
-        combined_payloads = []
-
-        # Check if component has secrets and render Secret template first
-        component_settings = application_component.get("settings", {})
-        secrets = component_settings.get("secrets", [])
-        if secrets and len(secrets) > 0:
-            secret_payload = (
-                KubernetesApplicationComponentManager._render_secrets_template(
-                    variables
-                )
-            )
-            if secret_payload:
-                combined_payloads.append(secret_payload)
-
-        # Render each template in configured order
-        for template in templates:
-            try:
-                rendered_yaml = (
-                    KubernetesApplicationComponentManager.render_template_from_string(
-                        template.content, variables
+        with observe_template_render(component_type):
+            combined_payloads = []
+
+            # Check if component has secrets and render Secret template first
+            component_settings = application_component.get("settings", {})
+            secrets = component_settings.get("secrets", [])
+            if secrets and len(secrets) > 0:
+                with span(
+                    "template.render",
+                    {"template.name": "secret", "component.type": component_type},
+                ):
+                    secret_payload = (
+                        KubernetesApplicationComponentManager._render_secrets_template(
+                            variables
+                        )
                     )
-                )
-                # Filter None documents (when template doesn't render anything due to conditions)
-                if rendered_yaml is not None:
-                    combined_payloads.append(rendered_yaml)
-            except Exception as e:
-                raise ValueError(f"Error rendering template '{template.name}': {e}")
+                if secret_payload:
+                    combined_payloads.append(secret_payload)
+
+            # Render each template in configured order
+            for template in templates:
+                try:
+                    with span(
+                        "template.render",
+                        {
+                            "template.name": template.name,
+                            "component.type": component_type,
+                        },
+                    ):
+                        rendered_yaml = KubernetesApplicationComponentManager.render_template_from_string(
+                            template.content, variables
+                        )
+                    # Filter None documents (when template doesn't render anything due to conditions)
+                    if rendered_yaml is not None:
+                        combined_payloads.append(rendered_yaml)
+                except Exception as e:
+                    raise ValueError(f"Error rendering template '{template.name}': {e}")
 
         return combined_payloads
 
@@ -166,10 +192,8 @@ class KubernetesApplicationComponentManager:
             FileNotFoundError: If there's an error creating the template
             ValueError: If there's an error parsing the YAML
         """
-        env = Environment(loader=BaseLoader())
-
         try:
-            template = env.from_string(template_content)
+            template = compile_template(template_content)
         except Exception as e:
             raise FileNotFoundError(f"Template rendering error: {e}")
 
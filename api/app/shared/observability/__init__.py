@@ -0,0 +1 @@
+"""Metrics and instrumentation hooks for the API process."""
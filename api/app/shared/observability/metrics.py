@@ -0,0 +1,300 @@
+"""
+Prometheus metrics.
+
+Everything is registered on the default prometheus_client registry and served
+by GET /metrics:
+
+- tron_http_*: request latency per route template and requests in flight
+- tron_threadpool_*: tokens of the AnyIO thread pool that runs sync endpoints
+- tron_db_*: query duration, pool occupancy and checkout wait
+- tron_k8s_api_*: Kubernetes API calls per cluster, verb and kind
+- tron_template_render_seconds / tron_deploy_duration_seconds
+
+The production image runs several uvicorn workers. Each worker has its own
+registry, so a scrape would only see whichever worker answered. When
+PROMETHEUS_MULTIPROC_DIR is set, prometheus_client writes the values to files
+in that directory instead and /metrics aggregates the files of all workers.
+The directory must be empty when the workers start.
+"""
+
+import os
+import time
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+from anyio import to_thread
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+)
+from prometheus_client import multiprocess
+from sqlalchemy import event
+from sqlalchemy.pool import QueuePool
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+__all__ = [
+    "MetricsMiddleware",
+    "instrument_engine",
+    "mark_worker_stopped",
+    "metrics_endpoint",
+    "observe_db_pool_checkout",
+    "observe_deploy",
+    "observe_k8s_call",
+    "observe_template_render",
+    "route_template",
+    "statement_operation",
+]
+
+UNMATCHED_ROUTE = "<unmatched>"
+
+HTTP_REQUEST_DURATION = Histogram(
+    "tron_http_request_duration_seconds",
+    "HTTP request latency by route template.",
+    ["method", "route", "status"],
+)
+HTTP_REQUESTS_IN_PROGRESS = Gauge(
+    "tron_http_requests_in_progress",
+    "HTTP requests being handled.",
+    ["method"],
+    multiprocess_mode="livesum",
+)
+THREADPOOL_IN_USE = Gauge(
+    "tron_threadpool_in_use",
+    "Threads of the AnyIO pool busy with sync endpoints and dependencies.",
+    multiprocess_mode="livesum",
+)
+THREADPOOL_SIZE = Gauge(
+    "tron_threadpool_size",
+    "Size of the AnyIO thread pool.",
+    multiprocess_mode="livesum",
+)
+DB_QUERY_DURATION = Histogram(
+    "tron_db_query_duration_seconds",
+    "Duration of SQL statements by database and operation.",
+    ["database", "operation"],
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5),
+)
+DB_POOL_CHECKED_OUT = Gauge(
+    "tron_db_pool_checked_out",
+    "Database connections currently checked out of the pool.",
+    ["database"],
+    multiprocess_mode="livesum",
+)
+DB_POOL_SIZE = Gauge(
+    "tron_db_pool_size",
+    "Configured size of the database connection pool.",
+    ["database"],
+    multiprocess_mode="livesum",
+)
+DB_POOL_WAIT = Histogram(
+    "tron_db_pool_checkout_wait_seconds",
+    "Time spent waiting for a pooled connection.",
+    buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 2.5, 5, 10),
+)
+DB_POOL_TIMEOUTS = Counter(
+    "tron_db_pool_checkout_timeouts",
+    "Checkouts that gave up waiting for a connection.",
+)
+K8S_API_DURATION = Histogram(
+    "tron_k8s_api_request_duration_seconds",
+    "Kubernetes API call latency.",
+    ["cluster", "verb", "kind"],
+)
+K8S_API_ERRORS = Counter(
+    "tron_k8s_api_errors",
+    "Failed Kubernetes API calls by status code (or 'error' without a response).",
+    ["cluster", "verb", "kind", "code"],
+)
+TEMPLATE_RENDER_DURATION = Histogram(
+    "tron_template_render_seconds",
+    "Time to render the Kubernetes templates of a component.",
+    ["component_type"],
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1),
+)
+DEPLOY_DURATION = Histogram(
+    "tron_deploy_duration_seconds",
+    "Time to deploy a component to Kubernetes, rendering included.",
+    ["component_type", "outcome"],
+    buckets=(0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120),
+)
+
+
+def route_template(scope: Scope) -> str:
+    """Path template of the matched route, e.g. /webapps/{uuid}."""
+    route = scope.get("route")
+    return getattr(route, "path", None) or UNMATCHED_ROUTE
+
+
+def _observe_threadpool() -> None:
+    limiter = to_thread.current_default_thread_limiter()
+    THREADPOOL_IN_USE.set(limiter.borrowed_tokens)
+    THREADPOOL_SIZE.set(limiter.total_tokens)
+
+
+class MetricsMiddleware:
+    """Record latency and in-flight count of every HTTP request."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        in_progress = HTTP_REQUESTS_IN_PROGRESS.labels(method)
+        in_progress.inc()
+        _observe_threadpool()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            # The route is only known once the router has matched the request
+            HTTP_REQUEST_DURATION.labels(
+                method, route_template(scope), str(status)
+            ).observe(time.perf_counter() - started)
+            in_progress.dec()
+            _observe_threadpool()
+
+
+def statement_operation(statement: str) -> str:
+    """SELECT, INSERT, UPDATE, DELETE or OTHER."""
+    operation = statement.lstrip().split(None, 1)[0].upper() if statement else ""
+    if operation in ("SELECT", "INSERT", "UPDATE", "DELETE"):
+        return operation
+    return "OTHER"
+
+
+def instrument_engine(engine, database: str = "primary") -> None:
+    """
+    Time every statement run on the engine and track its pool occupancy.
+
+    Args:
+        engine: SQLAlchemy engine to instrument
+        database: Value of the database label (primary, or the replica host)
+    """
+    query_duration = {
+        operation: DB_QUERY_DURATION.labels(database, operation)
+        for operation in ("SELECT", "INSERT", "UPDATE", "DELETE", "OTHER")
+    }
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, many):
+        conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, many):
+        started = conn.info["query_started"].pop()
+        query_duration[statement_operation(statement)].observe(
+            time.perf_counter() - started
+        )
+
+    @event.listens_for(engine, "handle_error")
+    def _handle_error(context):
+        # after_cursor_execute doesn't run for failed statements
+        if context.connection is not None:
+            stack = context.connection.info.get("query_started")
+            if stack:
+                stack.pop()
+
+    pool = engine.pool
+    if not isinstance(pool, QueuePool):
+        return
+    DB_POOL_SIZE.labels(database).set(pool.size())
+    checked_out = DB_POOL_CHECKED_OUT.labels(database)
+
+    @event.listens_for(pool, "checkout")
+    def _checkout(dbapi_connection, connection_record, connection_proxy):
+        checked_out.inc()
+
+    @event.listens_for(pool, "checkin")
+    def _checkin(dbapi_connection, connection_record):
+        checked_out.dec()
+
+
+def observe_db_pool_checkout(waited: Optional[float]) -> None:
+    """Record a pool checkout that waited `waited` seconds, or None for a timeout."""
+    if waited is None:
+        DB_POOL_TIMEOUTS.inc()
+    else:
+        DB_POOL_WAIT.observe(waited)
+
+
+@contextmanager
+def observe_k8s_call(cluster: str, verb: str, kind: str) -> Iterator[None]:
+    """
+    Time a Kubernetes API call and count it as an error if it raises.
+
+    Args:
+        cluster: API server the call went to
+        verb: Kubernetes verb (get, list, create, replace, patch, delete, ...)
+        kind: Resource, e.g. deployments or pods/log
+    """
+    started = time.perf_counter()
+    try:
+        yield
+    except Exception as e:
+        # ApiException carries the HTTP status; connection errors don't
+        code = getattr(e, "status", None)
+        K8S_API_ERRORS.labels(cluster, verb, kind, str(code or "error")).inc()
+        raise
+    finally:
+        K8S_API_DURATION.labels(cluster, verb, kind).observe(
+            time.perf_counter() - started
+        )
+
+
+@contextmanager
+def observe_template_render(component_type: str) -> Iterator[None]:
+    """Time rendering the templates of one component."""
+    with TEMPLATE_RENDER_DURATION.labels(component_type).time():
+        yield
+
+
+@contextmanager
+def observe_deploy(component_type: str) -> Iterator[None]:
+    """Time a deploy and label it with whether it succeeded."""
+    started = time.perf_counter()
+    outcome = "failure"
+    try:
+        yield
+        outcome = "success"
+    finally:
+        DEPLOY_DURATION.labels(component_type, outcome).observe(
+            time.perf_counter() - started
+        )
+
+
+def _is_multiprocess() -> bool:
+    return bool(os.getenv("PROMETHEUS_MULTIPROC_DIR"))
+
+
+def mark_worker_stopped() -> None:
+    """Drop this worker's live gauges from the shared directory on shutdown."""
+    if _is_multiprocess():
+        multiprocess.mark_process_dead(os.getpid())
+
+
+async def metrics_endpoint(request: Request) -> Response:
+    """Prometheus text exposition of this process, or of all workers."""
+    registry = REGISTRY
+    if _is_multiprocess():
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    return Response(generate_latest(registry), media_type=CONTENT_TYPE_LATEST)
@@ -0,0 +1,268 @@
+"""
+Optional OpenTelemetry tracing.
+
+Off unless TRACING_EXPORTER is set and the optional `opentelemetry-sdk` package
+is installed (`opentelemetry-exporter-otlp-proto-http` as well for otlp):
+
+- otlp: OTLP over HTTP, configured with the standard OTEL_EXPORTER_OTLP_*
+  variables
+- console: spans printed to stdout
+- file: one JSON span per line appended to TRACING_FILE, for offline use
+
+Spans cover HTTP requests, SQL statements, template rendering (one span per
+template), deploys and every Kubernetes API call. TRACING_SAMPLE_RATIO keeps a
+fraction of the traces; incoming `traceparent` headers are honoured.
+
+While tracing is off none of the hooks are installed, and span() hands out one
+shared no-op object, so the instrumented code pays a function call and nothing
+else.
+"""
+
+import logging
+import os
+from typing import Any, Dict, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.shared.observability.metrics import route_template, statement_operation
+
+try:  # Optional dependency
+    from opentelemetry import propagate
+    from opentelemetry.sdk.resources import Resource
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import (
+        BatchSpanProcessor,
+        ConsoleSpanExporter,
+        SimpleSpanProcessor,
+    )
+    from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
+    from opentelemetry.trace import SpanKind, Status, StatusCode, get_current_span
+except ImportError:  # pragma: no cover - depends on the environment
+    TracerProvider = None
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    "TracingMiddleware",
+    "configure_tracing",
+    "current_span",
+    "is_tracing_enabled",
+    "shutdown_tracing",
+    "span",
+]
+
+EXPORTERS = ("otlp", "console", "file")
+MAX_STATEMENT_LENGTH = 2048
+
+_provider = None
+_tracer = None
+
+
+class _NoSpan:
+    """Stands in for a span while tracing is off."""
+
+    def __enter__(self) -> "_NoSpan":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        return None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        return None
+
+    def add_event(self, name: str, attributes: Optional[Dict] = None) -> None:
+        return None
+
+
+_NO_SPAN = _NoSpan()
+
+
+def get_exporter_name() -> str:
+    return os.getenv("TRACING_EXPORTER", "").strip().lower()
+
+
+def get_sample_ratio() -> float:
+    return float(os.getenv("TRACING_SAMPLE_RATIO", "1.0"))
+
+
+def get_trace_file() -> str:
+    return os.getenv("TRACING_FILE", "traces.jsonl")
+
+
+def is_tracing_enabled() -> bool:
+    return _tracer is not None
+
+
+def _build_exporter(name: str):
+    if name == "otlp":
+        from opentelemetry.exporter.otlp.proto.http.trace_exporter import (
+            OTLPSpanExporter,
+        )
+
+        return OTLPSpanExporter()
+    if name == "console":
+        return ConsoleSpanExporter()
+    return ConsoleSpanExporter(
+        out=open(get_trace_file(), "a"),
+        formatter=lambda span: span.to_json(indent=None) + "\n",
+    )
+
+
+def configure_tracing(exporter: Any = None) -> bool:
+    """
+    Start tracing according to TRACING_EXPORTER.
+
+    Args:
+        exporter: Span exporter to use instead of the configured one (tests).
+            Spans are then exported as they end instead of in batches.
+
+    Returns:
+        Whether tracing is on.
+    """
+    global _provider, _tracer
+
+    name = get_exporter_name()
+    if exporter is None and name in ("", "none"):
+        return False
+    if TracerProvider is None:
+        logger.warning(
+            "TRACING_EXPORTER=%s but opentelemetry-sdk is not installed; "
+            "tracing is off",
+            name,
+        )
+        return False
+    if exporter is None and name not in EXPORTERS:
+        raise ValueError(
+            f"TRACING_EXPORTER must be one of {', '.join(EXPORTERS)} or none, "
+            f"got '{name}'"
+        )
+
+    _provider = TracerProvider(
+        resource=Resource.create(
+            {"service.name": os.getenv("OTEL_SERVICE_NAME", "tron-api")}
+        ),
+        sampler=ParentBased(TraceIdRatioBased(get_sample_ratio())),
+    )
+    if exporter is None:
+        _provider.add_span_processor(BatchSpanProcessor(_build_exporter(name)))
+    else:
+        _provider.add_span_processor(SimpleSpanProcessor(exporter))
+    _tracer = _provider.get_tracer("tron")
+    _install_sqlalchemy_hooks()
+    return True
+
+
+def shutdown_tracing() -> None:
+    """Flush pending spans and turn tracing off."""
+    global _provider, _tracer
+
+    if _provider is not None:
+        _provider.shutdown()
+    _provider = None
+    _tracer = None
+
+
+def span(name: str, attributes: Optional[Dict[str, Any]] = None):
+    """
+    Context manager for a child span of the current one.
+
+    Exceptions raised inside are recorded on the span and mark it as failed.
+    While tracing is off this returns a no-op object.
+    """
+    if _tracer is None:
+        return _NO_SPAN
+    return _tracer.start_as_current_span(name, attributes=attributes)
+
+
+def current_span():
+    """The active span, to add attributes or events to it."""
+    if _tracer is None:
+        return _NO_SPAN
+    return get_current_span()
+
+
+class TracingMiddleware:
+    """Open a server span per HTTP request, named after the route template."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or _tracer is None:
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        carrier = {
+            key.decode("latin-1"): value.decode("latin-1")
+            for key, value in scope["headers"]
+        }
+        status = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        with _tracer.start_as_current_span(
+            method,
+            context=propagate.extract(carrier),
+            kind=SpanKind.SERVER,
+            attributes={"http.request.method": method, "url.path": scope["path"]},
+        ) as server_span:
+            try:
+                await self.app(scope, receive, send_wrapper)
+            finally:
+                route = route_template(scope)
+                server_span.update_name(f"{method} {route}")
+                server_span.set_attribute("http.route", route)
+                server_span.set_attribute("http.response.status_code", status)
+                if status >= 500:
+                    server_span.set_status(Status(StatusCode.ERROR))
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, many):
+    if _tracer is None:
+        return
+    operation = statement_operation(statement)
+    statement_span = _tracer.start_span(
+        f"db {operation}",
+        kind=SpanKind.CLIENT,
+        attributes={
+            "db.system": conn.dialect.name,
+            "db.operation": operation,
+            "db.statement": statement[:MAX_STATEMENT_LENGTH],
+        },
+    )
+    conn.info.setdefault("trace_spans", []).append(statement_span)
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, many):
+    spans = conn.info.get("trace_spans")
+    if spans:
+        spans.pop().end()
+
+
+def _handle_error(context) -> None:
+    connection = context.connection
+    spans = connection.info.get("trace_spans") if connection is not None else None
+    if spans:
+        statement_span = spans.pop()
+        statement_span.record_exception(context.original_exception)
+        statement_span.set_status(Status(StatusCode.ERROR))
+        statement_span.end()
+
+
+def _install_sqlalchemy_hooks() -> None:
+    # On the Engine class, so the primary, replica and async engines are all
+    # covered, including ones created after tracing was configured
+    for name, listener in (
+        ("before_cursor_execute", _before_cursor_execute),
+        ("after_cursor_execute", _after_cursor_execute),
+        ("handle_error", _handle_error),
+    ):
+        if not event.contains(Engine, name, listener):
+            event.listen(Engine, name, listener)
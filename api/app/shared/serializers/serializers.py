@@ -25,25 +25,27 @@ def serialize_application_component(application_component):
     # These decrypted values are ONLY used to create K8s Secrets
     # SECURITY: Never log decrypted values
     if settings and "secrets" in settings and settings["secrets"]:
-        from app.shared.crypto import decrypt_secret
+        from app.shared.crypto import decrypt_many
         import logging
 
         logger = logging.getLogger(__name__)
+        secrets = settings["secrets"]
+        values = decrypt_many(
+            (secret.get("value", "") for secret in secrets), strict=False
+        )
         decrypted_secrets = []
-        for secret in settings["secrets"]:
-            try:
-                decrypted_value = decrypt_secret(secret.get("value", ""))
-                decrypted_secrets.append(
-                    {"key": secret.get("key", ""), "value": decrypted_value}
-                )
-            except Exception as e:
+        for secret, decrypted_value in zip(secrets, values):
+            if decrypted_value is None:
                 # Log failure without exposing secret value
                 logger.warning(
                     f"Failed to decrypt secret '{secret.get('key')}' for component "
-                    f"'{application_component.name}': {type(e).__name__}"
+                    f"'{application_component.name}'"
                 )
                 # Skip corrupted/invalid secrets
-                pass
+                continue
+            decrypted_secrets.append(
+                {"key": secret.get("key", ""), "value": decrypted_value}
+            )
         settings["secrets"] = decrypted_secrets
 
     # Ensure command is always a list when not None
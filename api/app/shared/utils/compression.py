@@ -0,0 +1,199 @@
+"""
+Negotiated response compression.
+
+Large JSON lists (components with settings, instances, templates) compress
+very well, so responses above a minimum size are encoded with the best
+encoding the client accepts: brotli when the optional `brotli` package is
+installed, otherwise gzip. Small responses are sent as is; the CPU cost is not
+worth the few bytes saved.
+"""
+
+import os
+import zlib
+from typing import Dict, Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:  # Optional dependency
+    import brotli
+except ImportError:  # pragma: no cover - depends on the environment
+    brotli = None
+
+COMPRESSIBLE_TYPES = (
+    "application/json",
+    "application/javascript",
+    "application/xml",
+    "text/",
+)
+
+
+def get_minimum_size() -> int:
+    return int(os.getenv("COMPRESSION_MINIMUM_SIZE", "1024"))
+
+
+def get_gzip_level() -> int:
+    return int(os.getenv("COMPRESSION_GZIP_LEVEL", "6"))
+
+
+def get_brotli_quality() -> int:
+    return int(os.getenv("COMPRESSION_BROTLI_QUALITY", "4"))
+
+
+def supported_encodings() -> tuple:
+    """Encodings this process can produce, in order of preference."""
+    return ("br", "gzip") if brotli is not None else ("gzip",)
+
+
+def parse_accept_encoding(header: str) -> Dict[str, float]:
+    """Map each coding in an Accept-Encoding header to its q-value."""
+    codings: Dict[str, float] = {}
+    for part in header.split(","):
+        coding, _, params = part.strip().partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        codings[coding] = quality
+    return codings
+
+
+def negotiate_encoding(header: Optional[str]) -> Optional[str]:
+    """
+    Pick the response encoding for an Accept-Encoding header.
+
+    Args:
+        header: Accept-Encoding request header
+
+    Returns:
+        "br" or "gzip", or None to send the response uncompressed
+    """
+    if not header:
+        return None
+    codings = parse_accept_encoding(header)
+    wildcard = codings.get("*", 0.0)
+    best, best_quality = None, 0.0
+    for encoding in supported_encodings():
+        quality = codings.get(encoding, wildcard)
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+class _Compressor:
+    """Streaming compressor with the same interface for gzip and brotli."""
+
+    def __init__(self, encoding: str):
+        if encoding == "br":
+            self._compressor = brotli.Compressor(quality=get_brotli_quality())
+            self._compress = self._compressor.process
+            self._flush = self._compressor.flush
+            self._finish = self._compressor.finish
+        else:
+            # wbits=31 writes the gzip header and trailer
+            self._compressor = zlib.compressobj(get_gzip_level(), zlib.DEFLATED, 31)
+            self._compress = self._compressor.compress
+            self._flush = lambda: self._compressor.flush(zlib.Z_SYNC_FLUSH)
+            self._finish = self._compressor.flush
+
+    def compress(self, data: bytes, more: bool) -> bytes:
+        chunk = self._compress(data)
+        # Flush each streamed chunk so clients don't wait for the whole body
+        return chunk + (self._flush() if more else self._finish())
+
+
+class CompressionMiddleware:
+    """Compress responses with the encoding negotiated from Accept-Encoding."""
+
+    def __init__(self, app: ASGIApp, minimum_size: Optional[int] = None) -> None:
+        self.app = app
+        self.minimum_size = get_minimum_size() if minimum_size is None else minimum_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding"))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        responder = _CompressionResponder(self.app, encoding, self.minimum_size)
+        await responder(scope, receive, send)
+
+
+class _CompressionResponder:
+    def __init__(self, app: ASGIApp, encoding: str, minimum_size: int) -> None:
+        self.app = app
+        self.encoding = encoding
+        self.minimum_size = minimum_size
+        self.send: Optional[Send] = None
+        self.start_message: Optional[Message] = None
+        self.compressor: Optional[_Compressor] = None
+        self.passthrough = False
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        self.send = send
+        await self.app(scope, receive, self.send_compressed)
+
+    @staticmethod
+    def _should_skip(message: Message) -> bool:
+        headers = Headers(raw=message["headers"])
+        return (
+            "content-encoding" in headers
+            or not headers.get("content-type", "").startswith(COMPRESSIBLE_TYPES)
+            or message["status"] in (204, 304)
+        )
+
+    def _start_compressing(self, start: Message) -> None:
+        headers = MutableHeaders(raw=start["headers"])
+        headers["Content-Encoding"] = self.encoding
+        headers.add_vary_header("Accept-Encoding")
+        # The bytes differ from the uncompressed representation
+        etag = headers.get("etag")
+        if etag and not etag.startswith("W/"):
+            headers["ETag"] = "W/" + etag
+        if "content-length" in headers:
+            del headers["Content-Length"]
+        self.compressor = _Compressor(self.encoding)
+
+    async def send_compressed(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            # Hold the headers until the first body chunk tells us the size
+            self.start_message = message
+            self.passthrough = self._should_skip(message)
+            return
+        if message["type"] != "http.response.body":
+            await self.send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self.start_message is not None:
+            start, self.start_message = self.start_message, None
+            if self.passthrough or (not more_body and len(body) < self.minimum_size):
+                self.passthrough = True
+                await self.send(start)
+                await self.send(message)
+                return
+            self._start_compressing(start)
+            compressed = self.compressor.compress(body, more_body)
+            if not more_body:
+                MutableHeaders(raw=start["headers"])["Content-Length"] = str(
+                    len(compressed)
+                )
+            await self.send(start)
+            await self.send({**message, "body": compressed})
+            return
+
+        if self.passthrough:
+            await self.send(message)
+            return
+        await self.send({**message, "body": self.compressor.compress(body, more_body)})
@@ -0,0 +1,31 @@
+"""ETag helpers for conditional GET requests."""
+
+import hashlib
+from typing import Optional
+
+from fastapi import Request
+
+
+def make_etag(payload: bytes, weak: bool = False) -> str:
+    """Build a quoted ETag from the representation bytes."""
+    digest = hashlib.sha256(payload).hexdigest()[:32]
+    return f'W/"{digest}"' if weak else f'"{digest}"'
+
+
+def _opaque(etag: str) -> str:
+    return etag[2:] if etag.startswith("W/") else etag
+
+
+def etag_matches(request: Request, etag: Optional[str]) -> bool:
+    """
+    Check the If-None-Match header against an ETag.
+
+    Uses weak comparison, as required for If-None-Match (RFC 9110, 13.1.2).
+    """
+    header = request.headers.get("if-none-match")
+    if not header or not etag:
+        return False
+    if header.strip() == "*":
+        return True
+    candidates = {_opaque(candidate.strip()) for candidate in header.split(",")}
+    return _opaque(etag) in candidates
@@ -0,0 +1,172 @@
+"""Keyset (cursor) pagination helpers shared by repositories and handlers."""
+
+import base64
+import json
+from datetime import datetime
+from typing import Any, Callable, Iterable, List, Optional, Sequence
+from uuid import UUID
+
+from fastapi import Response
+from sqlalchemy import tuple_
+from sqlalchemy.orm import Query
+
+__all__ = [
+    "NEXT_CURSOR_HEADER",
+    "CURSOR_DESCRIPTION",
+    "CursorPage",
+    "InvalidCursorError",
+    "encode_cursor",
+    "decode_cursor",
+    "paginate",
+    "map_page",
+    "set_next_cursor_header",
+]
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+CURSOR_DESCRIPTION = (
+    "Opaque cursor from the X-Next-Cursor header of the previous page. "
+    "When given, skip is ignored."
+)
+
+
+class InvalidCursorError(Exception):
+    """Raised when a pagination cursor cannot be decoded."""
+
+    pass
+
+
+class CursorPage(list):
+    """A list of results that also carries the cursor of the next page (or None)."""
+
+    def __init__(self, items: Iterable[Any] = (), next_cursor: Optional[str] = None):
+        super().__init__(items)
+        self.next_cursor = next_cursor
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    return value
+
+
+def _decode_value(value: Any, column: Any) -> Any:
+    """Convert a cursor value to the column's Python type; raise ValueError if it can't be."""
+    try:
+        python_type = column.type.python_type
+    except NotImplementedError:
+        return value
+    if python_type is datetime:
+        return datetime.fromisoformat(value)
+    if python_type is int:
+        # bool is an int too, but never a valid key
+        if not isinstance(value, int) or isinstance(value, bool):
+            raise ValueError(f"expected an integer, got {value!r}")
+        return value
+    if python_type is str:
+        if not isinstance(value, str):
+            raise ValueError(f"expected a string, got {value!r}")
+        return value
+    if python_type is UUID:
+        return UUID(value)
+    return python_type(value)
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """Encode the sort key of the last row into an opaque cursor."""
+    payload = json.dumps([_encode_value(v) for v in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, columns: Sequence[Any]) -> List[Any]:
+    """
+    Decode a cursor produced by encode_cursor for the given sort columns.
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed or doesn't match the columns
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()).decode())
+    except (ValueError, UnicodeDecodeError) as e:
+        raise InvalidCursorError(f"Invalid pagination cursor: {e}")
+
+    if not isinstance(values, list) or len(values) != len(columns):
+        raise InvalidCursorError("Invalid pagination cursor")
+
+    decoded = []
+    for column, value in zip(columns, values):
+        if value is not None:
+            try:
+                value = _decode_value(value, column)
+            except (AttributeError, TypeError, ValueError):
+                raise InvalidCursorError("Invalid pagination cursor")
+        decoded.append(value)
+    return decoded
+
+
+def paginate(
+    query: Query,
+    order_columns: Sequence[Any],
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    descending: bool = False,
+) -> CursorPage:
+    """
+    Apply a stable order plus offset or keyset pagination to a query.
+
+    Rows are ordered by `order_columns` (typically created_at, id). When a cursor
+    is given, rows after it are selected with a row-value comparison that can use
+    an index on the same columns, and `skip` is ignored. A next cursor is returned
+    whenever the page is full.
+
+    Args:
+        query: Query to paginate
+        order_columns: Unique sort key, last column must be the primary key
+        skip: Offset (only used without cursor, kept for compatibility)
+        limit: Page size
+        cursor: Opaque cursor returned by a previous page
+        descending: Sort newest first
+
+    Returns:
+        CursorPage with the rows and next_cursor
+    """
+    if descending:
+        query = query.order_by(*[column.desc() for column in order_columns])
+    else:
+        query = query.order_by(*order_columns)
+
+    if cursor:
+        values = decode_cursor(cursor, order_columns)
+        key = tuple_(*order_columns)
+        query = query.filter(
+            key < tuple_(*values) if descending else key > tuple_(*values)
+        )
+    elif skip:
+        query = query.offset(skip)
+
+    rows = query.limit(limit).all()
+
+    next_cursor = None
+    if limit and len(rows) == limit:
+        last = rows[-1]
+        next_cursor = encode_cursor(
+            [getattr(last, column.key) for column in order_columns]
+        )
+    return CursorPage(rows, next_cursor)
+
+
+def map_page(page: Iterable[Any], serializer: Callable[[Any], Any]) -> CursorPage:
+    """Serialize each item of a page, keeping its next cursor."""
+    return CursorPage(
+        [serializer(item) for item in page], getattr(page, "next_cursor", None)
+    )
+
+
+def set_next_cursor_header(response: Response, page: Iterable[Any]) -> None:
+    """Expose the next cursor of a page to the client, if there is one."""
+    next_cursor = getattr(page, "next_cursor", None)
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
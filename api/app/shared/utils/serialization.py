@@ -0,0 +1,132 @@
+"""
+Fast serialization for list endpoints.
+
+Rows are validated into DTOs once, with a cached TypeAdapter for the whole page,
+and the handler returns the JSON bytes directly. Returning a Response makes
+FastAPI skip the response_model re-validation and jsonable_encoder pass, which
+dominate the cost of large lists. response_model is still declared on the
+route for the OpenAPI schema.
+
+List endpoints also accept sparse fieldsets (?fields=uuid,name,enabled) so
+tables don't download full settings or template bodies.
+"""
+
+import typing
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Type
+
+from fastapi import Response
+from pydantic import BaseModel, TypeAdapter
+
+from app.shared.utils.pagination import CursorPage, set_next_cursor_header
+
+FIELDS_DESCRIPTION = (
+    "Comma separated fields to return, e.g. uuid,name,enabled. "
+    "Nested fields use dots, e.g. application.name. Defaults to all fields."
+)
+
+
+class InvalidFieldsError(Exception):
+    """Raised when a sparse fieldset names unknown fields."""
+
+    pass
+
+
+@lru_cache(maxsize=None)
+def list_adapter(model: Type[BaseModel]) -> TypeAdapter:
+    """TypeAdapter for List[model], built once per model."""
+    return TypeAdapter(List[model])
+
+
+def validate_page(model: Type[BaseModel], page: Iterable[Any]) -> CursorPage:
+    """Validate ORM rows (or dicts) into DTOs in one call, keeping the next cursor."""
+    items = list_adapter(model).validate_python(list(page), from_attributes=True)
+    return CursorPage(items, getattr(page, "next_cursor", None))
+
+
+def _nested_model(annotation: Any) -> Optional[Type[BaseModel]]:
+    """The DTO class inside an annotation (Model, Optional[Model], List[Model])."""
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation
+    for argument in typing.get_args(annotation):
+        model = _nested_model(argument)
+        if model is not None:
+            return model
+    return None
+
+
+def _is_list(annotation: Any) -> bool:
+    if typing.get_origin(annotation) is list:
+        return True
+    return any(_is_list(argument) for argument in typing.get_args(annotation))
+
+
+def parse_fields(
+    model: Type[BaseModel], raw: Optional[str]
+) -> Optional[Dict[str, Any]]:
+    """
+    Parse a sparse fieldset into a pydantic include specification.
+
+    Args:
+        model: DTO class of the list items
+        raw: Value of the fields query parameter
+
+    Returns:
+        Include dict for one item, or None for all fields
+
+    Raises:
+        InvalidFieldsError: If a field doesn't exist on the DTO
+    """
+    if not raw or not raw.strip():
+        return None
+
+    include: Dict[str, Any] = {}
+    for field in (f.strip() for f in raw.split(",")):
+        if not field:
+            continue
+        current_model, target = model, include
+        segments = field.split(".")
+        for position, segment in enumerate(segments):
+            if current_model is None or segment not in current_model.model_fields:
+                raise InvalidFieldsError(f"Unknown field '{field}'")
+            if position == len(segments) - 1:
+                target[segment] = True
+                break
+            annotation = current_model.model_fields[segment].annotation
+            current_model = _nested_model(annotation)
+            existing = target.get(segment)
+            if existing is True:
+                break
+            target = target.setdefault(segment, {})
+            if _is_list(annotation):
+                target = target.setdefault("__all__", {})
+    return include or None
+
+
+def json_list_response(
+    model: Type[BaseModel],
+    page: Iterable[Any],
+    fields: Optional[Dict[str, Any]] = None,
+    response: Optional[Response] = None,
+) -> Response:
+    """
+    Build the JSON response for a page of already validated DTOs.
+
+    Args:
+        model: DTO class of the items
+        page: Items, usually the CursorPage returned by validate_page
+        fields: Include specification from parse_fields, None for all fields
+        response: Injected response whose headers (e.g. ETag) must be kept
+
+    Returns:
+        Response with the serialized items and the X-Next-Cursor header, if any
+    """
+    include = {"__all__": fields} if fields else None
+    result = Response(
+        content=list_adapter(model).dump_json(list(page), include=include),
+        media_type="application/json",
+    )
+    if response is not None:
+        result.headers.update(response.headers)
+    set_next_cursor_header(result, page)
+    return result
@@ -0,0 +1,202 @@
+"""Server-side filters on JSON settings columns.
+
+List endpoints accept filters as query parameters addressed by a dotted path:
+
+    ?settings.exposure.visibility=public
+    ?settings.cpu>=2
+    ?settings.envs.key=DATABASE_URL
+    ?settings.secrets.key=API_TOKEN
+
+They are translated to SQL. On Postgres, equality filters become JSONB
+containment (@>), which the GIN jsonb_path_ops indexes serve. Secret values
+are never filterable; only secret keys are.
+"""
+
+import json
+import re
+from typing import Any, List, NamedTuple, Tuple
+from urllib.parse import unquote_plus
+
+from sqlalchemy import and_, case, exists, func, not_, select, type_coerce
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Query
+
+__all__ = [
+    "InvalidSettingsFilterError",
+    "SettingsFilter",
+    "parse_settings_filters",
+    "apply_settings_filters",
+]
+
+# Settings fields holding lists of {"key": ..., "value": ...} objects
+ARRAY_FIELDS = {"envs", "secrets"}
+COMPARISON_OPERATORS = {">=", "<=", ">", "<"}
+MAX_FILTERS = 20
+
+_FILTER_PATTERN = r"^{prefix}((?:\.[A-Za-z0-9_\-]+)*)(>=|<=|!=|>|<|=)(.*)$"
+
+
+class InvalidSettingsFilterError(Exception):
+    """Raised when a settings filter is malformed or targets a forbidden path."""
+
+    pass
+
+
+class SettingsFilter(NamedTuple):
+    path: Tuple[str, ...]
+    operator: str
+    value: Any
+
+
+def _parse_value(raw: str) -> Any:
+    """Interpret numbers, booleans and null as JSON; anything else is a string."""
+    try:
+        value = json.loads(raw)
+    except ValueError:
+        return raw
+    if isinstance(value, (dict, list)):
+        return raw
+    return value
+
+
+def _validate(settings_filter: SettingsFilter, allow_root: bool) -> None:
+    path, operator, value = settings_filter
+
+    if not path and not allow_root:
+        raise InvalidSettingsFilterError(
+            "Settings filter needs a path, e.g. settings.cpu"
+        )
+
+    if path and path[0] in ARRAY_FIELDS:
+        if len(path) != 2 or path[1] not in ("key", "value"):
+            raise InvalidSettingsFilterError(
+                f"Filters on '{path[0]}' must target '{path[0]}.key' or '{path[0]}.value'"
+            )
+        if path[0] == "secrets" and path[1] != "key":
+            raise InvalidSettingsFilterError("Secret values cannot be filtered")
+        if operator != "=":
+            raise InvalidSettingsFilterError(
+                f"Only '=' is supported for filters on '{path[0]}'"
+            )
+
+    if operator in COMPARISON_OPERATORS and (
+        isinstance(value, bool) or not isinstance(value, (int, float))
+    ):
+        raise InvalidSettingsFilterError(
+            f"Operator '{operator}' requires a numeric value, got '{value}'"
+        )
+
+
+def parse_settings_filters(
+    query_string: str, prefix: str = "settings", allow_root: bool = False
+) -> List[SettingsFilter]:
+    """
+    Extract settings filters from a raw query string.
+
+    Args:
+        query_string: Raw (URL encoded) query string of the request
+        prefix: Parameter prefix addressing the JSON column ("settings", "value")
+        allow_root: Whether the prefix alone (compare the whole value) is allowed
+
+    Returns:
+        List of SettingsFilter
+
+    Raises:
+        InvalidSettingsFilterError: If a filter is malformed or not allowed
+    """
+    pattern = re.compile(_FILTER_PATTERN.format(prefix=re.escape(prefix)))
+    addressed = re.compile(rf"^{re.escape(prefix)}(?:$|[.<>=!])")
+    filters = []
+    for part in query_string.split("&") if query_string else []:
+        decoded = unquote_plus(part)
+        if not addressed.match(decoded):
+            continue
+        match = pattern.match(decoded)
+        if not match:
+            raise InvalidSettingsFilterError(f"Invalid settings filter '{decoded}'")
+        path = tuple(segment for segment in match.group(1).split(".") if segment)
+        settings_filter = SettingsFilter(
+            path, match.group(2), _parse_value(match.group(3))
+        )
+        _validate(settings_filter, allow_root)
+        filters.append(settings_filter)
+
+    if len(filters) > MAX_FILTERS:
+        raise InvalidSettingsFilterError(
+            f"At most {MAX_FILTERS} settings filters are allowed"
+        )
+    return filters
+
+
+def _nest(path: Tuple[str, ...], value: Any) -> Any:
+    """Build the containment document for a path, e.g. ("a", "b"), 1 -> {"a": {"b": 1}}."""
+    if path and path[0] in ARRAY_FIELDS:
+        return {path[0]: [{path[1]: value}]}
+    document = value
+    for segment in reversed(path):
+        document = {segment: document}
+    return document
+
+
+def _postgres_condition(column, settings_filter: SettingsFilter):
+    path, operator, value = settings_filter
+    jsonb_column = type_coerce(column, JSONB)
+
+    if operator in ("=", "!="):
+        condition = jsonb_column.contains(_nest(path, value))
+        return condition if operator == "=" else not_(condition)
+
+    # Only numbers are compared, other JSON types never match instead of failing the cast
+    target = jsonb_column[path]
+    numeric = case(
+        (func.jsonb_typeof(target) == "number", target.as_float()), else_=None
+    )
+    return _compare(numeric, operator, value)
+
+
+def _json_path(path: Tuple[str, ...]) -> str:
+    return "$" + "".join(f'."{segment}"' for segment in path)
+
+
+def _generic_condition(column, settings_filter: SettingsFilter):
+    """Fallback for SQLite (tests and local development), based on json_extract."""
+    path, operator, value = settings_filter
+
+    if path and path[0] in ARRAY_FIELDS:
+        items = (
+            func.json_each(column, _json_path(path[:1])).table_valued("value").alias()
+        )
+        return exists(
+            select(1)
+            .select_from(items)
+            .where(func.json_extract(items.c.value, _json_path(path[1:])) == value)
+        )
+
+    target = func.json_extract(column, _json_path(path))
+    if operator in ("=", "!="):
+        condition = target.is_(None) if value is None else target == value
+        return condition if operator == "=" else not_(condition)
+
+    return _compare(target, operator, value)
+
+
+def _compare(expression, operator: str, value: Any):
+    if operator == ">=":
+        return expression >= value
+    if operator == "<=":
+        return expression <= value
+    if operator == ">":
+        return expression > value
+    return expression < value
+
+
+def apply_settings_filters(
+    query: Query, column, filters: List[SettingsFilter]
+) -> Query:
+    """Add a WHERE clause for every settings filter to the query."""
+    if not filters:
+        return query
+
+    dialect_name = query.session.get_bind().dialect.name
+    build = _postgres_condition if dialect_name == "postgresql" else _generic_condition
+    return query.filter(and_(*[build(column, f) for f in filters]))
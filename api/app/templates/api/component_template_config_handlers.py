@@ -1,9 +1,14 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.orm import Session
 from uuid import UUID
-from typing import List
+from typing import List, Optional
 
 from app.shared.database.database import get_db
+from app.shared.utils.pagination import (
+    CURSOR_DESCRIPTION,
+    InvalidCursorError,
+    set_next_cursor_header,
+)
 from app.templates.infra.component_template_config_repository import (
     ComponentTemplateConfigRepository,
 )
@@ -21,6 +26,7 @@ from app.templates.core.component_template_config_validators import (
     ComponentTemplateConfigAlreadyExistsError,
     TemplateNotFoundError,
 )
+from app.shared.dependencies.conditional_get import conditional_get
 from app.users.infra.user_model import User, UserRole
 from app.shared.dependencies.auth import require_role, get_current_user
 
@@ -96,18 +102,25 @@ def update_component_template_config(
     "/component-template-configs/", response_model=List[ComponentTemplateConfig]
 )
 def list_component_template_configs(
+    response: Response,
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = Query(None, description=CURSOR_DESCRIPTION),
     component_type: str = Query(None, description="Filter by component type"),
     service: ComponentTemplateConfigService = Depends(
         get_component_template_config_service
     ),
     current_user: User = Depends(get_current_user),
+    etag: str = conditional_get("component_template_configs", "templates"),
 ):
     """List all component template configs."""
-    configs = service.get_component_template_configs(
-        component_type=component_type, skip=skip, limit=limit
-    )
+    try:
+        configs = service.get_component_template_configs(
+            component_type=component_type, skip=skip, limit=limit, cursor=cursor
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    set_next_cursor_header(response, configs)
     # Serialize manually to include template information
     result = []
     for config in configs:
@@ -132,6 +145,7 @@ def get_component_template_config(
         get_component_template_config_service
     ),
     current_user: User = Depends(get_current_user),
+    etag: str = conditional_get("component_template_configs", "templates"),
 ):
     """Get component template config by UUID."""
     try:
@@ -173,6 +187,7 @@ def get_templates_for_component(
         get_component_template_config_service
     ),
     current_user: User = Depends(get_current_user),
+    etag: str = conditional_get("component_template_configs", "templates"),
 ):
     """Get templates ordered by render_order for a specific component type."""
     templates = service.get_templates_for_component_type(component_type)
@@ -1,13 +1,25 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.orm import Session
 from uuid import UUID
 from typing import Optional
 
 from app.shared.database.database import get_db
+from app.shared.utils.pagination import (
+    CURSOR_DESCRIPTION,
+    InvalidCursorError,
+)
+from app.shared.utils.serialization import (
+    FIELDS_DESCRIPTION,
+    InvalidFieldsError,
+    json_list_response,
+    parse_fields,
+    validate_page,
+)
 from app.templates.infra.template_repository import TemplateRepository
 from app.templates.core.template_service import TemplateService
 from app.templates.api.template_dto import TemplateCreate, TemplateUpdate, Template
 from app.templates.core.template_validators import TemplateNotFoundError
+from app.shared.dependencies.conditional_get import conditional_get
 from app.users.infra.user_model import User, UserRole
 from app.shared.dependencies.auth import require_role, get_current_user
 
@@ -58,14 +70,27 @@ def update_template(
 
 @router.get("/templates/", response_model=list[Template])
 def list_templates(
+    response: Response,
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = Query(None, description=CURSOR_DESCRIPTION),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
     category: Optional[str] = Query(None, description="Filter by category"),
     service: TemplateService = Depends(get_template_service),
     current_user: User = Depends(get_current_user),
+    etag: str = conditional_get("templates"),
 ):
-    """List all templates."""
-    return service.get_templates(skip=skip, limit=limit, category=category)
+    """List all templates. Use ?fields=uuid,name,category to skip template bodies."""
+    try:
+        include = parse_fields(Template, fields)
+        page = service.get_templates(
+            skip=skip, limit=limit, category=category, cursor=cursor
+        )
+    except (InvalidCursorError, InvalidFieldsError) as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return json_list_response(
+        Template, validate_page(Template, page), fields=include, response=response
+    )
 
 
 @router.get("/templates/{uuid}", response_model=Template)
@@ -73,6 +98,7 @@ def get_template(
     uuid: UUID,
     service: TemplateService = Depends(get_template_service),
     current_user: User = Depends(get_current_user),
+    etag: str = conditional_get("templates"),
 ):
     """Get template by UUID."""
     try:
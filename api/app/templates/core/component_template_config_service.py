@@ -61,7 +61,8 @@ class ComponentTemplateConfigService:
             enabled=str(config_data.enabled).lower(),
         )
 
-        return self.config_repository.create(new_config)
+        with self.config_repository.unit_of_work():
+            return self.config_repository.create(new_config)
 
     def update_component_template_config(
         self, config_uuid: UUID, config_data: ComponentTemplateConfigUpdate
@@ -79,7 +80,8 @@ class ComponentTemplateConfigService:
         if config_data.enabled is not None:
             config.enabled = str(config_data.enabled).lower()
 
-        return self.config_repository.update(config)
+        with self.config_repository.unit_of_work():
+            return self.config_repository.update(config)
 
     def get_component_template_config(
         self, config_uuid: UUID
@@ -93,11 +95,15 @@ class ComponentTemplateConfigService:
         return config
 
     def get_component_template_configs(
-        self, component_type: Optional[str] = None, skip: int = 0, limit: int = 100
+        self,
+        component_type: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None,
     ) -> List[ComponentTemplateConfigModel]:
         """Get all component template configs, optionally filtered by component type."""
         return self.config_repository.find_all(
-            component_type=component_type, skip=skip, limit=limit
+            component_type=component_type, skip=skip, limit=limit, cursor=cursor
         )
 
     def get_templates_for_component_type(
@@ -114,7 +120,8 @@ class ComponentTemplateConfigService:
                 f"Component template config with UUID {config_uuid} not found"
             )
 
-        self.config_repository.delete(config)
+        with self.config_repository.unit_of_work():
+            self.config_repository.delete(config)
         return {
             "status": "success",
             "message": "Component template config deleted successfully",
@@ -22,14 +22,13 @@ class TemplateService:
         validate_template_create_dto(dto)
 
         template = self._build_template_entity(dto)
-        return self.repository.create(template)
+        with self.repository.unit_of_work():
+            return self.repository.create(template)
 
     def update_template(self, uuid: UUID, dto: TemplateUpdate) -> Template:
         """Update an existing template."""
         validate_template_update_dto(dto)
-        validate_template_exists(self.repository, uuid)
-
-        template = self.repository.find_by_uuid(uuid)
+        template = validate_template_exists(self.repository, uuid)
 
         if dto.name is not None:
             template.name = dto.name
@@ -43,33 +42,39 @@ class TemplateService:
         if dto.variables_schema is not None:
             template.variables_schema = dto.variables_schema
 
-        return self.repository.update(template)
+        with self.repository.unit_of_work():
+            return self.repository.update(template)
 
     def get_template(self, uuid: UUID) -> Template:
         """Get template by UUID."""
-        validate_template_exists(self.repository, uuid)
-        return self.repository.find_by_uuid(uuid)
+        return validate_template_exists(self.repository, uuid)
 
     def get_templates(
-        self, skip: int = 0, limit: int = 100, category: Optional[str] = None
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        category: Optional[str] = None,
+        cursor: Optional[str] = None,
     ) -> List[Template]:
         """Get all templates, optionally filtered by category."""
-        return self.repository.find_all(skip=skip, limit=limit, category=category)
+        return self.repository.find_all(
+            skip=skip, limit=limit, category=category, cursor=cursor
+        )
 
     def delete_template(self, uuid: UUID) -> dict:
         """Delete a template and its associated component configs."""
-        validate_template_exists(self.repository, uuid)
+        template = validate_template_exists(self.repository, uuid)
         validate_template_can_be_deleted(self.repository, uuid)
 
-        template = self.repository.find_by_uuid(uuid)
         configs = self.repository.find_component_configs_by_template_id(template.id)
 
-        # Delete associated configs first
-        if configs:
-            self.repository.delete_component_configs(configs)
+        with self.repository.unit_of_work():
+            # Delete associated configs first
+            if configs:
+                self.repository.delete_component_configs(configs)
 
-        # Delete template
-        self.repository.delete(template)
+            # Delete template
+            self.repository.delete(template)
 
         return {"status": "success", "message": "Template deleted successfully"}
 
@@ -1,5 +1,6 @@
 from uuid import UUID
 from app.templates.infra.template_repository import TemplateRepository
+from app.templates.infra.template_model import Template as TemplateModel
 
 
 class TemplateNotFoundError(Exception):
@@ -35,11 +36,17 @@ def validate_template_update_dto(dto) -> None:
         raise ValueError("Template content cannot be empty")
 
 
-def validate_template_exists(repository: TemplateRepository, uuid: UUID) -> None:
-    """Validate that template exists. Raises TemplateNotFoundError if not found."""
+def validate_template_exists(
+    repository: TemplateRepository, uuid: UUID
+) -> TemplateModel:
+    """
+    Validate that template exists and return it.
+    Raises TemplateNotFoundError if not found.
+    """
     template = repository.find_by_uuid(uuid)
     if not template:
         raise TemplateNotFoundError(f"Template with UUID '{uuid}' not found")
+    return template
 
 
 def validate_template_can_be_deleted(
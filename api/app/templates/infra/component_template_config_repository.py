@@ -5,6 +5,9 @@ from app.templates.infra.component_template_config_model import (
     ComponentTemplateConfig as ComponentTemplateConfigModel,
 )
 from app.templates.infra.template_model import Template as TemplateModel
+from app.shared.database.lookup_cache import cached_lookup
+from app.shared.database.unit_of_work import UnitOfWork
+from app.shared.utils.pagination import paginate
 
 
 class ComponentTemplateConfigRepository:
@@ -15,11 +18,17 @@ class ComponentTemplateConfigRepository:
 
     def find_by_uuid(self, uuid: UUID) -> Optional[ComponentTemplateConfigModel]:
         """Find component template config by UUID."""
-        return (
-            self.db.query(ComponentTemplateConfigModel)
-            .options(joinedload(ComponentTemplateConfigModel.template))
-            .filter(ComponentTemplateConfigModel.uuid == uuid)
-            .first()
+        return cached_lookup(
+            self.db,
+            ComponentTemplateConfigModel,
+            uuid,
+            lambda: (
+                self.db.query(ComponentTemplateConfigModel)
+                .options(joinedload(ComponentTemplateConfigModel.template))
+                .filter(ComponentTemplateConfigModel.uuid == uuid)
+                .first()
+            ),
+            options=("template",),
         )
 
     def find_by_component_type_and_template_id(
@@ -36,19 +45,31 @@ class ComponentTemplateConfigRepository:
         )
 
     def find_all(
-        self, component_type: Optional[str] = None, skip: int = 0, limit: int = 100
+        self,
+        component_type: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None,
     ) -> List[ComponentTemplateConfigModel]:
         """Find all component template configs, optionally filtered by component type."""
-        query = (
-            self.db.query(ComponentTemplateConfigModel)
-            .options(joinedload(ComponentTemplateConfigModel.template))
-            .order_by(ComponentTemplateConfigModel.render_order)
+        query = self.db.query(ComponentTemplateConfigModel).options(
+            joinedload(ComponentTemplateConfigModel.template)
         )
         if component_type:
             query = query.filter(
                 ComponentTemplateConfigModel.component_type == component_type
             )
-        return query.offset(skip).limit(limit).all()
+        # Keep render order as the primary sort key, id makes it unique
+        return paginate(
+            query,
+            [
+                ComponentTemplateConfigModel.render_order,
+                ComponentTemplateConfigModel.id,
+            ],
+            skip=skip,
+            limit=limit,
+            cursor=cursor,
+        )
 
     def find_templates_for_component_type(
         self, component_type: str
@@ -72,12 +93,8 @@ class ComponentTemplateConfigRepository:
         """Create a new component template config."""
         self.db.add(config)
         try:
-            self.db.commit()
-            self.db.refresh(config)
-            # Load template relationship
-            self.db.refresh(config, ["template"])
+            self.db.flush()
         except Exception as e:
-            self.db.rollback()
             raise Exception(f"Failed to create component template config: {str(e)}")
         return config
 
@@ -86,24 +103,25 @@ class ComponentTemplateConfigRepository:
     ) -> ComponentTemplateConfigModel:
         """Update an existing component template config."""
         try:
-            self.db.commit()
-            self.db.refresh(config)
-            # Load template relationship
-            self.db.refresh(config, ["template"])
+            self.db.flush()
         except Exception as e:
-            self.db.rollback()
             raise Exception(f"Failed to update component template config: {str(e)}")
+        # template_id may have changed; reload the relationship on next access
+        self.db.expire(config, ["template"])
         return config
 
     def delete(self, config: ComponentTemplateConfigModel) -> None:
         """Delete a component template config."""
         self.db.delete(config)
         try:
-            self.db.commit()
+            self.db.flush()
         except Exception as e:
-            self.db.rollback()
             raise Exception(f"Failed to delete component template config: {str(e)}")
 
+    def unit_of_work(self) -> UnitOfWork:
+        """Open a transaction that commits once, when the block succeeds."""
+        return UnitOfWork(self.db)
+
     def rollback(self) -> None:
         """Rollback current transaction."""
         self.db.rollback()
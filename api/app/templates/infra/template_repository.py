@@ -2,9 +2,12 @@ from sqlalchemy.orm import Session
 from uuid import UUID
 from typing import Optional, List
 from app.templates.infra.template_model import Template as TemplateModel
+from app.shared.database.lookup_cache import cached_lookup
+from app.shared.database.unit_of_work import UnitOfWork
 from app.templates.infra.component_template_config_model import (
     ComponentTemplateConfig as ComponentTemplateConfigModel,
 )
+from app.shared.utils.pagination import paginate
 
 
 class TemplateRepository:
@@ -15,16 +18,33 @@ class TemplateRepository:
 
     def find_by_uuid(self, uuid: UUID) -> Optional[TemplateModel]:
         """Find template by UUID."""
-        return self.db.query(TemplateModel).filter(TemplateModel.uuid == uuid).first()
+        return cached_lookup(
+            self.db,
+            TemplateModel,
+            uuid,
+            lambda: (
+                self.db.query(TemplateModel).filter(TemplateModel.uuid == uuid).first()
+            ),
+        )
 
     def find_all(
-        self, skip: int = 0, limit: int = 100, category: str = None
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        category: str = None,
+        cursor: Optional[str] = None,
     ) -> List[TemplateModel]:
         """Find all templates, optionally filtered by category."""
         query = self.db.query(TemplateModel)
         if category:
             query = query.filter(TemplateModel.category == category)
-        return query.offset(skip).limit(limit).all()
+        return paginate(
+            query,
+            [TemplateModel.created_at, TemplateModel.id],
+            skip=skip,
+            limit=limit,
+            cursor=cursor,
+        )
 
     def find_component_configs_by_template_id(
         self, template_id: int
@@ -40,20 +60,16 @@ class TemplateRepository:
         """Create a new template."""
         self.db.add(template)
         try:
-            self.db.commit()
-            self.db.refresh(template)
+            self.db.flush()
         except Exception as e:
-            self.db.rollback()
             raise Exception(f"Failed to create template: {str(e)}")
         return template
 
     def update(self, template: TemplateModel) -> TemplateModel:
         """Update an existing template."""
         try:
-            self.db.commit()
-            self.db.refresh(template)
+            self.db.flush()
         except Exception as e:
-            self.db.rollback()
             raise Exception(f"Failed to update template: {str(e)}")
         return template
 
@@ -61,9 +77,8 @@ class TemplateRepository:
         """Delete a template."""
         self.db.delete(template)
         try:
-            self.db.commit()
+            self.db.flush()
         except Exception as e:
-            self.db.rollback()
             raise Exception(f"Failed to delete template: {str(e)}")
 
     def delete_component_configs(
@@ -75,9 +90,12 @@ class TemplateRepository:
         try:
             self.db.flush()
         except Exception as e:
-            self.db.rollback()
             raise Exception(f"Failed to delete component configs: {str(e)}")
 
+    def unit_of_work(self) -> UnitOfWork:
+        """Open a transaction that commits once, when the block succeeds."""
+        return UnitOfWork(self.db)
+
     def rollback(self) -> None:
         """Rollback current transaction."""
         self.db.rollback()
@@ -1,9 +1,14 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from uuid import UUID
 
 from app.shared.database.database import get_db
+from app.shared.utils.pagination import (
+    CURSOR_DESCRIPTION,
+    InvalidCursorError,
+    set_next_cursor_header,
+)
 from app.users.infra.user_repository import UserRepository
 from app.users.core.user_service import UserService
 from app.users.api.user_dto import UserCreate, UserUpdate, UserResponse
@@ -30,14 +35,21 @@ def get_user_service(database_session: Session = Depends(get_db)) -> UserService
 
 @router.get("", response_model=List[UserResponse])
 async def list_users(
+    response: Response,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description=CURSOR_DESCRIPTION),
     search: Optional[str] = Query(None),
     service: UserService = Depends(get_user_service),
     current_user: User = Depends(require_role([UserRole.ADMIN])),
 ):
     """List all users (admin only)."""
-    return service.get_users(skip=skip, limit=limit, search=search)
+    try:
+        page = service.get_users(skip=skip, limit=limit, search=search, cursor=cursor)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    set_next_cursor_header(response, page)
+    return page
 
 
 @router.get("/{user_uuid}", response_model=UserResponse)
@@ -28,14 +28,13 @@ class UserService:
         hashed_password = self.auth_service.get_password_hash(dto.password)
         user = self._build_user_entity(dto, hashed_password)
 
-        return self.repository.create(user)
+        with self.repository.unit_of_work():
+            return self.repository.create(user)
 
     def update_user(self, uuid: UUID, dto: UserUpdate) -> UserResponse:
         """Update an existing user."""
         validate_user_update_dto(dto)
-        validate_user_exists(self.repository, uuid)
-
-        user = self.repository.find_by_uuid(uuid)
+        user = validate_user_exists(self.repository, uuid)
 
         if dto.email is not None:
             validate_user_email_uniqueness(
@@ -55,26 +54,31 @@ class UserService:
         if dto.password is not None:
             user.hashed_password = self.auth_service.get_password_hash(dto.password)
 
-        return self.repository.update(user)
+        with self.repository.unit_of_work():
+            return self.repository.update(user)
 
     def get_user(self, uuid: UUID) -> UserResponse:
         """Get user by UUID."""
-        validate_user_exists(self.repository, uuid)
-        return self.repository.find_by_uuid(uuid)
+        return validate_user_exists(self.repository, uuid)
 
     def get_users(
-        self, skip: int = 0, limit: int = 100, search: Optional[str] = None
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        search: Optional[str] = None,
+        cursor: Optional[str] = None,
     ) -> List[UserResponse]:
         """Get all users, optionally filtered by search term."""
-        return self.repository.find_all(skip=skip, limit=limit, search=search)
+        return self.repository.find_all(
+            skip=skip, limit=limit, search=search, cursor=cursor
+        )
 
     def delete_user(self, uuid: UUID, current_user_uuid: UUID) -> None:
         """Delete a user."""
-        validate_user_exists(self.repository, uuid)
+        user = validate_user_exists(self.repository, uuid)
         validate_can_delete_user(self.repository, uuid, current_user_uuid)
-
-        user = self.repository.find_by_uuid(uuid)
-        self.repository.delete(user)
+        with self.repository.unit_of_work():
+            self.repository.delete(user)
 
     def _build_user_entity(self, dto: UserCreate, hashed_password: str) -> UserModel:
         """Build User entity from DTO."""
@@ -1,6 +1,7 @@
 from uuid import UUID
 from app.users.infra.user_repository import UserRepository
 from app.users.api.user_dto import UserCreate, UserUpdate
+from app.users.infra.user_model import User as UserModel
 
 
 class UserNotFoundError(Exception):
@@ -39,11 +40,15 @@ def validate_user_update_dto(dto: UserUpdate) -> None:
         raise ValueError("Password must be at least 6 characters long")
 
 
-def validate_user_exists(repository: UserRepository, uuid: UUID) -> None:
-    """Validate that user exists. Raises UserNotFoundError if not found."""
+def validate_user_exists(repository: UserRepository, uuid: UUID) -> UserModel:
+    """
+    Validate that user exists and return it.
+    Raises UserNotFoundError if not found.
+    """
     user = repository.find_by_uuid(uuid)
     if not user:
         raise UserNotFoundError(f"User with UUID '{uuid}' not found")
+    return user
 
 
 def validate_user_email_uniqueness(
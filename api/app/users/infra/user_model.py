@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, Index
 from sqlalchemy.sql import func
 from sqlalchemy.dialects.postgresql import UUID
 from uuid import uuid4
@@ -31,3 +31,6 @@ class User(Base):
     updated_at = Column(
         DateTime, server_default=func.now(), onupdate=func.now(), nullable=False
     )
+
+    # Keyset pagination order
+    __table_args__ = (Index("ix_users_created_at_id", "created_at", "id"),)
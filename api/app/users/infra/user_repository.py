@@ -2,6 +2,9 @@ from sqlalchemy.orm import Session
 from uuid import UUID
 from typing import Optional, List
 from app.users.infra.user_model import User as UserModel
+from app.shared.database.lookup_cache import cached_lookup
+from app.shared.database.unit_of_work import UnitOfWork
+from app.shared.utils.pagination import paginate
 
 
 class UserRepository:
@@ -12,7 +15,12 @@ class UserRepository:
 
     def find_by_uuid(self, uuid: UUID) -> Optional[UserModel]:
         """Find user by UUID."""
-        return self.db.query(UserModel).filter(UserModel.uuid == uuid).first()
+        return cached_lookup(
+            self.db,
+            UserModel,
+            uuid,
+            lambda: self.db.query(UserModel).filter(UserModel.uuid == uuid).first(),
+        )
 
     def find_by_email(self, email: str) -> Optional[UserModel]:
         """Find user by email."""
@@ -23,7 +31,11 @@ class UserRepository:
         return self.db.query(UserModel).filter(UserModel.google_id == google_id).first()
 
     def find_all(
-        self, skip: int = 0, limit: int = 100, search: Optional[str] = None
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        search: Optional[str] = None,
+        cursor: Optional[str] = None,
     ) -> List[UserModel]:
         """Find all users, optionally filtered by search term."""
         query = self.db.query(UserModel)
@@ -35,27 +47,34 @@ class UserRepository:
                 | (UserModel.full_name.ilike(search_term))
             )
 
-        return (
-            query.order_by(UserModel.created_at.desc()).offset(skip).limit(limit).all()
+        return paginate(
+            query,
+            [UserModel.created_at, UserModel.id],
+            skip=skip,
+            limit=limit,
+            cursor=cursor,
+            descending=True,
         )
 
     def create(self, user: UserModel) -> UserModel:
         """Create a new user."""
         self.db.add(user)
-        self.db.commit()
-        self.db.refresh(user)
+        self.db.flush()
         return user
 
     def update(self, user: UserModel) -> UserModel:
         """Update an existing user."""
-        self.db.commit()
-        self.db.refresh(user)
+        self.db.flush()
         return user
 
     def delete(self, user: UserModel) -> None:
         """Delete a user."""
         self.db.delete(user)
-        self.db.commit()
+        self.db.flush()
+
+    def unit_of_work(self) -> UnitOfWork:
+        """Open a transaction that commits once, when the block succeeds."""
+        return UnitOfWork(self.db)
 
     def rollback(self) -> None:
         """Rollback current transaction."""
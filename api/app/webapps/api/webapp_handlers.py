@@ -1,8 +1,24 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from sqlalchemy.orm import Session
 from uuid import UUID
+from typing import Optional
 
 from app.shared.database.database import get_db
+from app.shared.utils.serialization import (
+    FIELDS_DESCRIPTION,
+    InvalidFieldsError,
+    json_list_response,
+    parse_fields,
+)
+from app.shared.utils.pagination import (
+    CURSOR_DESCRIPTION,
+    InvalidCursorError,
+)
+from app.shared.database.replica import get_read_db
+from app.shared.utils.settings_filters import (
+    InvalidSettingsFilterError,
+    parse_settings_filters,
+)
 from app.webapps.infra.webapp_repository import WebappRepository
 from app.webapps.core.webapp_service import WebappService
 from app.webapps.api.webapp_dto import (
@@ -41,6 +57,14 @@ def get_webapp_service(database_session: Session = Depends(get_db)) -> WebappSer
     return WebappService(webapp_repository, database_session)
 
 
+def get_webapp_read_service(
+    database_session: Session = Depends(get_read_db),
+) -> WebappService:
+    """Dependency to get WebappService instance bound to a read replica when available."""
+    webapp_repository = WebappRepository(database_session)
+    return WebappService(webapp_repository, database_session)
+
+
 @router.post("/", response_model=Webapp)
 def create_webapp(
     webapp: WebappCreate,
@@ -65,19 +89,37 @@ def create_webapp(
 
 @router.get("/", response_model=list[Webapp])
 def list_webapps(
+    request: Request,
     skip: int = 0,
     limit: int = 100,
-    service: WebappService = Depends(get_webapp_service),
+    cursor: Optional[str] = Query(None, description=CURSOR_DESCRIPTION),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+    service: WebappService = Depends(get_webapp_read_service),
     current_user: User = Depends(get_current_user),
 ):
-    """List all webapps."""
-    return service.get_webapps(skip=skip, limit=limit)
+    """
+    List all webapps.
+
+    Filter on settings with dotted paths, e.g. ?settings.exposure.visibility=public
+    or ?settings.cpu>=2. Secret values are not filterable.
+    """
+    try:
+        include = parse_fields(Webapp, fields)
+        page = service.get_webapps(
+            skip=skip,
+            limit=limit,
+            cursor=cursor,
+            settings_filters=parse_settings_filters(request.url.query),
+        )
+    except (InvalidCursorError, InvalidSettingsFilterError, InvalidFieldsError) as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return json_list_response(Webapp, page, fields=include)
 
 
 @router.get("/{uuid}", response_model=Webapp)
 def get_webapp(
     uuid: UUID,
-    service: WebappService = Depends(get_webapp_service),
+    service: WebappService = Depends(get_webapp_read_service),
     current_user: User = Depends(get_current_user),
 ):
     """Get webapp by UUID."""
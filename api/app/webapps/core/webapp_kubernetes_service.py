@@ -1,6 +1,5 @@
 """Kubernetes operations for webapps. Isolated from business logic."""
 
-from app.k8s.client import K8sClient
 from app.shared.k8s.application_component_manager import (
     KubernetesApplicationComponentManager,
 )
@@ -10,10 +9,13 @@ from app.webapps.infra.application_component_model import (
     ApplicationComponent as ApplicationComponentModel,
 )
 from app.clusters.infra.cluster_model import Cluster as ClusterModel
-from typing import Dict, Any
+from typing import TYPE_CHECKING, Dict, Any
 
+if TYPE_CHECKING:
+    from app.k8s.client import K8sClient
 
-def ensure_namespace_exists(k8s_client: K8sClient, application_name: str) -> None:
+
+def ensure_namespace_exists(k8s_client: "K8sClient", application_name: str) -> None:
     """Ensure namespace exists in cluster."""
     if application_name:
         k8s_client.ensure_namespace_exists(application_name)
@@ -45,6 +47,8 @@ def apply_to_kubernetes(
     database_session,
 ) -> None:
     """Apply or delete component in Kubernetes."""
+    from app.k8s.client import K8sClient
+
     k8s_client = K8sClient(url=cluster.api_address, token=cluster.token)
 
     application_component_serialized = serialize_application_component(component)
@@ -1,6 +1,5 @@
 """Kubernetes pods operations for webapps. Isolated from business logic."""
 
-from app.k8s.client import K8sClient
 from app.clusters.infra.cluster_model import Cluster as ClusterModel
 from typing import List, Dict, Any
 
@@ -9,6 +8,8 @@ def get_webapp_pods_from_cluster(
     cluster: ClusterModel, application_name: str, component_name: str
 ) -> List[Dict[str, Any]]:
     """Get pods for webapp from cluster."""
+    from app.k8s.client import K8sClient
+
     k8s_client = K8sClient(url=cluster.api_address, token=cluster.token)
     label_selector = f"app={component_name}"
     pods = k8s_client.list_pods(
@@ -26,6 +27,8 @@ def delete_webapp_pod_from_cluster(
     cluster: ClusterModel, application_name: str, pod_name: str
 ) -> None:
     """Delete pod from cluster."""
+    from app.k8s.client import K8sClient
+
     k8s_client = K8sClient(url=cluster.api_address, token=cluster.token)
     k8s_client.delete_pod(namespace=application_name, pod_name=pod_name)
 
@@ -38,6 +41,8 @@ def get_webapp_pod_logs_from_cluster(
     tail_lines: int = 100,
 ) -> str:
     """Get pod logs from cluster."""
+    from app.k8s.client import K8sClient
+
     k8s_client = K8sClient(url=cluster.api_address, token=cluster.token)
     return k8s_client.get_pod_logs(
         namespace=application_name,
@@ -55,6 +60,8 @@ def exec_webapp_pod_command_from_cluster(
     container_name: str = None,
 ) -> Dict[str, Any]:
     """Execute command in pod from cluster."""
+    from app.k8s.client import K8sClient
+
     k8s_client = K8sClient(url=cluster.api_address, token=cluster.token)
     return k8s_client.exec_pod_command(
         namespace=application_name,
@@ -1,7 +1,7 @@
 """Business logic for webapps. Broken into small, focused functions."""
 
 from uuid import uuid4, UUID
-from typing import List
+from typing import List, Optional
 from sqlalchemy.orm import Session
 
 from app.webapps.infra.webapp_repository import WebappRepository
@@ -39,9 +39,10 @@ from app.shared.core.application_component_helpers import (
 )
 from app.shared.crypto import (
     encrypt_secrets_in_settings,
-    strip_secrets_from_settings,
     merge_secrets_for_update,
 )
+from app.shared.utils.serialization import validate_page
+from app.shared.utils.settings_filters import SettingsFilter
 
 
 class WebappService:
@@ -54,9 +55,7 @@ class WebappService:
     def create_webapp(self, dto: WebappCreate) -> Webapp:
         """Create a new webapp."""
         validate_webapp_create_dto(dto)
-        validate_instance_exists(self.repository, dto.instance_uuid)
-
-        instance = self.repository.find_instance_by_uuid(dto.instance_uuid)
+        instance = validate_instance_exists(self.repository, dto.instance_uuid)
         cluster = get_cluster_for_instance(self.db, instance)
 
         self._validate_exposure_settings(dto.settings.model_dump(), cluster)
@@ -65,21 +64,20 @@ class WebappService:
         )
 
         webapp = self._build_webapp_entity(dto, instance.id)
-        webapp = self.repository.create(webapp)
+        with self.repository.unit_of_work():
+            webapp = self.repository.create(webapp)
 
-        cluster_instance = ensure_cluster_instance(self.repository, webapp, cluster)
-        self._deploy_to_kubernetes(
-            webapp, instance.environment_id, cluster, cluster_instance
-        )
+            cluster_instance = ensure_cluster_instance(self.repository, webapp, cluster)
+            self._deploy_to_kubernetes(
+                webapp, instance.environment_id, cluster, cluster_instance
+            )
 
         return self._serialize_webapp(webapp)
 
     def update_webapp(self, uuid: UUID, dto: WebappUpdate) -> Webapp:
         """Update an existing webapp."""
         validate_webapp_update_dto(dto)
-        validate_webapp_exists(self.repository, uuid)
-
-        webapp = self.repository.find_by_uuid(uuid)
+        webapp = validate_webapp_exists(self.repository, uuid, load_relations=True)
         validate_webapp_type(webapp)
 
         # Check if there are any changes that require Kubernetes update
@@ -87,63 +85,69 @@ class WebappService:
             dto.settings is not None or dto.url is not None or dto.enabled is not None
         )
 
-        enabled_changed = self._update_webapp_fields(webapp, dto)
-        cluster_instance = get_or_create_cluster_instance(
-            self.repository, self.db, webapp
-        )
-        cluster = cluster_instance.cluster
-
-        if enabled_changed["changed"]:
-            # Handle enabled status change
-            handle_enabled_change(
-                webapp,
-                enabled_changed,
-                cluster,
-                cluster_instance,
-                lambda c, cl: self._delete_from_kubernetes_safe(c, cl),
-                lambda c, eid, cl, ci: self._deploy_to_kubernetes(c, eid, cl, ci),
-            )
-        elif webapp.enabled and has_changes:
-            # If webapp is enabled and there are changes, always redeploy to apply new configs
-            self._deploy_to_kubernetes(
-                webapp, webapp.instance.environment_id, cluster, cluster_instance
+        with self.repository.unit_of_work():
+            enabled_changed = self._update_webapp_fields(webapp, dto)
+            cluster_instance = get_or_create_cluster_instance(
+                self.repository, self.db, webapp
             )
+            cluster = cluster_instance.cluster
+
+            if enabled_changed["changed"]:
+                # Handle enabled status change
+                handle_enabled_change(
+                    webapp,
+                    enabled_changed,
+                    cluster,
+                    cluster_instance,
+                    lambda c, cl: self._delete_from_kubernetes_safe(c, cl),
+                    lambda c, eid, cl, ci: self._deploy_to_kubernetes(c, eid, cl, ci),
+                )
+            elif webapp.enabled and has_changes:
+                # If webapp is enabled and there are changes, always redeploy to apply new configs
+                self._deploy_to_kubernetes(
+                    webapp, webapp.instance.environment_id, cluster, cluster_instance
+                )
 
         return self._serialize_webapp(webapp)
 
     def get_webapp(self, uuid: UUID) -> Webapp:
         """Get webapp by UUID."""
-        validate_webapp_exists(self.repository, uuid)
-        webapp = self.repository.find_by_uuid(uuid)
+        webapp = validate_webapp_exists(self.repository, uuid)
         validate_webapp_type(webapp)
         return self._serialize_webapp(webapp)
 
     def get_webapp_raw(self, uuid: UUID):
         """Get raw webapp model by UUID (for admin operations like decrypting secrets)."""
-        validate_webapp_exists(self.repository, uuid)
-        webapp = self.repository.find_by_uuid(uuid)
+        webapp = validate_webapp_exists(self.repository, uuid)
         validate_webapp_type(webapp)
         return webapp
 
-    def get_webapps(self, skip: int = 0, limit: int = 100) -> List[Webapp]:
-        """Get all webapps."""
-        webapps = self.repository.find_all(skip=skip, limit=limit)
-        return [self._serialize_webapp(w) for w in webapps]
+    def get_webapps(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        settings_filters: Optional[List[SettingsFilter]] = None,
+    ) -> List[Webapp]:
+        """Get all webapps. The result carries next_cursor for keyset pagination."""
+        webapps = self.repository.find_all(
+            skip=skip, limit=limit, cursor=cursor, settings_filters=settings_filters
+        )
+        return validate_page(Webapp, webapps)
 
     def delete_webapp(self, uuid: UUID) -> dict:
         """Delete a webapp."""
-        validate_webapp_exists(self.repository, uuid)
-
-        webapp = self.repository.find_by_uuid(uuid, load_relations=True)
+        webapp = validate_webapp_exists(self.repository, uuid, load_relations=True)
         validate_webapp_type(webapp)
 
-        return delete_component(
-            webapp,
-            self.repository,
-            self.db,
-            lambda c, cl: self._delete_from_kubernetes_safe(c, cl),
-            "webapp",
-        )
+        with self.repository.unit_of_work():
+            return delete_component(
+                webapp,
+                self.repository,
+                self.db,
+                lambda c, cl: self._delete_from_kubernetes_safe(c, cl),
+                "webapp",
+            )
 
     def _validate_exposure_settings(self, settings_dict: dict, cluster: any) -> None:
         """Validate exposure settings for cluster."""
@@ -274,8 +278,5 @@ class WebappService:
         )
 
     def _serialize_webapp(self, webapp: ApplicationComponentModel) -> Webapp:
-        """Serialize webapp to DTO with secrets stripped."""
-        # Strip secret values before returning to API
-        if webapp.settings:
-            webapp.settings = strip_secrets_from_settings(webapp.settings)
+        """Serialize webapp to DTO. The DTO strips secret values."""
         return Webapp.model_validate(webapp)
@@ -8,6 +8,10 @@ from app.shared.utils.validators import (
     InvalidEnvVarError,
     InvalidSecretError,
 )
+from app.webapps.infra.application_component_model import (
+    ApplicationComponent as ApplicationComponentModel,
+)
+from app.instances.infra.instance_model import Instance as InstanceModel
 
 # Re-export for backward compatibility
 __all__ = [
@@ -95,11 +99,17 @@ def validate_webapp_update_dto(dto: WebappUpdate) -> None:
     pass
 
 
-def validate_webapp_exists(repository: WebappRepository, uuid: UUID) -> None:
-    """Validate that webapp exists. Raises WebappNotFoundError if not found."""
-    webapp = repository.find_by_uuid(uuid)
+def validate_webapp_exists(
+    repository: WebappRepository, uuid: UUID, load_relations: bool = False
+) -> ApplicationComponentModel:
+    """
+    Validate that webapp exists and return it.
+    Raises WebappNotFoundError if not found.
+    """
+    webapp = repository.find_by_uuid(uuid, load_relations=load_relations)
     if not webapp:
         raise WebappNotFoundError(f"Webapp with UUID '{uuid}' not found")
+    return webapp
 
 
 def validate_webapp_type(webapp) -> None:
@@ -110,11 +120,12 @@ def validate_webapp_type(webapp) -> None:
         raise WebappNotWebappTypeError("Component is not a webapp")
 
 
-def validate_instance_exists(repository: WebappRepository, uuid: UUID) -> None:
-    """Validate that instance exists."""
+def validate_instance_exists(repository: WebappRepository, uuid: UUID) -> InstanceModel:
+    """Validate that instance exists and return it."""
     instance = repository.find_instance_by_uuid(uuid)
     if not instance:
         raise InstanceNotFoundError(f"Instance with UUID '{uuid}' not found")
+    return instance
 
 
 def validate_exposure_type_for_cluster(
@@ -8,10 +8,11 @@ from sqlalchemy import (
     Enum,
     JSON,
     DateTime,
+    Index,
 )
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from uuid import uuid4
 from app.shared.database.database import Base
 
@@ -41,13 +42,15 @@ class ApplicationComponent(Base):
     id = Column(Integer, primary_key=True, index=True)
     uuid = Column(UUID(as_uuid=True), default=uuid4, unique=True, nullable=False)
 
-    instance_id = Column(Integer, ForeignKey("instances.id"), nullable=False)
+    instance_id = Column(
+        Integer, ForeignKey("instances.id"), nullable=False, index=True
+    )
     instance = relationship("Instance", back_populates="components")
 
     name = Column(String, nullable=False)
     type = Column(Enum(WebappType), nullable=False, default=WebappType.webapp)
 
-    settings = Column(JSON, nullable=True)
+    settings = Column(JSON().with_variant(JSONB, "postgresql"), nullable=True)
 
     url = Column(String, unique=True, nullable=True)
     enabled = Column(Boolean, nullable=False, default=True)
@@ -64,4 +67,16 @@ class ApplicationComponent(Base):
         DateTime, server_default=func.now(), server_onupdate=func.now(), nullable=False
     )
 
-    __table_args__ = ()
+    __table_args__ = (
+        # Type filtered lists ordered for keyset pagination
+        Index(
+            "ix_application_components_type_created_at_id", "type", "created_at", "id"
+        ),
+        # Containment (@>) filters on settings
+        Index(
+            "ix_application_components_settings_gin",
+            "settings",
+            postgresql_using="gin",
+            postgresql_ops={"settings": "jsonb_path_ops"},
+        ),
+    )
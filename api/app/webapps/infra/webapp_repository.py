@@ -1,4 +1,4 @@
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session
 from uuid import UUID
 from typing import Optional, List
 from app.webapps.infra.application_component_model import (
@@ -6,10 +6,21 @@ from app.webapps.infra.application_component_model import (
     WebappType,
 )
 from app.instances.infra.instance_model import Instance as InstanceModel
+from app.shared.database.lookup_cache import cached_lookup
+from app.shared.database.unit_of_work import UnitOfWork
 from app.shared.infra.cluster_instance_model import (
     ClusterInstance as ClusterInstanceModel,
 )
+from app.shared.infra.deploy_context import (
+    component_deploy_context,
+    instance_deploy_context,
+)
 from app.settings.infra.settings_model import Settings as SettingsModel
+from app.shared.utils.pagination import paginate
+from app.shared.utils.settings_filters import (
+    SettingsFilter,
+    apply_settings_filters,
+)
 
 
 class WebappRepository:
@@ -21,38 +32,62 @@ class WebappRepository:
     def find_by_uuid(
         self, uuid: UUID, load_relations: bool = False
     ) -> Optional[ApplicationComponentModel]:
-        """Find webapp by UUID."""
+        """
+        Find webapp by UUID.
+
+        load_relations loads everything a deploy or delete reads: instance,
+        application, environment and its settings, cluster instance and cluster.
+        """
         query = self.db.query(ApplicationComponentModel).filter(
             ApplicationComponentModel.uuid == uuid,
             ApplicationComponentModel.type == WebappType.webapp,
         )
         if load_relations:
-            query = query.options(
-                joinedload(ApplicationComponentModel.instance).joinedload(
-                    InstanceModel.application
-                ),
-                joinedload(ApplicationComponentModel.instance).joinedload(
-                    InstanceModel.environment
-                ),
-                joinedload(ApplicationComponentModel.instances),
-            )
-        return query.first()
+            query = query.options(*component_deploy_context())
+        return cached_lookup(
+            self.db,
+            ApplicationComponentModel,
+            uuid,
+            query.first,
+            options=(WebappType.webapp, load_relations),
+        )
 
     def find_all(
-        self, skip: int = 0, limit: int = 100
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        settings_filters: Optional[List[SettingsFilter]] = None,
     ) -> List[ApplicationComponentModel]:
-        """Find all webapps."""
-        return (
-            self.db.query(ApplicationComponentModel)
-            .filter(ApplicationComponentModel.type == WebappType.webapp)
-            .offset(skip)
-            .limit(limit)
-            .all()
+        """Find all webapps, ordered by (created_at, id), optionally filtered on settings."""
+        query = self.db.query(ApplicationComponentModel).filter(
+            ApplicationComponentModel.type == WebappType.webapp
+        )
+        query = apply_settings_filters(
+            query, ApplicationComponentModel.settings, settings_filters
+        )
+        return paginate(
+            query,
+            [ApplicationComponentModel.created_at, ApplicationComponentModel.id],
+            skip=skip,
+            limit=limit,
+            cursor=cursor,
         )
 
     def find_instance_by_uuid(self, uuid: UUID) -> Optional[InstanceModel]:
-        """Find instance by UUID."""
-        return self.db.query(InstanceModel).filter(InstanceModel.uuid == uuid).first()
+        """Find instance by UUID, with what deploying a new component reads."""
+        return cached_lookup(
+            self.db,
+            InstanceModel,
+            uuid,
+            lambda: (
+                self.db.query(InstanceModel)
+                .options(*instance_deploy_context(load_components=False))
+                .filter(InstanceModel.uuid == uuid)
+                .first()
+            ),
+            options=("deploy_context",),
+        )
 
     def find_cluster_instance_by_component_id(
         self, component_id: int
@@ -78,20 +113,16 @@ class WebappRepository:
         """Create a new webapp."""
         self.db.add(webapp)
         try:
-            self.db.commit()
-            self.db.refresh(webapp)
+            self.db.flush()
         except Exception as e:
-            self.db.rollback()
             raise Exception(f"Failed to create webapp: {str(e)}")
         return webapp
 
     def update(self, webapp: ApplicationComponentModel) -> ApplicationComponentModel:
         """Update an existing webapp."""
         try:
-            self.db.commit()
-            self.db.refresh(webapp)
+            self.db.flush()
         except Exception as e:
-            self.db.rollback()
             raise Exception(f"Failed to update webapp: {str(e)}")
         return webapp
 
@@ -99,9 +130,8 @@ class WebappRepository:
         """Delete a webapp."""
         self.db.delete(webapp)
         try:
-            self.db.commit()
+            self.db.flush()
         except Exception as e:
-            self.db.rollback()
             raise Exception(f"Failed to delete webapp: {str(e)}")
 
     def create_cluster_instance(
@@ -115,6 +145,10 @@ class WebappRepository:
         """Delete a cluster instance."""
         self.db.delete(cluster_instance)
 
+    def unit_of_work(self) -> UnitOfWork:
+        """Open a transaction that commits once, when the block succeeds."""
+        return UnitOfWork(self.db)
+
     def rollback(self) -> None:
         """Rollback current transaction."""
         self.db.rollback()
@@ -1,8 +1,24 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from sqlalchemy.orm import Session
 from uuid import UUID
+from typing import Optional
 
 from app.shared.database.database import get_db
+from app.shared.utils.serialization import (
+    FIELDS_DESCRIPTION,
+    InvalidFieldsError,
+    json_list_response,
+    parse_fields,
+)
+from app.shared.utils.pagination import (
+    CURSOR_DESCRIPTION,
+    InvalidCursorError,
+)
+from app.shared.database.replica import get_read_db
+from app.shared.utils.settings_filters import (
+    InvalidSettingsFilterError,
+    parse_settings_filters,
+)
 from app.workers.infra.worker_repository import WorkerRepository
 from app.workers.core.worker_service import WorkerService
 from app.workers.api.worker_dto import WorkerCreate, WorkerUpdate, Worker
@@ -24,6 +40,14 @@ def get_worker_service(database_session: Session = Depends(get_db)) -> WorkerSer
     return WorkerService(worker_repository, database_session)
 
 
+def get_worker_read_service(
+    database_session: Session = Depends(get_read_db),
+) -> WorkerService:
+    """Dependency to get WorkerService instance bound to a read replica when available."""
+    worker_repository = WorkerRepository(database_session)
+    return WorkerService(worker_repository, database_session)
+
+
 @router.post("/", response_model=Worker)
 def create_worker(
     worker: WorkerCreate,
@@ -41,19 +65,37 @@ def create_worker(
 
 @router.get("/", response_model=list[Worker])
 def list_workers(
+    request: Request,
     skip: int = 0,
     limit: int = 100,
-    service: WorkerService = Depends(get_worker_service),
+    cursor: Optional[str] = Query(None, description=CURSOR_DESCRIPTION),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+    service: WorkerService = Depends(get_worker_read_service),
     current_user: User = Depends(get_current_user),
 ):
-    """List all workers."""
-    return service.get_workers(skip=skip, limit=limit)
+    """
+    List all workers.
+
+    Filter on settings with dotted paths, e.g. ?settings.exposure.visibility=public
+    or ?settings.cpu>=2. Secret values are not filterable.
+    """
+    try:
+        include = parse_fields(Worker, fields)
+        page = service.get_workers(
+            skip=skip,
+            limit=limit,
+            cursor=cursor,
+            settings_filters=parse_settings_filters(request.url.query),
+        )
+    except (InvalidCursorError, InvalidSettingsFilterError, InvalidFieldsError) as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return json_list_response(Worker, page, fields=include)
 
 
 @router.get("/{uuid}", response_model=Worker)
 def get_worker(
     uuid: UUID,
-    service: WorkerService = Depends(get_worker_service),
+    service: WorkerService = Depends(get_worker_read_service),
     current_user: User = Depends(get_current_user),
 ):
     """Get worker by UUID."""
@@ -1,7 +1,7 @@
 """Business logic for workers. Broken into small, focused functions."""
 
 from uuid import UUID
-from typing import List
+from typing import List, Optional
 from sqlalchemy.orm import Session
 
 from app.workers.infra.worker_repository import WorkerRepository
@@ -38,9 +38,10 @@ from app.shared.core.application_component_helpers import (
 )
 from app.shared.crypto import (
     encrypt_secrets_in_settings,
-    strip_secrets_from_settings,
     merge_secrets_for_update,
 )
+from app.shared.utils.serialization import validate_page
+from app.shared.utils.settings_filters import SettingsFilter
 
 
 class WorkerService:
@@ -53,9 +54,7 @@ class WorkerService:
     def create_worker(self, dto: WorkerCreate) -> Worker:
         """Create a new worker."""
         validate_worker_create_dto(dto)
-        validate_instance_exists(self.repository, dto.instance_uuid)
-
-        instance = self.repository.find_instance_by_uuid(dto.instance_uuid)
+        instance = validate_instance_exists(self.repository, dto.instance_uuid)
         cluster = get_cluster_for_instance(self.db, instance)
 
         settings_dict = ensure_private_exposure_settings(dto.settings.model_dump())
@@ -63,83 +62,88 @@ class WorkerService:
         settings_dict = encrypt_secrets_in_settings(settings_dict)
 
         worker = self._build_worker_entity(dto, instance.id, settings_dict)
-        worker = self.repository.create(worker)
+        with self.repository.unit_of_work():
+            worker = self.repository.create(worker)
 
-        cluster_instance = ensure_cluster_instance(self.repository, worker, cluster)
-        self._deploy_to_kubernetes(
-            worker, instance.environment_id, cluster, cluster_instance
-        )
+            cluster_instance = ensure_cluster_instance(self.repository, worker, cluster)
+            self._deploy_to_kubernetes(
+                worker, instance.environment_id, cluster, cluster_instance
+            )
 
         return self._serialize_worker(worker)
 
     def update_worker(self, uuid: UUID, dto: WorkerUpdate) -> Worker:
         """Update an existing worker."""
         validate_worker_update_dto(dto)
-        validate_worker_exists(self.repository, uuid)
-
-        worker = self.repository.find_by_uuid(uuid)
+        worker = validate_worker_exists(self.repository, uuid, load_relations=True)
         validate_worker_type(worker)
 
         # Check if there are any changes that require Kubernetes update
         has_changes = dto.settings is not None or dto.enabled is not None
 
-        enabled_changed = self._update_worker_fields(worker, dto)
-        cluster_instance = get_or_create_cluster_instance(
-            self.repository, self.db, worker
-        )
-        cluster = cluster_instance.cluster
-
-        if enabled_changed["changed"]:
-            # Handle enabled status change
-            handle_enabled_change(
-                worker,
-                enabled_changed,
-                cluster,
-                cluster_instance,
-                lambda c, cl: self._delete_from_kubernetes_safe(c, cl),
-                lambda c, eid, cl, ci: self._deploy_to_kubernetes(c, eid, cl, ci),
-            )
-        elif worker.enabled and has_changes:
-            # If worker is enabled and there are changes, always redeploy to apply new configs
-            self._deploy_to_kubernetes(
-                worker, worker.instance.environment_id, cluster, cluster_instance
+        with self.repository.unit_of_work():
+            enabled_changed = self._update_worker_fields(worker, dto)
+            cluster_instance = get_or_create_cluster_instance(
+                self.repository, self.db, worker
             )
+            cluster = cluster_instance.cluster
+
+            if enabled_changed["changed"]:
+                # Handle enabled status change
+                handle_enabled_change(
+                    worker,
+                    enabled_changed,
+                    cluster,
+                    cluster_instance,
+                    lambda c, cl: self._delete_from_kubernetes_safe(c, cl),
+                    lambda c, eid, cl, ci: self._deploy_to_kubernetes(c, eid, cl, ci),
+                )
+            elif worker.enabled and has_changes:
+                # If worker is enabled and there are changes, always redeploy to apply new configs
+                self._deploy_to_kubernetes(
+                    worker, worker.instance.environment_id, cluster, cluster_instance
+                )
 
         return self._serialize_worker(worker)
 
     def get_worker(self, uuid: UUID) -> Worker:
         """Get worker by UUID."""
-        validate_worker_exists(self.repository, uuid)
-        worker = self.repository.find_by_uuid(uuid)
+        worker = validate_worker_exists(self.repository, uuid)
         validate_worker_type(worker)
         return self._serialize_worker(worker)
 
     def get_worker_raw(self, uuid: UUID):
         """Get raw worker model by UUID (for admin operations like decrypting secrets)."""
-        validate_worker_exists(self.repository, uuid)
-        worker = self.repository.find_by_uuid(uuid)
+        worker = validate_worker_exists(self.repository, uuid)
         validate_worker_type(worker)
         return worker
 
-    def get_workers(self, skip: int = 0, limit: int = 100) -> List[Worker]:
-        """Get all workers."""
-        workers = self.repository.find_all(skip=skip, limit=limit)
-        return [self._serialize_worker(w) for w in workers]
+    def get_workers(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        settings_filters: Optional[List[SettingsFilter]] = None,
+    ) -> List[Worker]:
+        """Get all workers. The result carries next_cursor for keyset pagination."""
+        workers = self.repository.find_all(
+            skip=skip, limit=limit, cursor=cursor, settings_filters=settings_filters
+        )
+        return validate_page(Worker, workers)
 
     def delete_worker(self, uuid: UUID) -> dict:
         """Delete a worker."""
-        validate_worker_exists(self.repository, uuid)
-
-        worker = self.repository.find_by_uuid(uuid, load_relations=True)
+        worker = validate_worker_exists(self.repository, uuid, load_relations=True)
         validate_worker_type(worker)
 
-        return delete_component(
-            worker,
-            self.repository,
-            self.db,
-            lambda c, cl: self._delete_from_kubernetes_safe(c, cl),
-            "worker",
-        )
+        with self.repository.unit_of_work():
+            return delete_component(
+                worker,
+                self.repository,
+                self.db,
+                lambda c, cl: self._delete_from_kubernetes_safe(c, cl),
+                "worker",
+            )
 
     def _build_worker_entity(
         self, dto: WorkerCreate, instance_id: int, settings_dict: dict
@@ -208,8 +212,5 @@ class WorkerService:
         )
 
     def _serialize_worker(self, worker: ApplicationComponentModel) -> Worker:
-        """Serialize worker to DTO with secrets stripped."""
-        # Strip secret values before returning to API
-        if worker.settings:
-            worker.settings = strip_secrets_from_settings(worker.settings)
+        """Serialize worker to DTO. The DTO strips secret values."""
         return Worker.model_validate(worker)
@@ -7,6 +7,10 @@ from app.shared.utils.validators import (
     InvalidEnvVarError,
     InvalidSecretError,
 )
+from app.workers.infra.application_component_model import (
+    ApplicationComponent as ApplicationComponentModel,
+)
+from app.instances.infra.instance_model import Instance as InstanceModel
 
 # Re-export for backward compatibility
 __all__ = [
@@ -69,11 +73,17 @@ def validate_worker_update_dto(dto: WorkerUpdate) -> None:
     pass
 
 
-def validate_worker_exists(repository: WorkerRepository, uuid: UUID) -> None:
-    """Validate that worker exists. Raises WorkerNotFoundError if not found."""
-    worker = repository.find_by_uuid(uuid)
+def validate_worker_exists(
+    repository: WorkerRepository, uuid: UUID, load_relations: bool = False
+) -> ApplicationComponentModel:
+    """
+    Validate that worker exists and return it.
+    Raises WorkerNotFoundError if not found.
+    """
+    worker = repository.find_by_uuid(uuid, load_relations=load_relations)
     if not worker:
         raise WorkerNotFoundError(f"Worker with UUID '{uuid}' not found")
+    return worker
 
 
 def validate_worker_type(worker) -> None:
@@ -84,8 +94,9 @@ def validate_worker_type(worker) -> None:
         raise WorkerNotWorkerTypeError("Component is not a worker")
 
 
-def validate_instance_exists(repository: WorkerRepository, uuid: UUID) -> None:
-    """Validate that instance exists."""
+def validate_instance_exists(repository: WorkerRepository, uuid: UUID) -> InstanceModel:
+    """Validate that instance exists and return it."""
     instance = repository.find_instance_by_uuid(uuid)
     if not instance:
         raise InstanceNotFoundError(f"Instance with UUID '{uuid}' not found")
+    return instance
@@ -0,0 +1,14 @@
+"""
+Benchmarks for the deploy pipeline hot paths.
+
+Every benchmark builds its own synthetic, deterministic fixtures, so two runs on
+the same machine measure the same work. Results are written as JSON and two
+result files can be compared to flag regressions between commits:
+
+    python -m benchmarks run --output base.json
+    git checkout my-branch
+    python -m benchmarks run --output head.json
+    python -m benchmarks compare base.json head.json
+
+See benchmarks/__main__.py for all options.
+"""
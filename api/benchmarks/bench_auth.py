@@ -0,0 +1,72 @@
+"""
+x-tron-token authentication with 1, 100 and 1000 active tokens.
+
+Token hashes are made with the minimum bcrypt cost (4 rounds) so the fixtures
+build in seconds; every round the production cost (12) adds doubles the time
+per checked hash. The scan order is the same, so the comparison between
+commits holds.
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+
+import bcrypt
+
+from benchmarks import fixtures
+from benchmarks.harness import Options, benchmark, timed
+from app.auth.infra.token_model import Token
+from app.shared.dependencies.auth import get_current_user_or_token
+
+TOKEN_COUNTS = [1, 100, 1000]
+QUICK_TOKEN_COUNTS = [1, 100]
+BCRYPT_ROUNDS = 4
+
+
+def seed_tokens(session, count: int) -> list:
+    """Insert `count` active tokens and return their plain values, oldest first."""
+    salt = bcrypt.gensalt(rounds=BCRYPT_ROUNDS)
+    plain_tokens = [f"benchmark-token-{n:06d}" for n in range(count)]
+    created_at = datetime(2024, 1, 1)
+    session.execute(
+        Token.__table__.insert(),
+        [
+            {
+                "uuid": fixtures.fixed_uuid(n + 1),
+                "name": f"token-{n}",
+                "token_hash": bcrypt.hashpw(plain.encode(), salt).decode(),
+                "role": "user",
+                "is_active": True,
+                "created_at": created_at + timedelta(seconds=n),
+                "updated_at": created_at,
+            }
+            for n, plain in enumerate(plain_tokens)
+        ],
+    )
+    session.commit()
+    return plain_tokens
+
+
+def authenticate(session, plain_token: str):
+    return asyncio.run(
+        get_current_user_or_token(
+            x_tron_token=plain_token, credentials=None, db=session
+        )
+    )
+
+
+@benchmark("auth")
+def run(options: Options) -> dict:
+    results = {}
+    for count in QUICK_TOKEN_COUNTS if options.quick else TOKEN_COUNTS:
+        sessions = fixtures.session_factory()
+        with sessions() as session:
+            plain_tokens = seed_tokens(session, count)
+            runs = max(3, options.runs // 4) if count >= 1000 else options.runs
+            for position, plain in (
+                ("first", plain_tokens[0]),
+                ("last", plain_tokens[-1]),
+            ):
+                results[f"x-tron-token/tokens={count}/{position}"] = timed(
+                    lambda plain=plain: authenticate(session, plain), runs
+                )
+    return results
@@ -0,0 +1,134 @@
+"""ClusterSelectionService with many clusters in one environment."""
+
+from datetime import datetime
+
+from benchmarks import fixtures
+from benchmarks.harness import Options, benchmark, timed
+from app.applications.infra.application_model import Application
+from app.clusters.infra.cluster_model import Cluster
+from app.environments.infra.environment_model import Environment
+from app.instances.infra.instance_model import Instance
+from app.shared.infra.cluster_instance_model import ClusterInstance
+from app.shared.k8s.cluster_selection import ClusterSelectionService
+from app.webapps.infra.application_component_model import ApplicationComponent
+
+CLUSTER_COUNTS = [1, 10, 100, 500]
+QUICK_CLUSTER_COUNTS = [1, 10, 100]
+# Components deployed per cluster; cluster n gets a few more than cluster n - 1
+# so the least loaded one is well defined
+COMPONENTS_PER_CLUSTER = 20
+
+
+def seed_clusters(session, clusters: int) -> int:
+    """Seed one environment with `clusters` loaded clusters; return its id."""
+    now = datetime(2024, 1, 1)
+    session.execute(
+        Environment.__table__.insert(),
+        [
+            {
+                "id": 1,
+                "uuid": fixtures.fixed_uuid(1),
+                "name": "production",
+                "created_at": now,
+                "updated_at": now,
+            }
+        ],
+    )
+    session.execute(
+        Application.__table__.insert(),
+        [
+            {
+                "id": 1,
+                "uuid": fixtures.fixed_uuid(1),
+                "name": "checkout",
+                "enabled": True,
+                "created_at": now,
+                "updated_at": now,
+            }
+        ],
+    )
+    session.execute(
+        Instance.__table__.insert(),
+        [
+            {
+                "id": 1,
+                "uuid": fixtures.fixed_uuid(1),
+                "application_id": 1,
+                "environment_id": 1,
+                "image": "nginx",
+                "version": "1.0.0",
+                "enabled": True,
+                "created_at": now,
+                "updated_at": now,
+            }
+        ],
+    )
+    session.execute(
+        Cluster.__table__.insert(),
+        [
+            {
+                "id": c,
+                "uuid": fixtures.fixed_uuid(c),
+                "name": f"cluster-{c}",
+                "api_address": f"https://cluster-{c}.example.com:6443",
+                "token": "token",
+                "environment_id": 1,
+                "created_at": now,
+                "updated_at": now,
+            }
+            for c in range(1, clusters + 1)
+        ],
+    )
+    components, cluster_instances = [], []
+    for c in range(1, clusters + 1):
+        for _ in range(COMPONENTS_PER_CLUSTER + c % 7):
+            n = len(components) + 1
+            components.append(
+                {
+                    "id": n,
+                    "uuid": fixtures.fixed_uuid(n),
+                    "instance_id": 1,
+                    "name": f"component-{n}",
+                    "type": "worker",
+                    "settings": {"cpu": 0.5, "memory": 512},
+                    "enabled": True,
+                    "created_at": now,
+                    "updated_at": now,
+                }
+            )
+            cluster_instances.append(
+                {
+                    "id": n,
+                    "uuid": fixtures.fixed_uuid(n),
+                    "application_component_id": n,
+                    "cluster_id": c,
+                    "created_at": now,
+                    "updated_at": now,
+                }
+            )
+    session.execute(ApplicationComponent.__table__.insert(), components)
+    session.execute(ClusterInstance.__table__.insert(), cluster_instances)
+    session.commit()
+    return 1
+
+
+@benchmark("cluster_selection")
+def run(options: Options) -> dict:
+    results = {}
+    for count in QUICK_CLUSTER_COUNTS if options.quick else CLUSTER_COUNTS:
+        sessions = fixtures.session_factory()
+        with sessions() as session:
+            environment_id = seed_clusters(session, count)
+            results[f"get_cluster_with_least_load/clusters={count}"] = timed(
+                lambda: ClusterSelectionService.get_cluster_with_least_load(
+                    session, environment_id
+                ),
+                options.runs,
+            )
+            results[f"get_cluster_loads/clusters={count}"] = timed(
+                lambda: ClusterSelectionService.get_cluster_loads(
+                    session, environment_id
+                ),
+                options.runs,
+            )
+    return results
@@ -0,0 +1,54 @@
+"""
+List responses with and without ?fields=, for every encoding the API produces.
+
+identity, gzip and, when the brotli package is installed, br. Each case also
+records the bytes on the wire.
+"""
+
+from benchmarks import fixtures
+from benchmarks.harness import Options, benchmark, timed
+from app.shared.utils.compression import supported_encodings
+
+CASES = [
+    ("/application_components/webapp/", None),
+    ("/application_components/webapp/", "uuid,name,enabled"),
+    ("/instances/", None),
+    ("/instances/", "uuid,image,version,enabled"),
+]
+ROWS = 10000
+QUICK_ROWS = 1000
+
+
+def wire_bytes(client, path: str, params: dict, encoding: str) -> int:
+    headers = {"Accept-Encoding": encoding}
+    with client.stream("GET", path, params=params, headers=headers) as response:
+        response.raise_for_status()
+        assert response.headers.get("content-encoding", "identity") == encoding
+        return sum(len(chunk) for chunk in response.iter_raw())
+
+
+@benchmark("compression")
+def run(options: Options) -> dict:
+    rows = QUICK_ROWS if options.quick else ROWS
+    runs = max(3, options.runs // 4)
+    encodings = ("identity",) + tuple(reversed(supported_encodings()))
+
+    results = {}
+    with fixtures.api_client(fixtures.list_dataset(rows)) as client:
+        for path, fields in CASES:
+            params = {"limit": rows}
+            if fields:
+                params["fields"] = fields
+            for encoding in encodings:
+                headers = {"Accept-Encoding": encoding}
+                timing = timed(
+                    lambda path=path, params=params, headers=headers: client.get(
+                        path, params=params, headers=headers
+                    ).raise_for_status(),
+                    runs,
+                )
+                timing["bytes"] = wire_bytes(client, path, params, encoding)
+                results[
+                    f"GET {path}/fields={fields or 'all'}/{encoding}/rows={rows}"
+                ] = timing
+    return results
@@ -0,0 +1,81 @@
+"""
+List endpoints with 10k rows on one page, through the whole FastAPI stack.
+
+Runs on an in-memory SQLite database, and also on Postgres when a disposable
+database is given with --database-url or BENCHMARK_DATABASE_URL. A second,
+smaller dataset gives every component large env and secret lists.
+"""
+
+from sqlalchemy import func, select
+
+from benchmarks import fixtures
+from benchmarks.harness import Options, benchmark, timed
+from app.webapps.infra.application_component_model import (
+    ApplicationComponent,
+    WebappType,
+)
+
+ENDPOINTS = ["/application_components/webapp/", "/instances/"]
+ROWS = 10000
+QUICK_ROWS = 1000
+# (envs, secrets) per component of the large-settings dataset, a tenth the rows
+LARGE_SETTINGS = (100, 20)
+
+
+def expected_rows(sessions, path: str, rows: int) -> int:
+    if path != "/application_components/webapp/":
+        return rows
+    with sessions() as session:
+        return session.execute(
+            select(func.count())
+            .select_from(ApplicationComponent)
+            .where(ApplicationComponent.type == WebappType.webapp)
+        ).scalar()
+
+
+def measure(sessions, prefix: str, paths, rows: int, runs: int) -> dict:
+    results = {}
+    with fixtures.api_client(sessions) as client:
+        for path in paths:
+            response = client.get(path, params={"limit": rows})
+            response.raise_for_status()
+            expected = expected_rows(sessions, path, rows)
+            assert len(response.json()) == expected, (
+                f"{path} returned {len(response.json())} rows, expected {expected}"
+            )
+            # Stored secrets are "v2:<token>"; none may reach a response
+            assert "v2:" not in response.text, f"{path} leaked stored secrets"
+            results[f"{prefix}/GET {path}/rows={rows}"] = timed(
+                lambda path=path: client.get(
+                    path, params={"limit": rows}
+                ).raise_for_status(),
+                runs,
+            )
+    return results
+
+
+@benchmark("lists")
+def run(options: Options) -> dict:
+    rows = QUICK_ROWS if options.quick else ROWS
+    # Whole-stack requests on 10k rows take long enough that a few runs suffice
+    runs = max(3, options.runs // 4)
+    envs, secrets = LARGE_SETTINGS
+    databases = [("sqlite", None)]
+    if options.database_url:
+        databases.append(("postgres", options.database_url))
+
+    results = {}
+    for database, database_url in databases:
+        sessions = fixtures.list_dataset(rows, database_url)
+        results.update(measure(sessions, database, ENDPOINTS, rows, runs))
+        sessions = fixtures.list_dataset(rows // 10, database_url, envs, secrets)
+        results.update(
+            measure(
+                sessions,
+                f"{database}/envs={envs},secrets={secrets}",
+                ["/instances/"],
+                rows // 10,
+                runs,
+            )
+        )
+    return results
@@ -0,0 +1,34 @@
+"""Encrypting secrets before storage, merging them on update and masking them."""
+
+from benchmarks import fixtures
+from benchmarks.harness import Options, benchmark, timed
+from app.shared.crypto import (
+    encrypt_secrets_in_settings,
+    merge_secrets_for_update,
+    strip_secrets_from_settings,
+)
+
+SECRET_COUNTS = [1, 50, 500]
+
+
+@benchmark("secrets")
+def run(options: Options) -> dict:
+    results = {}
+    for count in SECRET_COUNTS:
+        plain = fixtures.component_settings("webapp", envs=50, secrets=count)
+        stored = encrypt_secrets_in_settings(plain)
+        results[f"encrypt_secrets_in_settings/secrets={count}"] = timed(
+            lambda: encrypt_secrets_in_settings(plain), options.runs
+        )
+        # An update that sends every secret back unchanged (the placeholder)
+        unchanged = [
+            {"key": secret["key"], "value": "********"} for secret in plain["secrets"]
+        ]
+        results[f"merge_secrets_for_update/secrets={count}"] = timed(
+            lambda: merge_secrets_for_update(unchanged, stored["secrets"]),
+            options.runs,
+        )
+        results[f"strip_secrets_from_settings/secrets={count}"] = timed(
+            lambda: strip_secrets_from_settings(stored), options.runs
+        )
+    return results
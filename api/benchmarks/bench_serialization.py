@@ -0,0 +1,22 @@
+"""serialize_application_component() with small and large settings/secrets."""
+
+from benchmarks import fixtures
+from benchmarks.harness import Options, benchmark, timed
+from app.shared.serializers.serializers import serialize_application_component
+
+# (envs, secrets) per component
+SIZES = [(10, 5), (200, 200), (1000, 1000)]
+QUICK_SIZES = [(10, 5), (200, 200)]
+
+
+@benchmark("serialization")
+def run(options: Options) -> dict:
+    results = {}
+    for envs, secrets in QUICK_SIZES if options.quick else SIZES:
+        for component_type in fixtures.COMPONENT_TYPES:
+            component = fixtures.component(component_type.value, envs, secrets)
+            results[
+                f"serialize_application_component/{component_type.value}/"
+                f"envs={envs},secrets={secrets}"
+            ] = timed(lambda: serialize_application_component(component), options.runs)
+    return results
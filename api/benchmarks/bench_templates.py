@@ -0,0 +1,48 @@
+"""Template rendering: single bundled templates and the whole instance_management()."""
+
+from benchmarks import fixtures
+from benchmarks.harness import Options, benchmark, timed
+from app.shared.k8s.application_component_manager import (
+    KubernetesApplicationComponentManager,
+)
+from app.shared.serializers.serializers import serialize_application_component
+
+
+@benchmark("templates")
+def run(options: Options) -> dict:
+    results = {}
+    sessions = fixtures.session_factory()
+    with sessions() as session:
+        fixtures.load_templates(session)
+
+        for component_type in fixtures.COMPONENT_TYPES:
+            type_name = component_type.value
+            variables = {
+                "application": serialize_application_component(
+                    fixtures.component(type_name)
+                ),
+                "environment": {},
+                "cluster": {"gateway": {"reference": fixtures.GATEWAY_REFERENCE}},
+            }
+
+            for name, content in fixtures.bundled_templates(type_name).items():
+                results[f"render/{type_name}/{name}"] = timed(
+                    lambda content=content: (
+                        KubernetesApplicationComponentManager.render_template_from_string(
+                            content, variables
+                        )
+                    ),
+                    options.runs,
+                )
+
+            results[f"instance_management/{type_name}"] = timed(
+                lambda: KubernetesApplicationComponentManager.instance_management(
+                    variables["application"],
+                    type_name,
+                    {},
+                    db=session,
+                    gateway_reference=fixtures.GATEWAY_REFERENCE,
+                ),
+                options.runs,
+            )
+    return results
@@ -0,0 +1,200 @@
+"""
+Synthetic fixtures for the benchmarks.
+
+Everything here is deterministic: names, settings and row counts only depend on
+the arguments, so runs on different commits measure the same data.
+"""
+
+import contextlib
+import io
+import os
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Optional
+from uuid import UUID
+
+from cryptography.fernet import Fernet
+
+# Benchmarks must never touch a real database or need a configured key
+os.environ["ENV"] = "test"
+os.environ.setdefault("TRON_SECRETS_KEY", Fernet.generate_key().decode())
+
+from sqlalchemy import create_engine  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+from sqlalchemy.pool import StaticPool  # noqa: E402
+
+from app.shared.crypto import encrypt_secrets_in_settings  # noqa: E402
+from app.shared.database.database import Base  # noqa: E402
+from app.webapps.infra.application_component_model import WebappType  # noqa: E402
+
+TEMPLATES_DIR = Path(__file__).parent.parent / "app" / "k8s" / "templates"
+
+COMPONENT_TYPES = [WebappType.webapp, WebappType.worker, WebappType.cron]
+
+GATEWAY_REFERENCE = {"namespace": "gateway-system", "name": "public-gateway"}
+
+
+def fixed_uuid(n: int) -> UUID:
+    # The letters keep SQLite from reading an all-digit UUID back as a number
+    return UUID(f"be4c0000-0000-4000-a000-{n:012x}")
+
+
+def component_settings(component_type: str, envs: int = 10, secrets: int = 5) -> dict:
+    """Plaintext settings of a component of the given type."""
+    settings = {
+        "cpu": 0.5,
+        "memory": 512,
+        "envs": [
+            {"key": f"ENV_{i}", "value": f"value-{i:05d}-" + "x" * 32}
+            for i in range(envs)
+        ],
+        "secrets": [
+            {"key": f"SECRET_{i}", "value": f"secret-{i:05d}-" + "s" * 24}
+            for i in range(secrets)
+        ],
+    }
+    if component_type == "cron":
+        settings["schedule"] = "*/5 * * * *"
+        settings["command"] = ["python", "manage.py", "run-job", "--verbose"]
+        return settings
+
+    settings.update(
+        {
+            "command": None,
+            "autoscaling": {"min": 2, "max": 10},
+            "cpu_scaling_threshold": 80,
+            "memory_scaling_threshold": 80,
+            "custom_metrics": {"enabled": True, "port": 9090, "path": "/metrics"},
+        }
+    )
+    if component_type == "webapp":
+        settings["exposure"] = {"type": "http", "port": 8080, "visibility": "public"}
+        settings["healthcheck"] = {
+            "protocol": "http",
+            "path": "/health",
+            "port": 8080,
+            "failure_threshold": 3,
+            "initial_interval": 10,
+            "interval": 10,
+            "timeout": 2,
+        }
+    return settings
+
+
+def component(component_type: str, envs: int = 10, secrets: int = 5) -> SimpleNamespace:
+    """
+    A stand-in for an ApplicationComponent with its instance, application and
+    environment loaded, with secrets encrypted as they are stored.
+    """
+    environment = SimpleNamespace(name="production", uuid=fixed_uuid(1))
+    application = SimpleNamespace(
+        name="checkout", namespace="tron-ns-checkout", uuid=fixed_uuid(2)
+    )
+    instance = SimpleNamespace(
+        application=application,
+        environment=environment,
+        image="registry.example.com/checkout",
+        version="1.42.0",
+    )
+    return SimpleNamespace(
+        name=f"checkout-{component_type}",
+        uuid=fixed_uuid(3),
+        type=WebappType(component_type),
+        url="https://checkout.example.com" if component_type == "webapp" else None,
+        enabled=True,
+        instance=instance,
+        settings=encrypt_secrets_in_settings(
+            component_settings(component_type, envs, secrets)
+        ),
+    )
+
+
+def bundled_templates(component_type: str) -> dict:
+    """{file name: content} of the templates shipped for a component type."""
+    return {
+        path.name: path.read_text()
+        for path in sorted((TEMPLATES_DIR / component_type).glob("*.j2"))
+    }
+
+
+def session_factory(database_url: Optional[str] = None):
+    """
+    A session factory on a fresh schema.
+
+    Without a URL the database is an in-memory SQLite. A Postgres URL must
+    point at a disposable database: all tables are dropped and recreated.
+    """
+    if database_url:
+        engine = create_engine(database_url)
+        Base.metadata.drop_all(bind=engine)
+    else:
+        engine = create_engine(
+            "sqlite:///:memory:",
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+        )
+    Base.metadata.create_all(bind=engine)
+    return sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+def load_templates(session) -> None:
+    """Load the bundled templates and their configuration, as a new install does."""
+    from scripts.load_initial_templates import load_templates as load
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        load(session)
+
+
+def list_dataset(
+    rows: int,
+    database_url: Optional[str] = None,
+    envs_per_component: int = 10,
+    secrets_per_component: int = 3,
+):
+    """
+    A session factory on a fresh schema with `rows` instances and as many
+    components (about 60% webapps), generated by scripts.generate_dataset with
+    a fixed seed. `rows` must be a multiple of 10.
+    """
+    from scripts.generate_dataset import Scale, generate
+
+    sessions = session_factory(database_url)
+    scale = Scale(
+        environments=10,
+        clusters=10,
+        applications=rows // 10,
+        instances=rows,
+        components=rows,
+        envs_per_component=envs_per_component,
+        secrets_per_component=secrets_per_component,
+        settings_per_environment=5,
+        users=1,
+        tokens=1,
+        active_tokens=1,
+    )
+    generate(sessions.kw["bind"], scale, seed=0)
+    return sessions
+
+
+@contextlib.contextmanager
+def api_client(sessions):
+    """A TestClient for the whole app, reading from `sessions`, with auth skipped."""
+    from fastapi.testclient import TestClient
+
+    from app.main import app
+    from app.shared.database.database import get_db
+    from app.shared.dependencies.auth import get_current_user
+
+    def override_get_db():
+        session = sessions()
+        try:
+            yield session
+        finally:
+            session.close()
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_current_user] = lambda: None
+    try:
+        yield TestClient(app)
+    finally:
+        app.dependency_overrides.clear()
@@ -0,0 +1,207 @@
+"""
+Timing, result files and comparison for the benchmark suite.
+
+A benchmark is a function registered with @benchmark("group"). It receives the
+run options and returns {case name: timing}, where a timing comes from timed().
+Results are keyed "group/case", so the same case can be found again in another
+run's file.
+"""
+
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional
+
+# Each sample runs the function often enough to take at least this long, so
+# microsecond-scale cases aren't dominated by timer resolution
+MIN_SAMPLE_SECONDS = 0.002
+
+# Differences below this are treated as noise, whatever the ratio
+NOISE_FLOOR_MS = 0.01
+
+BENCHMARKS: Dict[str, Callable[["Options"], Dict[str, dict]]] = {}
+
+
+@dataclass
+class Options:
+    """Options shared by all benchmarks."""
+
+    runs: int = 20
+    quick: bool = False
+    database_url: Optional[str] = None
+
+
+def benchmark(group: str):
+    """Register a benchmark function under a group name."""
+
+    def register(func):
+        BENCHMARKS[group] = func
+        return func
+
+    return register
+
+
+def timed(func: Callable[[], object], runs: int) -> dict:
+    """
+    Time func() over `runs` samples after one warm-up call.
+
+    Returns median, p95 and min per call in milliseconds.
+    """
+    func()
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= MIN_SAMPLE_SECONDS or number >= 1000:
+            break
+        number *= 10
+
+    samples = [elapsed / number]
+    for _ in range(runs - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        samples.append((time.perf_counter() - start) / number)
+
+    samples = sorted(s * 1000 for s in samples)
+    return {
+        "median_ms": round(statistics.median(samples), 4),
+        "p95_ms": round(samples[min(len(samples) - 1, int(len(samples) * 0.95))], 4),
+        "min_ms": round(samples[0], 4),
+        "runs": runs,
+        "calls_per_run": number,
+    }
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=os.path.dirname(__file__),
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_benchmarks(options: Options, groups: Optional[List[str]] = None) -> dict:
+    """Run the selected groups (all by default) and build a result document."""
+    results = {}
+    for group, func in BENCHMARKS.items():
+        if groups and group not in groups:
+            continue
+        print(f"{group} ...", file=sys.stderr)
+        for case, timing in func(options).items():
+            results[f"{group}/{case}"] = timing
+    return {
+        "meta": {
+            "commit": _git_commit(),
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "runs": options.runs,
+            "quick": options.quick,
+        },
+        "results": results,
+    }
+
+
+def load(path: str) -> dict:
+    with open(path) as f:
+        return json.load(f)
+
+
+def save(document: dict, path: str) -> None:
+    with open(path, "w") as f:
+        json.dump(document, f, indent=2, sort_keys=True)
+
+
+def _change(base_ms: float, head_ms: float) -> float:
+    return (head_ms - base_ms) / base_ms if base_ms else 0.0
+
+
+def compare(base: dict, head: dict, threshold: float) -> List[dict]:
+    """
+    Compare every case present in both documents.
+
+    A case regresses when both its median and its fastest run are more than
+    `threshold` (0.15 = 15%) slower in head than in base, and the medians
+    differ by more than the noise floor; it improves in the opposite case.
+    Requiring both keeps a few slow samples on a busy machine from being
+    reported.
+    """
+    rows = []
+    for key, head_timing in sorted(head["results"].items()):
+        base_timing = base["results"].get(key)
+        if base_timing is None:
+            rows.append(
+                {"case": key, "status": "new", "head_ms": head_timing["median_ms"]}
+            )
+            continue
+        base_ms, head_ms = base_timing["median_ms"], head_timing["median_ms"]
+        change = _change(base_ms, head_ms)
+        min_change = _change(base_timing["min_ms"], head_timing["min_ms"])
+        status = "ok"
+        if abs(head_ms - base_ms) >= NOISE_FLOOR_MS:
+            if change > threshold and min_change > threshold:
+                status = "regression"
+            elif change < -threshold and min_change < -threshold:
+                status = "improvement"
+        rows.append(
+            {
+                "case": key,
+                "status": status,
+                "base_ms": base_ms,
+                "head_ms": head_ms,
+                "change": round(change, 4),
+            }
+        )
+    # Cases of groups head ran that it no longer has; other groups were skipped
+    head_groups = {key.split("/", 1)[0] for key in head["results"]}
+    for key in sorted(set(base["results"]) - set(head["results"])):
+        if key.split("/", 1)[0] in head_groups:
+            rows.append(
+                {
+                    "case": key,
+                    "status": "missing",
+                    "base_ms": base["results"][key]["median_ms"],
+                }
+            )
+    return rows
+
+
+def _width(cases) -> int:
+    return max([len("case"), *(len(case) for case in cases)])
+
+
+def print_results(document: dict) -> None:
+    width = _width(document["results"])
+    print(f"{'case':<{width}} {'median ms':>11} {'p95 ms':>11}")
+    for key, timing in document["results"].items():
+        print(f"{key:<{width}} {timing['median_ms']:>11.3f} {timing['p95_ms']:>11.3f}")
+
+
+def print_comparison(rows: List[dict], base: dict, head: dict) -> None:
+    print(
+        f"base {base['meta'].get('commit') or '?'} -> "
+        f"head {head['meta'].get('commit') or '?'}"
+    )
+    width = _width(row["case"] for row in rows)
+    print(f"{'case':<{width}} {'base ms':>11} {'head ms':>11} {'change':>8}  status")
+    for row in rows:
+        base_ms = f"{row['base_ms']:.3f}" if "base_ms" in row else "-"
+        head_ms = f"{row['head_ms']:.3f}" if "head_ms" in row else "-"
+        change = f"{row['change']:+.1%}" if "change" in row else "-"
+        print(
+            f"{row['case']:<{width}} {base_ms:>11} {head_ms:>11} {change:>8}  {row['status']}"
+        )
@@ -0,0 +1,369 @@
+#!/usr/bin/env python3
+"""
+Load test for the deploy pipeline against a fake Kubernetes apiserver.
+
+Each client owns an application and instance and repeatedly creates a public
+webapp, updates it, syncs the instance and deletes the webapp, all through
+the real API. Per concurrency level it reports p50/p99 per operation, errors
+and how many apiserver calls the deploys made:
+
+    # Everything in-process: the fake apiserver, and the API on a temp SQLite file
+    python scripts/deploy_load_test.py --clients 1,4,16 --deploys 5
+
+    # Slower apiserver with some failures
+    python scripts/deploy_load_test.py --latency-ms 20 --jitter-ms 10 --error-rate 0.01
+
+    # A running API (e.g. on Postgres) and a fake apiserver it can reach
+    python -m tests.fake_k8s --host 0.0.0.0 --port 8443 &
+    python scripts/deploy_load_test.py --api-url http://localhost:8000 \\
+        --apiserver-url http://host.docker.internal:8443 \\
+        --stats-url http://localhost:8443 --email admin@example.com --password ...
+
+SQLite serializes writers, so in-process numbers at high concurrency mostly
+measure lock waits; run the API on Postgres for those.
+"""
+
+import argparse
+import math
+import os
+import statistics
+import sys
+import tempfile
+import time
+import uuid
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+# Add root directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import httpx
+
+OPERATIONS = ["create", "update", "sync", "delete"]
+LOCAL_EMAIL = "load-test@example.com"
+LOCAL_PASSWORD = "load-test"
+
+
+def webapp_settings(cpu: float) -> dict:
+    return {
+        "exposure": {"type": "http", "port": 80, "visibility": "public"},
+        "envs": [{"key": "LOG_LEVEL", "value": "info"}],
+        "secrets": [{"key": "API_KEY", "value": "not-a-secret"}],
+        "cpu": cpu,
+        "memory": 256,
+        "healthcheck": {"path": "/healthcheck", "protocol": "http", "port": 80},
+        "custom_metrics": {"enabled": False, "port": 9090},
+        "autoscaling": {"min": 2, "max": 4},
+    }
+
+
+def start_local_api(database_url: str):
+    """Serve app.main:app in-process on a fresh database; return the server."""
+    os.environ["ENV"] = "test"
+    # The warmup would run against the in-memory test engine, not this database
+    os.environ["WARMUP_ENABLED"] = "false"
+    os.environ.setdefault(
+        "TRON_SECRETS_KEY", "vW0Jt0M3hPO9rGjGmUKg3PbDWh7kh3UdbyGZi9n2jLs="
+    )
+
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+
+    from app.main import app
+    from app.shared.database.database import Base, get_db
+    from benchmarks.fixtures import load_templates
+    from tests.fake_k8s.server import ThreadedServer
+
+    connect_args = {}
+    if database_url.startswith("sqlite"):
+        connect_args = {"check_same_thread": False, "timeout": 60}
+    engine = create_engine(database_url, connect_args=connect_args)
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    sessions = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    with sessions() as session:
+        load_templates(session)
+        create_admin(session)
+
+    def override_get_db():
+        session = sessions()
+        try:
+            yield session
+        finally:
+            session.close()
+
+    app.dependency_overrides[get_db] = override_get_db
+    return ThreadedServer(app).start()
+
+
+def create_admin(session):
+    from app.auth.core.auth_service import AuthService
+    from app.auth.infra.token_repository import TokenRepository
+    from app.users.infra.user_model import User, UserRole
+    from app.users.infra.user_repository import UserRepository
+
+    users = UserRepository(session)
+    auth = AuthService(users, TokenRepository(session))
+    users.create(
+        User(
+            email=LOCAL_EMAIL,
+            hashed_password=auth.get_password_hash(LOCAL_PASSWORD),
+            full_name="Load Test",
+            role=UserRole.ADMIN.value,
+            is_active=True,
+        )
+    )
+    session.commit()
+
+
+def login(api_url: str, email: str, password: str) -> dict:
+    response = httpx.post(
+        f"{api_url}/auth/login", json={"email": email, "password": password}
+    )
+    response.raise_for_status()
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+def setup(api: httpx.Client, apiserver_url: str, clients: int) -> list:
+    """Create an environment and cluster, and an application and instance per client."""
+    run = uuid.uuid4().hex[:6]
+    environment = api.post("/environments/", json={"name": f"load-{run}"})
+    environment.raise_for_status()
+    environment_uuid = environment.json()["uuid"]
+    api.post(
+        "/clusters/",
+        json={
+            "name": f"fake-{run}",
+            "api_address": apiserver_url,
+            "token": "fake",
+            "environment_uuid": environment_uuid,
+        },
+    ).raise_for_status()
+
+    instances = []
+    for n in range(clients):
+        application = api.post(
+            "/applications/",
+            json={"name": f"load-{run}-{n}", "repository": "https://example.com/repo"},
+        )
+        application.raise_for_status()
+        instance = api.post(
+            "/instances/",
+            json={
+                "application_uuid": application.json()["uuid"],
+                "environment_uuid": environment_uuid,
+                "image": "nginx",
+                "version": "1.0.0",
+            },
+        )
+        instance.raise_for_status()
+        instances.append(instance.json()["uuid"])
+    return instances
+
+
+def run_client(api_url, headers, instance_uuid, deploys, timeout):
+    """create -> update -> sync -> delete, `deploys` times; return per-op latencies and errors."""
+    latencies = defaultdict(list)
+    errors = defaultdict(int)
+    with httpx.Client(base_url=api_url, headers=headers, timeout=timeout) as api:
+
+        def timed(operation, method, path, **kwargs):
+            started = time.perf_counter()
+            try:
+                response = api.request(method, path, **kwargs)
+                ok = response.status_code < 400
+            except httpx.HTTPError:
+                response, ok = None, False
+            if ok:
+                latencies[operation].append(time.perf_counter() - started)
+            else:
+                errors[operation] += 1
+            return response if ok else None
+
+        for n in range(deploys):
+            name = f"web-{uuid.uuid4().hex[:8]}"
+            created = timed(
+                "create",
+                "POST",
+                "/application_components/webapp/",
+                json={
+                    "instance_uuid": instance_uuid,
+                    "name": name,
+                    "url": f"{name}.example.com",
+                    "enabled": True,
+                    "settings": webapp_settings(0.25),
+                },
+            )
+            if created is None:
+                continue
+            webapp_uuid = created.json()["uuid"]
+            timed(
+                "update",
+                "PUT",
+                f"/application_components/webapp/{webapp_uuid}",
+                json={"settings": webapp_settings(0.5)},
+            )
+            timed("sync", "POST", f"/instances/{instance_uuid}/sync")
+            timed("delete", "DELETE", f"/application_components/webapp/{webapp_uuid}")
+    return latencies, errors
+
+
+def run_level(api_url, headers, instances, deploys, timeout, stats_url) -> dict:
+    httpx.post(f"{stats_url}/_fake/reset").raise_for_status()
+    latencies = defaultdict(list)
+    errors = defaultdict(int)
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=len(instances)) as executor:
+        futures = [
+            executor.submit(run_client, api_url, headers, instance, deploys, timeout)
+            for instance in instances
+        ]
+        for future in futures:
+            client_latencies, client_errors = future.result()
+            for operation, values in client_latencies.items():
+                latencies[operation].extend(values)
+            for operation, count in client_errors.items():
+                errors[operation] += count
+    elapsed = time.perf_counter() - started
+    return {
+        "latencies": latencies,
+        "errors": errors,
+        "elapsed": elapsed,
+        "apiserver": httpx.get(f"{stats_url}/_fake/stats").json(),
+    }
+
+
+def percentile(values, fraction):
+    """Nearest-rank percentile in milliseconds."""
+    values = sorted(values)
+    return values[max(math.ceil(len(values) * fraction) - 1, 0)] * 1000 if values else 0
+
+
+def print_level(clients: int, deploys: int, result: dict, top: int) -> None:
+    completed = len(result["latencies"]["create"])
+    print(
+        f"\nclients={clients} deploys={clients * deploys} completed={completed} "
+        f"elapsed={result['elapsed']:.1f}s "
+        f"throughput={completed / result['elapsed']:.2f} deploys/s"
+    )
+    print(f"{'operation':>10} {'ok':>6} {'errors':>7} {'p50 ms':>9} {'p99 ms':>9}")
+    for operation in OPERATIONS:
+        values = result["latencies"][operation]
+        p50 = statistics.median(values) * 1000 if values else 0
+        print(
+            f"{operation:>10} {len(values):>6} {result['errors'][operation]:>7} "
+            f"{p50:>9.1f} {percentile(values, 0.99):>9.1f}"
+        )
+
+    apiserver = result["apiserver"]
+    per_deploy = apiserver["total_calls"] / completed if completed else 0
+    print(
+        f"apiserver: {apiserver['total_calls']} calls ({per_deploy:.1f} per deploy cycle), "
+        f"{apiserver['injected_errors']} injected errors"
+    )
+    calls = sorted(apiserver["calls"].items(), key=lambda item: -item[1])
+    for call, count in calls[:top]:
+        print(f"  {call:<40} {count:>7}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Deploy pipeline load test")
+    parser.add_argument(
+        "--clients", default="1,4,16", help="Comma separated concurrency levels"
+    )
+    parser.add_argument(
+        "--deploys", type=int, default=5, help="Deploy cycles per client and level"
+    )
+    parser.add_argument(
+        "--api-url", help="A running API; by default one is started in-process"
+    )
+    parser.add_argument("--email", default=LOCAL_EMAIL, help="Admin user of --api-url")
+    parser.add_argument("--password", default=LOCAL_PASSWORD)
+    parser.add_argument(
+        "--database-url",
+        help="Database of the in-process API (default: a temporary SQLite file); dropped and recreated",
+    )
+    parser.add_argument(
+        "--apiserver-url",
+        help="Fake apiserver as the API reaches it; by default one is started in-process",
+    )
+    parser.add_argument(
+        "--stats-url",
+        help="Fake apiserver as this script reaches it (default: --apiserver-url)",
+    )
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--conflict-rate", type=float, default=0.0)
+    parser.add_argument(
+        "--timeout", type=float, default=120.0, help="Seconds per API request"
+    )
+    parser.add_argument(
+        "--top", type=int, default=8, help="Apiserver call kinds to list per level"
+    )
+    args = parser.parse_args()
+
+    levels = [int(x) for x in args.clients.split(",")]
+    fake = None
+    local_api = None
+    database = None
+    try:
+        if args.apiserver_url:
+            apiserver_url = args.apiserver_url
+        else:
+            from tests.fake_k8s.server import FakeApiServer
+
+            fake = FakeApiServer().start()
+            apiserver_url = fake.url
+        stats_url = args.stats_url or apiserver_url
+        httpx.post(
+            f"{stats_url}/_fake/faults",
+            json={
+                "latency": args.latency_ms / 1000,
+                "jitter": args.jitter_ms / 1000,
+                "error_rate": args.error_rate,
+                "conflict_rate": args.conflict_rate,
+            },
+        ).raise_for_status()
+
+        if args.api_url:
+            api_url = args.api_url
+        else:
+            database_url = args.database_url
+            if not database_url:
+                database = tempfile.NamedTemporaryFile(suffix=".sqlite3", delete=False)
+                database_url = f"sqlite:///{database.name}"
+            local_api = start_local_api(database_url)
+            api_url = local_api.url
+
+        headers = login(api_url, args.email, args.password)
+        print(
+            f"api={api_url} apiserver={apiserver_url} latency={args.latency_ms}ms "
+            f"jitter={args.jitter_ms}ms error_rate={args.error_rate} "
+            f"conflict_rate={args.conflict_rate}"
+        )
+        with httpx.Client(
+            base_url=api_url, headers=headers, timeout=args.timeout
+        ) as api:
+            instances = setup(api, apiserver_url, max(levels))
+        for level in levels:
+            result = run_level(
+                api_url,
+                headers,
+                instances[:level],
+                args.deploys,
+                args.timeout,
+                stats_url,
+            )
+            print_level(level, args.deploys, result, args.top)
+    finally:
+        if local_api:
+            local_api.stop()
+        if fake:
+            fake.stop()
+        if database:
+            os.unlink(database.name)
+
+
+if __name__ == "__main__":
+    main()
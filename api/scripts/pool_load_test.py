@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Load test for the database connection pool.
+
+Runs increasing numbers of concurrent workers that each hold a connection for
+a short query and reports checkout wait times and pool timeouts per level.
+Run it once with the old defaults and once with the tuned settings to see
+where pool exhaustion starts:
+
+    # Before: SQLAlchemy defaults (pool_size=5, max_overflow=10, timeout=30)
+    python scripts/pool_load_test.py --pool-size 5 --max-overflow 10 --pool-timeout 30
+
+    # After: whatever DB_POOL_* variables are configured
+    python scripts/pool_load_test.py
+
+Requires the usual DB_HOST/DB_USER/DB_PASSWORD/DB_NAME variables.
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# Add root directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from sqlalchemy import create_engine, exc, text
+
+from app.shared.database.pool import (
+    InstrumentedQueuePool,
+    build_pool_options,
+    get_pool_stats,
+    reset_pool_stats,
+)
+
+
+def build_engine(args):
+    """Build an engine from DB_* variables, overridden by CLI flags."""
+    options = build_pool_options()
+    options.pop("statement_timeout_ms")
+    for key in ("pool_size", "max_overflow", "pool_timeout"):
+        value = getattr(args, key)
+        if value is not None:
+            options[key] = value
+
+    url = (
+        f"postgresql://{os.getenv('DB_USER')}:{os.getenv('DB_PASSWORD')}"
+        f"@{os.getenv('DB_HOST')}/{os.getenv('DB_NAME')}"
+    )
+    return create_engine(url, poolclass=InstrumentedQueuePool, **options), options
+
+
+def run_level(engine, concurrency: int, requests: int, hold: float) -> dict:
+    """Run `requests` checkouts with `concurrency` threads, each holding for `hold` seconds."""
+    reset_pool_stats()
+    latencies = []
+    errors = 0
+
+    def one_request(_):
+        started = time.perf_counter()
+        try:
+            with engine.connect() as conn:
+                conn.execute(text("SELECT pg_sleep(:s)"), {"s": hold})
+        except exc.TimeoutError:
+            return None
+        return time.perf_counter() - started
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        for result in executor.map(one_request, range(requests)):
+            if result is None:
+                errors += 1
+            else:
+                latencies.append(result)
+
+    stats = get_pool_stats(engine)
+    latencies.sort()
+    return {
+        "concurrency": concurrency,
+        "ok": len(latencies),
+        "timeouts": errors,
+        "p50_ms": statistics.median(latencies) * 1000 if latencies else 0,
+        "p99_ms": latencies[int(len(latencies) * 0.99) - 1] * 1000 if latencies else 0,
+        "avg_wait_ms": (stats["wait_seconds_total"] / stats["checkouts"] * 1000)
+        if stats["checkouts"]
+        else 0,
+        "max_wait_ms": stats["wait_seconds_max"] * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Database pool load test")
+    parser.add_argument("--pool-size", dest="pool_size", type=int)
+    parser.add_argument("--max-overflow", dest="max_overflow", type=int)
+    parser.add_argument("--pool-timeout", dest="pool_timeout", type=int)
+    parser.add_argument(
+        "--levels",
+        default="5,10,20,40,80,160",
+        help="Comma separated concurrency levels",
+    )
+    parser.add_argument("--requests", type=int, default=400, help="Requests per level")
+    parser.add_argument("--hold", type=float, default=0.05, help="Seconds each query holds a connection")
+    args = parser.parse_args()
+
+    engine, options = build_engine(args)
+    print(
+        f"pool_size={options['pool_size']} max_overflow={options['max_overflow']} "
+        f"pool_timeout={options['pool_timeout']}s pre_ping={options['pool_pre_ping']}"
+    )
+    print(f"{'threads':>8} {'ok':>6} {'timeouts':>9} {'p50 ms':>9} {'p99 ms':>9} {'avg wait':>9} {'max wait':>9}")
+
+    for level in [int(x) for x in args.levels.split(",")]:
+        r = run_level(engine, level, args.requests, args.hold)
+        print(
+            f"{r['concurrency']:>8} {r['ok']:>6} {r['timeouts']:>9} {r['p50_ms']:>9.1f} "
+            f"{r['p99_ms']:>9.1f} {r['avg_wait_ms']:>9.1f} {r['max_wait_ms']:>9.1f}"
+        )
+
+    engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Re-encrypt all stored component secrets with the newest secrets key.
+
+Rotation runs online:
+
+1. Generate a new key and deploy the API with
+   TRON_SECRETS_KEYS=<new key>,<old key>. New secrets use the new key and
+   existing ones still decrypt with the old one.
+2. Run this script with the same TRON_SECRETS_KEYS. It re-encrypts components in
+   small batches and can be throttled with --rate.
+3. Run it again with --verify. This pass only reads: it counts the components
+   still holding a value the new key can't read, and exits non-zero unless
+   there are none.
+4. Once --verify reports 0, drop the old key from TRON_SECRETS_KEYS.
+
+    python scripts/rotate_secrets_key.py
+    python scripts/rotate_secrets_key.py --batch-size 200 --rate 500
+    python scripts/rotate_secrets_key.py --state-file /tmp/rotation.state
+    python scripts/rotate_secrets_key.py --verify
+
+With --state-file the last finished component id is saved after every batch;
+running the same command again resumes from there. --after-id does the same
+by hand.
+"""
+import argparse
+import os
+import sys
+import time
+
+# Add root directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+# Import the app to ensure all models are loaded
+from app.main import app  # noqa: F401,E402
+
+from app.shared.crypto import get_secrets_keys  # noqa: E402
+from app.shared.crypto.key_rotation import (  # noqa: E402
+    RotationProgress,
+    reencrypt_component_secrets,
+    verify_component_secrets,
+)
+from app.shared.database.database import SessionLocal  # noqa: E402
+
+
+def read_state(path: str) -> int:
+    if path and os.path.exists(path):
+        with open(path) as f:
+            return int(f.read().strip() or 0)
+    return 0
+
+
+def write_state(path: str, last_id: int) -> None:
+    # Write then rename, so an interrupted run never leaves a truncated file
+    with open(path + ".tmp", "w") as f:
+        f.write(str(last_id))
+    os.replace(path + ".tmp", path)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--rate", type=float, help="Maximum components per second")
+    parser.add_argument("--after-id", type=int, help="Resume after this component id")
+    parser.add_argument("--state-file", help="Save progress here and resume from it")
+    parser.add_argument(
+        "--verify",
+        action="store_true",
+        help="Only count components not yet on the newest key; writes nothing",
+    )
+    args = parser.parse_args()
+
+    if args.verify:
+        progress = verify_component_secrets(SessionLocal, batch_size=args.batch_size)
+        print(
+            f"Checked {progress.processed} components: {progress.failed} still "
+            "hold values the newest key can't read."
+        )
+        return 1 if progress.failed else 0
+
+    if len(get_secrets_keys()) < 2:
+        print("Only one key is configured; new values already use it.")
+        print("Set TRON_SECRETS_KEYS=<new key>,<old key> to rotate.")
+
+    after_id = args.after_id
+    if after_id is None:
+        after_id = read_state(args.state_file)
+    started = time.monotonic()
+
+    def report(progress: RotationProgress) -> None:
+        if args.state_file:
+            write_state(args.state_file, progress.last_id)
+        elapsed = time.monotonic() - started
+        print(
+            f"{progress.processed}/{progress.total} components, "
+            f"{progress.updated} updated, {progress.failed} failed, "
+            f"last id {progress.last_id}, "
+            f"{progress.processed / elapsed if elapsed else 0:.0f}/s",
+            flush=True,
+        )
+
+    progress = reencrypt_component_secrets(
+        SessionLocal,
+        batch_size=args.batch_size,
+        max_rows_per_second=args.rate,
+        after_id=after_id,
+        on_batch=report,
+    )
+
+    print(
+        f"Done: {progress.updated} components re-encrypted, "
+        f"{progress.failed} secrets matched no configured key."
+    )
+    return 1 if progress.failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,5 @@
+"""In-memory fake Kubernetes API server for end-to-end and load tests."""
+
+from tests.fake_k8s.server import FakeApiServer, FakeCluster, FaultConfig
+
+__all__ = ["FakeApiServer", "FakeCluster", "FaultConfig"]
@@ -0,0 +1,66 @@
+"""
+Run the fake apiserver as its own process:
+
+    python -m tests.fake_k8s --port 8443 --latency-ms 20 --jitter-ms 10 --error-rate 0.01
+
+Point a cluster's api_address at http://127.0.0.1:8443 (any token works).
+"""
+
+import argparse
+import time
+
+from tests.fake_k8s.server import FakeApiServer, FaultConfig
+
+
+def main():
+    parser = argparse.ArgumentParser(description="In-memory fake Kubernetes API server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8443)
+    parser.add_argument(
+        "--latency-ms", type=float, default=0.0, help="Delay added to every call"
+    )
+    parser.add_argument(
+        "--jitter-ms",
+        type=float,
+        default=0.0,
+        help="Random extra delay, up to this much",
+    )
+    parser.add_argument(
+        "--error-rate",
+        type=float,
+        default=0.0,
+        help="Fraction of resource calls that fail",
+    )
+    parser.add_argument(
+        "--error-status", type=int, default=500, help="Status of injected failures"
+    )
+    parser.add_argument(
+        "--conflict-rate",
+        type=float,
+        default=0.0,
+        help="Fraction of replaces answered with 409",
+    )
+    parser.add_argument(
+        "--seed", type=int, default=None, help="Seed for reproducible fault injection"
+    )
+    args = parser.parse_args()
+
+    faults = FaultConfig(
+        latency=args.latency_ms / 1000,
+        jitter=args.jitter_ms / 1000,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        conflict_rate=args.conflict_rate,
+        seed=args.seed,
+    )
+    with FakeApiServer(args.host, args.port, faults) as server:
+        print(f"Fake apiserver listening on {server.url} (Ctrl+C to stop)")
+        try:
+            while True:
+                time.sleep(3600)
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,941 @@
+"""
+In-memory fake of the Kubernetes API server.
+
+Implements the subset of the API Tron uses, so K8sClient can be driven
+end to end without a cluster:
+
+- discovery: /version, /api, /api/v1, /apis, /apis/{group}, /apis/{group}/{version}
+- namespaces, nodes, and namespaced resources for every kind in
+  K8S_API_MAPPING plus pods, events, jobs and the Gateway API kinds
+- get, list (labelSelector, fieldSelector), watch, create, replace
+  (resourceVersion conflicts), merge patch, server-side apply and delete
+- deployments get one Running pod per replica and a ScalingReplicaSet event,
+  so the pod and event endpoints have something to show
+
+Latency and errors can be injected (FaultConfig), and every call is counted
+per verb and resource with the same labels as the tron_k8s_api_* metrics.
+Besides the Kubernetes paths the server answers:
+
+    GET  /_fake/stats              call counts, injected errors, stored objects
+    POST /_fake/faults             replace the FaultConfig (JSON body)
+    POST /_fake/reset?objects=1    clear the counters, and the objects if asked
+
+Everything lives in one process and is lost on exit. It is not a conformance
+target: admission, defaulting, finalizers and garbage collection beyond
+namespaces and deployment pods are not modelled.
+"""
+
+import asyncio
+import copy
+import json
+import random
+import socket
+import threading
+import time
+import uuid
+from collections import Counter, deque
+from dataclasses import asdict, dataclass, fields
+from datetime import datetime, timezone
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+import uvicorn
+import yaml
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response, StreamingResponse
+from starlette.routing import Route
+
+from app.k8s.client import describe_api_call
+
+
+class ResourceType(NamedTuple):
+    group: str
+    version: str
+    plural: str
+    kind: str
+    namespaced: bool = True
+
+    @property
+    def api_version(self) -> str:
+        return f"{self.group}/{self.version}" if self.group else self.version
+
+
+RESOURCE_TYPES = [
+    ResourceType("", "v1", "namespaces", "Namespace", namespaced=False),
+    ResourceType("", "v1", "nodes", "Node", namespaced=False),
+    ResourceType("", "v1", "pods", "Pod"),
+    ResourceType("", "v1", "services", "Service"),
+    ResourceType("", "v1", "configmaps", "ConfigMap"),
+    ResourceType("", "v1", "secrets", "Secret"),
+    ResourceType("", "v1", "events", "Event"),
+    ResourceType("apps", "v1", "deployments", "Deployment"),
+    ResourceType("batch", "v1", "jobs", "Job"),
+    ResourceType("batch", "v1", "cronjobs", "CronJob"),
+    ResourceType(
+        "autoscaling", "v2", "horizontalpodautoscalers", "HorizontalPodAutoscaler"
+    ),
+    ResourceType("networking.k8s.io", "v1", "ingresses", "Ingress"),
+    ResourceType("discovery.k8s.io", "v1", "endpointslices", "EndpointSlice"),
+    ResourceType("gateway.networking.k8s.io", "v1", "gateways", "Gateway"),
+    ResourceType("gateway.networking.k8s.io", "v1beta1", "gateways", "Gateway"),
+    ResourceType("gateway.networking.k8s.io", "v1", "httproutes", "HTTPRoute"),
+    ResourceType("gateway.networking.k8s.io", "v1alpha2", "tcproutes", "TCPRoute"),
+    ResourceType("gateway.networking.k8s.io", "v1alpha2", "udproutes", "UDPRoute"),
+]
+
+_TYPES = {(t.group, t.version, t.plural): t for t in RESOURCE_TYPES}
+
+# Objects are stored per group, not per version, like the real server does
+ObjectKey = Tuple[str, str, str, str]  # group, plural, namespace, name
+
+DEFAULT_NAMESPACES = ["default", "kube-system", "gateway-system"]
+NODES = 3
+
+
+@dataclass
+class FaultConfig:
+    """
+    What to inject into every call.
+
+    latency and jitter are in seconds: each call waits latency plus a uniform
+    random share of jitter. error_rate is the fraction of resource calls
+    answered with error_status instead; conflict_rate the fraction of
+    replaces answered with 409 Conflict. Discovery and /_fake calls never fail.
+    """
+
+    latency: float = 0.0
+    jitter: float = 0.0
+    error_rate: float = 0.0
+    error_status: int = 500
+    conflict_rate: float = 0.0
+    seed: Optional[int] = None
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _status(code: int, reason: str, message: str) -> JSONResponse:
+    return JSONResponse(
+        {
+            "kind": "Status",
+            "apiVersion": "v1",
+            "metadata": {},
+            "status": "Failure",
+            "message": message,
+            "reason": reason,
+            "code": code,
+        },
+        status_code=code,
+    )
+
+
+def _merge_patch(target, patch):
+    """RFC 7386 JSON merge patch."""
+    if not isinstance(patch, dict):
+        return copy.deepcopy(patch)
+    result = dict(target) if isinstance(target, dict) else {}
+    for key, value in patch.items():
+        if value is None:
+            result.pop(key, None)
+        else:
+            result[key] = _merge_patch(result.get(key), value)
+    return result
+
+
+def _lookup(obj: dict, dotted: str):
+    for part in dotted.split("."):
+        if not isinstance(obj, dict):
+            return None
+        obj = obj.get(part)
+    return obj
+
+
+def _matches_labels(obj: dict, selector: Optional[str]) -> bool:
+    if not selector:
+        return True
+    labels = obj.get("metadata", {}).get("labels") or {}
+    for term in selector.split(","):
+        term = term.strip()
+        if "!=" in term:
+            key, value = term.split("!=", 1)
+            if labels.get(key.strip()) == value.strip():
+                return False
+        elif "=" in term:
+            key, value = term.replace("==", "=").split("=", 1)
+            if labels.get(key.strip()) != value.strip():
+                return False
+        elif term.startswith("!"):
+            if term[1:] in labels:
+                return False
+        elif term not in labels:
+            return False
+    return True
+
+
+def _matches_fields(obj: dict, selector: Optional[str]) -> bool:
+    if not selector:
+        return True
+    for term in selector.split(","):
+        negate = "!=" in term
+        key, value = term.replace("!=", "=").replace("==", "=").split("=", 1)
+        actual = _lookup(obj, key.strip())
+        if (str(actual) == value.strip()) == negate:
+            return False
+    return True
+
+
+class FakeCluster:
+    """State of the fake cluster: stored objects, watch history and counters."""
+
+    def __init__(self, faults: Optional[FaultConfig] = None):
+        self._lock = threading.Lock()
+        self.faults = faults or FaultConfig()
+        self._random = random.Random(self.faults.seed)
+        self.calls: Counter = Counter()
+        self.injected_errors = 0
+        self.reset(objects=True)
+
+    # -- state ---------------------------------------------------------------
+
+    def reset(self, objects: bool = False) -> None:
+        with self._lock:
+            self.calls.clear()
+            self.injected_errors = 0
+            if objects:
+                self.objects: Dict[ObjectKey, dict] = {}
+                self.history: deque = deque(maxlen=10000)
+                self._resource_version = 0
+        if objects:
+            self._seed()
+
+    def _seed(self) -> None:
+        for name in DEFAULT_NAMESPACES:
+            self.create(
+                _TYPES[("", "v1", "namespaces")], "", {"metadata": {"name": name}}
+            )
+        for n in range(NODES):
+            self.create(
+                _TYPES[("", "v1", "nodes")],
+                "",
+                {
+                    "metadata": {
+                        "name": f"node-{n}",
+                        "labels": {"kubernetes.io/os": "linux"},
+                    },
+                    "status": {
+                        "capacity": {"cpu": "4", "memory": "16384000Ki", "pods": "110"},
+                        "allocatable": {
+                            "cpu": "4",
+                            "memory": "16000000Ki",
+                            "pods": "110",
+                        },
+                        "addresses": [
+                            {"type": "InternalIP", "address": f"10.0.0.{n + 1}"}
+                        ],
+                    },
+                },
+            )
+        self.create(
+            _TYPES[("gateway.networking.k8s.io", "v1", "gateways")],
+            "gateway-system",
+            {
+                "metadata": {"name": "public-gateway"},
+                "spec": {
+                    "gatewayClassName": "fake",
+                    "listeners": [{"name": "http", "port": 80, "protocol": "HTTP"}],
+                },
+            },
+        )
+
+    def set_faults(self, faults: FaultConfig) -> None:
+        self.faults = faults
+        self._random = random.Random(faults.seed)
+
+    @property
+    def resource_version(self) -> int:
+        return self._resource_version
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "calls": dict(sorted(self.calls.items())),
+                "total_calls": sum(self.calls.values()),
+                "injected_errors": self.injected_errors,
+                "objects": len(self.objects),
+            }
+
+    def get(self, rtype: ResourceType, namespace: str, name: str) -> Optional[dict]:
+        obj = self.objects.get((rtype.group, rtype.plural, namespace, name))
+        return self._present(rtype, obj) if obj else None
+
+    def list(
+        self,
+        rtype: ResourceType,
+        namespace: Optional[str],
+        label_selector: Optional[str] = None,
+        field_selector: Optional[str] = None,
+    ) -> List[dict]:
+        with self._lock:
+            found = [
+                obj
+                for (group, plural, obj_namespace, _), obj in self.objects.items()
+                if group == rtype.group
+                and plural == rtype.plural
+                and (namespace is None or obj_namespace == namespace)
+            ]
+        return [
+            self._present(rtype, obj)
+            for obj in sorted(
+                found, key=lambda o: int(o["metadata"]["resourceVersion"])
+            )
+            if _matches_labels(obj, label_selector)
+            and _matches_fields(obj, field_selector)
+        ]
+
+    def _present(self, rtype: ResourceType, obj: dict) -> dict:
+        """The object as served for this API version."""
+        obj = copy.deepcopy(obj)
+        obj["apiVersion"] = rtype.api_version
+        obj["kind"] = rtype.kind
+        return obj
+
+    def _record(self, event_type: str, rtype: ResourceType, obj: dict) -> None:
+        self.history.append(
+            (int(obj["metadata"]["resourceVersion"]), event_type, rtype, obj)
+        )
+
+    def _next_version(self) -> str:
+        self._resource_version += 1
+        return str(self._resource_version)
+
+    def create(
+        self, rtype: ResourceType, namespace: str, body: dict
+    ) -> Tuple[int, dict]:
+        name = (body.get("metadata") or {}).get("name")
+        if not name:
+            return 422, {
+                "reason": "Invalid",
+                "message": "metadata.name: Required value",
+            }
+        key = (rtype.group, rtype.plural, namespace, name)
+        with self._lock:
+            if (
+                rtype.namespaced
+                and ("", "namespaces", "", namespace) not in self.objects
+            ):
+                return 404, {
+                    "reason": "NotFound",
+                    "message": f'namespaces "{namespace}" not found',
+                }
+            if key in self.objects:
+                return 409, {
+                    "reason": "AlreadyExists",
+                    "message": f'{rtype.plural} "{name}" already exists',
+                }
+            obj = copy.deepcopy(body)
+            metadata = obj.setdefault("metadata", {})
+            metadata.update(
+                {
+                    "name": name,
+                    "uid": str(uuid.uuid4()),
+                    "resourceVersion": self._next_version(),
+                    "creationTimestamp": _now(),
+                    "generation": 1,
+                }
+            )
+            if rtype.namespaced:
+                metadata["namespace"] = namespace
+            else:
+                metadata.pop("namespace", None)
+            if rtype.plural == "namespaces":
+                obj["status"] = {"phase": "Active"}
+            self.objects[key] = obj
+            self._record("ADDED", rtype, obj)
+        self._after_write(rtype, obj)
+        return 201, self._present(rtype, obj)
+
+    def replace(
+        self, rtype: ResourceType, namespace: str, name: str, body: dict
+    ) -> Tuple[int, dict]:
+        key = (rtype.group, rtype.plural, namespace, name)
+        with self._lock:
+            existing = self.objects.get(key)
+            if existing is None:
+                return 404, {
+                    "reason": "NotFound",
+                    "message": f'{rtype.plural} "{name}" not found',
+                }
+            requested = (body.get("metadata") or {}).get("resourceVersion")
+            if requested and requested != existing["metadata"]["resourceVersion"]:
+                return 409, {
+                    "reason": "Conflict",
+                    "message": (
+                        f'Operation cannot be fulfilled on {rtype.plural} "{name}": the object '
+                        "has been modified; please apply your changes to the latest version "
+                        "and try again"
+                    ),
+                }
+            obj = copy.deepcopy(body)
+            self._carry_over(existing, obj)
+            self.objects[key] = obj
+            self._record("MODIFIED", rtype, obj)
+        self._after_write(rtype, obj)
+        return 200, self._present(rtype, obj)
+
+    def patch(
+        self, rtype: ResourceType, namespace: str, name: str, body: dict, apply: bool
+    ) -> Tuple[int, dict]:
+        key = (rtype.group, rtype.plural, namespace, name)
+        existing = self.objects.get(key)
+        if existing is None:
+            if not apply:
+                return 404, {
+                    "reason": "NotFound",
+                    "message": f'{rtype.plural} "{name}" not found',
+                }
+            body = copy.deepcopy(body)
+            body.setdefault("metadata", {})["name"] = name
+            return self.create(rtype, namespace, body)
+        with self._lock:
+            obj = _merge_patch(existing, body)
+            self._carry_over(existing, obj)
+            self.objects[key] = obj
+            self._record("MODIFIED", rtype, obj)
+        self._after_write(rtype, obj)
+        return 200, self._present(rtype, obj)
+
+    def _carry_over(self, existing: dict, obj: dict) -> None:
+        metadata = obj.setdefault("metadata", {})
+        for field in ("name", "namespace", "uid", "creationTimestamp"):
+            if field in existing["metadata"]:
+                metadata[field] = existing["metadata"][field]
+        generation = existing["metadata"].get("generation", 1)
+        if obj.get("spec") != existing.get("spec"):
+            generation += 1
+        metadata["generation"] = generation
+        metadata["resourceVersion"] = self._next_version()
+
+    def delete(
+        self, rtype: ResourceType, namespace: str, name: str
+    ) -> Tuple[int, dict]:
+        key = (rtype.group, rtype.plural, namespace, name)
+        with self._lock:
+            obj = self.objects.pop(key, None)
+            if obj is None:
+                return 404, {
+                    "reason": "NotFound",
+                    "message": f'{rtype.plural} "{name}" not found',
+                }
+            obj = copy.deepcopy(obj)
+            obj["metadata"]["resourceVersion"] = self._next_version()
+            self._record("DELETED", rtype, obj)
+            if rtype.plural == "namespaces":
+                # The real server deletes the contents asynchronously
+                for other in [k for k in self.objects if k[2] == name]:
+                    removed = self.objects.pop(other)
+                    removed["metadata"]["resourceVersion"] = self._next_version()
+                    other_type = self._type_for(other)
+                    if other_type:
+                        self._record("DELETED", other_type, removed)
+        if rtype.plural == "deployments":
+            self._sync_pods(namespace, name, None)
+        return 200, {
+            "kind": "Status",
+            "apiVersion": "v1",
+            "metadata": {},
+            "status": "Success",
+            "details": {
+                "name": name,
+                "kind": rtype.plural,
+                "uid": obj["metadata"]["uid"],
+            },
+        }
+
+    def _type_for(self, key: ObjectKey) -> Optional[ResourceType]:
+        for rtype in RESOURCE_TYPES:
+            if (rtype.group, rtype.plural) == key[:2]:
+                return rtype
+        return None
+
+    # -- controllers -----------------------------------------------------------
+
+    def _after_write(self, rtype: ResourceType, obj: dict) -> None:
+        if rtype.plural != "deployments":
+            return
+        namespace, name = obj["metadata"]["namespace"], obj["metadata"]["name"]
+        self._sync_pods(namespace, name, obj)
+        replicas = (obj.get("spec") or {}).get("replicas", 1)
+        self._emit_event(
+            namespace,
+            {"kind": "Deployment", "name": name, "namespace": namespace},
+            "ScalingReplicaSet",
+            f"Scaled up replica set {name}-fake to {replicas}",
+        )
+
+    def _sync_pods(self, namespace: str, deployment: str, obj: Optional[dict]) -> None:
+        """One Running pod per replica of the deployment (none once it is deleted)."""
+        pods = _TYPES[("", "v1", "pods")]
+        prefix = f"{deployment}-fake-"
+        for existing in self.list(pods, namespace):
+            if existing["metadata"]["name"].startswith(prefix):
+                self.delete(pods, namespace, existing["metadata"]["name"])
+        if obj is None:
+            return
+        spec = obj.get("spec") or {}
+        template = spec.get("template") or {}
+        containers = (template.get("spec") or {}).get("containers") or []
+        for n in range(spec.get("replicas", 1) or 0):
+            self.create(
+                pods,
+                namespace,
+                {
+                    "metadata": {
+                        "name": f"{prefix}{n}",
+                        "labels": (template.get("metadata") or {}).get("labels") or {},
+                    },
+                    "spec": template.get("spec") or {"containers": []},
+                    "status": {
+                        "phase": "Running",
+                        "hostIP": f"10.0.0.{n % NODES + 1}",
+                        "startTime": _now(),
+                        "containerStatuses": [
+                            {
+                                "name": container.get("name", "app"),
+                                "image": container.get("image", ""),
+                                "imageID": "",
+                                "ready": True,
+                                "restartCount": 0,
+                            }
+                            for container in containers
+                        ],
+                    },
+                },
+            )
+
+    def _emit_event(
+        self, namespace: str, involved: dict, reason: str, message: str
+    ) -> None:
+        self.create(
+            _TYPES[("", "v1", "events")],
+            namespace,
+            {
+                "metadata": {"name": f"{involved['name']}.{uuid.uuid4().hex[:16]}"},
+                "involvedObject": involved,
+                "reason": reason,
+                "message": message,
+                "type": "Normal",
+                "count": 1,
+                "firstTimestamp": _now(),
+                "lastTimestamp": _now(),
+                "source": {"component": "fake-controller"},
+            },
+        )
+
+    # -- faults --------------------------------------------------------------
+
+    def injected_delay(self) -> float:
+        if not self.faults.jitter:
+            return self.faults.latency
+        return self.faults.latency + self._random.random() * self.faults.jitter
+
+    def injected_error(self, method: str) -> Optional[int]:
+        if self.faults.error_rate and self._random.random() < self.faults.error_rate:
+            return self.faults.error_status
+        if (
+            method == "PUT"
+            and self.faults.conflict_rate
+            and self._random.random() < self.faults.conflict_rate
+        ):
+            return 409
+        return None
+
+    def count(self, verb: str, kind: str) -> None:
+        with self._lock:
+            self.calls[f"{verb} {kind}"] += 1
+
+
+# -- HTTP --------------------------------------------------------------------------
+
+
+def _discovery_resources(group: str, version: str) -> dict:
+    return {
+        "kind": "APIResourceList",
+        "apiVersion": "v1",
+        "groupVersion": f"{group}/{version}" if group else version,
+        "resources": [
+            {
+                "name": t.plural,
+                "singularName": t.kind.lower(),
+                "namespaced": t.namespaced,
+                "kind": t.kind,
+                "verbs": [
+                    "create",
+                    "delete",
+                    "get",
+                    "list",
+                    "patch",
+                    "update",
+                    "watch",
+                ],
+            }
+            for t in RESOURCE_TYPES
+            if (t.group, t.version) == (group, version)
+        ],
+    }
+
+
+def _discovery_group(group: str) -> Optional[dict]:
+    versions = sorted(
+        {t.version for t in RESOURCE_TYPES if t.group == group}, reverse=True
+    )
+    if not versions:
+        return None
+    entries = [{"groupVersion": f"{group}/{v}", "version": v} for v in versions]
+    return {
+        "kind": "APIGroup",
+        "apiVersion": "v1",
+        "name": group,
+        "versions": entries,
+        "preferredVersion": entries[0],
+    }
+
+
+def _parse_path(path: str):
+    """
+    Split a resource path into (ResourceType, namespace, name, subresource).
+
+    Returns None for paths that aren't resources (discovery) and raises
+    KeyError for unknown resources.
+    """
+    parts = [p for p in path.split("/") if p]
+    if parts[:1] == ["api"] and len(parts) >= 2:
+        group, version, rest = "", parts[1], parts[2:]
+    elif parts[:1] == ["apis"] and len(parts) >= 3:
+        group, version, rest = parts[1], parts[2], parts[3:]
+    else:
+        return None
+    if not rest:
+        return None
+    namespace = ""
+    if rest[0] == "namespaces" and len(rest) >= 3:
+        namespace, rest = rest[1], rest[2:]
+    rtype = _TYPES[(group, version, rest[0])]
+    name = rest[1] if len(rest) > 1 else None
+    subresource = rest[2] if len(rest) > 2 else None
+    return rtype, namespace, name, subresource
+
+
+async def _read_body(request: Request) -> dict:
+    raw = await request.body()
+    if not raw:
+        return {}
+    if "yaml" in request.headers.get("content-type", ""):
+        return yaml.safe_load(raw) or {}
+    return json.loads(raw)
+
+
+def build_app(cluster: FakeCluster) -> Starlette:
+    """The ASGI app serving `cluster`."""
+
+    async def stats(request: Request) -> JSONResponse:
+        return JSONResponse(cluster.stats())
+
+    async def set_faults(request: Request) -> JSONResponse:
+        body = await request.json()
+        known = {f.name for f in fields(FaultConfig)}
+        cluster.set_faults(FaultConfig(**{k: v for k, v in body.items() if k in known}))
+        return JSONResponse(asdict(cluster.faults))
+
+    async def reset(request: Request) -> JSONResponse:
+        cluster.reset(
+            objects=request.query_params.get("objects", "").lower() in ("1", "true")
+        )
+        return JSONResponse(cluster.stats())
+
+    async def kubernetes(request: Request) -> Response:
+        path, method = request.url.path, request.method
+        verb, kind = describe_api_call(method, path)
+        watching = request.query_params.get("watch", "").lower() in ("1", "true")
+        if watching:
+            verb = "watch"
+        cluster.count(verb, kind)
+
+        delay = cluster.injected_delay()
+        if delay:
+            await asyncio.sleep(delay)
+
+        discovery = _discovery(path)
+        if discovery is not None:
+            return discovery
+
+        try:
+            parsed = _parse_path(path)
+        except KeyError:
+            return _status(
+                404, "NotFound", "the server could not find the requested resource"
+            )
+        if parsed is None:
+            return _status(
+                404, "NotFound", "the server could not find the requested resource"
+            )
+        rtype, namespace, name, subresource = parsed
+
+        error = cluster.injected_error(method)
+        if error:
+            cluster.injected_errors += 1
+            reason = {409: "Conflict", 429: "TooManyRequests"}.get(
+                error, "InternalError"
+            )
+            response = _status(error, reason, f"injected {error}")
+            if error == 429:
+                response.headers["Retry-After"] = "1"
+            return response
+
+        if subresource == "log" and method == "GET":
+            return Response(f"fake log line for {name}\n", media_type="text/plain")
+        if subresource:
+            return _status(
+                404, "NotFound", f"subresource {subresource} is not supported"
+            )
+
+        if method == "GET" and name:
+            obj = cluster.get(rtype, namespace, name)
+            if obj is None:
+                return _status(404, "NotFound", f'{rtype.plural} "{name}" not found')
+            return JSONResponse(obj)
+        if method == "GET":
+            params = request.query_params
+            scope = namespace if rtype.namespaced and namespace else None
+            if watching:
+                return _watch(rtype, scope, params)
+            items = cluster.list(
+                rtype, scope, params.get("labelSelector"), params.get("fieldSelector")
+            )
+            return JSONResponse(
+                {
+                    "kind": f"{rtype.kind}List",
+                    "apiVersion": rtype.api_version,
+                    "metadata": {"resourceVersion": str(cluster.resource_version)},
+                    "items": items,
+                }
+            )
+
+        if method == "POST" and not name:
+            code, result = cluster.create(rtype, namespace, await _read_body(request))
+        elif method == "PUT" and name:
+            code, result = cluster.replace(
+                rtype, namespace, name, await _read_body(request)
+            )
+        elif method == "PATCH" and name:
+            content_type = request.headers.get("content-type", "")
+            if "json-patch" in content_type:
+                return _status(
+                    415, "UnsupportedMediaType", "JSON patch is not supported"
+                )
+            code, result = cluster.patch(
+                rtype,
+                namespace,
+                name,
+                await _read_body(request),
+                apply="apply-patch" in content_type,
+            )
+        elif method == "DELETE" and name:
+            code, result = cluster.delete(rtype, namespace, name)
+        else:
+            return _status(
+                405, "MethodNotAllowed", f"{method} is not supported on {path}"
+            )
+
+        if code >= 400:
+            return _status(code, result["reason"], result["message"])
+        return JSONResponse(result, status_code=code)
+
+    def _discovery(path: str) -> Optional[Response]:
+        parts = [p for p in path.split("/") if p]
+        if parts == ["version"]:
+            return JSONResponse(
+                {
+                    "major": "1",
+                    "minor": "30",
+                    "gitVersion": "v1.30.0-fake",
+                    "gitCommit": "fake",
+                    "gitTreeState": "clean",
+                    "buildDate": "2024-01-01T00:00:00Z",
+                    "goVersion": "go1.22",
+                    "compiler": "gc",
+                    "platform": "linux/amd64",
+                }
+            )
+        if parts == ["api"]:
+            return JSONResponse(
+                {
+                    "kind": "APIVersions",
+                    "versions": ["v1"],
+                    "serverAddressByClientCIDRs": [
+                        {"clientCIDR": "0.0.0.0/0", "serverAddress": "127.0.0.1"}
+                    ],
+                }
+            )
+        if parts == ["api", "v1"]:
+            return JSONResponse(_discovery_resources("", "v1"))
+        if parts == ["apis"]:
+            groups = sorted({t.group for t in RESOURCE_TYPES if t.group})
+            return JSONResponse(
+                {
+                    "kind": "APIGroupList",
+                    "apiVersion": "v1",
+                    "groups": [_discovery_group(g) for g in groups],
+                }
+            )
+        if len(parts) == 2 and parts[0] == "apis":
+            group = _discovery_group(parts[1])
+            return (
+                JSONResponse(group)
+                if group
+                else _status(404, "NotFound", "404 page not found")
+            )
+        if len(parts) == 3 and parts[0] == "apis":
+            resources = _discovery_resources(parts[1], parts[2])
+            if not resources["resources"]:
+                return _status(404, "NotFound", "404 page not found")
+            return JSONResponse(resources)
+        return None
+
+    def _watch(
+        rtype: ResourceType, namespace: Optional[str], params
+    ) -> StreamingResponse:
+        timeout = min(float(params.get("timeoutSeconds") or 30), 300)
+        label_selector = params.get("labelSelector")
+        field_selector = params.get("fieldSelector")
+        since = params.get("resourceVersion")
+
+        def relevant(event_rtype: ResourceType, obj: dict) -> bool:
+            return (
+                (event_rtype.group, event_rtype.plural) == (rtype.group, rtype.plural)
+                and (namespace is None or obj["metadata"].get("namespace") == namespace)
+                and _matches_labels(obj, label_selector)
+                and _matches_fields(obj, field_selector)
+            )
+
+        def line(event_type: str, obj: dict) -> bytes:
+            return (
+                json.dumps(
+                    {"type": event_type, "object": cluster._present(rtype, obj)}
+                ).encode()
+                + b"\n"
+            )
+
+        async def events():
+            if since in (None, "", "0"):
+                # Like the real server: start with the current state
+                for obj in cluster.list(
+                    rtype, namespace, label_selector, field_selector
+                ):
+                    yield line("ADDED", obj)
+                last = cluster.resource_version
+            else:
+                last = int(since)
+            deadline = time.monotonic() + timeout
+            while time.monotonic() < deadline and not server_state["closing"]:
+                for version, event_type, event_rtype, obj in list(cluster.history):
+                    if version > last and relevant(event_rtype, obj):
+                        yield line(event_type, obj)
+                last = max(last, cluster.resource_version)
+                await asyncio.sleep(0.02)
+
+        return StreamingResponse(events(), media_type="application/json")
+
+    server_state = {"closing": False}
+    app = Starlette(
+        routes=[
+            Route("/_fake/stats", stats, methods=["GET"]),
+            Route("/_fake/faults", set_faults, methods=["POST"]),
+            Route("/_fake/reset", reset, methods=["POST"]),
+            Route(
+                "/{path:path}",
+                kubernetes,
+                methods=["GET", "POST", "PUT", "PATCH", "DELETE"],
+            ),
+        ]
+    )
+    app.state.server_state = server_state
+    return app
+
+
+class ThreadedServer:
+    """Serves an ASGI app with uvicorn in a daemon thread. Port 0 picks a free port."""
+
+    def __init__(self, app, host: str = "127.0.0.1", port: int = 0):
+        self.app = app
+        self._socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._socket.bind((host, port))
+        self.host, self.port = self._socket.getsockname()[:2]
+        self._server = uvicorn.Server(
+            uvicorn.Config(
+                app,
+                log_level="warning",
+                lifespan="off",
+                timeout_graceful_shutdown=1,
+                backlog=2048,
+            )
+        )
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    def start(self):
+        self._thread = threading.Thread(
+            target=self._server.run,
+            kwargs={"sockets": [self._socket]},
+            name=f"uvicorn-{self.port}",
+            daemon=True,
+        )
+        self._thread.start()
+        deadline = time.monotonic() + 10
+        while not self._server.started:
+            if time.monotonic() > deadline or not self._thread.is_alive():
+                raise RuntimeError(f"Server on port {self.port} did not start")
+            time.sleep(0.01)
+        return self
+
+    def stop(self) -> None:
+        self._server.should_exit = True
+        if self._thread is not None:
+            self._thread.join(timeout=10)
+        self._socket.close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+
+class FakeApiServer(ThreadedServer):
+    """
+    Runs a FakeCluster behind uvicorn in a background thread.
+
+        with FakeApiServer(faults=FaultConfig(latency=0.01)) as server:
+            K8sClient(url=server.url, token="any").validate_connection()
+            server.cluster.stats()
+
+    Any bearer token is accepted.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        faults: Optional[FaultConfig] = None,
+    ):
+        self.cluster = FakeCluster(faults)
+        super().__init__(build_app(self.cluster), host, port)
+
+    def stop(self) -> None:
+        # Lets open watches finish instead of holding up the shutdown
+        self.app.state.server_state["closing"] = True
+        super().stop()
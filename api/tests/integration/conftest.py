@@ -1,4 +1,6 @@
 """Configuration for integration tests."""
+from contextlib import contextmanager
+
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine, event
@@ -7,6 +9,8 @@ from sqlalchemy.pool import StaticPool
 
 from app.main import app
 from app.shared.database.database import Base, get_db
+from app.shared.database.lookup_cache import clear_lookup_cache
+from app.shared.database.unit_of_work import has_uncommitted_writes
 from app.users.infra.user_model import User, UserRole
 from app.users.infra.user_repository import UserRepository
 from app.auth.core.auth_service import AuthService
@@ -82,6 +86,39 @@ def receive_before_flush(session, flush_context, instances):
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
+@pytest.fixture
+def assert_max_queries(test_db):
+    """
+    Fail when a block runs more SQL statements than its budget.
+
+        with assert_max_queries(6):
+            client.get(f"/instances/{uuid}", headers=headers)
+
+    Budgets include authentication. Lower them when a change removes queries.
+    """
+
+    @contextmanager
+    def max_queries(budget):
+        # Tests share one session across requests; start like a fresh request
+        clear_lookup_cache(test_db)
+        statements = []
+
+        def count(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", count)
+        try:
+            yield statements
+        finally:
+            event.remove(engine, "before_cursor_execute", count)
+        assert len(statements) <= budget, (
+            f"{len(statements)} SQL statements, budget is {budget}:\n"
+            + "\n".join(statements)
+        )
+
+    return max_queries
+
+
 @pytest.fixture(scope="function")
 def test_db():
     """Create a fresh database for each test."""
@@ -98,10 +135,9 @@ def test_db():
 def client(test_db):
     """Create a test client with database override."""
     def override_get_db():
-        try:
-            yield test_db
-        finally:
-            pass
+        yield test_db
+        # The shared session would hide a missing commit from later requests
+        assert not has_uncommitted_writes(test_db), "request left writes uncommitted"
 
     app.dependency_overrides[get_db] = override_get_db
     yield TestClient(app)
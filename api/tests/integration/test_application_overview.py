@@ -0,0 +1,280 @@
+"""GET /applications/{uuid}/overview against fake apiservers."""
+
+import threading
+import time
+from collections import Counter
+from uuid import UUID, uuid4
+
+import pytest
+from kubernetes import client as k8s_api
+
+from app.applications.core import application_overview_service
+from app.clusters.infra.cluster_model import Cluster
+from app.instances.infra.instance_model import Instance
+from app.k8s.client import K8sClient, discovery_cache
+from app.shared.infra.cluster_instance_model import ClusterInstance
+from app.webapps.infra.application_component_model import (
+    ApplicationComponent,
+    WebappType,
+)
+from tests.fake_k8s import FakeApiServer, FaultConfig
+
+NAMESPACE = "tron-ns-overview-app"
+
+
+@pytest.fixture(scope="module")
+def servers():
+    with FakeApiServer() as fast, FakeApiServer() as slow:
+        yield fast, slow
+
+
+@pytest.fixture
+def headers(admin_token):
+    return {"Authorization": f"Bearer {admin_token}"}
+
+
+def deployment(name, replicas):
+    return {
+        "apiVersion": "apps/v1",
+        "kind": "Deployment",
+        "metadata": {"name": name, "namespace": NAMESPACE},
+        "spec": {
+            "replicas": replicas,
+            "selector": {"matchLabels": {"app": name}},
+            "template": {
+                "metadata": {"labels": {"app": name}},
+                "spec": {"containers": [{"name": name, "image": "nginx"}]},
+            },
+        },
+    }
+
+
+def seed(server, documents):
+    k8s = K8sClient(url=server.url, token="overview")
+    k8s.create_namespace(NAMESPACE)
+    k8s.apply_or_delete_yaml_to_k8s(documents, operation="create")
+    # Jobs of a CronJob carry no `app` label, only the CronJob's name prefix
+    k8s_api.BatchV1Api(k8s.api_client).create_namespaced_job(
+        NAMESPACE,
+        {
+            "metadata": {"name": "nightly-29000000"},
+            "spec": {"template": {"spec": {"containers": []}}},
+            "status": {"succeeded": 1},
+        },
+    )
+
+
+@pytest.fixture
+def application(client, headers, test_db, servers):
+    """web, worker and nightly on the fast cluster; web also on the slow one."""
+    fast, slow = servers
+    for server in servers:
+        server.cluster.set_faults(FaultConfig())
+        server.cluster.reset(objects=True)
+    discovery_cache.clear()
+    seed(fast, [deployment("web", 2), deployment("worker", 1), deployment("web-admin", 1)])
+    seed(slow, [deployment("web", 1)])
+
+    application = client.post(
+        "/applications/", headers=headers, json={"name": "overview-app"}
+    ).json()
+    environment = client.post(
+        "/environments/", headers=headers, json={"name": "overview-env"}
+    ).json()
+    instance = client.post(
+        "/instances/",
+        headers=headers,
+        json={
+            "application_uuid": application["uuid"],
+            "environment_uuid": environment["uuid"],
+            "image": "nginx",
+            "version": "1.0.0",
+        },
+    ).json()
+    instance_row = test_db.query(Instance).filter_by(uuid=UUID(instance["uuid"])).one()
+    clusters = [
+        Cluster(
+            uuid=uuid4(),
+            name=name,
+            api_address=server.url,
+            token="overview",
+            environment_id=instance_row.environment_id,
+        )
+        for name, server in [("fast", fast), ("slow", slow)]
+    ]
+    test_db.add_all(clusters)
+    for name, component_type, on in [
+        ("web", WebappType.webapp, clusters),
+        ("worker", WebappType.worker, clusters[:1]),
+        ("nightly", WebappType.cron, clusters[:1]),
+    ]:
+        component = ApplicationComponent(
+            uuid=uuid4(),
+            instance_id=instance_row.id,
+            name=name,
+            type=component_type,
+            settings={"secrets": []},
+            enabled=True,
+        )
+        test_db.add(component)
+        test_db.flush()
+        test_db.add_all(
+            ClusterInstance(
+                uuid=uuid4(), cluster_id=cluster.id, application_component_id=component.id
+            )
+            for cluster in on
+        )
+    test_db.commit()
+    for server in servers:
+        server.cluster.reset()
+    return application
+
+
+def components_of(overview):
+    [instance] = overview["instances"]
+    return {
+        component["name"]: {cluster["name"]: cluster for cluster in component["clusters"]}
+        for component in instance["components"]
+    }
+
+
+def test_overview_composes_every_section(client, headers, application, servers):
+    response = client.get(f"/applications/{application['uuid']}/overview", headers=headers)
+
+    assert response.status_code == 200
+    overview = response.json()
+    assert overview["application"]["name"] == "overview-app"
+    assert overview["namespace"] == NAMESPACE
+    assert overview["instances"][0]["environment"]["name"] == "overview-env"
+    components = components_of(overview)
+    assert [pod["name"] for pod in components["web"]["fast"]["pods"]] == [
+        "web-fake-0",
+        "web-fake-1",
+    ]
+    assert [pod["name"] for pod in components["web"]["slow"]["pods"]] == ["web-fake-0"]
+    assert [pod["name"] for pod in components["worker"]["fast"]["pods"]] == [
+        "worker-fake-0"
+    ]
+    assert components["nightly"]["fast"]["status"] == "ok"
+    assert [job["name"] for job in components["nightly"]["fast"]["jobs"]] == [
+        "nightly-29000000"
+    ]
+    assert components["nightly"]["fast"]["pods"] is None
+    assert "labels" not in components["web"]["fast"]["pods"][0]
+
+    # One list per kind and cluster, not one per component
+    fast, slow = servers
+    assert fast.cluster.stats()["calls"] == {"list jobs": 1, "list pods": 1}
+    assert slow.cluster.stats()["calls"] == {"list pods": 1}
+
+
+def test_slow_cluster_times_out_without_failing_the_overview(
+    client, headers, application, servers, monkeypatch
+):
+    monkeypatch.setenv("OVERVIEW_CLUSTER_TIMEOUT_SECONDS", "0.2")
+    servers[1].cluster.set_faults(FaultConfig(latency=1.0))
+
+    started = time.perf_counter()
+    response = client.get(f"/applications/{application['uuid']}/overview", headers=headers)
+    elapsed = time.perf_counter() - started
+
+    assert response.status_code == 200
+    assert elapsed < 1.0
+    components = components_of(response.json())
+    assert components["web"]["slow"] == {
+        "uuid": components["web"]["slow"]["uuid"],
+        "name": "slow",
+        "status": "timeout",
+        "error": None,
+        "pods": None,
+        "jobs": None,
+    }
+    assert components["web"]["fast"]["status"] == "ok"
+    assert len(components["web"]["fast"]["pods"]) == 2
+
+
+def test_hanging_cluster_does_not_starve_healthy_ones(
+    client, headers, application, servers, monkeypatch
+):
+    """More overview loads than shared threads, while one cluster hangs."""
+    monkeypatch.setenv("OVERVIEW_CLUSTER_TIMEOUT_SECONDS", "0.1")
+    servers[1].cluster.set_faults(FaultConfig(latency=5.0))
+    url = f"/applications/{application['uuid']}/overview"
+
+    for _ in range(20):
+        client.get(url, headers=headers)
+    components = components_of(client.get(url, headers=headers).json())
+
+    assert components["web"]["slow"]["status"] in ("timeout", "error")
+    assert components["web"]["fast"]["status"] == "ok"
+    assert components["worker"]["fast"]["status"] == "ok"
+    assert components["nightly"]["fast"]["status"] == "ok"
+
+
+def test_requests_join_running_cluster_calls(
+    client, headers, application, monkeypatch
+):
+    calls = Counter()
+    release = threading.Event()
+
+    def hanging_list_workloads(api_address, token, namespace, kind, timeout_seconds):
+        calls[(api_address, kind)] += 1
+        release.wait(5)
+        return []
+
+    monkeypatch.setenv("OVERVIEW_CLUSTER_TIMEOUT_SECONDS", "0.1")
+    monkeypatch.setattr(
+        application_overview_service, "list_workloads", hanging_list_workloads
+    )
+    # Calls left running by earlier tests would be joined too
+    monkeypatch.setattr(application_overview_service, "_in_flight", {})
+    try:
+        for _ in range(3):
+            response = client.get(
+                f"/applications/{application['uuid']}/overview", headers=headers
+            )
+            assert components_of(response.json())["web"]["fast"]["status"] == "timeout"
+    finally:
+        release.set()
+
+    # fast: pods and jobs, slow: pods; one call each for all three requests
+    assert sorted(calls.values()) == [1, 1, 1]
+
+
+def test_unreachable_cluster_is_reported_as_an_error(
+    client, headers, application, test_db
+):
+    test_db.query(Cluster).filter_by(name="slow").update(
+        {"api_address": "http://127.0.0.1:9"}
+    )
+    test_db.commit()
+
+    response = client.get(f"/applications/{application['uuid']}/overview", headers=headers)
+
+    assert response.status_code == 200
+    components = components_of(response.json())
+    assert components["web"]["slow"]["status"] == "error"
+    assert components["web"]["slow"]["error"] == "MaxRetryError"
+    assert components["web"]["fast"]["status"] == "ok"
+
+
+@pytest.mark.parametrize("error_status", [403, 500])
+def test_cluster_api_errors_are_reported_as_errors(
+    client, headers, application, servers, error_status
+):
+    servers[1].cluster.set_faults(FaultConfig(error_rate=1.0, error_status=error_status))
+
+    response = client.get(f"/applications/{application['uuid']}/overview", headers=headers)
+
+    assert response.status_code == 200
+    components = components_of(response.json())
+    assert components["web"]["slow"]["status"] == "error"
+    assert components["web"]["slow"]["error"] == "ApiException"
+    assert components["web"]["slow"]["pods"] is None
+    assert components["web"]["fast"]["status"] == "ok"
+
+
+def test_overview_of_unknown_application_is_404(client, headers):
+    response = client.get(f"/applications/{uuid4()}/overview", headers=headers)
+
+    assert response.status_code == 404
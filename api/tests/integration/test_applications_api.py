@@ -3,6 +3,8 @@ import pytest
 from fastapi import status
 from uuid import uuid4
 
+from app.shared.utils.pagination import encode_cursor
+
 
 def test_create_application_success(client, admin_token):
     """Test successful application creation."""
@@ -245,3 +247,80 @@ def test_delete_application_requires_admin_role(client, admin_token, user_token)
     )
 
     assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+def test_list_applications_cursor_pagination(client, test_db, admin_token):
+    """Test walking all applications with the X-Next-Cursor header."""
+    from datetime import datetime
+    from app.applications.infra.application_model import Application
+
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    # Same timestamp for every row, so ordering relies on the id tie-breaker
+    created_at = datetime(2024, 1, 1, 12, 0, 0)
+    for i in range(5):
+        test_db.add(
+            Application(
+                uuid=uuid4(),
+                name=f"paged-app-{i}",
+                repository=f"https://github.com/example/{i}",
+                created_at=created_at,
+            )
+        )
+    test_db.commit()
+
+    names = []
+    cursor = None
+    pages = 0
+    while True:
+        params = {"limit": 2}
+        if cursor:
+            params["cursor"] = cursor
+        response = client.get("/applications/", headers=headers, params=params)
+        assert response.status_code == status.HTTP_200_OK
+        names.extend(app["name"] for app in response.json())
+        pages += 1
+        cursor = response.headers.get("X-Next-Cursor")
+        if not cursor:
+            break
+
+    assert pages == 3
+    assert names == [f"paged-app-{i}" for i in range(5)]
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    ["not-a-cursor", encode_cursor(["2024-01-01T00:00:00", "abc"])],
+)
+def test_list_applications_invalid_cursor(client, admin_token, cursor):
+    """Test that a malformed or tampered cursor is rejected."""
+    response = client.get(
+        "/applications/",
+        headers={"Authorization": f"Bearer {admin_token}"},
+        params={"cursor": cursor},
+    )
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_list_applications_sparse_fieldset(client, admin_token):
+    """Test that ?fields= returns only the requested fields."""
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    client.post("/applications/", headers=headers, json={"name": "sparse-app"})
+
+    response = client.get("/applications/", headers=headers, params={"fields": "uuid,name"})
+
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert data
+    assert all(set(app) == {"uuid", "name"} for app in data)
+
+
+def test_list_applications_unknown_field(client, admin_token):
+    """Test that unknown fields are rejected."""
+    response = client.get(
+        "/applications/",
+        headers={"Authorization": f"Bearer {admin_token}"},
+        params={"fields": "name,password"},
+    )
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
@@ -21,7 +21,7 @@ def test_environment(test_db, admin_user):
     return environment
 
 
-@patch('app.clusters.core.cluster_service.K8sClient')
+@patch('app.k8s.client.K8sClient')
 def test_create_cluster_success(mock_k8s_client, client, admin_token, test_environment):
     """Test successful cluster creation."""
     # Mock Kubernetes connection validation
@@ -111,7 +111,7 @@ def test_create_cluster_missing_fields(client, admin_token, test_environment):
 
 
 @patch('app.clusters.core.cluster_service.get_gateway_reference_from_cluster')
-@patch('app.clusters.core.cluster_service.K8sClient')
+@patch('app.k8s.client.K8sClient')
 def test_list_clusters_success(mock_k8s_client, mock_gateway_ref, client, admin_token, test_environment):
     """Test successful cluster listing."""
     # Mock Kubernetes connection validation
@@ -154,7 +154,7 @@ def test_list_clusters_requires_authentication(client):
 
 
 @patch('app.clusters.core.cluster_service.get_gateway_reference_from_cluster')
-@patch('app.clusters.core.cluster_service.K8sClient')
+@patch('app.k8s.client.K8sClient')
 def test_get_cluster_success(mock_k8s_client, mock_gateway_ref, client, admin_token, test_environment):
     """Test successful cluster retrieval."""
     # Mock Kubernetes connection validation and gateway methods
@@ -205,7 +205,7 @@ def test_get_cluster_not_found(client, admin_token):
     assert response.status_code == status.HTTP_404_NOT_FOUND
 
 
-@patch('app.clusters.core.cluster_service.K8sClient')
+@patch('app.k8s.client.K8sClient')
 def test_update_cluster_success(mock_k8s_client, client, admin_token, test_environment):
     """Test successful cluster update."""
     # Mock Kubernetes connection validation
@@ -261,7 +261,7 @@ def test_update_cluster_not_found(client, admin_token, test_environment):
     assert response.status_code == status.HTTP_404_NOT_FOUND
 
 
-@patch('app.clusters.core.cluster_service.K8sClient')
+@patch('app.k8s.client.K8sClient')
 def test_delete_cluster_success(mock_k8s_client, client, admin_token, test_environment):
     """Test successful cluster deletion."""
     # Mock Kubernetes connection validation
@@ -308,7 +308,7 @@ def test_delete_cluster_not_found(client, admin_token):
     assert response.status_code == status.HTTP_404_NOT_FOUND
 
 
-@patch('app.clusters.core.cluster_service.K8sClient')
+@patch('app.k8s.client.K8sClient')
 def test_delete_cluster_requires_admin_role(mock_k8s_client, client, admin_token, user_token, test_environment):
     """Test that cluster deletion requires admin role."""
     # Mock Kubernetes connection validation
@@ -32,7 +32,7 @@ def test_instance(client, admin_token):
     env_uuid = env_response.json()["uuid"]
 
     # Create cluster (required for components)
-    with patch('app.clusters.core.cluster_service.K8sClient') as mock_k8s_client:
+    with patch('app.k8s.client.K8sClient') as mock_k8s_client:
         mock_client_instance = MagicMock()
         mock_client_instance.validate_connection.return_value = (True, {"message": "Connection successful"})
         mock_k8s_client.return_value = mock_client_instance
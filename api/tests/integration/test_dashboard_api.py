@@ -0,0 +1,119 @@
+"""Integration tests for dashboard endpoints."""
+import pytest
+from fastapi import status
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+from app.dashboard.core.dashboard_cache import dashboard_cache
+from app.applications.infra.application_model import Application
+from app.environments.infra.environment_model import Environment
+from app.instances.infra.instance_model import Instance
+from app.webapps.infra.application_component_model import (
+    ApplicationComponent,
+    WebappType,
+)
+from benchmarks.fixtures import session_factory
+
+
+@pytest.fixture(autouse=True)
+def empty_dashboard_cache():
+    """The cache is process wide; don't leak snapshots between tests."""
+    dashboard_cache.invalidate()
+    yield
+    dashboard_cache.invalidate()
+
+
+def seed_components(test_db):
+    application = Application(uuid=uuid4(), name="dashboard-app")
+    environment = Environment(uuid=uuid4(), name="production")
+    test_db.add_all([application, environment])
+    test_db.flush()
+    instance = Instance(
+        uuid=uuid4(),
+        application_id=application.id,
+        environment_id=environment.id,
+        image="nginx",
+        version="latest",
+    )
+    test_db.add(instance)
+    test_db.flush()
+    for name, component_type, enabled in [
+        ("web", WebappType.webapp, True),
+        ("worker", WebappType.worker, True),
+        ("cron", WebappType.cron, False),
+    ]:
+        test_db.add(
+            ApplicationComponent(
+                uuid=uuid4(),
+                instance_id=instance.id,
+                name=name,
+                type=component_type,
+                enabled=enabled,
+                settings={},
+            )
+        )
+    test_db.commit()
+
+
+def test_dashboard_overview(client, test_db, admin_token):
+    """Test counts are aggregated in a single pass."""
+    seed_components(test_db)
+
+    response = client.get(
+        "/dashboard/", headers={"Authorization": f"Bearer {admin_token}"}
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert data["applications"] == 1
+    assert data["instances"] == 1
+    assert data["environments"] == 1
+    assert data["components"] == {
+        "total": 3,
+        "webapp": 1,
+        "worker": 1,
+        "cron": 1,
+        "enabled": 2,
+        "disabled": 1,
+    }
+    assert data["components_by_environment"] == {"production": 3}
+    assert data["components_by_cluster"] == {}
+
+
+def test_dashboard_overview_not_modified(client, test_db, admin_token):
+    """Test polling with the ETag gets a 304 until a tracked model changes."""
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    response = client.get("/dashboard/", headers=headers)
+    etag = response.headers["ETag"]
+
+    response = client.get("/dashboard/", headers={**headers, "If-None-Match": etag})
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response.content == b""
+
+    seed_components(test_db)
+
+    response = client.get("/dashboard/", headers={**headers, "If-None-Match": etag})
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["ETag"] != etag
+    assert response.json()["components"]["total"] == 3
+
+
+def test_dashboard_snapshot_ignores_lagging_replica(client, test_db, admin_token):
+    """Test a replica that hasn't replayed a write can't fill the shared cache."""
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    # The replica still has the empty, pre-write database
+    replica_sessions = session_factory()
+    router = MagicMock()
+    router.choose_engine.return_value = replica_sessions.kw["bind"]
+    router.session_for.side_effect = lambda engine: replica_sessions()
+
+    with patch(
+        "app.shared.database.replica.get_replica_router", return_value=router
+    ):
+        assert client.get("/dashboard/", headers=headers).json()["applications"] == 0
+        seed_components(test_db)
+
+        for _ in range(2):
+            data = client.get("/dashboard/", headers=headers).json()
+            assert data["applications"] == 1
+            assert data["components"]["total"] == 3
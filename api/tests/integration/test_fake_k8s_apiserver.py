@@ -0,0 +1,187 @@
+"""The real K8sClient against the in-memory fake apiserver in tests/fake_k8s."""
+
+import pytest
+from kubernetes import client, watch
+
+from app.k8s.client import K8S_API_MAPPING, K8sClient, discovery_cache
+from tests.fake_k8s import FakeApiServer, FaultConfig
+
+NAMESPACE = "tron-ns-shop"
+
+
+def documents(image="nginx:1.0", replicas=None):
+    deployment_spec = {
+        "selector": {"matchLabels": {"app": "web"}},
+        "template": {
+            "metadata": {"labels": {"app": "web"}},
+            "spec": {
+                "containers": [
+                    {
+                        "name": "web",
+                        "image": image,
+                        "resources": {
+                            "requests": {"cpu": "250m", "memory": "256Mi"},
+                            "limits": {"cpu": "500m", "memory": "512Mi"},
+                        },
+                    }
+                ]
+            },
+        },
+    }
+    if replicas is not None:
+        deployment_spec["replicas"] = replicas
+    return [
+        {
+            "apiVersion": "apps/v1",
+            "kind": "Deployment",
+            "metadata": {"name": "web", "namespace": NAMESPACE},
+            "spec": deployment_spec,
+        },
+        {
+            "apiVersion": "v1",
+            "kind": "Service",
+            "metadata": {"name": "web", "namespace": NAMESPACE},
+            "spec": {"selector": {"app": "web"}, "ports": [{"port": 80}]},
+        },
+        {
+            "apiVersion": "gateway.networking.k8s.io/v1",
+            "kind": "HTTPRoute",
+            "metadata": {"name": "web", "namespace": NAMESPACE},
+            "spec": {
+                "parentRefs": [
+                    {"name": "public-gateway", "namespace": "gateway-system"}
+                ]
+            },
+        },
+    ]
+
+
+@pytest.fixture(scope="module")
+def server():
+    with FakeApiServer() as server:
+        yield server
+
+
+@pytest.fixture
+def k8s(server):
+    server.cluster.set_faults(FaultConfig())
+    server.cluster.reset(objects=True)
+    discovery_cache.clear()
+    return K8sClient(url=server.url, token="any")
+
+
+def test_connection_discovery_and_gateway(k8s):
+    assert k8s.validate_connection()[0] is True
+    assert k8s.check_api_available("gateway.networking.k8s.io") is True
+    assert k8s.check_api_available("example.com") is False
+    assert {"HTTPRoute", "TCPRoute", "UDPRoute"} <= set(k8s.get_gateway_api_resources())
+    assert k8s.get_gateway_reference() == {
+        "namespace": "gateway-system",
+        "name": "public-gateway",
+    }
+    assert k8s.get_available_cpu() == 12
+
+
+def test_upsert_creates_then_replaces_and_spawns_pods(k8s, server):
+    k8s.apply_or_delete_yaml_to_k8s(documents(replicas=2), operation="upsert")
+
+    pods = k8s.list_pods(NAMESPACE, label_selector="app=web")
+    assert [pod["status"] for pod in pods] == ["Running", "Running"]
+    assert pods[0]["memory_limits"] == 512
+    events = k8s.list_events(NAMESPACE, field_selector="involvedObject.name=web")
+    assert events[0]["reason"] == "ScalingReplicaSet"
+
+    # Without replicas in the document the current count is kept
+    k8s.apply_or_delete_yaml_to_k8s(documents(image="nginx:2.0"), operation="upsert")
+    deployment = client.AppsV1Api(k8s.api_client).read_namespaced_deployment(
+        "web", NAMESPACE
+    )
+    assert deployment.spec.replicas == 2
+    assert deployment.spec.template.spec.containers[0].image == "nginx:2.0"
+    assert deployment.metadata.generation == 2
+
+    calls = server.cluster.stats()["calls"]
+    assert calls["create namespaces"] == 1
+    assert calls["replace httproutes"] == 1
+    assert calls["create deployments"] == 1
+
+
+def test_raw_path_upsert_retries_conflicts(k8s, server):
+    k8s.apply_or_delete_yaml_to_k8s(documents(), operation="upsert")
+    server.cluster.set_faults(FaultConfig(conflict_rate=0.5, seed=3))
+
+    k8s.apply_or_delete_yaml_to_k8s(documents()[2:], operation="upsert")
+
+    # The first replace conflicts, the retry succeeds
+    assert server.cluster.injected_errors == 1
+    assert server.cluster.stats()["calls"]["replace httproutes"] == 2
+
+
+def test_injected_errors_surface_as_api_errors(k8s, server):
+    server.cluster.set_faults(FaultConfig(error_rate=1.0, error_status=503))
+
+    assert k8s.validate_connection() == (
+        False,
+        {"status": "error", "message": {"code": "503", "message": "injected 503"}},
+    )
+    # Discovery never fails
+    assert k8s.check_api_available("gateway.networking.k8s.io") is True
+
+
+def test_delete_removes_resources_and_pods(k8s):
+    k8s.apply_or_delete_yaml_to_k8s(documents(), operation="upsert")
+    k8s.apply_or_delete_yaml_to_k8s(documents(), operation="delete")
+
+    assert k8s.list_pods(NAMESPACE) == []
+    k8s.delete_namespace(NAMESPACE)
+    assert NAMESPACE not in [ns.metadata.name for ns in k8s.get_namespaces()]
+
+
+def test_every_mapped_kind_round_trips(k8s):
+    specs = {
+        "Deployment": documents()[0]["spec"],
+        "HorizontalPodAutoscaler": {
+            "scaleTargetRef": {
+                "apiVersion": "apps/v1",
+                "kind": "Deployment",
+                "name": "web",
+            },
+            "maxReplicas": 3,
+        },
+        "CronJob": {
+            "schedule": "* * * * *",
+            "jobTemplate": {"spec": {"template": documents()[0]["spec"]["template"]}},
+        },
+    }
+    k8s.ensure_namespace_exists(NAMESPACE)
+    for kind, (api_class, create, delete, replace) in K8S_API_MAPPING.items():
+        api = api_class(k8s.api_client)
+        body = {"metadata": {"name": "thing"}, "spec": specs.get(kind, {})}
+        getattr(api, create)(namespace=NAMESPACE, body=body)
+        replaced = getattr(api, replace)(name="thing", namespace=NAMESPACE, body=body)
+        assert replaced.kind == kind
+        getattr(api, delete)(name="thing", namespace=NAMESPACE)
+
+
+def test_server_side_apply_and_watch(k8s):
+    core = client.CoreV1Api(k8s.api_client)
+    k8s.ensure_namespace_exists(NAMESPACE)
+    # Server-side apply creates the object when it doesn't exist yet
+    k8s.api_client.call_api(
+        f"/api/v1/namespaces/{NAMESPACE}/configmaps/settings",
+        "PATCH",
+        query_params=[("fieldManager", "tron")],
+        header_params={"Content-Type": "application/apply-patch+yaml"},
+        body={"apiVersion": "v1", "kind": "ConfigMap", "data": {"a": "1"}},
+        auth_settings=["BearerToken"],
+        response_type="object",
+    )
+    core.patch_namespaced_config_map("settings", NAMESPACE, {"data": {"b": "2"}})
+
+    seen = [
+        (event["type"], event["object"].data)
+        for event in watch.Watch().stream(
+            core.list_namespaced_config_map, NAMESPACE, timeout_seconds=1
+        )
+    ]
+    assert seen == [("ADDED", {"a": "1", "b": "2"})]
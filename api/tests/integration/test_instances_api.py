@@ -1,7 +1,7 @@
 """Integration tests for instances endpoints."""
 import pytest
 from fastapi import status
-from uuid import uuid4
+from uuid import UUID, uuid4
 
 
 @pytest.fixture
@@ -183,6 +183,51 @@ def test_get_instance_success(client, admin_token, test_application, test_enviro
     assert data["version"] == "1.0.0"
 
 
+def test_get_instance_masks_secrets_without_changing_stored_values(
+    client, admin_token, test_db, test_application, test_environment
+):
+    """Secrets are masked in the response; the loaded rows are left untouched."""
+    from app.instances.infra.instance_model import Instance
+    from app.webapps.infra.application_component_model import (
+        ApplicationComponent,
+        WebappType,
+    )
+
+    create_response = client.post(
+        "/instances/",
+        headers={"Authorization": f"Bearer {admin_token}"},
+        json={
+            "application_uuid": test_application["uuid"],
+            "environment_uuid": test_environment["uuid"],
+            "image": "nginx:latest",
+            "version": "1.0.0"
+        }
+    )
+    instance_uuid = create_response.json()["uuid"]
+    instance = test_db.query(Instance).filter_by(uuid=UUID(instance_uuid)).one()
+    component = ApplicationComponent(
+        uuid=uuid4(),
+        instance_id=instance.id,
+        name="api",
+        type=WebappType.webapp,
+        settings={"envs": [], "secrets": [{"key": "TOKEN", "value": "v2:stored"}]},
+        enabled=True,
+    )
+    test_db.add(component)
+    test_db.commit()
+
+    response = client.get(
+        f"/instances/{instance_uuid}",
+        headers={"Authorization": f"Bearer {admin_token}"}
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    secrets = response.json()["components"][0]["settings"]["secrets"]
+    assert secrets == [{"key": "TOKEN", "value": "********"}]
+    assert not test_db.dirty
+    assert component.settings["secrets"][0]["value"] == "v2:stored"
+
+
 def test_get_instance_not_found(client, admin_token):
     """Test that getting non-existent instance returns 404."""
     fake_uuid = uuid4()
@@ -0,0 +1,97 @@
+"""Integration tests for per-request profiling."""
+import pytest
+from fastapi import status
+
+from app.main import app
+from app.profiling.core.profiling_service import reset_profiling_service
+from app.shared.database.database import get_db
+
+
+@pytest.fixture(autouse=True)
+def profiles_dir(monkeypatch, tmp_path):
+    monkeypatch.setenv("PROFILER_DIR", str(tmp_path))
+    monkeypatch.setenv("PROFILER_INTERVAL_MS", "1")
+    monkeypatch.setenv("PROFILER_MAX_PER_MINUTE", "2")
+    reset_profiling_service()
+    yield tmp_path
+    reset_profiling_service()
+
+
+def test_admin_can_profile_a_request_and_download_it(client, admin_token):
+    headers = {"Authorization": f"Bearer {admin_token}"}
+
+    response = client.get("/users", headers={**headers, "X-Tron-Profile": "1"})
+
+    assert response.status_code == status.HTTP_200_OK
+    profile_id = response.headers["X-Tron-Profile-Id"]
+    listed = client.get("/profiles/", headers=headers).json()
+    assert [(p["id"], p["name"]) for p in listed] == [(profile_id, "GET /users")]
+
+    profile = client.get(f"/profiles/{profile_id}", headers=headers)
+    assert profile.status_code == status.HTTP_200_OK
+    document = profile.json()
+    assert document["$schema"].startswith("https://www.speedscope.app")
+    assert document["name"] == "GET /users"
+
+
+def test_profile_id_is_returned_by_handlers_building_their_own_response(
+    client, admin_token
+):
+    """List endpoints return a Response themselves instead of a model."""
+    headers = {"Authorization": f"Bearer {admin_token}"}
+
+    response = client.get("/applications/", headers={**headers, "X-Tron-Profile": "1"})
+
+    assert response.status_code == status.HTTP_200_OK
+    profile_id = response.headers["X-Tron-Profile-Id"]
+    listed = client.get("/profiles/", headers=headers).json()
+    assert [p["id"] for p in listed] == [profile_id]
+
+
+def test_requests_without_the_header_are_not_profiled(client, admin_token, profiles_dir):
+    response = client.get("/users", headers={"Authorization": f"Bearer {admin_token}"})
+
+    assert "X-Tron-Profile-Id" not in response.headers
+    assert list(profiles_dir.iterdir()) == []
+
+
+def test_requests_without_the_header_open_no_session(client):
+    override = app.dependency_overrides[get_db]
+    opened = []
+
+    def counting_get_db():
+        opened.append(True)
+        yield from override()
+
+    app.dependency_overrides[get_db] = counting_get_db
+
+    assert client.get("/health").status_code == status.HTTP_200_OK
+    assert opened == []
+
+
+def test_non_admins_cannot_profile(client, user_token):
+    headers = {"Authorization": f"Bearer {user_token}"}
+
+    response = client.get("/health", headers={**headers, "X-Tron-Profile": "1"})
+
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+    assert client.get("/profiles/", headers=headers).status_code == status.HTTP_403_FORBIDDEN
+
+
+def test_profiling_is_rate_limited(client, admin_token):
+    headers = {"Authorization": f"Bearer {admin_token}", "X-Tron-Profile": "1"}
+
+    assert client.get("/health", headers=headers).status_code == status.HTTP_200_OK
+    assert client.get("/health", headers=headers).status_code == status.HTTP_200_OK
+    response = client.get("/health", headers=headers)
+
+    assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+    assert int(response.headers["Retry-After"]) > 0
+
+
+def test_unknown_profile_is_not_found(client, admin_token):
+    response = client.get(
+        "/profiles/../../etc/passwd", headers={"Authorization": f"Bearer {admin_token}"}
+    )
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
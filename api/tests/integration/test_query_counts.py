@@ -0,0 +1,233 @@
+"""SQL statement budgets for endpoints that look entities up by UUID or write rows."""
+import pytest
+from unittest.mock import patch
+from uuid import UUID, uuid4
+
+from app.clusters.infra.cluster_model import Cluster
+from app.instances.infra.instance_model import Instance
+from app.settings.infra.settings_model import Settings
+from app.shared.infra.cluster_instance_model import ClusterInstance
+from app.shared.serializers.serializers import serialize_application_component
+from app.webapps.infra.application_component_model import (
+    ApplicationComponent,
+    WebappType,
+)
+
+
+@pytest.fixture
+def headers(admin_token):
+    return {"Authorization": f"Bearer {admin_token}"}
+
+
+@pytest.fixture
+def application(client, headers):
+    return client.post("/applications/", headers=headers, json={"name": "budget-app"}).json()
+
+
+@pytest.fixture
+def environment(client, headers):
+    return client.post("/environments/", headers=headers, json={"name": "budget-env"}).json()
+
+
+@pytest.fixture
+def instance(client, headers, application, environment):
+    return client.post(
+        "/instances/",
+        headers=headers,
+        json={
+            "application_uuid": application["uuid"],
+            "environment_uuid": environment["uuid"],
+            "image": "nginx",
+            "version": "1.0.0",
+        },
+    ).json()
+
+
+@pytest.fixture
+def webapp(test_db, instance):
+    component = ApplicationComponent(
+        uuid=uuid4(),
+        instance_id=test_db.query(Instance)
+        .filter_by(uuid=UUID(instance["uuid"]))
+        .one()
+        .id,
+        name="budget-webapp",
+        type=WebappType.webapp,
+        settings={"cpu": 0.5, "memory": 512, "secrets": []},
+        enabled=True,
+    )
+    test_db.add(component)
+    test_db.commit()
+    return str(component.uuid)
+
+
+@pytest.fixture
+def deployed_webapp(test_db, webapp):
+    """The webapp running on a cluster, in an environment with settings."""
+    component = test_db.query(ApplicationComponent).filter_by(uuid=UUID(webapp)).one()
+    environment_id = component.instance.environment_id
+    cluster = Cluster(
+        uuid=uuid4(),
+        name="budget-cluster",
+        api_address="https://budget.example.com",
+        token="token",
+        environment_id=environment_id,
+    )
+    test_db.add(cluster)
+    test_db.flush()
+    test_db.add_all(
+        [
+            ClusterInstance(
+                uuid=uuid4(), cluster_id=cluster.id, application_component_id=component.id
+            ),
+            Settings(uuid=uuid4(), key="domain", value="example.com", environment_id=environment_id),
+            Settings(uuid=uuid4(), key="region", value="eu", environment_id=environment_id),
+        ]
+    )
+    test_db.commit()
+    # Start from an empty identity map, as a new request does
+    test_db.expunge_all()
+    return webapp
+
+
+@pytest.fixture
+def rendered():
+    """Stand-in for the Kubernetes apply that reads what the real one reads."""
+    calls = []
+
+    def render(cluster, component, settings, database_session):
+        calls.append(
+            (cluster.name, serialize_application_component(component), settings)
+        )
+
+    with patch("app.webapps.core.webapp_service.upsert_to_kubernetes", render), patch(
+        "app.webapps.core.webapp_service.delete_from_kubernetes", render
+    ):
+        yield calls
+
+
+def test_create_instance_query_budget(client, headers, application, environment, assert_max_queries):
+    """Each lookup runs once and nothing is re-read after the commit."""
+    with assert_max_queries(8):
+        response = client.post(
+            "/instances/",
+            headers=headers,
+            json={
+                "application_uuid": application["uuid"],
+                "environment_uuid": environment["uuid"],
+                "image": "nginx",
+                "version": "1.0.0",
+            },
+        )
+    assert response.status_code == 200
+
+
+def test_get_instance_query_budget(client, headers, instance, assert_max_queries):
+    with assert_max_queries(2):
+        response = client.get(f"/instances/{instance['uuid']}", headers=headers)
+    assert response.status_code == 200
+
+
+def test_update_instance_query_budget(client, headers, instance, assert_max_queries):
+    """One flush and one commit; the updated row is not refreshed."""
+    with assert_max_queries(4):
+        response = client.put(
+            f"/instances/{instance['uuid']}", headers=headers, json={"image": "httpd"}
+        )
+    assert response.status_code == 200
+
+
+def test_delete_instance_query_budget(client, headers, instance, assert_max_queries):
+    """The instance is loaded once, with what deleting its components reads."""
+    with assert_max_queries(4):
+        response = client.delete(f"/instances/{instance['uuid']}", headers=headers)
+    assert response.status_code == 200
+
+
+def test_update_application_query_budget(client, headers, application, assert_max_queries):
+    with assert_max_queries(6):
+        response = client.put(
+            f"/applications/{application['uuid']}", headers=headers, json={"name": "renamed"}
+        )
+    assert response.status_code == 200
+
+
+def test_update_environment_query_budget(client, headers, environment, assert_max_queries):
+    with assert_max_queries(4):
+        response = client.put(
+            f"/environments/{environment['uuid']}", headers=headers, json={"name": "renamed"}
+        )
+    assert response.status_code == 200
+
+
+def test_get_webapp_query_budget(client, headers, webapp, assert_max_queries):
+    """The webapp is fetched once for the existence check and the response."""
+    with assert_max_queries(2):
+        response = client.get(
+            f"/application_components/webapp/{webapp}", headers=headers
+        )
+    assert response.status_code == 200
+
+
+def test_redeploy_webapp_query_budget(
+    client, headers, deployed_webapp, rendered, assert_max_queries
+):
+    """Component, instance, application, environment, settings and cluster in three."""
+    with assert_max_queries(5):
+        response = client.put(
+            f"/application_components/webapp/{deployed_webapp}",
+            headers=headers,
+            json={"enabled": True},
+        )
+    assert response.status_code == 200
+    [(cluster_name, component, settings)] = rendered
+    assert cluster_name == "budget-cluster"
+    assert component["application_name"] == "tron-ns-budget-app"
+    assert component["environment"] == "budget-env"
+    assert settings == {"domain": "example.com", "region": "eu"}
+
+
+def test_delete_webapp_query_budget(
+    client, headers, deployed_webapp, rendered, assert_max_queries
+):
+    """Three queries load the deploy context, two statements delete the rows."""
+    with assert_max_queries(6):
+        response = client.delete(
+            f"/application_components/webapp/{deployed_webapp}", headers=headers
+        )
+    assert response.status_code == 200
+    assert [cluster_name for cluster_name, _, _ in rendered] == ["budget-cluster"]
+
+
+def test_sync_instance_query_budget(
+    client, headers, instance, deployed_webapp, rendered, assert_max_queries
+):
+    """The instance and everything its components deploy with load in three."""
+    with patch("app.instances.core.instance_service.upsert_webapp_to_k8s") as upsert:
+        upsert.side_effect = lambda cluster, component, settings, db: rendered.append(
+            (cluster.name, serialize_application_component(component), settings)
+        )
+        with assert_max_queries(4):
+            response = client.post(
+                f"/instances/{instance['uuid']}/sync", headers=headers
+            )
+    assert response.status_code == 200
+    assert response.json()["synced_components"] == 1
+    assert rendered[0][2] == {"domain": "example.com", "region": "eu"}
+
+
+def test_application_overview_query_budget(
+    client, headers, application, deployed_webapp, assert_max_queries
+):
+    """One query per level however many components and clusters there are."""
+    with patch(
+        "app.applications.core.application_overview_service.list_workloads",
+        return_value=[],
+    ), assert_max_queries(5):
+        response = client.get(
+            f"/applications/{application['uuid']}/overview", headers=headers
+        )
+    assert response.status_code == 200
+    [instance] = response.json()["instances"]
+    [component] = instance["components"]
+    assert [cluster["name"] for cluster in component["clusters"]] == ["budget-cluster"]
@@ -287,3 +287,48 @@ def test_delete_template_requires_admin_role(client, user_token):
     )
 
     assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+def test_list_templates_conditional_get(client, admin_token):
+    """Test list ETags answer 304 until a template changes."""
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    created = client.post(
+        "/templates/",
+        headers=headers,
+        json={"name": "etag-template", "category": "webapp", "content": "v1"},
+    ).json()
+
+    response = client.get("/templates/", headers=headers)
+    etag = response.headers["ETag"]
+    assert etag.startswith('W/"')
+    assert response.headers["Cache-Control"] == "private, no-cache"
+
+    response = client.get("/templates/", headers={**headers, "If-None-Match": etag})
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response.content == b""
+
+    client.put(
+        f"/templates/{created['uuid']}",
+        headers=headers,
+        json={"content": "v2"},
+    )
+
+    response = client.get("/templates/", headers={**headers, "If-None-Match": etag})
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["ETag"] != etag
+    assert response.json()[0]["content"] == "v2"
+
+
+def test_get_template_conditional_get_requires_authentication(client, admin_token):
+    """Test a matching ETag never bypasses authentication."""
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    created = client.post(
+        "/templates/",
+        headers=headers,
+        json={"name": "etag-template", "category": "webapp", "content": "v1"},
+    ).json()
+    etag = client.get(f"/templates/{created['uuid']}", headers=headers).headers["ETag"]
+
+    response = client.get(f"/templates/{created['uuid']}", headers={"If-None-Match": etag})
+
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
@@ -0,0 +1,142 @@
+"""Startup warmup and the /ready endpoint."""
+
+import asyncio
+import time
+from uuid import uuid4
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.clusters.infra.cluster_model import Cluster
+from app.environments.infra.environment_model import Environment
+from app.health.api import health_handlers
+from app.health.core.readiness import ReadinessMonitor
+from app.health.core.warmup import Warmup
+from app.k8s.client import discovery_cache
+from app.shared.k8s.application_component_manager import compile_template
+from benchmarks.fixtures import load_templates, session_factory
+from tests.fake_k8s import FakeApiServer
+
+
+@pytest.fixture(scope="module")
+def server():
+    with FakeApiServer() as server:
+        yield server
+
+
+@pytest.fixture
+def sessions(server):
+    sessions = session_factory()
+    with sessions() as session:
+        load_templates(session)
+        environment = Environment(uuid=uuid4(), name="prod")
+        session.add(environment)
+        session.flush()
+        session.add(
+            Cluster(
+                uuid=uuid4(),
+                name="fake",
+                api_address=server.url,
+                token="warmup",
+                environment_id=environment.id,
+            )
+        )
+        session.commit()
+    discovery_cache.clear()
+    compile_template.cache_clear()
+    server.cluster.reset(objects=True)
+    return sessions
+
+
+def warmup_for(sessions, **options):
+    return Warmup(
+        db_connections=2,
+        database_engine=sessions.kw["bind"],
+        session_factory=sessions,
+        **options,
+    )
+
+
+def test_warmup_compiles_templates_and_primes_clusters(sessions, server):
+    warmup = warmup_for(sessions)
+
+    asyncio.run(warmup.run())
+
+    assert warmup.ready is True
+    assert warmup.timed_out is False
+    assert {name: step["status"] for name, step in warmup.steps.items()} == {
+        "database": "ok",
+        "templates": "ok",
+        "clusters": "ok",
+    }
+    assert warmup.steps["clusters"]["count"] == 1
+    assert compile_template.cache_info().currsize == warmup.steps["templates"]["count"]
+
+    # Discovery is answered from the cache afterwards
+    from app.k8s.client import K8sClient
+
+    calls = server.cluster.stats()["total_calls"]
+    k8s = K8sClient(url=server.url, token="warmup")
+    assert k8s.check_api_available("gateway.networking.k8s.io") is True
+    assert k8s.get_gateway_reference() == {
+        "namespace": "gateway-system",
+        "name": "public-gateway",
+    }
+    assert server.cluster.stats()["total_calls"] == calls
+
+
+def test_unreachable_cluster_does_not_fail_the_warmup(sessions):
+    with sessions() as session:
+        session.query(Cluster).update({"api_address": "http://127.0.0.1:9"})
+        session.commit()
+    warmup = warmup_for(sessions)
+
+    asyncio.run(warmup.run())
+
+    assert warmup.ready is True
+    assert warmup.steps["clusters"] == {
+        "status": "ok",
+        "count": 0,
+        "seconds": warmup.steps["clusters"]["seconds"],
+    }
+
+
+def test_warmup_becomes_ready_after_the_timeout(sessions, monkeypatch):
+    warmup = warmup_for(sessions, timeout_seconds=0.1)
+    monkeypatch.setattr(
+        warmup, "steps_to_run", lambda: {"slow": lambda: time.sleep(1) or 0}
+    )
+
+    asyncio.run(warmup.run())
+
+    assert warmup.ready is True
+    assert warmup.timed_out is True
+    assert warmup.steps["slow"] == {"status": "running"}
+
+
+def test_ready_is_503_until_warm(sessions, monkeypatch):
+    warmup = warmup_for(sessions)
+    monitor = ReadinessMonitor(database_engine=sessions.kw["bind"])
+    monitor.run_checks()
+    monkeypatch.setattr(health_handlers, "get_warmup", lambda: warmup)
+    monkeypatch.setattr(health_handlers, "get_readiness_monitor", lambda: monitor)
+    app = FastAPI()
+    app.include_router(health_handlers.router)
+    client = TestClient(app)
+
+    response = client.get("/ready")
+    assert response.status_code == 503
+    assert response.json()["status"] == "warming"
+
+    asyncio.run(warmup.run())
+    response = client.get("/ready")
+    assert response.status_code == 200
+    assert response.json()["status"] == "ready"
+
+
+def test_disabled_warmup_is_ready_immediately():
+    warmup = Warmup(enabled=False)
+
+    assert warmup.ready is True
+    assert warmup.status()["status"] == "ready"
@@ -32,7 +32,7 @@ def test_instance(client, admin_token):
     env_uuid = env_response.json()["uuid"]
 
     # Create cluster (required for components)
-    with patch('app.clusters.core.cluster_service.K8sClient') as mock_k8s_client:
+    with patch('app.k8s.client.K8sClient') as mock_k8s_client:
         mock_client_instance = MagicMock()
         mock_client_instance.validate_connection.return_value = (True, {"message": "Connection successful"})
         mock_k8s_client.return_value = mock_client_instance
@@ -129,6 +129,50 @@ def test_create_webapp_success(mock_get_cluster, mock_apply, mock_gateway, mock_
     assert "uuid" in data
 
 
+@patch('app.webapps.core.webapp_service.validate_exposure_type_for_cluster')
+@patch('app.webapps.core.webapp_service.validate_visibility_for_cluster')
+@patch('app.clusters.core.cluster_service.get_gateway_reference_from_cluster')
+@patch('app.webapps.core.webapp_kubernetes_service.apply_to_kubernetes')
+@patch('app.shared.k8s.cluster_selection.ClusterSelectionService.get_cluster_with_least_load_or_raise')
+def test_create_webapp_rolls_back_when_kubernetes_apply_fails(mock_get_cluster, mock_apply, mock_gateway, mock_validate_visibility, mock_validate_exposure, client, admin_token, test_instance):
+    """A failed apply leaves neither the webapp nor its cluster instance behind."""
+    from unittest.mock import MagicMock
+
+    mock_cluster = MagicMock(spec=['id', 'name', 'api_address', 'token', 'environment_id'])
+    mock_cluster.id = 1
+    mock_cluster.name = "test-cluster"
+    mock_get_cluster.return_value = mock_cluster
+    mock_apply.side_effect = Exception("apply failed")
+    mock_gateway.return_value = {"namespace": "", "name": ""}
+
+    response = client.post(
+        "/application_components/webapp/",
+        headers={"Authorization": f"Bearer {admin_token}"},
+        json={
+            "instance_uuid": test_instance["uuid"],
+            "name": "test-webapp",
+            "enabled": True,
+            "settings": {
+                "exposure": {"type": "http", "port": 80, "visibility": "cluster"},
+                "cpu": 0.5,
+                "memory": 512,
+                "healthcheck": {"path": "/health", "protocol": "http", "port": 80},
+                "custom_metrics": {"enabled": False, "path": "/metrics", "port": 8080},
+                "autoscaling": {"min": 1, "max": 3}
+            }
+        }
+    )
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert "apply failed" in response.json()["detail"]
+
+    list_response = client.get(
+        "/application_components/webapp/",
+        headers={"Authorization": f"Bearer {admin_token}"},
+    )
+    assert list_response.json() == []
+
+
 def test_create_webapp_requires_authentication(client, test_instance):
     """Test that webapp creation requires authentication."""
     response = client.post(
@@ -0,0 +1,113 @@
+"""Query plan regression tests for the main repository queries.
+
+Each test runs a real repository method against the seeded Postgres dataset,
+captures the SQL it issued and fails if EXPLAIN shows a sequential scan on a
+large table. Skipped unless QUERY_PLAN_DATABASE_URL is set (see conftest.py).
+"""
+import pytest
+
+from app.webapps.infra.webapp_repository import WebappRepository
+from app.workers.infra.worker_repository import WorkerRepository
+from app.cron.infra.cron_repository import CronRepository
+from app.instances.infra.instance_repository import InstanceRepository
+from app.environments.infra.environment_repository import EnvironmentRepository
+from app.auth.infra.token_repository import TokenRepository
+from app.applications.infra.application_repository import ApplicationRepository
+from app.shared.k8s.cluster_selection import ClusterSelectionService
+from app.shared.utils.settings_filters import parse_settings_filters
+
+
+@pytest.mark.parametrize(
+    "repository_class", [WebappRepository, WorkerRepository, CronRepository]
+)
+def test_component_list_first_and_next_page(
+    repository_class, plan_session, capture_statements, assert_no_seq_scans
+):
+    """Type filtered component lists use the (type, created_at, id) index."""
+    repository = repository_class(plan_session)
+    page = repository.find_all(limit=100)
+    repository.find_all(limit=100, cursor=page.next_cursor)
+
+    assert_no_seq_scans(capture_statements)
+
+
+@pytest.mark.parametrize(
+    "repository_class", [InstanceRepository, ApplicationRepository, TokenRepository]
+)
+def test_list_first_and_next_page(
+    repository_class, plan_session, capture_statements, assert_no_seq_scans
+):
+    """Lists paged on (created_at, id) use the matching index."""
+    repository = repository_class(plan_session)
+    page = repository.find_all(limit=100)
+    repository.find_all(limit=100, cursor=page.next_cursor)
+
+    assert_no_seq_scans(capture_statements)
+
+
+def test_find_cluster_instance_by_component_id(
+    plan_session, seed_ids, capture_statements, assert_no_seq_scans
+):
+    WebappRepository(plan_session).find_cluster_instance_by_component_id(
+        seed_ids["component_id"]
+    )
+
+    assert_no_seq_scans(capture_statements)
+
+
+def test_find_settings_by_environment_id(
+    plan_session, seed_ids, capture_statements, assert_no_seq_scans
+):
+    WebappRepository(plan_session).find_settings_by_environment_id(
+        seed_ids["environment_id"]
+    )
+
+    assert_no_seq_scans(capture_statements)
+
+
+def test_find_instance_by_application_and_environment(
+    plan_session, seed_ids, capture_statements, assert_no_seq_scans
+):
+    InstanceRepository(plan_session).find_by_application_and_environment(
+        seed_ids["instance_application_id"], seed_ids["instance_environment_id"]
+    )
+
+    assert_no_seq_scans(capture_statements)
+
+
+def test_find_components_by_environment_id(
+    plan_session, seed_ids, capture_statements, assert_no_seq_scans
+):
+    EnvironmentRepository(plan_session).find_components_by_environment_id(
+        seed_ids["environment_id"]
+    )
+
+    assert_no_seq_scans(capture_statements)
+
+
+def test_find_active_tokens(plan_session, capture_statements, assert_no_seq_scans):
+    """Active tokens are read from the partial index."""
+    TokenRepository(plan_session).find_active_tokens()
+
+    assert_no_seq_scans(capture_statements)
+
+
+def test_cluster_least_load(
+    plan_session, seed_ids, capture_statements, assert_no_seq_scans
+):
+    ClusterSelectionService.get_cluster_with_least_load(
+        plan_session, seed_ids["environment_id"]
+    )
+
+    assert_no_seq_scans(capture_statements)
+
+
+def test_component_list_filtered_on_settings(
+    plan_session, capture_statements, assert_no_seq_scans
+):
+    """Settings equality filters are served by the GIN (jsonb_path_ops) index."""
+    WebappRepository(plan_session).find_all(
+        limit=100, settings_filters=parse_settings_filters("settings.cpu=2")
+    )
+
+    assert_no_seq_scans(capture_statements)
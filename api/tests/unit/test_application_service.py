@@ -138,7 +138,7 @@ def test_get_applications(application_service, mock_repository):
     result = application_service.get_applications(skip=0, limit=10)
 
     assert result == mock_apps
-    mock_repository.find_all.assert_called_once_with(skip=0, limit=10)
+    mock_repository.find_all.assert_called_once_with(skip=0, limit=10, cursor=None)
 
 
 def test_delete_application_success(application_service, mock_repository):
@@ -162,7 +162,7 @@ def test_delete_application_success(application_service, mock_repository):
         # Validator calls find_by_uuid, then service calls it again
         assert mock_repository.find_by_uuid.call_count >= 1
         mock_repository.delete_by_id.assert_called_once_with(mock_application.id)
-        mock_db.commit.assert_called()
+        mock_repository.unit_of_work.assert_called_once()
 
 
 def test_delete_application_with_instances(application_service, mock_repository):
@@ -195,8 +195,8 @@ def test_delete_application_with_instances(application_service, mock_repository)
         assert mock_instance_service.delete_instance.call_count == 2
         assert mock_instance_service.delete_instance.call_args_list[0][0][0] == mock_instance1.uuid
         assert mock_instance_service.delete_instance.call_args_list[1][0][0] == mock_instance2.uuid
-        # Should commit after each instance deletion
-        assert mock_db.commit.call_count >= 2
+        # Instances and application are deleted in a single transaction
+        mock_repository.unit_of_work.assert_called_once()
         mock_repository.delete_by_id.assert_called_once_with(mock_application.id)
 
 
@@ -365,7 +365,7 @@ def test_get_applications_with_pagination(application_service, mock_repository):
     result = application_service.get_applications(skip=10, limit=20)
 
     assert len(result) == 3
-    mock_repository.find_all.assert_called_once_with(skip=10, limit=20)
+    mock_repository.find_all.assert_called_once_with(skip=10, limit=20, cursor=None)
 
 
 def test_get_applications_empty(application_service, mock_repository):
@@ -376,7 +376,7 @@ def test_get_applications_empty(application_service, mock_repository):
 
     assert result == []
     assert len(result) == 0
-    mock_repository.find_all.assert_called_once_with(skip=0, limit=10)
+    mock_repository.find_all.assert_called_once_with(skip=0, limit=10, cursor=None)
 
 
 def test_delete_application_instance_deletion_error(application_service, mock_repository):
@@ -402,7 +402,9 @@ def test_delete_application_instance_deletion_error(application_service, mock_re
         with pytest.raises(Exception, match="Failed to delete instance"):
             application_service.delete_application(app_uuid, mock_db)
 
-        mock_db.rollback.assert_called()
+        # The unit of work sees the failure and rolls everything back
+        unit_of_work = mock_repository.unit_of_work.return_value
+        assert unit_of_work.__exit__.call_args[0][0] is Exception
         mock_repository.delete_by_id.assert_not_called()
 
 
@@ -425,7 +427,9 @@ def test_delete_application_application_deletion_error(application_service, mock
         with pytest.raises(Exception, match="Failed to delete application"):
             application_service.delete_application(app_uuid, mock_db)
 
-        mock_db.rollback.assert_called()
+        # The unit of work sees the failure and rolls everything back
+        unit_of_work = mock_repository.unit_of_work.return_value
+        assert unit_of_work.__exit__.call_args[0][0] is Exception
 
 
 def test_delete_application_creates_instance_service(application_service, mock_repository):
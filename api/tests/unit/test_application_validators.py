@@ -41,15 +41,14 @@ def test_validate_application_name_uniqueness_excluding_uuid(mock_db):
 
 
 def test_validate_application_exists_found(mock_db):
-    """Test validation when application exists."""
+    """Test validation returns the application when it exists."""
     repository = MagicMock()
     app_uuid = uuid4()
     mock_application = MagicMock()
     mock_application.uuid = app_uuid
     repository.find_by_uuid.return_value = mock_application
 
-    # Should not raise exception
-    validate_application_exists(repository, app_uuid)
+    assert validate_application_exists(repository, app_uuid) is mock_application
 
 
 def test_validate_application_exists_not_found(mock_db):
@@ -0,0 +1,55 @@
+"""Tests for comparing benchmark result files."""
+
+from benchmarks.harness import compare
+
+
+def document(**cases):
+    return {
+        "meta": {"commit": "abc1234"},
+        "results": {
+            key: {"median_ms": median, "min_ms": minimum}
+            for key, (median, minimum) in cases.items()
+        },
+    }
+
+
+def statuses(rows):
+    return {row["case"]: row["status"] for row in rows}
+
+
+def test_flags_cases_slower_in_median_and_fastest_run():
+    base = document(
+        **{"a/slower": (10.0, 9.0), "a/noisy": (10.0, 9.0), "a/same": (10.0, 9.0)}
+    )
+    head = document(
+        **{"a/slower": (13.0, 12.0), "a/noisy": (13.0, 9.1), "a/same": (10.5, 9.2)}
+    )
+
+    assert statuses(compare(base, head, threshold=0.15)) == {
+        "a/slower": "regression",
+        "a/noisy": "ok",
+        "a/same": "ok",
+    }
+
+
+def test_reports_improvements_and_ignores_differences_below_the_noise_floor():
+    base = document(**{"a/faster": (10.0, 9.0), "a/tiny": (0.002, 0.002)})
+    head = document(**{"a/faster": (5.0, 4.5), "a/tiny": (0.004, 0.004)})
+
+    assert statuses(compare(base, head, threshold=0.15)) == {
+        "a/faster": "improvement",
+        "a/tiny": "ok",
+    }
+
+
+def test_new_and_missing_cases_only_within_groups_that_ran():
+    base = document(
+        **{"a/old": (1.0, 1.0), "a/kept": (1.0, 1.0), "b/skipped": (1.0, 1.0)}
+    )
+    head = document(**{"a/kept": (1.0, 1.0), "a/added": (1.0, 1.0)})
+
+    assert statuses(compare(base, head, threshold=0.15)) == {
+        "a/added": "new",
+        "a/kept": "ok",
+        "a/old": "missing",
+    }
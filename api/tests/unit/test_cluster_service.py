@@ -191,7 +191,7 @@ def test_get_clusters(cluster_service, mock_repository, mock_cluster):
         result = cluster_service.get_clusters(skip=0, limit=10)
 
         assert len(result) == 2
-        mock_repository.find_all.assert_called_once_with(skip=0, limit=10)
+        mock_repository.find_all.assert_called_once_with(skip=0, limit=10, cursor=None)
 
 
 def test_delete_cluster_success(cluster_service, mock_repository, mock_cluster):
@@ -221,7 +221,7 @@ def test_validate_cluster_connection_success(cluster_service):
     api_address = "https://k8s.example.com"
     token = "test-token"
 
-    with patch('app.clusters.core.cluster_service.K8sClient') as mock_k8s_client_class:
+    with patch('app.k8s.client.K8sClient') as mock_k8s_client_class:
         mock_k8s_client = MagicMock()
         mock_k8s_client.validate_connection.return_value = (True, {"message": "Connected"})
         mock_k8s_client_class.return_value = mock_k8s_client
@@ -237,7 +237,7 @@ def test_validate_cluster_connection_failure(cluster_service):
     api_address = "https://invalid.example.com"
     token = "invalid-token"
 
-    with patch('app.clusters.core.cluster_service.K8sClient') as mock_k8s_client_class:
+    with patch('app.k8s.client.K8sClient') as mock_k8s_client_class:
         mock_k8s_client = MagicMock()
         mock_k8s_client.validate_connection.return_value = (False, {"message": "Connection failed"})
         mock_k8s_client_class.return_value = mock_k8s_client
@@ -0,0 +1,100 @@
+"""Tests for the response compression middleware."""
+import gzip
+
+import pytest
+from fastapi import FastAPI, Response
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.shared.utils import compression
+from app.shared.utils.compression import CompressionMiddleware, negotiate_encoding
+
+LARGE = b'{"name": "web", "enabled": true}' * 100
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, minimum_size=500)
+
+    @app.get("/large")
+    def large():
+        return Response(LARGE, media_type="application/json", headers={"ETag": '"abc"'})
+
+    @app.get("/small")
+    def small():
+        return Response(b'{"ok": true}', media_type="application/json")
+
+    @app.get("/image")
+    def image():
+        return Response(LARGE, media_type="image/png")
+
+    @app.get("/stream")
+    def stream():
+        return StreamingResponse(iter([LARGE, LARGE]), media_type="text/plain")
+
+    return TestClient(app)
+
+
+@pytest.fixture
+def gzip_only(monkeypatch):
+    monkeypatch.setattr(compression, "brotli", None)
+
+
+@pytest.mark.parametrize(
+    "header,expected",
+    [
+        (None, None),
+        ("", None),
+        ("identity", None),
+        ("gzip", "gzip"),
+        ("deflate, gzip;q=0.5", "gzip"),
+        ("gzip;q=0", None),
+        ("*", "gzip"),
+        ("br", None),
+    ],
+)
+def test_negotiate_encoding_without_brotli(gzip_only, header, expected):
+    assert negotiate_encoding(header) == expected
+
+
+def test_negotiate_encoding_prefers_brotli_when_installed(monkeypatch):
+    monkeypatch.setattr(compression, "brotli", object())
+
+    assert negotiate_encoding("gzip, br") == "br"
+    assert negotiate_encoding("gzip, br;q=0.5") == "gzip"
+
+
+def test_large_response_is_gzipped(gzip_only, client):
+    response = client.get("/large", headers={"Accept-Encoding": "gzip"})
+
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert response.headers["Vary"] == "Accept-Encoding"
+    assert response.headers["ETag"] == 'W/"abc"'
+    assert int(response.headers["Content-Length"]) < len(LARGE)
+    # httpx decodes the body
+    assert response.content == LARGE
+
+
+def test_response_is_not_compressed_without_accept_encoding(client):
+    response = client.get("/large", headers={"Accept-Encoding": "identity"})
+
+    assert "Content-Encoding" not in response.headers
+    assert response.headers["ETag"] == '"abc"'
+    assert response.content == LARGE
+
+
+@pytest.mark.parametrize("path", ["/small", "/image"])
+def test_small_or_binary_responses_are_not_compressed(gzip_only, client, path):
+    response = client.get(path, headers={"Accept-Encoding": "gzip"})
+
+    assert "Content-Encoding" not in response.headers
+
+
+def test_streaming_response_is_compressed_chunk_by_chunk(gzip_only, client):
+    with client.stream("GET", "/stream", headers={"Accept-Encoding": "gzip"}) as response:
+        raw = b"".join(response.iter_raw())
+
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert "Content-Length" not in response.headers
+    assert gzip.decompress(raw) == LARGE * 2
@@ -208,7 +208,9 @@ def test_get_crons(cron_service, mock_repository, mock_cron):
     result = cron_service.get_crons(skip=0, limit=10)
 
     assert len(result) == 2
-    mock_repository.find_all.assert_called_once_with(skip=0, limit=10)
+    mock_repository.find_all.assert_called_once_with(
+        skip=0, limit=10, cursor=None, settings_filters=None
+    )
 
 
 def test_delete_cron_success(cron_service, mock_repository, mock_db, mock_cron):
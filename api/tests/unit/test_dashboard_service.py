@@ -2,6 +2,7 @@
 import pytest
 from unittest.mock import MagicMock
 from app.dashboard.core.dashboard_service import DashboardService
+from app.dashboard.core.dashboard_cache import DashboardCache
 from app.dashboard.infra.dashboard_repository import DashboardRepository
 
 
@@ -12,33 +13,53 @@ def mock_repository():
 
 
 @pytest.fixture
-def dashboard_service(mock_repository):
+def cache():
+    """Create an empty DashboardCache."""
+    return DashboardCache(ttl_seconds=60)
+
+
+@pytest.fixture
+def dashboard_service(mock_repository, cache):
     """Create DashboardService instance."""
-    return DashboardService(mock_repository)
+    return DashboardService(mock_repository, cache=cache)
+
+
+def mock_totals(**overrides):
+    totals = {
+        "applications": 0,
+        "instances": 0,
+        "clusters": 0,
+        "environments": 0,
+        "total": 0,
+        "webapp": 0,
+        "worker": 0,
+        "cron": 0,
+        "enabled": 0,
+        "disabled": 0,
+    }
+    totals.update(overrides)
+    return totals
 
 
 def test_get_dashboard_overview_success(dashboard_service, mock_repository):
     """Test successful dashboard overview retrieval."""
-    # Mock repository methods
-    mock_repository.count_applications.return_value = 5
-    mock_repository.count_instances.return_value = 10
-    mock_repository.count_total_components.return_value = 20
-    mock_repository.count_components_by_type.side_effect = lambda t: {
-        "webapp": 8,
-        "worker": 7,
-        "cron": 5
-    }.get(t, 0)
-    mock_repository.count_enabled_components.return_value = 15
-    mock_repository.count_disabled_components.return_value = 5
-    mock_repository.count_clusters.return_value = 3
-    mock_repository.count_environments.return_value = 2
-    mock_repository.get_components_by_environment.return_value = [
-        ("prod", 12),
-        ("dev", 8)
-    ]
-    mock_repository.get_components_by_cluster.return_value = [
-        ("cluster-1", 10),
-        ("cluster-2", 10)
+    mock_repository.get_totals.return_value = mock_totals(
+        applications=5,
+        instances=10,
+        clusters=3,
+        environments=2,
+        total=20,
+        webapp=8,
+        worker=7,
+        cron=5,
+        enabled=15,
+        disabled=5,
+    )
+    mock_repository.get_component_breakdown.return_value = [
+        ("environment", "prod", 12),
+        ("environment", "dev", 8),
+        ("cluster", "cluster-1", 10),
+        ("cluster", "cluster-2", 10),
     ]
 
     result = dashboard_service.get_dashboard_overview()
@@ -56,32 +77,14 @@ def test_get_dashboard_overview_success(dashboard_service, mock_repository):
     assert result.components_by_environment == {"prod": 12, "dev": 8}
     assert result.components_by_cluster == {"cluster-1": 10, "cluster-2": 10}
 
-    # Verify all repository methods were called
-    mock_repository.count_applications.assert_called_once()
-    mock_repository.count_instances.assert_called_once()
-    mock_repository.count_total_components.assert_called_once()
-    assert mock_repository.count_components_by_type.call_count == 3
-    mock_repository.count_enabled_components.assert_called_once()
-    mock_repository.count_disabled_components.assert_called_once()
-    mock_repository.count_clusters.assert_called_once()
-    mock_repository.count_environments.assert_called_once()
-    mock_repository.get_components_by_environment.assert_called_once()
-    mock_repository.get_components_by_cluster.assert_called_once()
+    mock_repository.get_totals.assert_called_once()
+    mock_repository.get_component_breakdown.assert_called_once()
 
 
 def test_get_dashboard_overview_empty(dashboard_service, mock_repository):
     """Test dashboard overview with no data."""
-    # Mock repository methods to return zeros/empty
-    mock_repository.count_applications.return_value = 0
-    mock_repository.count_instances.return_value = 0
-    mock_repository.count_total_components.return_value = 0
-    mock_repository.count_components_by_type.return_value = 0
-    mock_repository.count_enabled_components.return_value = 0
-    mock_repository.count_disabled_components.return_value = 0
-    mock_repository.count_clusters.return_value = 0
-    mock_repository.count_environments.return_value = 0
-    mock_repository.get_components_by_environment.return_value = []
-    mock_repository.get_components_by_cluster.return_value = []
+    mock_repository.get_totals.return_value = mock_totals()
+    mock_repository.get_component_breakdown.return_value = []
 
     result = dashboard_service.get_dashboard_overview()
 
@@ -97,3 +100,38 @@ def test_get_dashboard_overview_empty(dashboard_service, mock_repository):
     assert result.environments == 0
     assert result.components_by_environment == {}
     assert result.components_by_cluster == {}
+
+
+def test_get_dashboard_snapshot_is_cached(dashboard_service, mock_repository, cache):
+    """Test the snapshot is served from the cache until invalidated."""
+    mock_repository.get_totals.return_value = mock_totals(applications=1)
+    mock_repository.get_component_breakdown.return_value = []
+
+    first = dashboard_service.get_dashboard_snapshot()
+    second = dashboard_service.get_dashboard_snapshot()
+
+    assert second is first
+    mock_repository.get_totals.assert_called_once()
+
+    mock_repository.get_totals.return_value = mock_totals(applications=2)
+    cache.invalidate()
+    third = dashboard_service.get_dashboard_snapshot()
+
+    assert third.overview.applications == 2
+    assert third.etag != first.etag
+
+
+def test_snapshot_computed_during_invalidation_is_not_cached(cache):
+    """Test a snapshot started before an invalidation is not stored."""
+    generation = cache.generation
+    cache.invalidate()
+    cache.set(MagicMock(), generation)
+
+    assert cache.get() is None
+
+
+def test_cache_disabled_with_zero_ttl():
+    cache = DashboardCache(ttl_seconds=0)
+    cache.set(MagicMock(), cache.generation)
+
+    assert cache.get() is None
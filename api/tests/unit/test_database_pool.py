@@ -0,0 +1,115 @@
+"""Tests for database pool configuration and checkout metrics."""
+import asyncio
+import pytest
+from sqlalchemy import create_engine, exc, text
+
+from app.shared.database.pool import (
+    InstrumentedQueuePool,
+    build_pool_options,
+    get_pool_stats,
+    reset_pool_stats,
+)
+from app.shared.database import database
+
+
+@pytest.fixture(autouse=True)
+def clean_pool_env(monkeypatch):
+    """Remove pool related variables so defaults are predictable."""
+    for name in (
+        "DB_POOL_SIZE",
+        "DB_MAX_OVERFLOW",
+        "DB_POOL_TIMEOUT",
+        "DB_POOL_RECYCLE",
+        "DB_POOL_PRE_PING",
+        "DB_STATEMENT_TIMEOUT_MS",
+        "DB_ASYNC_ENABLED",
+    ):
+        monkeypatch.delenv(name, raising=False)
+    reset_pool_stats()
+
+
+def test_build_pool_options_defaults():
+    """Test defaults enable pre-ping and recycle."""
+    options = build_pool_options()
+
+    assert options["pool_size"] == 10
+    assert options["max_overflow"] == 10
+    assert options["pool_timeout"] == 10
+    assert options["pool_recycle"] == 1800
+    assert options["pool_pre_ping"] is True
+    assert options["statement_timeout_ms"] is None
+
+
+def test_build_pool_options_from_env(monkeypatch):
+    """Test pool options are read from the environment."""
+    monkeypatch.setenv("DB_POOL_SIZE", "25")
+    monkeypatch.setenv("DB_MAX_OVERFLOW", "0")
+    monkeypatch.setenv("DB_POOL_TIMEOUT", "3")
+    monkeypatch.setenv("DB_POOL_RECYCLE", "-1")
+    monkeypatch.setenv("DB_POOL_PRE_PING", "false")
+    monkeypatch.setenv("DB_STATEMENT_TIMEOUT_MS", "15000")
+
+    options = build_pool_options()
+
+    assert options["pool_size"] == 25
+    assert options["max_overflow"] == 0
+    assert options["pool_timeout"] == 3
+    assert options["pool_recycle"] == -1
+    assert options["pool_pre_ping"] is False
+    assert options["statement_timeout_ms"] == 15000
+
+
+def test_build_pool_options_invalid_integer(monkeypatch):
+    """Test invalid integer values raise a clear error."""
+    monkeypatch.setenv("DB_POOL_SIZE", "many")
+
+    with pytest.raises(ValueError, match="DB_POOL_SIZE"):
+        build_pool_options()
+
+
+def test_instrumented_pool_records_checkouts_and_timeouts(tmp_path):
+    """Test checkouts and pool timeouts are counted."""
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}",
+        poolclass=InstrumentedQueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.05,
+    )
+
+    held = engine.connect()
+    held.execute(text("SELECT 1"))
+
+    stats = get_pool_stats(engine)
+    assert stats["checkouts"] == 1
+    assert stats["checked_out"] == 1
+    assert stats["size"] == 1
+
+    with pytest.raises(exc.TimeoutError):
+        engine.connect()
+
+    held.close()
+    stats = get_pool_stats(engine)
+    assert stats["timeouts"] == 1
+    assert stats["checked_out"] == 0
+    assert stats["wait_seconds_max"] >= 0
+    engine.dispose()
+
+
+def test_get_async_engine_disabled_by_default():
+    """Test async engine is opt-in."""
+    assert database.is_async_enabled() is False
+
+    with pytest.raises(RuntimeError, match="DB_ASYNC_ENABLED"):
+        database.get_async_engine()
+
+
+def test_get_async_db_disabled_by_default():
+    """Test async dependency refuses to run when the engine is disabled."""
+
+    async def consume():
+        async for _ in database.get_async_db():
+            pass
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(consume())
@@ -124,7 +124,7 @@ def test_get_environments(environment_service, mock_repository, mock_environment
         result = environment_service.get_environments(skip=0, limit=10)
 
         assert len(result) == 2
-        mock_repository.find_all.assert_called_once_with(skip=0, limit=10)
+        mock_repository.find_all.assert_called_once_with(skip=0, limit=10, cursor=None)
 
 
 def test_delete_environment_success(environment_service, mock_repository, mock_environment):
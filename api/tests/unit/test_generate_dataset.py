@@ -0,0 +1,108 @@
+"""Tests for the synthetic dataset generator."""
+import asyncio
+
+import pytest
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.shared.crypto import decrypt_many
+from app.shared.database.database import Base
+from app.shared.dependencies.auth import get_current_user_or_token
+from app.webapps.infra.application_component_model import ApplicationComponent
+from app.instances.infra.instance_model import Instance
+from scripts.generate_dataset import Scale, build_rows, generate, main, token_value
+
+SCALE = Scale(
+    environments=4,
+    clusters=6,
+    applications=20,
+    instances=50,
+    components=120,
+    envs_per_component=2,
+    secrets_per_component=2,
+    settings_per_environment=3,
+    users=10,
+    tokens=8,
+    active_tokens=3,
+)
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    yield engine
+    Base.metadata.drop_all(bind=engine)
+
+
+def plaintext(rows):
+    """The generated rows with component secrets decrypted."""
+    for component in rows:
+        secrets = component["settings"]["secrets"]
+        values = decrypt_many(secret["value"] for secret in secrets)
+        component["settings"]["secrets"] = [
+            {**secret, "value": value} for secret, value in zip(secrets, values)
+        ]
+    return rows
+
+
+def test_same_seed_generates_the_same_rows():
+    first = build_rows(SCALE, seed=7)
+    second = build_rows(SCALE, seed=7)
+    other = build_rows(SCALE, seed=8)
+
+    assert plaintext(first[ApplicationComponent]) == plaintext(second[ApplicationComponent])
+    assert first[Instance] == second[Instance]
+    assert first[Instance] != other[Instance]
+
+
+def test_generate_inserts_every_table(engine):
+    summary = generate(engine, SCALE, seed=1, batch_size=16)
+
+    assert summary["counts"]["applications"] == 20
+    assert summary["counts"]["instances"] == 50
+    assert summary["counts"]["application_components"] == 120
+    with sessionmaker(bind=engine)() as session:
+        assert session.scalar(select(func.count()).select_from(Instance)) == 50
+        stored = session.scalars(select(ApplicationComponent.settings)).all()
+    assert any(settings["secrets"] for settings in stored)
+    assert all(
+        secret["value"].startswith("v2:")
+        for settings in stored
+        for secret in settings["secrets"]
+    )
+
+
+def test_active_tokens_authenticate(engine):
+    generate(engine, SCALE, seed=1)
+
+    with sessionmaker(bind=engine)() as session:
+        token = asyncio.run(
+            get_current_user_or_token(
+                x_tron_token=token_value(1, 2), credentials=None, db=session
+            )
+        )
+    assert token.name == "token-2"
+
+
+def test_scale_rejects_more_instances_than_environments_allow():
+    with pytest.raises(ValueError):
+        build_rows(Scale(environments=2, applications=5, instances=11), seed=0)
+
+
+def test_invalid_counts_are_a_usage_error(monkeypatch, capsys):
+    monkeypatch.setattr(
+        "sys.argv",
+        ["generate_dataset.py", "--applications", "10", "--instances", "5"],
+    )
+
+    with pytest.raises(SystemExit) as exc_info:
+        main()
+
+    assert exc_info.value.code == 2
+    assert "every application needs at least one instance" in capsys.readouterr().err
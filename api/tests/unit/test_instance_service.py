@@ -135,7 +135,7 @@ def test_update_instance_success(instance_service, mock_repository):
     updated_instance.image = dto.image
     updated_instance.version = dto.version
 
-    mock_repository.find_by_uuid.return_value = mock_instance
+    mock_repository.find_by_uuid_with_relations.return_value = mock_instance
     mock_repository.update.return_value = updated_instance
 
     result = instance_service.update_instance(instance_uuid, dto)
@@ -151,32 +151,24 @@ def test_get_instance_success(instance_service, mock_repository):
     instance_uuid = uuid4()
     mock_instance = MagicMock()
     mock_instance.uuid = instance_uuid
-    mock_repository.find_by_uuid.return_value = mock_instance
+    mock_repository.find_by_uuid_with_relations.return_value = mock_instance
 
     result = instance_service.get_instance(instance_uuid)
 
     assert result == mock_instance
-    # Validator calls find_by_uuid without load_components, service calls with load_components=True
-    assert mock_repository.find_by_uuid.call_count >= 1
-    # Check that it was called with load_components=True at least once
-    assert any(
-        call.kwargs.get('load_components') == True
-        for call in mock_repository.find_by_uuid.call_args_list
-        if call.kwargs
-    )
+    # Application, environment and components are all read by the Instance DTO
+    mock_repository.find_by_uuid_with_relations.assert_called_once_with(instance_uuid)
 
 
 def test_get_instance_not_found(instance_service, mock_repository):
     """Test getting non-existent instance."""
     instance_uuid = uuid4()
-    mock_repository.find_by_uuid.return_value = None
+    mock_repository.find_by_uuid_with_relations.return_value = None
 
     with pytest.raises(InstanceNotFoundError):
         instance_service.get_instance(instance_uuid)
 
-    # Validator calls find_by_uuid without load_components first, which returns None
-    # So the exception is raised before service calls it with load_components
-    assert mock_repository.find_by_uuid.call_count >= 1
+    mock_repository.find_by_uuid_with_relations.assert_called_once_with(instance_uuid)
 
 
 def test_delete_instance_success(instance_service, mock_repository, mock_db):
@@ -188,15 +180,17 @@ def test_delete_instance_success(instance_service, mock_repository, mock_db):
     mock_instance.components = []  # No components
 
     mock_repository.find_by_uuid.return_value = mock_instance
-    mock_repository.find_by_uuid_with_relations.return_value = mock_instance
+    mock_repository.find_by_uuid_for_deploy.return_value = mock_instance
 
     with patch.object(instance_service, '_get_component_repository') as mock_get_repo:
         result = instance_service.delete_instance(instance_uuid, mock_db)
 
         assert result == {"detail": "Instance deleted successfully"}
-        # Validator calls find_by_uuid, then service calls find_by_uuid_with_relations
-        assert mock_repository.find_by_uuid.call_count >= 1
-        assert mock_repository.find_by_uuid_with_relations.call_count >= 1
+        # The validator loads the instance and its deploy context in a single lookup
+        mock_repository.find_by_uuid.assert_not_called()
+        mock_repository.find_by_uuid_for_deploy.assert_called_once_with(
+            instance_uuid
+        )
         mock_repository.delete_by_id.assert_called_once_with(mock_instance.id)
 
 
@@ -221,7 +215,7 @@ def test_delete_instance_with_components(instance_service, mock_repository, mock
     mock_instance.components = [mock_component1, mock_component2]
 
     mock_repository.find_by_uuid.return_value = mock_instance
-    mock_repository.find_by_uuid_with_relations.return_value = mock_instance
+    mock_repository.find_by_uuid_for_deploy.return_value = mock_instance
 
     # Mock component repositories
     mock_webapp_repo = MagicMock()
@@ -250,15 +244,42 @@ def test_delete_instance_with_components(instance_service, mock_repository, mock
             assert result == {"detail": "Instance deleted successfully"}
             # Should delete both components
             assert mock_delete_component.call_count == 2
-            # Should commit after component deletions
-            assert mock_db.commit.call_count >= 2
+            # Components and instance are deleted in a single transaction
+            mock_repository.unit_of_work.assert_called_once()
+            mock_db.commit.assert_not_called()
             mock_repository.delete_by_id.assert_called_once_with(mock_instance.id)
 
 
+def test_delete_instance_component_failure_is_not_retried(
+    instance_service, mock_repository, mock_db
+):
+    """A failed component delete ends the unit of work instead of retrying on the failed session."""
+    instance_uuid = uuid4()
+    mock_instance = MagicMock()
+    mock_instance.id = 1
+    mock_component = MagicMock()
+    mock_component.type = WebappType.webapp
+    mock_instance.components = [mock_component]
+    mock_repository.find_by_uuid_for_deploy.return_value = mock_instance
+
+    mock_webapp_repo = MagicMock()
+    mock_webapp_repo.find_cluster_instance_by_component_id.return_value = None
+    mock_webapp_repo.delete.side_effect = Exception("Failed to delete webapp: flush failed")
+
+    with patch.object(
+        instance_service, '_get_component_repository', return_value=mock_webapp_repo
+    ):
+        with pytest.raises(Exception, match="flush failed"):
+            instance_service.delete_instance(instance_uuid, mock_db)
+
+    mock_webapp_repo.delete.assert_called_once_with(mock_component)
+    mock_repository.delete_by_id.assert_not_called()
+
+
 def test_delete_instance_not_found(instance_service, mock_repository, mock_db):
     """Test deleting non-existent instance."""
     instance_uuid = uuid4()
-    mock_repository.find_by_uuid.return_value = None
+    mock_repository.find_by_uuid_for_deploy.return_value = None
 
     with pytest.raises(InstanceNotFoundError):
         instance_service.delete_instance(instance_uuid, mock_db)
@@ -307,7 +328,7 @@ def test_get_instance_events_success(instance_service, mock_repository, mock_db)
     mock_instance.application.namespace = None
 
     with patch('app.instances.core.instance_service.ClusterSelectionService.get_cluster_with_least_load_or_raise') as mock_get_cluster, \
-         patch('app.instances.core.instance_service.K8sClient') as mock_k8s_client_class:
+         patch('app.k8s.client.K8sClient') as mock_k8s_client_class:
         mock_get_cluster.return_value = mock_cluster
         mock_k8s_client = MagicMock()
         mock_k8s_client.list_events.return_value = mock_events
@@ -366,11 +387,10 @@ def test_sync_instance_success(instance_service, mock_repository, mock_db):
     mock_instance.components = [mock_component]
 
     mock_repository.find_by_uuid.return_value = mock_instance
-    mock_repository.find_by_uuid_with_relations.return_value = mock_instance
+    mock_repository.find_by_uuid_for_deploy.return_value = mock_instance
 
-    # Mock settings
-    mock_settings = MagicMock()
-    mock_db.query.return_value.filter.return_value.first.return_value = mock_settings
+    # Environment settings come loaded with the instance
+    mock_instance.environment.settings = [MagicMock()]
 
     # Mock component repository
     mock_component_repo = MagicMock()
@@ -393,7 +413,7 @@ def test_sync_instance_success(instance_service, mock_repository, mock_db):
         assert result["total_components"] == 1
         assert len(result["errors"]) == 0
         mock_upsert.assert_called_once()
-        assert mock_db.commit.call_count >= 1
+        mock_repository.unit_of_work.assert_called_once()
 
 
 def test_sync_instance_with_errors(instance_service, mock_repository, mock_db):
@@ -414,11 +434,10 @@ def test_sync_instance_with_errors(instance_service, mock_repository, mock_db):
     mock_instance.components = [mock_component]
 
     mock_repository.find_by_uuid.return_value = mock_instance
-    mock_repository.find_by_uuid_with_relations.return_value = mock_instance
+    mock_repository.find_by_uuid_for_deploy.return_value = mock_instance
 
-    # Mock settings
-    mock_settings = MagicMock()
-    mock_db.query.return_value.filter.return_value.first.return_value = mock_settings
+    # Environment settings come loaded with the instance
+    mock_instance.environment.settings = [MagicMock()]
 
     # Mock component repository
     mock_component_repo = MagicMock()
@@ -460,7 +479,7 @@ def test_update_instance_partial(instance_service, mock_repository):
     updated_instance = MagicMock()
     updated_instance.uuid = instance_uuid
 
-    mock_repository.find_by_uuid.return_value = mock_instance
+    mock_repository.find_by_uuid_with_relations.return_value = mock_instance
     mock_repository.update.return_value = updated_instance
 
     result = instance_service.update_instance(instance_uuid, dto)
@@ -473,14 +492,88 @@ def test_update_instance_partial(instance_service, mock_repository):
 
 def test_get_instances(instance_service, mock_repository):
     """Test getting all instances."""
-    mock_instance1 = MagicMock()
-    mock_instance1.uuid = uuid4()
-    mock_instance2 = MagicMock()
-    mock_instance2.uuid = uuid4()
+    from datetime import datetime
+    from types import SimpleNamespace
+
+    def make_instance():
+        return SimpleNamespace(
+            uuid=uuid4(),
+            image="nginx",
+            version="1.0.0",
+            enabled=True,
+            application=SimpleNamespace(
+                uuid=uuid4(),
+                name="app",
+                repository=None,
+                enabled=True,
+                created_at=datetime(2024, 1, 1),
+                updated_at=datetime(2024, 1, 1),
+            ),
+            environment=SimpleNamespace(uuid=uuid4(), name="prod"),
+            components=[],
+            created_at=datetime(2024, 1, 1),
+            updated_at=datetime(2024, 1, 1),
+        )
+
+    mock_instance1 = make_instance()
+    mock_instance2 = make_instance()
 
     mock_repository.find_all.return_value = [mock_instance1, mock_instance2]
 
     result = instance_service.get_instances(skip=0, limit=10)
 
     assert len(result) == 2
-    mock_repository.find_all.assert_called_once_with(skip=0, limit=10, load_components=True)
+    assert [i.uuid for i in result] == [mock_instance1.uuid, mock_instance2.uuid]
+    mock_repository.find_all.assert_called_once_with(skip=0, limit=10, load_components=True, cursor=None)
+
+
+def test_get_instances_strips_secrets_without_touching_the_rows(
+    instance_service, mock_repository
+):
+    """Secrets are masked in the DTOs while the loaded rows keep their values."""
+    from datetime import datetime
+    from types import SimpleNamespace
+
+    settings = {
+        "envs": [{"key": "PORT", "value": "8080"}],
+        "secrets": [{"key": "TOKEN", "value": "v2:stored"}],
+    }
+    component = SimpleNamespace(
+        uuid=uuid4(),
+        name="api",
+        type="webapp",
+        url=None,
+        enabled=True,
+        settings=settings,
+        created_at=datetime(2024, 1, 1),
+        updated_at=datetime(2024, 1, 1),
+    )
+    instance = SimpleNamespace(
+        uuid=uuid4(),
+        image="nginx",
+        version="1.0.0",
+        enabled=True,
+        application=SimpleNamespace(
+            uuid=uuid4(),
+            name="app",
+            repository=None,
+            enabled=True,
+            created_at=datetime(2024, 1, 1),
+            updated_at=datetime(2024, 1, 1),
+        ),
+        environment=SimpleNamespace(uuid=uuid4(), name="prod"),
+        components=[component],
+        created_at=datetime(2024, 1, 1),
+        updated_at=datetime(2024, 1, 1),
+    )
+    mock_repository.find_all.return_value = [instance]
+
+    result = instance_service.get_instances()
+
+    dto_settings = result[0].components[0].settings
+    assert dto_settings["secrets"] == [{"key": "TOKEN", "value": "********"}]
+    assert dto_settings["envs"] == settings["envs"]
+    assert component.settings is settings
+    assert settings["secrets"] == [{"key": "TOKEN", "value": "v2:stored"}]
+    assert isinstance(component.created_at, datetime)
+    assert isinstance(instance.application.created_at, datetime)
@@ -0,0 +1,158 @@
+"""Tests for the batched secrets re-encryption job."""
+import pytest
+from cryptography.fernet import Fernet
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.shared.crypto import decrypt_many, encrypt_secret
+from app.shared.crypto.key_rotation import (
+    components,
+    reencrypt_component_secrets,
+    verify_component_secrets,
+)
+from app.shared.database.database import Base
+from app.webapps.infra.application_component_model import WebappType
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    yield engine
+    Base.metadata.drop_all(bind=engine)
+
+
+@pytest.fixture
+def session_factory(engine):
+    return sessionmaker(bind=engine)
+
+
+@pytest.fixture
+def old_key(monkeypatch):
+    key = Fernet.generate_key().decode()
+    monkeypatch.setenv("TRON_SECRETS_KEY", key)
+    monkeypatch.delenv("TRON_SECRETS_KEYS", raising=False)
+    return key
+
+
+@pytest.fixture
+def new_key(monkeypatch, old_key):
+    key = Fernet.generate_key().decode()
+    monkeypatch.setenv("TRON_SECRETS_KEYS", f"{key},{old_key}")
+    return key
+
+
+def add_components(engine, settings_list):
+    with engine.begin() as connection:
+        for i, settings in enumerate(settings_list):
+            connection.execute(
+                insert(components).values(
+                    instance_id=1,
+                    name=f"component-{i}",
+                    type=WebappType.webapp,
+                    settings=settings,
+                )
+            )
+
+
+def stored_values(engine):
+    with engine.connect() as connection:
+        rows = connection.execute(
+            select(components.c.settings).order_by(components.c.id)
+        )
+        return [
+            [secret["value"] for secret in (settings or {}).get("secrets", [])]
+            for (settings,) in rows
+        ]
+
+
+def with_secrets(*values):
+    return {
+        "cpu": 1,
+        "secrets": [{"key": f"K{i}", "value": v} for i, v in enumerate(values)],
+    }
+
+
+def test_reencrypts_every_component_in_batches(
+    engine, session_factory, monkeypatch, old_key, new_key
+):
+    monkeypatch.setenv("TRON_SECRETS_KEYS", old_key)
+    add_components(
+        engine,
+        [with_secrets(encrypt_secret(f"v{i}"), encrypt_secret("x")) for i in range(5)]
+        + [{"cpu": 1}, None],
+    )
+    monkeypatch.setenv("TRON_SECRETS_KEYS", f"{new_key},{old_key}")
+    batches = []
+
+    progress = reencrypt_component_secrets(
+        session_factory, batch_size=2, on_batch=lambda p: batches.append(p.last_id)
+    )
+
+    assert (progress.total, progress.processed, progress.updated) == (7, 7, 5)
+    assert progress.failed == 0
+    assert batches == [2, 4, 6, 7]
+
+    monkeypatch.setenv("TRON_SECRETS_KEYS", new_key)
+    values = stored_values(engine)
+    assert [decrypt_many(v) for v in values[:5]] == [[f"v{i}", "x"] for i in range(5)]
+    assert values[5:] == [[], []]
+
+
+def test_resumes_after_the_given_id(
+    engine, session_factory, monkeypatch, old_key, new_key
+):
+    monkeypatch.setenv("TRON_SECRETS_KEYS", old_key)
+    skipped = encrypt_secret("skipped")
+    add_components(engine, [with_secrets(skipped), with_secrets(encrypt_secret("a"))])
+    monkeypatch.setenv("TRON_SECRETS_KEYS", f"{new_key},{old_key}")
+
+    progress = reencrypt_component_secrets(session_factory, after_id=1)
+
+    assert (progress.total, progress.processed, progress.last_id) == (1, 1, 2)
+    first, second = stored_values(engine)
+    assert first == [skipped]
+    monkeypatch.setenv("TRON_SECRETS_KEYS", new_key)
+    assert decrypt_many(second) == ["a"]
+
+
+def test_keeps_values_no_key_can_read_and_counts_them(
+    engine, session_factory, monkeypatch, old_key, new_key
+):
+    foreign = "v2:" + Fernet(Fernet.generate_key()).encrypt(b"x").decode()
+    monkeypatch.setenv("TRON_SECRETS_KEYS", old_key)
+    add_components(engine, [with_secrets(foreign, encrypt_secret("ok"))])
+    monkeypatch.setenv("TRON_SECRETS_KEYS", f"{new_key},{old_key}")
+
+    progress = reencrypt_component_secrets(session_factory)
+
+    assert progress.failed == 1
+    foreign_after, rotated = stored_values(engine)[0]
+    assert foreign_after == foreign
+    monkeypatch.setenv("TRON_SECRETS_KEYS", new_key)
+    assert decrypt_many([rotated]) == ["ok"]
+
+
+def test_verify_counts_components_left_on_the_old_key(
+    engine, session_factory, monkeypatch, old_key, new_key
+):
+    monkeypatch.setenv("TRON_SECRETS_KEYS", old_key)
+    add_components(engine, [with_secrets(encrypt_secret("a"))])
+    monkeypatch.setenv("TRON_SECRETS_KEYS", f"{new_key},{old_key}")
+    add_components(engine, [with_secrets(encrypt_secret("b")), {"cpu": 1}])
+
+    progress = verify_component_secrets(session_factory, batch_size=2)
+
+    assert (progress.total, progress.processed, progress.failed) == (3, 3, 1)
+    assert progress.updated == 0
+    before = stored_values(engine)
+
+    reencrypt_component_secrets(session_factory)
+
+    assert verify_component_secrets(session_factory).failed == 0
+    assert stored_values(engine) != before
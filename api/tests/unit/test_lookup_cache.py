@@ -0,0 +1,115 @@
+"""Tests for the request-scoped lookup cache."""
+import pytest
+from uuid import uuid4
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.shared.database.database import Base
+from app.environments.infra.environment_model import Environment
+from app.environments.infra.environment_repository import EnvironmentRepository
+from app.applications.infra.application_model import Application
+from app.instances.infra.instance_model import Instance
+from app.instances.infra.instance_repository import InstanceRepository
+from app.webapps.infra.webapp_repository import WebappRepository
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    yield engine
+    Base.metadata.drop_all(bind=engine)
+
+
+@pytest.fixture
+def db(engine):
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def statements(engine):
+    executed = []
+
+    def count(conn, cursor, statement, parameters, context, executemany):
+        executed.append(statement)
+
+    event.listen(engine, "before_cursor_execute", count)
+    yield executed
+    event.remove(engine, "before_cursor_execute", count)
+
+
+@pytest.fixture
+def environment_uuid(db):
+    uuid = uuid4()
+    db.add(Environment(uuid=uuid, name="prod"))
+    db.commit()
+    return uuid
+
+
+def test_repeated_lookups_run_one_query(db, environment_uuid, statements):
+    repository = EnvironmentRepository(db)
+
+    first = repository.find_by_uuid(environment_uuid)
+    second = repository.find_by_uuid(environment_uuid)
+
+    assert first is second
+    assert len(statements) == 1
+
+
+def test_misses_are_not_cached(db, statements):
+    repository = EnvironmentRepository(db)
+    uuid = uuid4()
+
+    assert repository.find_by_uuid(uuid) is None
+    db.add(Environment(uuid=uuid, name="staging"))
+    db.flush()
+
+    assert repository.find_by_uuid(uuid) is not None
+
+
+def test_cache_is_dropped_when_the_transaction_ends(db, environment_uuid, statements):
+    repository = EnvironmentRepository(db)
+    repository.find_by_uuid(environment_uuid)
+
+    db.commit()
+    repository.find_by_uuid(environment_uuid)
+
+    assert sum("FROM environments" in s for s in statements) == 2
+
+
+def test_deleted_entities_are_evicted(db, environment_uuid):
+    repository = EnvironmentRepository(db)
+    db.delete(repository.find_by_uuid(environment_uuid))
+    db.flush()
+
+    assert repository.find_by_uuid(environment_uuid) is None
+
+
+def test_lookups_loading_different_graphs_are_cached_apart(db, environment_uuid):
+    """Deploying a component skips the instance components; deleting it needs them."""
+    application = Application(name="api")
+    db.add(application)
+    db.flush()
+    instance = Instance(
+        application_id=application.id,
+        environment_id=EnvironmentRepository(db).find_by_uuid(environment_uuid).id,
+        image="nginx",
+        version="1",
+    )
+    db.add(instance)
+    db.commit()
+    uuid = instance.uuid
+    db.expunge_all()
+
+    without_components = WebappRepository(db).find_instance_by_uuid(uuid)
+    assert "components" not in without_components.__dict__
+
+    for_deploy = InstanceRepository(db).find_by_uuid_for_deploy(uuid)
+    assert "components" in for_deploy.__dict__
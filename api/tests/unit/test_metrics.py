@@ -0,0 +1,124 @@
+"""Tests for the Prometheus metrics and their hooks."""
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from kubernetes import client as k8s
+from kubernetes.client.rest import ApiException
+from prometheus_client import REGISTRY
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import QueuePool
+
+from app.k8s.client import InstrumentedApiClient, describe_api_call
+from app.shared.observability.metrics import (
+    MetricsMiddleware,
+    instrument_engine,
+    metrics_endpoint,
+    observe_deploy,
+)
+
+
+def sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+@pytest.mark.parametrize(
+    "method,path,expected",
+    [
+        ("GET", "/api/v1/namespaces", ("list", "namespaces")),
+        ("GET", "/api/v1/namespaces/{name}", ("get", "namespaces")),
+        ("GET", "/api/v1/namespaces/{namespace}/pods", ("list", "pods")),
+        ("GET", "/api/v1/namespaces/{namespace}/pods/{name}/log", ("get", "pods/log")),
+        (
+            "PUT",
+            "/apis/apps/v1/namespaces/{namespace}/deployments/{name}",
+            ("replace", "deployments"),
+        ),
+        (
+            "DELETE",
+            "/apis/gateway.networking.k8s.io/v1/namespaces/team-a/httproutes/web",
+            ("delete", "httproutes"),
+        ),
+        ("POST", "/apis/batch/v1/namespaces/{namespace}/jobs", ("create", "jobs")),
+        ("GET", "/apis/gateway.networking.k8s.io", ("get", "discovery")),
+    ],
+)
+def test_describe_api_call(method, path, expected):
+    assert describe_api_call(method, path) == expected
+
+
+def test_api_client_records_latency_and_errors(monkeypatch):
+    def fail(self, resource_path, method, *args, **kwargs):
+        raise ApiException(status=404)
+
+    monkeypatch.setattr(k8s.ApiClient, "call_api", fail)
+    api_client = InstrumentedApiClient(k8s.Configuration(), cluster="k8s.test:6443")
+    labels = {"cluster": "k8s.test:6443", "verb": "get", "kind": "namespaces"}
+    calls = sample("tron_k8s_api_request_duration_seconds_count", **labels)
+    errors = sample("tron_k8s_api_errors_total", code="404", **labels)
+
+    with pytest.raises(ApiException):
+        k8s.CoreV1Api(api_client).read_namespace("team-a")
+
+    assert sample("tron_k8s_api_request_duration_seconds_count", **labels) == calls + 1
+    assert sample("tron_k8s_api_errors_total", code="404", **labels) == errors + 1
+
+
+def test_middleware_labels_requests_with_the_route_template():
+    app = FastAPI()
+    app.add_middleware(MetricsMiddleware)
+    app.add_route("/metrics", metrics_endpoint)
+
+    @app.get("/items/{item_id}")
+    def get_item(item_id: int):
+        return {"id": item_id}
+
+    client = TestClient(app)
+    labels = {"method": "GET", "route": "/items/{item_id}", "status": "200"}
+    before = sample("tron_http_request_duration_seconds_count", **labels)
+
+    client.get("/items/1")
+    client.get("/items/2")
+    client.get("/nowhere")
+
+    assert sample("tron_http_request_duration_seconds_count", **labels) == before + 2
+    assert sample(
+        "tron_http_request_duration_seconds_count",
+        method="GET",
+        route="<unmatched>",
+        status="404",
+    )
+    assert sample("tron_http_requests_in_progress", method="GET") == 0
+    body = client.get("/metrics").text
+    assert 'route="/items/{item_id}"' in body
+    assert "tron_threadpool_size" in body
+
+
+def test_engine_records_queries_and_pool_occupancy():
+    engine = create_engine("sqlite://", poolclass=QueuePool, pool_size=2)
+    instrument_engine(engine, database="unit-test")
+    labels = {"database": "unit-test", "operation": "SELECT"}
+
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+        connection.execute(text("SELECT 2"))
+        assert sample("tron_db_pool_checked_out", database="unit-test") == 1
+        with pytest.raises(Exception):
+            connection.execute(text("SELECT * FROM missing"))
+
+    assert sample("tron_db_query_duration_seconds_count", **labels) == 2
+    assert sample("tron_db_pool_checked_out", database="unit-test") == 0
+    assert sample("tron_db_pool_size", database="unit-test") == 2
+
+
+def test_observe_deploy_labels_the_outcome():
+    success = sample("tron_deploy_duration_seconds_count", component_type="cron", outcome="success")
+    failure = sample("tron_deploy_duration_seconds_count", component_type="cron", outcome="failure")
+
+    with observe_deploy("cron"):
+        pass
+    with pytest.raises(RuntimeError):
+        with observe_deploy("cron"):
+            raise RuntimeError("apply failed")
+
+    assert sample("tron_deploy_duration_seconds_count", component_type="cron", outcome="success") == success + 1
+    assert sample("tron_deploy_duration_seconds_count", component_type="cron", outcome="failure") == failure + 1
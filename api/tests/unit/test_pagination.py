@@ -0,0 +1,125 @@
+"""Tests for keyset pagination helpers."""
+import pytest
+from datetime import datetime, timedelta
+from uuid import uuid4
+from sqlalchemy import create_engine, Column, DateTime, Integer, String, Uuid
+from sqlalchemy.orm import declarative_base, sessionmaker
+
+from app.shared.utils.pagination import (
+    CursorPage,
+    InvalidCursorError,
+    decode_cursor,
+    encode_cursor,
+    map_page,
+    paginate,
+)
+
+PaginationBase = declarative_base()
+
+
+class Row(PaginationBase):
+    __tablename__ = "rows"
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String)
+    created_at = Column(DateTime, nullable=False)
+
+
+@pytest.fixture
+def session():
+    """Create an in-memory database with rows sharing some created_at values."""
+    engine = create_engine("sqlite:///:memory:")
+    PaginationBase.metadata.create_all(engine)
+    db = sessionmaker(bind=engine)()
+    start = datetime(2024, 1, 1)
+    for i in range(1, 8):
+        # Pairs of rows share a timestamp so the id tie-breaker matters
+        db.add(Row(id=i, name=f"row-{i}", created_at=start + timedelta(minutes=i // 2)))
+    db.commit()
+    yield db
+    db.close()
+
+
+def walk(db, descending=False, limit=3):
+    names, cursor = [], None
+    while True:
+        page = paginate(
+            db.query(Row),
+            [Row.created_at, Row.id],
+            limit=limit,
+            cursor=cursor,
+            descending=descending,
+        )
+        names.extend(r.name for r in page)
+        cursor = page.next_cursor
+        if not cursor:
+            return names
+
+
+def test_cursor_roundtrip():
+    """Test cursors decode back to the encoded values."""
+    created_at = datetime(2024, 5, 1, 12, 30, 15, 123456)
+    cursor = encode_cursor([created_at, 42])
+
+    assert decode_cursor(cursor, [Row.created_at, Row.id]) == [created_at, 42]
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "not-a-cursor",
+        encode_cursor([1]),
+        "e30",
+        # Tampered values that would otherwise reach the database
+        encode_cursor(["2024-01-01T00:00:00", "abc"]),
+        encode_cursor(["2024-01-01T00:00:00", 1.5]),
+        encode_cursor(["2024-01-01T00:00:00", True]),
+        encode_cursor([5, 1]),
+    ],
+)
+def test_decode_cursor_invalid(cursor):
+    """Test malformed cursors raise InvalidCursorError."""
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(cursor, [Row.created_at, Row.id])
+
+
+def test_decode_cursor_converts_uuid_and_string_columns():
+    """Test values are checked against the Python type of each column."""
+    uuid_column = Column("uuid", Uuid())
+    value = uuid4()
+
+    assert decode_cursor(encode_cursor([value, "b"]), [uuid_column, Row.name]) == [
+        value,
+        "b",
+    ]
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(encode_cursor(["not-a-uuid", "b"]), [uuid_column, Row.name])
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(encode_cursor([str(value), 7]), [uuid_column, Row.name])
+
+
+def test_paginate_walks_all_rows_ascending(session):
+    """Test keyset pages cover every row exactly once in (created_at, id) order."""
+    assert walk(session) == [f"row-{i}" for i in range(1, 8)]
+
+
+def test_paginate_walks_all_rows_descending(session):
+    """Test descending keyset pages."""
+    assert walk(session, descending=True) == [f"row-{i}" for i in range(7, 0, -1)]
+
+
+def test_paginate_offset_is_kept(session):
+    """Test skip still works when no cursor is given."""
+    page = paginate(session.query(Row), [Row.created_at, Row.id], skip=5, limit=3)
+
+    assert [r.name for r in page] == ["row-6", "row-7"]
+    assert page.next_cursor is None
+
+
+def test_map_page_keeps_cursor():
+    """Test serializing a page keeps its cursor, and plain lists are accepted."""
+    page = map_page(CursorPage([1, 2], "abc"), lambda x: x * 10)
+    assert page == [10, 20]
+    assert page.next_cursor == "abc"
+
+    assert map_page([1], str).next_cursor is None
@@ -0,0 +1,98 @@
+"""Tests for the sampling profiler, its store and rate limits."""
+import os
+import threading
+import time
+
+import pytest
+
+from app.profiling.core.profiling_service import (
+    ProfilingRateLimitedError,
+    ProfilingService,
+)
+from app.profiling.core.sampler import SamplingProfiler
+from app.profiling.infra.profile_store import ProfileStore
+
+
+def busy_for(seconds):
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+
+def test_sampler_records_the_busy_thread_in_speedscope_format():
+    profiler = SamplingProfiler(interval=0.001, max_duration=5)
+    worker = threading.Thread(target=busy_for, args=(0.1,), name="busy-worker")
+
+    profiler.start()
+    worker.start()
+    worker.join()
+    profiler.stop()
+
+    document = profiler.to_speedscope("GET /slow")
+    frames = [frame["name"] for frame in document["shared"]["frames"]]
+    [profile] = [p for p in document["profiles"] if "busy-worker" in p["name"]]
+    assert "busy_for" in frames
+    assert profile["samples"]
+    assert len(profile["weights"]) == len(profile["samples"])
+    leaves = [frames[stack[-1]] for stack in profile["samples"]]
+    assert leaves.count("busy_for") > len(leaves) / 2
+
+
+def test_sampler_stops_at_the_maximum_duration():
+    profiler = SamplingProfiler(interval=0.001, max_duration=0.02)
+
+    profiler.start()
+    busy_for(0.1)
+    profiler.stop()
+
+    assert profiler.truncated
+    assert profiler.duration < 0.1
+
+
+def test_store_keeps_only_the_newest_profiles(tmp_path):
+    store = ProfileStore(str(tmp_path), max_profiles=2)
+
+    for n in range(3):
+        store.save(f"{n:032x}", {"name": f"GET /{n}"})
+        os.utime(tmp_path / f"{n:032x}.speedscope.json", (n, n))
+
+    assert [p["name"] for p in store.list()] == ["GET /2", "GET /1"]
+    assert store.path_for(f"{0:032x}") is None
+    assert store.path_for("../secrets") is None
+
+
+def test_service_allows_one_profile_at_a_time_and_a_budget_per_minute(tmp_path):
+    service = ProfilingService(
+        ProfileStore(str(tmp_path), max_profiles=5), interval=0.001, max_per_minute=2
+    )
+
+    first = service.start()
+    with pytest.raises(ProfilingRateLimitedError):
+        service.start()
+    service.finish(first, "GET /a")
+    service.finish(service.start(), "GET /b")
+
+    with pytest.raises(ProfilingRateLimitedError) as exc_info:
+        service.start()
+    assert exc_info.value.retry_after > 1
+    assert {p["name"] for p in service.list_profiles()} == {"GET /a", "GET /b"}
+
+
+def test_limits_are_shared_by_services_on_the_same_directory(tmp_path):
+    """Workers are separate processes; each builds its own service on PROFILER_DIR."""
+    workers = [
+        ProfilingService(
+            ProfileStore(str(tmp_path), max_profiles=5), interval=0.001, max_per_minute=2
+        )
+        for _ in range(2)
+    ]
+
+    first = workers[0].start()
+    with pytest.raises(ProfilingRateLimitedError):
+        workers[1].start()
+    workers[0].finish(first, "GET /a")
+    workers[1].finish(workers[1].start(), "GET /b")
+
+    with pytest.raises(ProfilingRateLimitedError) as exc_info:
+        workers[0].start()
+    assert exc_info.value.retry_after > 1
@@ -0,0 +1,192 @@
+"""Tests for read-replica routing."""
+import asyncio
+import time
+import pytest
+from unittest.mock import MagicMock, patch
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.shared.database import replica
+from app.shared.database.replica import (
+    LAST_WRITE_COOKIE,
+    LAST_WRITE_HEADER,
+    ReadYourWritesMiddleware,
+    ReplicaRouter,
+    get_read_db,
+    get_replica_hosts,
+)
+
+
+def make_router(lags, **kwargs):
+    """Build a router over fake engines whose lag is taken from `lags`."""
+    engines = [MagicMock(name=f"replica-{i}") for i in range(len(lags))]
+    router = ReplicaRouter(engines, **kwargs)
+    lag_by_engine = {id(e): lag for e, lag in zip(engines, lags)}
+    router._measure_lag = MagicMock(side_effect=lambda e: lag_by_engine[id(e)])
+    router.refresh_lag()
+    return router, engines
+
+
+def make_request(headers=None, cookies=None):
+    request = MagicMock()
+    request.headers = headers or {}
+    request.cookies = cookies or {}
+    return request
+
+
+def test_get_replica_hosts(monkeypatch):
+    """Test replica hosts are parsed from DB_READ_HOSTS, then DB_READ_HOST."""
+    monkeypatch.delenv("DB_READ_HOSTS", raising=False)
+    monkeypatch.delenv("DB_READ_HOST", raising=False)
+    assert get_replica_hosts() == []
+
+    monkeypatch.setenv("DB_READ_HOST", "replica-a")
+    assert get_replica_hosts() == ["replica-a"]
+
+    monkeypatch.setenv("DB_READ_HOSTS", "replica-a, replica-b,")
+    assert get_replica_hosts() == ["replica-a", "replica-b"]
+
+
+def test_choose_engine_without_replicas():
+    """Test no replicas means primary."""
+    router = ReplicaRouter([])
+    assert router.choose_engine() is None
+
+
+def test_choose_engine_round_robin():
+    """Test healthy replicas are used in turn."""
+    router, engines = make_router([0, 0])
+
+    assert router.choose_engine() is engines[0]
+    assert router.choose_engine() is engines[1]
+    assert router.choose_engine() is engines[0]
+
+
+def test_choose_engine_skips_lagging_and_unreachable():
+    """Test lagging or unreachable replicas are skipped."""
+    router, engines = make_router([30.0, None, 1.0], max_lag_seconds=10)
+
+    assert router.choose_engine() is engines[2]
+    assert router.choose_engine() is engines[2]
+
+
+def test_choose_engine_falls_back_to_primary_when_all_lag():
+    """Test primary is used when every replica is behind."""
+    router, _ = make_router([30.0, 60.0], max_lag_seconds=10)
+    assert router.choose_engine() is None
+
+
+def test_choose_engine_only_reads_cached_lag():
+    """Test requests never measure lag themselves."""
+    router, engines = make_router([0], lag_check_interval=60)
+
+    router.choose_engine()
+    router.choose_engine()
+
+    assert router._measure_lag.call_count == 1
+
+
+def test_replicas_are_skipped_until_lag_is_measured():
+    """Test a router whose lag was never measured uses the primary."""
+    engines = [MagicMock(name="replica-0")]
+    router = ReplicaRouter(engines)
+    router._measure_lag = MagicMock(return_value=0)
+
+    assert router.choose_engine() is None
+    router._measure_lag.assert_not_called()
+
+
+def test_stale_lag_counts_as_unreachable():
+    """Test replicas are skipped once the lag task stops reporting."""
+    router, engines = make_router([0], lag_check_interval=0.01)
+    assert router.choose_engine() is engines[0]
+
+    time.sleep(0.05)
+
+    assert router.choose_engine() is None
+
+
+def test_background_task_refreshes_lag():
+    """Test the lag task keeps measuring every check interval."""
+    router, _ = make_router([0], lag_check_interval=0.01)
+
+    async def run():
+        router.start()
+        await asyncio.sleep(0.1)
+        await router.stop()
+
+    asyncio.run(run())
+
+    assert router._measure_lag.call_count > 2
+
+
+def test_replica_engines_have_a_connect_timeout(monkeypatch):
+    """Test an unreachable replica fails fast instead of hanging the lag check."""
+    created = []
+    monkeypatch.setenv("ENV", "production")
+    monkeypatch.setenv("DB_READ_HOSTS", "replica-a")
+    monkeypatch.setenv("DB_REPLICA_CONNECT_TIMEOUT_SECONDS", "3")
+    monkeypatch.setattr(
+        replica,
+        "create_engine",
+        lambda url, **kwargs: created.append(kwargs) or MagicMock(),
+    )
+    monkeypatch.setattr(replica, "instrument_engine", MagicMock())
+
+    replica._build_router()
+
+    assert created[0]["connect_args"]["connect_timeout"] == 3
+
+
+def test_get_read_db_uses_primary_after_recent_write():
+    """Test read-your-writes stickiness keeps the client on the primary."""
+    router, _ = make_router([0])
+    router.choose_engine = MagicMock()
+    primary = MagicMock()
+    request = make_request(headers={LAST_WRITE_HEADER: str(time.time())})
+
+    with patch.object(replica, "get_replica_router", return_value=router):
+        generator = get_read_db(request, primary)
+        assert next(generator) is primary
+
+    router.choose_engine.assert_not_called()
+
+
+def test_get_read_db_uses_replica_when_write_is_old():
+    """Test clients go back to replicas once the sticky window has passed."""
+    router, engines = make_router([0])
+    replica_session = MagicMock()
+    router.session_for = MagicMock(return_value=replica_session)
+    primary = MagicMock()
+    request = make_request(cookies={LAST_WRITE_COOKIE: str(time.time() - 3600)})
+
+    with patch.object(replica, "get_replica_router", return_value=router):
+        generator = get_read_db(request, primary)
+        assert next(generator) is replica_session
+        with pytest.raises(StopIteration):
+            next(generator)
+
+    router.session_for.assert_called_once_with(engines[0])
+    replica_session.close.assert_called_once()
+
+
+def test_read_your_writes_middleware_marks_writes_only():
+    """Test the last-write marker is set on successful writes only."""
+    app = FastAPI()
+    app.add_middleware(ReadYourWritesMiddleware)
+
+    @app.get("/items")
+    def list_items():
+        return []
+
+    @app.post("/items")
+    def create_item():
+        return {}
+
+    client = TestClient(app)
+
+    assert LAST_WRITE_HEADER not in client.get("/items").headers
+
+    response = client.post("/items")
+    assert LAST_WRITE_HEADER in response.headers
+    assert LAST_WRITE_COOKIE in response.cookies
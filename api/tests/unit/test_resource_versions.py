@@ -0,0 +1,92 @@
+"""Tests for resource version counters and ETag helpers."""
+import pytest
+from unittest.mock import MagicMock
+from uuid import uuid4
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.shared.database.database import Base
+from app.shared.database.resource_versions import (
+    _changed_tables,
+    get_resource_versions,
+)
+from app.shared.utils.etag import etag_matches, make_etag
+from app.environments.infra.environment_model import Environment
+from app.applications.infra.application_model import Application
+
+
+@pytest.fixture
+def db():
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+    Base.metadata.drop_all(bind=engine)
+
+
+def make_request(if_none_match=None):
+    request = MagicMock()
+    request.headers = {"if-none-match": if_none_match} if if_none_match else {}
+    return request
+
+
+def test_versions_bump_on_changes_to_tracked_tables(db):
+    """Test inserts and real updates bump the version, no-op flushes don't."""
+    assert get_resource_versions(db, ["environments"]) == {"environments": 0}
+
+    environment = Environment(uuid=uuid4(), name="prod")
+    db.add(environment)
+    db.commit()
+    assert get_resource_versions(db, ["environments"]) == {"environments": 1}
+
+    environment.name = "production"
+    db.commit()
+    assert get_resource_versions(db, ["environments"]) == {"environments": 2}
+
+    # Checked before flushing: the integration conftest registers a global
+    # before_flush hook that touches updated_at on every dirty object
+    db.refresh(environment)
+    environment.name = "production"
+    assert _changed_tables(db) == set()
+
+
+def test_untracked_tables_are_not_versioned(db):
+    db.add(Application(uuid=uuid4(), name="app"))
+    db.commit()
+
+    assert get_resource_versions(db, ["applications"]) == {"applications": 0}
+
+
+def test_rolled_back_changes_keep_the_version(db):
+    db.add(Environment(uuid=uuid4(), name="prod"))
+    db.flush()
+    db.rollback()
+
+    assert get_resource_versions(db, ["environments"]) == {"environments": 0}
+
+
+def test_make_etag():
+    assert make_etag(b"payload").startswith('"')
+    assert make_etag(b"payload", weak=True) == "W/" + make_etag(b"payload")
+    assert make_etag(b"payload") != make_etag(b"other")
+
+
+@pytest.mark.parametrize(
+    "header,expected",
+    [
+        (None, False),
+        ('"abc"', True),
+        ('W/"abc"', True),
+        ('"other", W/"abc"', True),
+        ('"other"', False),
+        ("*", True),
+    ],
+)
+def test_etag_matches_uses_weak_comparison(header, expected):
+    assert etag_matches(make_request(header), 'W/"abc"') is expected
@@ -0,0 +1,148 @@
+"""Tests for secret encryption and its storage format."""
+import base64
+
+import pytest
+from cryptography.fernet import Fernet, InvalidToken
+
+from app.shared.crypto import (
+    decrypt_many,
+    decrypt_secret,
+    encrypt_many,
+    encrypt_secret,
+    encrypt_secrets_in_settings,
+    merge_secrets_for_update,
+    on_newest_key_many,
+    rotate_many,
+    strip_secrets_from_settings,
+)
+from app.shared.crypto.secrets_crypto import FORMAT_PREFIX, _get_fernet
+
+
+@pytest.fixture(autouse=True)
+def secrets_key(monkeypatch):
+    key = Fernet.generate_key().decode()
+    monkeypatch.setenv("TRON_SECRETS_KEY", key)
+    monkeypatch.delenv("TRON_SECRETS_KEYS", raising=False)
+    return key
+
+
+def test_round_trip():
+    ciphertext = encrypt_secret("hunter2")
+
+    assert ciphertext.startswith(FORMAT_PREFIX)
+    assert decrypt_secret(ciphertext) == "hunter2"
+
+
+def test_reads_legacy_double_encoded_values(secrets_key):
+    token = Fernet(secrets_key.encode()).encrypt(b"hunter2")
+    legacy = base64.urlsafe_b64encode(token).decode()
+
+    assert decrypt_secret(legacy) == "hunter2"
+    assert len(encrypt_secret("hunter2")) < len(legacy)
+
+
+def test_cipher_is_reused_until_the_key_changes(monkeypatch):
+    fernet = _get_fernet()
+    assert _get_fernet() is fernet
+
+    monkeypatch.setenv("TRON_SECRETS_KEY", Fernet.generate_key().decode())
+    assert _get_fernet() is not fernet
+
+
+def test_empty_values_stay_empty():
+    assert encrypt_many(["", "a"])[0] == ""
+    assert decrypt_many(["", encrypt_secret("a")]) == ["", "a"]
+
+
+def test_decrypt_many_strict_raises_on_foreign_values():
+    foreign = FORMAT_PREFIX + Fernet(Fernet.generate_key()).encrypt(b"x").decode()
+
+    with pytest.raises(InvalidToken):
+        decrypt_many([foreign])
+
+
+def test_decrypt_many_lenient_returns_none_for_bad_values():
+    values = [encrypt_secret("a"), "not-a-token", encrypt_secret("b")]
+
+    assert decrypt_many(values, strict=False) == ["a", None, "b"]
+
+
+def test_encrypt_secrets_in_settings_keeps_order_and_keys():
+    secrets = [{"key": f"K{i}", "value": f"v{i}"} for i in range(3)]
+    settings = {"cpu": 1, "secrets": secrets}
+
+    encrypted = encrypt_secrets_in_settings(settings)
+
+    assert [s["key"] for s in encrypted["secrets"]] == ["K0", "K1", "K2"]
+    assert decrypt_many(s["value"] for s in encrypted["secrets"]) == ["v0", "v1", "v2"]
+    assert settings["secrets"][0]["value"] == "v0"
+
+
+def test_merge_secrets_keeps_placeholders_and_encrypts_new_values():
+    existing = [{"key": "KEEP", "value": encrypt_secret("old")}]
+    merged = merge_secrets_for_update(
+        [{"key": "KEEP", "value": "********"}, {"key": "NEW", "value": "new"}],
+        existing,
+    )
+
+    assert merged[0]["key"] == "KEEP"
+    assert decrypt_secret(merged[0]["value"]) == "old"
+    assert merged[1]["key"] == "NEW"
+    assert decrypt_secret(merged[1]["value"]) == "new"
+
+
+def test_strip_secrets_masks_values_and_leaves_the_input_alone():
+    envs = [{"key": "PORT", "value": "8080"}]
+    settings = {"envs": envs, "secrets": [{"key": "TOKEN", "value": "v2:stored"}]}
+
+    stripped = strip_secrets_from_settings(settings)
+
+    assert stripped["secrets"] == [{"key": "TOKEN", "value": "********"}]
+    assert stripped["envs"] is envs
+    assert settings["secrets"][0]["value"] == "v2:stored"
+    assert strip_secrets_from_settings({"cpu": 1}) == {"cpu": 1}
+
+
+def test_multiple_keys_encrypt_with_the_first_and_decrypt_with_any(
+    monkeypatch, secrets_key
+):
+    old_value = encrypt_secret("old")
+    new_key = Fernet.generate_key().decode()
+    monkeypatch.setenv("TRON_SECRETS_KEYS", f"{new_key}, {secrets_key}")
+
+    new_value = encrypt_secret("new")
+
+    assert decrypt_many([old_value, new_value]) == ["old", "new"]
+    token = new_value[len(FORMAT_PREFIX) :].encode()
+    assert Fernet(new_key.encode()).decrypt(token) == b"new"
+
+
+def test_rotate_many_moves_values_to_the_newest_key(monkeypatch, secrets_key):
+    legacy = base64.urlsafe_b64encode(
+        Fernet(secrets_key.encode()).encrypt(b"a")
+    ).decode()
+    values = [encrypt_secret("b"), legacy, ""]
+    new_key = Fernet.generate_key().decode()
+    monkeypatch.setenv("TRON_SECRETS_KEYS", f"{new_key},{secrets_key}")
+
+    rotated = rotate_many(values)
+
+    monkeypatch.setenv("TRON_SECRETS_KEYS", new_key)
+    assert decrypt_many(rotated) == ["b", "a", ""]
+    assert all(value.startswith(FORMAT_PREFIX) for value in rotated[:2])
+
+
+def test_merge_secrets_moves_kept_values_to_the_newest_key(monkeypatch, secrets_key):
+    """An update doesn't write back ciphertext of a key that is being retired."""
+    existing = [{"key": "KEEP", "value": encrypt_secret("old")}]
+    new_key = Fernet.generate_key().decode()
+    monkeypatch.setenv("TRON_SECRETS_KEYS", f"{new_key},{secrets_key}")
+
+    merged = merge_secrets_for_update([{"key": "KEEP", "value": "********"}], existing)
+
+    assert on_newest_key_many([existing[0]["value"], merged[0]["value"]]) == [
+        False,
+        True,
+    ]
+    monkeypatch.setenv("TRON_SECRETS_KEYS", new_key)
+    assert decrypt_secret(merged[0]["value"]) == "old"
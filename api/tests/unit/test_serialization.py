@@ -0,0 +1,119 @@
+"""Tests for list serialization helpers."""
+import json
+from types import SimpleNamespace
+from typing import List, Optional
+
+import pytest
+from fastapi import Response
+from pydantic import BaseModel
+
+from app.shared.utils.pagination import NEXT_CURSOR_HEADER, CursorPage
+from app.shared.utils.serialization import (
+    InvalidFieldsError,
+    json_list_response,
+    list_adapter,
+    parse_fields,
+    validate_page,
+)
+
+
+class Item(BaseModel):
+    name: str
+    enabled: bool
+
+
+class Env(BaseModel):
+    key: str
+    value: str
+
+
+class Settings(BaseModel):
+    cpu: float
+    envs: List[Env] = []
+
+
+class Component(BaseModel):
+    uuid: str
+    name: str
+    settings: Optional[Settings] = None
+
+
+def test_list_adapter_is_cached():
+    assert list_adapter(Item) is list_adapter(Item)
+
+
+def test_validate_page_from_attributes_keeps_cursor():
+    """Test ORM-like rows are validated in one call and the cursor survives."""
+    page = CursorPage(
+        [SimpleNamespace(name="a", enabled=True), SimpleNamespace(name="b", enabled=False)],
+        "next",
+    )
+
+    result = validate_page(Item, page)
+
+    assert result == [Item(name="a", enabled=True), Item(name="b", enabled=False)]
+    assert result.next_cursor == "next"
+
+
+def test_json_list_response():
+    """Test items are dumped as JSON with the next cursor header."""
+    page = CursorPage([Item(name="a", enabled=True)], "next")
+
+    response = json_list_response(Item, page)
+
+    assert response.media_type == "application/json"
+    assert json.loads(response.body) == [{"name": "a", "enabled": True}]
+    assert response.headers[NEXT_CURSOR_HEADER] == "next"
+
+
+def test_json_list_response_without_cursor():
+    response = json_list_response(Item, [])
+
+    assert response.body == b"[]"
+    assert NEXT_CURSOR_HEADER not in response.headers
+
+
+@pytest.mark.parametrize("raw", [None, "", " , "])
+def test_parse_fields_defaults_to_all_fields(raw):
+    assert parse_fields(Component, raw) is None
+
+
+def test_parse_fields_nested_and_list_fields():
+    include = parse_fields(Component, "uuid, settings.cpu,settings.envs.key")
+
+    assert include == {
+        "uuid": True,
+        "settings": {"cpu": True, "envs": {"__all__": {"key": True}}},
+    }
+
+
+def test_parse_fields_whole_object_wins_over_subfields():
+    assert parse_fields(Component, "settings,settings.cpu") == {"settings": True}
+
+
+@pytest.mark.parametrize("raw", ["missing", "name.first", "settings.memory"])
+def test_parse_fields_rejects_unknown_fields(raw):
+    with pytest.raises(InvalidFieldsError):
+        parse_fields(Component, raw)
+
+
+def test_json_list_response_with_fields():
+    """Test only the requested fields are serialized."""
+    page = [
+        Component(uuid="1", name="web", settings=Settings(cpu=0.5, envs=[Env(key="A", value="1")]))
+    ]
+
+    response = json_list_response(
+        Component, page, fields=parse_fields(Component, "name,settings.envs.key")
+    )
+
+    assert json.loads(response.body) == [{"name": "web", "settings": {"envs": [{"key": "A"}]}}]
+
+
+def test_json_list_response_keeps_injected_headers():
+    injected = Response()
+    injected.headers["ETag"] = 'W/"abc"'
+
+    response = json_list_response(Item, [], response=injected)
+
+    assert response.headers["ETag"] == 'W/"abc"'
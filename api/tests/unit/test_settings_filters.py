@@ -0,0 +1,156 @@
+"""Tests for server-side settings filters."""
+import pytest
+from uuid import uuid4
+from sqlalchemy import create_engine
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.shared.database.database import Base
+from app.shared.utils.settings_filters import (
+    InvalidSettingsFilterError,
+    SettingsFilter,
+    _postgres_condition,
+    parse_settings_filters,
+)
+from app.webapps.infra.application_component_model import (
+    ApplicationComponent,
+    WebappType,
+)
+from app.webapps.infra.webapp_repository import WebappRepository
+from app.settings.infra.settings_model import Settings
+from app.settings.infra.settings_repository import SettingsRepository
+
+
+@pytest.fixture
+def db():
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+    Base.metadata.drop_all(bind=engine)
+
+
+def add_webapp(db, name, settings):
+    db.add(
+        ApplicationComponent(
+            uuid=uuid4(),
+            instance_id=1,
+            name=name,
+            type=WebappType.webapp,
+            settings=settings,
+        )
+    )
+    db.commit()
+
+
+def test_parse_settings_filters():
+    """Test operators, paths and value types are parsed from the query string."""
+    query = (
+        "skip=0&settings.exposure.visibility=public"
+        "&settings.cpu%3E%3D2&settings.memory%3C512&settings.enabled!=true"
+    )
+
+    assert parse_settings_filters(query) == [
+        SettingsFilter(("exposure", "visibility"), "=", "public"),
+        SettingsFilter(("cpu",), ">=", 2),
+        SettingsFilter(("memory",), "<", 512),
+        SettingsFilter(("enabled",), "!=", True),
+    ]
+
+
+def test_parse_settings_filters_ignores_other_parameters():
+    """Test unrelated parameters sharing the prefix are not treated as filters."""
+    assert parse_settings_filters("settingsx=1&limit=10&cursor=abc") == []
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "settings.secrets.value=hunter2",
+        "settings.secrets=x",
+        "settings.secrets.key!=API_TOKEN",
+        "settings.cpu>=high",
+        "settings=1",
+        "settings.cpu~1",
+    ],
+)
+def test_parse_settings_filters_rejects_invalid(query):
+    """Test secret values, non numeric comparisons and malformed filters are rejected."""
+    with pytest.raises(InvalidSettingsFilterError):
+        parse_settings_filters(query)
+
+
+def test_parse_settings_filters_allows_secret_keys():
+    assert parse_settings_filters("settings.secrets.key=API_TOKEN") == [
+        SettingsFilter(("secrets", "key"), "=", "API_TOKEN")
+    ]
+
+
+def test_postgres_equality_uses_containment():
+    """Test equality filters compile to @> so the GIN index can be used."""
+    condition = _postgres_condition(
+        ApplicationComponent.settings,
+        SettingsFilter(("exposure", "visibility"), "=", "public"),
+    )
+
+    sql = str(condition.compile(dialect=postgresql.dialect()))
+    assert "@>" in sql
+
+
+def test_find_all_filters_on_settings(db):
+    """Test equality, numeric comparison and list filters are pushed down into SQL."""
+    add_webapp(
+        db,
+        "public-big",
+        {
+            "cpu": 4,
+            "exposure": {"visibility": "public"},
+            "envs": [{"key": "DATABASE_URL", "value": "postgres://"}],
+            "secrets": [{"key": "API_TOKEN", "value": "secret"}],
+        },
+    )
+    add_webapp(
+        db,
+        "private-small",
+        {"cpu": 0.5, "exposure": {"visibility": "private"}, "envs": [], "secrets": []},
+    )
+    repository = WebappRepository(db)
+
+    def names(query):
+        return [
+            w.name
+            for w in repository.find_all(settings_filters=parse_settings_filters(query))
+        ]
+
+    assert names("settings.exposure.visibility=public") == ["public-big"]
+    assert names("settings.exposure.visibility!=public") == ["private-small"]
+    assert names("settings.cpu>=2") == ["public-big"]
+    assert names("settings.cpu<1") == ["private-small"]
+    assert names("settings.envs.key=DATABASE_URL") == ["public-big"]
+    assert names("settings.secrets.key=API_TOKEN") == ["public-big"]
+    assert names("settings.cpu>=2&settings.exposure.visibility=private") == []
+
+
+def test_settings_find_all_filters_on_value(db):
+    """Test settings can be filtered on the whole value or a nested path."""
+    db.add_all(
+        [
+            Settings(uuid=uuid4(), key="replicas", value=3, environment_id=1),
+            Settings(uuid=uuid4(), key="debug", value={"enabled": True}, environment_id=1),
+        ]
+    )
+    db.commit()
+    repository = SettingsRepository(db)
+
+    def keys(query):
+        filters = parse_settings_filters(query, prefix="value", allow_root=True)
+        return [s.key for s in repository.find_all(value_filters=filters)]
+
+    assert keys("value=3") == ["replicas"]
+    assert keys("value.enabled=true") == ["debug"]
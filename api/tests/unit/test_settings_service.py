@@ -206,7 +206,9 @@ def test_get_settings_list(settings_service, mock_repository, mock_settings):
         result = settings_service.get_settings_list(skip=0, limit=10)
 
         assert len(result) == 2
-        mock_repository.find_all.assert_called_once_with(skip=0, limit=10)
+        mock_repository.find_all.assert_called_once_with(
+            skip=0, limit=10, cursor=None, value_filters=None
+        )
 
 
 def test_delete_settings_success(settings_service, mock_repository, mock_settings):
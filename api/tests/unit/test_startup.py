@@ -0,0 +1,57 @@
+"""Import-time budget for app.main, which every worker pays on boot."""
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+API_DIR = Path(__file__).resolve().parents[2]
+
+# About 1.6s on a laptop; kubernetes alone used to add ~0.4s
+IMPORT_BUDGET_SECONDS = 3.0
+
+# Only needed once a request actually talks to a cluster
+LAZY_MODULES = ["kubernetes"]
+
+
+def import_app_main():
+    """Import app.main in a fresh interpreter; return ({module: cumulative us}, loaded modules)."""
+    env = {**os.environ, "ENV": "production", "PYTHONPATH": str(API_DIR)}
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-c",
+            "import sys, app.main; print(' '.join(sys.modules))",
+        ],
+        cwd=API_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    cumulative = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        _, total, name = line.split("|")
+        cumulative[name.strip()] = int(total)
+    return cumulative, set(result.stdout.split())
+
+
+def test_app_main_imports_within_budget():
+    # The first run may still be compiling bytecode; keep the faster one
+    runs = [import_app_main() for _ in range(2)]
+    seconds = min(cumulative["app.main"] for cumulative, _ in runs) / 1_000_000
+
+    assert seconds < IMPORT_BUDGET_SECONDS, (
+        f"import app.main took {seconds:.2f}s (budget {IMPORT_BUDGET_SECONDS}s); "
+        "run `python -X importtime -c 'import app.main'` to see what got slower"
+    )
+
+
+def test_heavy_dependencies_are_imported_on_first_use():
+    _, modules = import_app_main()
+
+    for name in LAZY_MODULES:
+        assert name not in modules, f"{name} is imported at startup"
@@ -141,7 +141,7 @@ def test_get_templates(template_service, mock_repository, mock_template):
     result = template_service.get_templates(skip=0, limit=10)
 
     assert len(result) == 2
-    mock_repository.find_all.assert_called_once_with(skip=0, limit=10, category=None)
+    mock_repository.find_all.assert_called_once_with(skip=0, limit=10, category=None, cursor=None)
 
 
 def test_get_templates_with_category(template_service, mock_repository, mock_template):
@@ -151,7 +151,7 @@ def test_get_templates_with_category(template_service, mock_repository, mock_tem
     result = template_service.get_templates(skip=0, limit=10, category="webapp")
 
     assert len(result) == 1
-    mock_repository.find_all.assert_called_once_with(skip=0, limit=10, category="webapp")
+    mock_repository.find_all.assert_called_once_with(skip=0, limit=10, category="webapp", cursor=None)
 
 
 def test_delete_template_success(template_service, mock_repository, mock_template):
@@ -67,7 +67,7 @@ def test_list_tokens_success(token_service, mock_repository, mock_token):
     result = token_service.list_tokens(skip=0, limit=10)
 
     assert len(result) == 2
-    mock_repository.find_all.assert_called_once_with(skip=0, limit=10, search=None)
+    mock_repository.find_all.assert_called_once_with(skip=0, limit=10, search=None, cursor=None)
 
 
 def test_list_tokens_with_search(token_service, mock_repository, mock_token):
@@ -77,7 +77,7 @@ def test_list_tokens_with_search(token_service, mock_repository, mock_token):
     result = token_service.list_tokens(skip=0, limit=10, search="test")
 
     assert len(result) == 1
-    mock_repository.find_all.assert_called_once_with(skip=0, limit=10, search="test")
+    mock_repository.find_all.assert_called_once_with(skip=0, limit=10, search="test", cursor=None)
 
 
 def test_get_token_success(token_service, mock_repository, mock_token):
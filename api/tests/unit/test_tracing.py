@@ -0,0 +1,144 @@
+"""Tests for the optional OpenTelemetry tracing."""
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import StaticPool
+
+pytest.importorskip("opentelemetry.sdk")
+
+from kubernetes import client as k8s  # noqa: E402
+from kubernetes.client.rest import ApiException  # noqa: E402
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import (  # noqa: E402
+    InMemorySpanExporter,
+)
+
+from app.k8s.client import InstrumentedApiClient  # noqa: E402
+from app.shared.k8s.application_component_manager import (  # noqa: E402
+    KubernetesApplicationComponentManager,
+)
+from app.shared.observability import tracing  # noqa: E402
+from app.shared.observability.tracing import (  # noqa: E402
+    TracingMiddleware,
+    configure_tracing,
+    shutdown_tracing,
+    span,
+)
+
+
+@pytest.fixture(autouse=True)
+def tracing_env(monkeypatch):
+    for name in ("TRACING_EXPORTER", "TRACING_FILE", "TRACING_SAMPLE_RATIO"):
+        monkeypatch.delenv(name, raising=False)
+    yield
+    shutdown_tracing()
+
+
+@pytest.fixture
+def exporter():
+    exporter = InMemorySpanExporter()
+    assert configure_tracing(exporter=exporter)
+    return exporter
+
+
+def spans_by_name(exporter):
+    return {finished.name: finished for finished in exporter.get_finished_spans()}
+
+
+def test_tracing_is_off_by_default():
+    assert configure_tracing() is False
+    with span("anything") as current:
+        current.set_attribute("key", "value")
+    assert not tracing.is_tracing_enabled()
+
+
+def test_request_and_statement_spans_share_a_trace(exporter):
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    app = FastAPI()
+    app.add_middleware(TracingMiddleware)
+
+    @app.get("/items/{item_id}")
+    def get_item(item_id: int):
+        with engine.connect() as connection:
+            return {"id": connection.execute(text("SELECT :id"), {"id": item_id}).scalar()}
+
+    parent = "00-0af7651916cd43dd8448eb211c80319c-b7ad6b7169203331-01"
+    response = TestClient(app).get("/items/7", headers={"traceparent": parent})
+
+    assert response.json() == {"id": 7}
+    spans = spans_by_name(exporter)
+    request, statement = spans["GET /items/{item_id}"], spans["db SELECT"]
+    assert request.attributes["http.route"] == "/items/{item_id}"
+    assert request.attributes["http.response.status_code"] == 200
+    assert format(request.context.trace_id, "032x") == parent.split("-")[1]
+    assert statement.parent.span_id == request.context.span_id
+    assert statement.attributes["db.statement"].startswith("SELECT")
+
+
+def test_one_span_per_rendered_template(exporter):
+    templates = []
+    for name in ("deployment", "service"):
+        template = MagicMock(content="kind: Service\nmetadata:\n  name: web\n")
+        template.name = name
+        templates.append(template)
+
+    with patch(
+        "app.shared.k8s.application_component_manager.ComponentTemplateConfigService"
+    ) as service:
+        service.return_value.get_templates_for_component_type.return_value = templates
+        KubernetesApplicationComponentManager.instance_management(
+            {"name": "web", "settings": {}}, "webapp", db=MagicMock()
+        )
+
+    rendered = [
+        finished.attributes["template.name"]
+        for finished in exporter.get_finished_spans()
+        if finished.name == "template.render"
+    ]
+    assert rendered == ["deployment", "service"]
+
+
+def test_kubernetes_calls_record_cluster_verb_kind_and_status(exporter, monkeypatch):
+    def conflict(self, resource_path, method, *args, **kwargs):
+        raise ApiException(status=409)
+
+    monkeypatch.setattr(k8s.ApiClient, "call_api", conflict)
+    api_client = InstrumentedApiClient(k8s.Configuration(), cluster="k8s.test:6443")
+
+    with pytest.raises(ApiException):
+        k8s.AppsV1Api(api_client).replace_namespaced_deployment(
+            name="web", namespace="team-a", body={}
+        )
+
+    call = spans_by_name(exporter)["k8s replace deployments"]
+    assert call.attributes["k8s.cluster"] == "k8s.test:6443"
+    assert call.attributes["k8s.verb"] == "replace"
+    assert call.attributes["k8s.kind"] == "deployments"
+    assert call.attributes["http.response.status_code"] == 409
+    assert not call.status.is_ok
+
+
+def test_file_exporter_writes_one_json_span_per_line(monkeypatch, tmp_path):
+    trace_file = tmp_path / "traces.jsonl"
+    monkeypatch.setenv("TRACING_EXPORTER", "file")
+    monkeypatch.setenv("TRACING_FILE", str(trace_file))
+
+    assert configure_tracing()
+    with span("offline", {"component.type": "cron"}):
+        pass
+    shutdown_tracing()
+
+    [line] = trace_file.read_text().splitlines()
+    assert json.loads(line)["name"] == "offline"
+
+
+def test_unknown_exporter_is_rejected(monkeypatch):
+    monkeypatch.setenv("TRACING_EXPORTER", "zipkin")
+
+    with pytest.raises(ValueError):
+        configure_tracing()
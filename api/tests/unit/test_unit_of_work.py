@@ -0,0 +1,108 @@
+"""Tests for the unit of work transaction boundary."""
+import pytest
+from uuid import uuid4
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.shared.database.database import Base
+from app.shared.database.unit_of_work import UnitOfWork, has_uncommitted_writes
+from app.environments.infra.environment_model import Environment
+from app.environments.infra.environment_repository import EnvironmentRepository
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    yield engine
+    Base.metadata.drop_all(bind=engine)
+
+
+@pytest.fixture
+def db(engine):
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def repository(db):
+    return EnvironmentRepository(db)
+
+
+@pytest.fixture
+def statements(engine):
+    executed = []
+
+    def count(conn, cursor, statement, parameters, context, executemany):
+        executed.append(statement)
+
+    event.listen(engine, "before_cursor_execute", count)
+    yield executed
+    event.remove(engine, "before_cursor_execute", count)
+
+
+@pytest.fixture
+def commits(db):
+    committed = []
+    event.listen(db, "after_commit", committed.append)
+    return committed
+
+
+def names(engine):
+    with engine.connect() as connection:
+        rows = connection.exec_driver_sql("SELECT name FROM environments")
+        return {row[0] for row in rows}
+
+
+def test_commits_once_for_all_writes(engine, repository, commits):
+    with repository.unit_of_work():
+        repository.create(Environment(uuid=uuid4(), name="prod"))
+        repository.create(Environment(uuid=uuid4(), name="staging"))
+
+    assert len(commits) == 1
+    assert names(engine) == {"prod", "staging"}
+
+
+def test_rolls_back_everything_on_error(engine, repository, commits):
+    with pytest.raises(RuntimeError):
+        with repository.unit_of_work():
+            repository.create(Environment(uuid=uuid4(), name="prod"))
+            raise RuntimeError("kubernetes apply failed")
+
+    assert commits == []
+    assert names(engine) == set()
+
+
+def test_nested_units_join_the_outer_transaction(engine, repository, commits):
+    with pytest.raises(RuntimeError):
+        with repository.unit_of_work():
+            with repository.unit_of_work():
+                repository.create(Environment(uuid=uuid4(), name="prod"))
+            assert commits == []
+            raise RuntimeError("later step failed")
+
+    assert names(engine) == set()
+
+
+def test_written_objects_are_not_reloaded_after_commit(repository, statements):
+    with repository.unit_of_work():
+        environment = repository.create(Environment(uuid=uuid4(), name="prod"))
+    executed = len(statements)
+
+    assert environment.name == "prod"
+    assert environment.id is not None
+    assert len(statements) == executed
+
+
+def test_tracks_flushed_writes_until_commit(db, repository):
+    repository.create(Environment(uuid=uuid4(), name="prod"))
+    assert has_uncommitted_writes(db)
+
+    UnitOfWork(db).commit()
+    assert not has_uncommitted_writes(db)
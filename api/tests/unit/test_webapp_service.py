@@ -236,7 +236,9 @@ def test_get_webapps(webapp_service, mock_repository, mock_webapp):
     result = webapp_service.get_webapps(skip=0, limit=10)
 
     assert len(result) == 2
-    mock_repository.find_all.assert_called_once_with(skip=0, limit=10)
+    mock_repository.find_all.assert_called_once_with(
+        skip=0, limit=10, cursor=None, settings_filters=None
+    )
 
 
 def test_delete_webapp_success(webapp_service, mock_repository, mock_db, mock_webapp, mock_cluster):
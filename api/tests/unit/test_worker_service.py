@@ -211,7 +211,9 @@ def test_get_workers(worker_service, mock_repository, mock_worker):
     result = worker_service.get_workers(skip=0, limit=10)
 
     assert len(result) == 2
-    mock_repository.find_all.assert_called_once_with(skip=0, limit=10)
+    mock_repository.find_all.assert_called_once_with(
+        skip=0, limit=10, cursor=None, settings_filters=None
+    )
 
 
 def test_delete_worker_success(worker_service, mock_repository, mock_db, mock_worker):